@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER, keyset_page, split_page
 from app.models.alert import Alert, AlertSetting
 from app.schemas.alert import AlertResponse, AlertSettingPatch, AlertSettingResponse, AlertSettingUpdate
 
@@ -12,19 +13,25 @@ router = APIRouter(tags=["alerts"])
 @router.get("/users/{user_id}/alerts", response_model=list[AlertResponse])
 async def get_alerts(
     user_id: int,
-    page: int = Query(1, ge=1),
+    response: Response,
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    page: int = Query(1, ge=1, deprecated=True, description="cursor 미지정 시에만 사용 (OFFSET)"),
     size: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
 ):
-    offset = (page - 1) * size
-    result = await db.execute(
-        select(Alert)
-        .where(Alert.user_id == user_id)
-        .order_by(Alert.created_at.desc())
-        .offset(offset)
-        .limit(size)
-    )
-    return result.scalars().all()
+    """최신순 알림 — 다음 페이지 커서는 X-Next-Cursor 헤더."""
+    query = select(Alert).where(Alert.user_id == user_id)
+    if cursor is None and page > 1:
+        query = query.offset((page - 1) * size)
+    try:
+        query = keyset_page(query, Alert.created_at, Alert.id, cursor, size)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    result = await db.execute(query)
+    alerts, next_cursor = split_page(result.scalars().all(), size)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return alerts
 
 
 @router.patch("/alerts/{alert_id}/read", response_model=AlertResponse)
@@ -10,5 +10,5 @@ router = APIRouter(tags=["categories"])
 
 @router.get("/naver-categories", response_model=NaverCategoryTree)
 async def get_naver_categories(db: AsyncSession = Depends(get_db)):
-    """크롤링된 keyword_rankings에서 네이버 카테고리 트리 구조를 반환."""
+    """크롤링된 네이버 카테고리 트리 구조를 반환 (naver_category_paths 집계 테이블 기반)."""
     return await get_naver_category_tree(db)
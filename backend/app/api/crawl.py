@@ -1,17 +1,17 @@
-from datetime import timedelta
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_db
+from app.core.pagination import NEXT_CURSOR_HEADER, keyset_page, split_page
 from app.core.rate_limit import limiter
-from app.core.utils import utcnow
-from app.crawlers.manager import shared_manager as manager, CrawlAlreadyRunningError
+from app.crawlers.executor import QueueWaitStats, crawl_executor
+from app.crawlers.manager import shared_manager as manager, CrawlAlreadyRunningError, CrawlDrainingError
 from app.models.crawl_log import CrawlLog
 from app.models.product import Product
 from app.models.search_keyword import SearchKeyword
 from app.schemas.crawl import CrawlBatchResult, CrawlKeywordResult, CrawlLogResponse, CrawlStatusResponse
+from app.services.crawl_stats_service import get_crawl_stats
 
 router = APIRouter(prefix="/crawl", tags=["crawl"])
 
@@ -27,6 +27,8 @@ async def crawl_product(request: Request, product_id: int, db: AsyncSession = De
         results = await manager.crawl_product(db, product_id)
     except CrawlAlreadyRunningError:
         raise HTTPException(409, "이미 크롤링이 진행 중입니다.")
+    except CrawlDrainingError:
+        raise HTTPException(503, "서버 종료 중입니다. 잠시 후 다시 시도해 주세요.")
     return [
         CrawlKeywordResult(
             keyword_id=0,
@@ -46,10 +48,14 @@ async def crawl_user(request: Request, user_id: int, db: AsyncSession = Depends(
         result = await manager.crawl_user_all(db, user_id)
     except CrawlAlreadyRunningError:
         raise HTTPException(409, "이미 크롤링이 진행 중입니다.")
+    except CrawlDrainingError:
+        raise HTTPException(503, "서버 종료 중입니다. 잠시 후 다시 시도해 주세요.")
     return CrawlBatchResult(
         total=result["total"],
         success=result["success"],
         failed=result["failed"],
+        queue_wait_avg_ms=result.get("queue_wait_avg_ms"),
+        queue_wait_max_ms=result.get("queue_wait_max_ms"),
     )
 
 
@@ -64,49 +70,38 @@ async def get_crawl_status(user_id: int, db: AsyncSession = Depends(get_db)):
     )
     total = total_q.scalar_one()
 
-    # 최근 24시간 성공/실패 (해당 유저의 상품만)
-    since = utcnow() - timedelta(hours=24)
-    log_q = await db.execute(
-        select(CrawlLog.status, func.count())
-        .join(SearchKeyword, CrawlLog.keyword_id == SearchKeyword.id)
-        .join(Product, SearchKeyword.product_id == Product.id)
-        .where(Product.user_id == user_id, CrawlLog.created_at >= since)
-        .group_by(CrawlLog.status)
-    )
-    status_counts = dict(log_q.all())
-
-    # 평균 크롤링 소요 시간 (해당 유저의 상품만)
-    avg_q = await db.execute(
-        select(func.avg(CrawlLog.duration_ms))
-        .join(SearchKeyword, CrawlLog.keyword_id == SearchKeyword.id)
-        .join(Product, SearchKeyword.product_id == Product.id)
-        .where(Product.user_id == user_id, CrawlLog.created_at >= since, CrawlLog.status == "success")
-    )
-    avg_duration = avg_q.scalar_one_or_none()
+    # 최근 24시간 성공/실패/평균 소요 시간 (시간 버킷 카운터, 성공 건만 평균)
+    stats = await get_crawl_stats(db, user_id)
 
     return {
         "total_keywords": total,
-        "last_24h_success": status_counts.get("success", 0),
-        "last_24h_failed": status_counts.get("failed", 0),
-        "avg_duration_ms": round(avg_duration) if avg_duration else None,
+        "last_24h_success": stats["success"],
+        "last_24h_failed": stats["failed"],
+        "avg_duration_ms": stats["avg_success_duration_ms"],
+        "queue_waiting": crawl_executor.waiting(user_id),
+        **crawl_executor.last_wait.get(user_id, QueueWaitStats()).as_dict(),
     }
 
 
 @router.get("/logs/{user_id}", response_model=list[CrawlLogResponse])
 async def get_crawl_logs(
     user_id: int,
-    page: int = Query(1, ge=1),
+    response: Response,
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    page: int = Query(1, ge=1, deprecated=True, description="cursor 미지정 시에만 사용 (OFFSET)"),
     size: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
 ):
-    offset = (page - 1) * size
-    result = await db.execute(
-        select(CrawlLog)
-        .join(SearchKeyword, CrawlLog.keyword_id == SearchKeyword.id)
-        .join(Product, SearchKeyword.product_id == Product.id)
-        .where(Product.user_id == user_id)
-        .order_by(CrawlLog.created_at.desc())
-        .offset(offset)
-        .limit(size)
-    )
-    return result.scalars().all()
+    """최신순 크롤링 로그 — 다음 페이지 커서는 X-Next-Cursor 헤더."""
+    query = select(CrawlLog).where(CrawlLog.user_id == user_id)
+    if cursor is None and page > 1:
+        query = query.offset((page - 1) * size)
+    try:
+        query = keyset_page(query, CrawlLog.created_at, CrawlLog.id, cursor, size)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    result = await db.execute(query)
+    logs, next_cursor = split_page(result.scalars().all(), size)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return logs
@@ -1,6 +1,3 @@
-import csv
-import io
-
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.deps import get_db
 from app.schemas.dashboard import DashboardSummary
 from app.services.dashboard_service import get_dashboard_summary
-from app.services.product_service import get_product_list_items
+from app.services.export_service import stream_product_export, stream_ranking_export
 
 router = APIRouter(tags=["dashboard"])
 
@@ -18,34 +15,37 @@ async def dashboard_summary(user_id: int, db: AsyncSession = Depends(get_db)):
     return await get_dashboard_summary(db, user_id)
 
 
-@router.get("/users/{user_id}/dashboard/export")
-async def export_csv(user_id: int, db: AsyncSession = Depends(get_db)):
-    items = await get_product_list_items(db, user_id)
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow([
-        "상품명", "카테고리", "판매가", "최저가", "차이", "차이(%)",
-        "순위", "마진(원)", "마진(%)", "상태", "가격고정"
-    ])
-    for item in items:
-        writer.writerow([
-            item["name"],
-            item["category"] or "",
-            item["selling_price"],
-            item["lowest_price"] or "",
-            item["price_gap"] or "",
-            item["price_gap_percent"] or "",
-            item["my_rank"] or "",
-            item["margin_amount"] or "",
-            item["margin_percent"] or "",
-            item["status"],
-            "Y" if item["is_price_locked"] else "N",
-        ])
-
-    output.seek(0)
+def _export_response(stream, fmt: str, filename: str) -> StreamingResponse:
+    if fmt == "ndjson":
+        return StreamingResponse(
+            stream, media_type="application/x-ndjson",
+            headers={"Content-Disposition": f"attachment; filename={filename}.ndjson"},
+        )
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=price-monitor-export.csv"},
+        stream, media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}.csv"},
+    )
+
+
+@router.get("/users/{user_id}/dashboard/export")
+async def export_csv(
+    user_id: int,
+    fmt: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+):
+    """상품 목록 내보내기 (등록 순, 청크 단위 스트리밍)."""
+    return _export_response(
+        stream_product_export(user_id, fmt), fmt, "price-monitor-export",
+    )
+
+
+@router.get("/users/{user_id}/rankings/export")
+async def export_rankings(
+    user_id: int,
+    fmt: str = Query("csv", alias="format", pattern="^(csv|ndjson)$"),
+    period: str = Query("7d", pattern="^(1d|7d|30d)$"),
+    product_id: int | None = None,
+):
+    """순위 이력 원본 내보내기 (수집 시각 순, 청크 단위 스트리밍)."""
+    return _export_response(
+        stream_ranking_export(user_id, fmt, period, product_id), fmt, "price-monitor-rankings",
     )
@@ -1,6 +1,5 @@
-import re
-
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,15 +8,17 @@ from app.core.deps import get_db
 from app.models.product import Product
 from app.models.search_keyword import SearchKeyword
 from app.schemas.keyword_suggest import (
+    KeywordSuggestBatchItem,
+    KeywordSuggestBatchRequest,
     KeywordSuggestRequest,
     KeywordSuggestionResponse,
     SuggestedKeyword,
     TokenItem,
 )
 from app.schemas.search_keyword import KeywordCreate, KeywordResponse
-from app.services.keyword_engine.classifier import classify_tokens
-from app.services.keyword_engine.dictionary import build_brand_dict, build_type_dict
-from app.services.keyword_engine.generator import generate_keywords
+from app.services.keyword_engine.batch import SuggestInput, suggest_batch
+from app.services.keyword_engine.dictionary import get_snapshot
+from app.services.keyword_engine.suggest import KeywordSuggestion, suggest
 
 router = APIRouter(tags=["keywords"])
 
@@ -83,44 +84,57 @@ async def delete_keyword(keyword_id: int, db: AsyncSession = Depends(get_db)):
     await db.delete(keyword)
 
 
+def _to_response(suggestion: KeywordSuggestion) -> dict:
+    return {
+        "tokens": [
+            TokenItem(text=t.text, category=t.category, weight=t.weight)
+            for t in suggestion.tokens
+        ],
+        "keywords": [
+            SuggestedKeyword(keyword=g.keyword, score=g.score, level=g.level)
+            for g in suggestion.keywords
+        ],
+        "field_guide": suggestion.field_guide,
+    }
+
+
 @router.post("/keywords/suggest", response_model=KeywordSuggestionResponse)
 async def suggest_keywords(
     data: KeywordSuggestRequest,
     db: AsyncSession = Depends(get_db),
 ):
     """SEO 기반 키워드 추천."""
-    name = data.product_name.strip()
-
-    # 스토어명 제거
-    if data.store_name:
-        for variant in [data.store_name, data.store_name.replace(" ", "")]:
-            name = re.sub(re.escape(variant), "", name, flags=re.IGNORECASE).strip()
-
-    # DB 사전 로드
-    db_brands = await build_brand_dict(db)
-    db_types = await build_type_dict(db)
-
-    # 토큰 분류
-    tokens = classify_tokens(name, db_brands, db_types)
-
-    # 키워드 생성
-    generated = generate_keywords(tokens)
+    # DB 사전 (워커 메모리 스냅샷, 백그라운드 갱신)
+    dictionary = await get_snapshot(db)
+    suggestion = suggest(
+        data.product_name, data.store_name, data.category_hint, matcher=dictionary.matcher,
+    )
+    return KeywordSuggestionResponse(**_to_response(suggestion))
 
-    # field_guide: 첫 번째 BRAND, category_hint 또는 첫 TYPE
-    brand_token = next((t for t in tokens if t.category == "BRAND"), None)
-    type_token = next((t for t in tokens if t.category == "TYPE"), None)
 
-    return KeywordSuggestionResponse(
-        tokens=[
-            TokenItem(text=t.text, category=t.category, weight=t.weight)
-            for t in tokens
-        ],
-        keywords=[
-            SuggestedKeyword(keyword=g.keyword, score=g.score, level=g.level)
-            for g in generated
-        ],
-        field_guide={
-            "brand": brand_token.text if brand_token else None,
-            "category": data.category_hint or (type_token.text if type_token else None),
-        },
-    )
+@router.post("/keywords/suggest/batch")
+async def suggest_keywords_batch(
+    data: KeywordSuggestBatchRequest,
+    db: AsyncSession = Depends(get_db),
+):
+    """SEO 키워드 일괄 추천 — 프로세스 풀에서 청크 단위 처리, NDJSON 스트리밍.
+
+    각 줄은 KeywordSuggestBatchItem이며 요청 순서(index)대로 내려간다.
+    """
+    dictionary = await get_snapshot(db)
+    inputs = [
+        SuggestInput(item.product_name, item.store_name, item.category_hint)
+        for item in data.items
+    ]
+
+    async def stream():
+        index = 0
+        async for chunk in suggest_batch(inputs, dictionary):
+            lines = []
+            for suggestion in chunk:
+                item = KeywordSuggestBatchItem(index=index, **_to_response(suggestion))
+                lines.append(item.model_dump_json() + "\n")
+                index += 1
+            yield "".join(lines)
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
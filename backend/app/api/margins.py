@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_db
-from app.schemas.cost import MarginResult, MarginSimulateRequest
-from app.services.margin_service import get_margin, simulate_margin
+from app.models.user import User
+from app.schemas.cost import (
+    MarginResult,
+    MarginSimulateRequest,
+    MarginSweepRequest,
+    MarginSweepResult,
+    RepricingPage,
+)
+from app.services.margin_service import get_margin, simulate_margin, sweep_margin
+from app.services.repricing_service import get_repricing_recommendations
 
 router = APIRouter(tags=["margins"])
 
@@ -24,3 +32,48 @@ async def simulate_product_margin(
     if result is None:
         raise HTTPException(404, "상품을 찾을 수 없습니다.")
     return result
+
+
+@router.post("/products/{product_id}/margin/sweep", response_model=MarginSweepResult)
+async def sweep_product_margin(
+    product_id: int, data: MarginSweepRequest, db: AsyncSession = Depends(get_db)
+):
+    """가격 범위 전체의 마진 곡선 (현재 최저가 기준 상태, 손익분기/목표 마진 가격 표시)."""
+    try:
+        result = await sweep_margin(
+            db, product_id,
+            min_price=data.min_price,
+            max_price=data.max_price,
+            step=data.step,
+            target_margin_percent=data.target_margin_percent,
+        )
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    if result is None:
+        raise HTTPException(404, "상품을 찾을 수 없습니다.")
+    return result
+
+
+@router.get("/users/{user_id}/repricing", response_model=RepricingPage)
+async def get_repricing(
+    user_id: int,
+    min_margin_percent: float | None = Query(None, ge=-100, lt=100, description="지켜야 할 최소 마진율 (기본: 설정값)"),
+    undercut: int | None = Query(None, ge=0, description="최저가보다 낮출 금액 (0이면 동일가)"),
+    action: str | None = Query(None, pattern="^(lower|raise|keep|locked|unreachable|no_competitor)$"),
+    sort: str = Query("urgency", pattern="^(urgency|margin_delta|margin|name)$"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    limit: int = Query(50, ge=1, le=500, description="페이지당 항목 수"),
+    db: AsyncSession = Depends(get_db),
+):
+    """전체 상품 가격 조정 추천 — 최저가를 이기거나 맞추되 최소 마진율 이상인 가격."""
+    if not await db.get(User, user_id):
+        raise HTTPException(404, "사업체를 찾을 수 없습니다.")
+    return await get_repricing_recommendations(
+        db, user_id,
+        min_margin_percent=min_margin_percent,
+        undercut=undercut,
+        action=action,
+        sort_by=sort,
+        page=page,
+        limit=limit,
+    )
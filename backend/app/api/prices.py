@@ -2,8 +2,12 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_db
-from app.schemas.price import PriceHistoryItem, PriceSnapshotItem
-from app.services.price_service import get_price_history, get_price_snapshot
+from app.schemas.price import PriceHistoryColumnar, PriceHistoryItem, PriceSnapshotItem
+from app.services.price_service import (
+    get_price_history,
+    get_price_history_columnar,
+    get_price_snapshot,
+)
 
 router = APIRouter(tags=["prices"])
 
@@ -18,6 +22,19 @@ async def price_history(
     return await get_price_history(db, product_id, period, keyword_id)
 
 
+@router.get("/products/{product_id}/price-history/columnar", response_model=PriceHistoryColumnar)
+async def price_history_columnar(
+    product_id: int,
+    period: str = Query("7d", pattern="^(1d|7d|30d)$"),
+    keyword_id: int | None = None,
+    points: int = Query(300, ge=10, le=5000, description="시리즈당 최대 점 수"),
+    downsample: str = Query("minmax", pattern="^(minmax|lttb|none)$"),
+    db: AsyncSession = Depends(get_db),
+):
+    """차트용 컬럼형 가격 이력 (판매처/상품명 사전 인코딩, 시리즈별 다운샘플링)."""
+    return await get_price_history_columnar(db, product_id, period, keyword_id, points, downsample)
+
+
 @router.get("/products/{product_id}/price-snapshot", response_model=list[PriceSnapshotItem])
 async def price_snapshot(product_id: int, db: AsyncSession = Depends(get_db)):
     return await get_price_snapshot(db, product_id)
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_db
@@ -9,6 +9,7 @@ from app.models.user import User
 from app.schemas.product import (
     BulkDeleteRequest,
     BulkDeleteResult,
+    DeletionJobResponse,
     ExcludeProductRequest,
     ExcludedProductResponse,
     PriceLockUpdate,
@@ -17,9 +18,22 @@ from app.schemas.product import (
     ProductListItem,
     ProductResponse,
     ProductUpdate,
+    RelevanceJobResponse,
+)
+from app.services.deletion_service import (
+    deletion_job_response,
+    get_deletion_job,
+    request_product_deletion,
+    schedule_deletion,
 )
 from app.services.excluded_service import add_excluded, get_excluded_list, remove_excluded
 from app.services.product_service import get_product_detail, get_product_list_items
+from app.services.relevance_service import (
+    get_latest_relevance_job,
+    needs_recompute,
+    request_recompute,
+    run_relevance_job,
+)
 
 router = APIRouter(tags=["products"])
 
@@ -29,13 +43,14 @@ async def get_products(
     user_id: int,
     category: str | None = None,
     search: str | None = None,
-    sort: str | None = Query(None, description="urgency|margin|rank_drop|category"),
+    sort: str | None = Query(None, description="urgency|margin|rank_drop|category|relevance (검색 시 기본값 relevance)"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(50, ge=1, le=500, description="페이지당 항목 수"),
     db: AsyncSession = Depends(get_db),
 ):
     return await get_product_list_items(
-        db, user_id, sort_by=sort or "urgency", category=category, search=search,
+        db, user_id, sort_by=sort or ("relevance" if search else "urgency"),
+        category=category, search=search,
         page=page, limit=limit,
     )
 
@@ -64,18 +79,21 @@ async def create_product(user_id: int, data: ProductCreate, db: AsyncSession = D
 
 @router.post("/users/{user_id}/products/bulk-delete", response_model=BulkDeleteResult)
 async def bulk_delete_products(
-    user_id: int, data: BulkDeleteRequest, db: AsyncSession = Depends(get_db)
+    user_id: int, data: BulkDeleteRequest, background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(Product).where(
-            Product.id.in_(data.product_ids),
-            Product.user_id == user_id,
-        )
-    )
-    products = result.scalars().all()
-    for product in products:
-        await db.delete(product)
-    return BulkDeleteResult(deleted=len(products))
+    """복수 삭제 — 집합 단위 DELETE (이력이 크면 즉시 숨김 + 백그라운드 청크 삭제)."""
+    job = await request_product_deletion(db, user_id, data.product_ids)
+    schedule_deletion(job, background_tasks)
+    return BulkDeleteResult(deleted=len(job.product_ids), job_id=job.id, status=job.status)
+
+
+@router.get("/deletion-jobs/{job_id}", response_model=DeletionJobResponse)
+async def get_deletion_job_status(job_id: str, db: AsyncSession = Depends(get_db)):
+    job = await get_deletion_job(db, job_id)
+    if not job:
+        raise HTTPException(404, "삭제 작업을 찾을 수 없습니다.")
+    return deletion_job_response(job)
 
 
 @router.get("/products/{product_id}", response_model=ProductDetail)
@@ -88,25 +106,64 @@ async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
 
 @router.put("/products/{product_id}", response_model=ProductResponse)
 async def update_product(
-    product_id: int, data: ProductUpdate, db: AsyncSession = Depends(get_db)
+    product_id: int, data: ProductUpdate, background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
 ):
     product = await db.get(Product, product_id)
     if not product:
         raise HTTPException(404, "상품을 찾을 수 없습니다.")
     update_data = data.model_dump(exclude_unset=True)
+    changes = {f: v for f, v in update_data.items() if getattr(product, f) != v}
     for field, value in update_data.items():
         setattr(product, field, value)
     await db.flush()
     await db.refresh(product)
+
+    # 관련성 필터 변경 → 보존 중인 순위 이력 소급 재판정 (작업 행 커밋 후 백그라운드, 중단 시 스케줄러가 재개)
+    if needs_recompute(product, changes):
+        job = await request_recompute(db, product_id)
+        background_tasks.add_task(run_relevance_job, job.id)
     return product
 
 
+@router.post("/products/{product_id}/relevance-recompute", response_model=RelevanceJobResponse, status_code=202)
+async def start_relevance_recompute(
+    product_id: int, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db),
+):
+    """관련성 재계산 수동 실행."""
+    product = await db.get(Product, product_id)
+    if not product:
+        raise HTTPException(404, "상품을 찾을 수 없습니다.")
+    job = await request_recompute(db, product_id)
+    background_tasks.add_task(run_relevance_job, job.id)
+    return job
+
+
+@router.get("/products/{product_id}/relevance-recompute", response_model=RelevanceJobResponse)
+async def get_relevance_recompute(product_id: int, db: AsyncSession = Depends(get_db)):
+    """최근 관련성 재계산 작업 진행률."""
+    job = await get_latest_relevance_job(db, product_id)
+    if not job:
+        raise HTTPException(404, "재계산 작업이 없습니다.")
+    return job
+
+
 @router.delete("/products/{product_id}", status_code=204)
-async def delete_product(product_id: int, db: AsyncSession = Depends(get_db)):
+async def delete_product(
+    product_id: int, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db),
+):
+    """상품 삭제 — 즉시 삭제 시 204, 백그라운드 삭제 시 202 + 작업 핸들."""
     product = await db.get(Product, product_id)
     if not product:
         raise HTTPException(404, "상품을 찾을 수 없습니다.")
-    await db.delete(product)
+    job = await request_product_deletion(db, product.user_id, [product_id])
+    if job.status == "pending":
+        schedule_deletion(job, background_tasks)
+        return JSONResponse(
+            deletion_job_response(job).model_dump(mode="json"),
+            status_code=202,
+        )
+    return Response(status_code=204)
 
 
 @router.patch("/products/{product_id}/price-lock", response_model=ProductResponse)
@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy import select
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_db
 from app.core.rate_limit import limiter
-from app.crawlers.store_scraper import fetch_store_products, suggest_keywords
-from app.models.product import Product
-from app.models.search_keyword import SearchKeyword
+from app.crawlers.store_scraper import fetch_store_products, parse_store_slug
 from app.models.user import User
 from app.schemas.store_import import (
     CreatedProductMapping,
@@ -14,16 +16,43 @@ from app.schemas.store_import import (
     StoreImportResult,
     StoreProductItem,
 )
+from app.scheduler.jobs import crawl_imported_products
+from app.services.keyword_engine.batch import SuggestInput, suggest_keyword_lists
+from app.services.keyword_engine.dictionary import get_snapshot
+from app.services.store_import_service import bulk_import_products
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["store-import"])
 
 
+async def _build_preview_items(products, dictionary) -> list[StoreProductItem]:
+    # 키워드 추천: DB 사전 + 프로세스 풀 일괄 처리 (이벤트 루프 비점유)
+    suggested = await suggest_keyword_lists(
+        [SuggestInput(p.name, p.mall_name) for p in products], dictionary,
+    )
+    return [
+        StoreProductItem(
+            name=p.name,
+            price=p.price,
+            image_url=p.image_url,
+            category=p.category,
+            naver_product_id=p.naver_product_id,
+            brand=p.brand,
+            maker=p.maker,
+            suggested_keywords=keywords,
+        )
+        for p, keywords in zip(products, suggested)
+    ]
+
+
 @router.get("/users/{user_id}/store/products", response_model=list[StoreProductItem])
 @limiter.limit("5/minute")
 async def preview_store_products(
     request: Request,
     user_id: int,
     store_url: str = Query(..., max_length=500, description="스마트스토어 URL (예: https://smartstore.naver.com/asmt)"),
+    refresh: bool = Query(False, description="캐시 무시하고 다시 수집"),
     db: AsyncSession = Depends(get_db),
 ):
     """스마트스토어 상품 목록 미리보기 (DB 저장 안함)."""
@@ -33,24 +62,82 @@ async def preview_store_products(
 
     try:
         products = await fetch_store_products(
-            store_url, fallback_store_name=user.naver_store_name,
+            store_url, fallback_store_name=user.naver_store_name, use_cache=not refresh,
         )
     except ValueError as e:
         raise HTTPException(400, str(e))
 
-    return [
-        StoreProductItem(
-            name=p.name,
-            price=p.price,
-            image_url=p.image_url,
-            category=p.category,
-            naver_product_id=p.naver_product_id,
-            brand=p.brand,
-            maker=p.maker,
-            suggested_keywords=suggest_keywords(p.name, p.mall_name),
-        )
-        for p in products
-    ]
+    return await _build_preview_items(products, await get_snapshot(db))
+
+
+@router.get("/users/{user_id}/store/products/stream")
+@limiter.limit("5/minute")
+async def stream_store_products(
+    request: Request,
+    user_id: int,
+    store_url: str = Query(..., max_length=500, description="스마트스토어 URL (예: https://smartstore.naver.com/asmt)"),
+    refresh: bool = Query(False, description="캐시 무시하고 다시 수집"),
+    db: AsyncSession = Depends(get_db),
+):
+    """스마트스토어 상품 미리보기 — 진행률 NDJSON 스트림 (대형 스토어용).
+
+    줄 형식:
+    - {"event": "progress", "pages_done": n, "pages_total": m}
+    - {"event": "result", "products": [StoreProductItem, ...]}
+    - {"event": "error", "detail": "..."}
+    """
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(404, "사업체를 찾을 수 없습니다.")
+    # 스트림 시작 전에 URL 검증 (잘못된 입력은 일반 400 응답)
+    try:
+        parse_store_slug(store_url)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    fallback_store_name = user.naver_store_name
+    # 스트림 중에는 요청 세션을 쓰지 않도록 사전 스냅샷을 미리 확보
+    dictionary = await get_snapshot(db)
+
+    async def stream():
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def on_progress(done: int, total: int) -> None:
+            queue.put_nowait({"event": "progress", "pages_done": done, "pages_total": total})
+
+        task = asyncio.create_task(fetch_store_products(
+            store_url, fallback_store_name=fallback_store_name,
+            use_cache=not refresh, on_progress=on_progress,
+        ))
+        try:
+            while not task.done() or not queue.empty():
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield json.dumps(getter.result()) + "\n"
+                else:
+                    getter.cancel()
+            try:
+                products = task.result()
+            except ValueError as e:
+                yield json.dumps({"event": "error", "detail": str(e)}, ensure_ascii=False) + "\n"
+                return
+            except Exception as e:
+                # 200 응답이 이미 나간 뒤라 HTTP 오류 대신 error 이벤트로 알림 (타임아웃/연결 오류 등)
+                logger.error("스토어 상품 수집 실패: %s - %s", store_url, e)
+                yield json.dumps(
+                    {"event": "error", "detail": "스토어 상품을 불러오지 못했습니다. 잠시 후 다시 시도해주세요."},
+                    ensure_ascii=False,
+                ) + "\n"
+                return
+            items = await _build_preview_items(products, dictionary)
+            yield json.dumps({
+                "event": "result",
+                "products": [item.model_dump() for item in items],
+            }, ensure_ascii=False) + "\n"
+        finally:
+            task.cancel()
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
 
 @router.post("/users/{user_id}/store/import", response_model=StoreImportResult)
@@ -59,71 +146,27 @@ async def import_store_products(
     request: Request,
     user_id: int,
     data: StoreImportRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
-    """선택한 상품 일괄 등록."""
+    """선택한 상품 일괄 등록 (상품/키워드 각각 배치 INSERT)."""
     user = await db.get(User, user_id)
     if not user:
         raise HTTPException(404, "사업체를 찾을 수 없습니다.")
 
-    # 기존 상품명 조회 (중복 체크용)
-    result = await db.execute(
-        select(Product.name).where(
-            Product.user_id == user_id,
-            Product.is_active == True,
-        )
-    )
-    existing_names = {name.lower() for name in result.scalars().all()}
-
-    created = 0
-    skipped = 0
-    skipped_names = []
-    created_products = []
-
-    for item in data.products:
-        if item.name.lower() in existing_names:
-            skipped += 1
-            skipped_names.append(item.name)
-            continue
-
-        product = Product(
-            user_id=user_id,
-            name=item.name,
-            selling_price=item.selling_price,
-            cost_price=0,
-            image_url=item.image_url,
-            category=item.category,
-            naver_product_id=item.naver_product_id,
-            model_code=item.model_code or None,
-            spec_keywords=item.spec_keywords if item.spec_keywords else None,
-            price_filter_min_pct=item.price_filter_min_pct,
-            price_filter_max_pct=item.price_filter_max_pct,
-            brand=item.brand or None,
-            maker=item.maker or None,
-        )
-        db.add(product)
-        await db.flush()
-
-        # 키워드 등록: 사용자 선택 키워드 또는 기본 상품명
-        kw_list = item.keywords if item.keywords else [item.name]
-        for i, kw in enumerate(kw_list):
-            db.add(SearchKeyword(
-                product_id=product.id,
-                keyword=kw,
-                is_primary=(i == 0),
-            ))
-        await db.flush()
-
-        existing_names.add(item.name.lower())
-        created += 1
-        created_products.append(CreatedProductMapping(
-            name=item.name,
-            product_id=product.id,
-        ))
+    outcome = await bulk_import_products(db, user_id, data.products)
+
+    # 초기 크롤링: 응답 전송(및 요청 세션 커밋) 후 백그라운드 실행
+    crawl_enqueued = bool(data.crawl and outcome.created)
+    if crawl_enqueued:
+        background_tasks.add_task(crawl_imported_products, [pid for _, pid in outcome.created])
 
     return StoreImportResult(
-        created=created,
-        skipped=skipped,
-        skipped_names=skipped_names,
-        created_products=created_products,
+        created=len(outcome.created),
+        skipped=len(outcome.skipped_names),
+        skipped_names=outcome.skipped_names,
+        created_products=[
+            CreatedProductMapping(name=name, product_id=pid) for name, pid in outcome.created
+        ],
+        crawl_enqueued=crawl_enqueued,
     )
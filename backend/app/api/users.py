@@ -1,5 +1,6 @@
 import bcrypt
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,6 +14,11 @@ from app.schemas.user import (
     UserResponse,
     UserUpdate,
 )
+from app.services.deletion_service import (
+    deletion_job_response,
+    request_user_deletion,
+    schedule_deletion,
+)
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -74,6 +80,7 @@ async def update_user(user_id: int, data: UserUpdate, db: AsyncSession = Depends
         user.naver_store_name = data.naver_store_name
     if data.crawl_interval_min is not None:
         user.crawl_interval_min = data.crawl_interval_min
+        user.schedule_next_crawl()
     if data.remove_password:
         user.password_hash = None
     elif data.password is not None:
@@ -86,11 +93,21 @@ async def update_user(user_id: int, data: UserUpdate, db: AsyncSession = Depends
 
 
 @router.delete("/{user_id}", status_code=204)
-async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)):
+async def delete_user(
+    user_id: int, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db),
+):
+    """사업체 삭제 — 즉시 삭제 시 204, 백그라운드 삭제 시 202 + 작업 핸들."""
     user = await db.get(User, user_id)
     if not user:
         raise HTTPException(404, "사업체를 찾을 수 없습니다.")
-    await db.delete(user)
+    job = await request_user_deletion(db, user_id)
+    if job.status == "pending":
+        schedule_deletion(job, background_tasks)
+        return JSONResponse(
+            deletion_job_response(job).model_dump(mode="json"),
+            status_code=202,
+        )
+    return Response(status_code=204)
 
 
 @router.post("/{user_id}/telegram-test")
@@ -20,6 +20,8 @@ class Settings(BaseSettings):
     VAPID_PUBLIC_KEY: str = ""
     VAPID_PRIVATE_KEY: str = ""
     VAPID_CLAIM_EMAIL: str = "admin@asimaster.com"
+    PUSH_MAX_WORKERS: int = 8
+    PUSH_TIMEOUT: int = 10
 
     SENTRY_DSN: str = ""
     SENTRY_TRACES_SAMPLE_RATE: float = 0.1
@@ -28,24 +30,57 @@ class Settings(BaseSettings):
     CRAWL_MAX_RETRIES: int = 3
     CRAWL_REQUEST_DELAY_MIN: int = 2
     CRAWL_REQUEST_DELAY_MAX: int = 5
-    CRAWL_CONCURRENCY: int = 5
+    CRAWL_CONCURRENCY: int = 5  # 사업체 1곳의 키워드 동시 요청 수
+    CRAWL_GLOBAL_CONCURRENCY: int = 8  # 모든 사업체 합계 네이버 API 동시 요청 수 (사업체 간 라운드로빈 배정)
+    CRAWL_GLOBAL_RATE_PER_SEC: float = 8.0  # 모든 사업체 합계 초당 API 요청 수 (0이면 제한 없음)
+    CRAWL_DB_CONCURRENCY: int = 4  # 사업체 크롤링의 DB 단계(조회/저장)를 동시에 실행하는 수 (API 호출 대기 중에는 연결 미사용)
+    CRAWL_DRAIN_TIMEOUT_SEC: int = 20  # 종료 시 진행 중 크롤링이 받은 결과를 저장하도록 기다리는 시간
+    CRAWL_DRAIN_COMMIT_CHUNK: int = 50  # 종료 중 저장 커밋 단위 (키워드 수) — 기한 초과 취소 시 잃는 최대 분량
     CRAWL_SHIPPING_CONCURRENCY: int = 3
     CRAWL_SHIPPING_TIMEOUT: int = 8
     CRAWL_API_TIMEOUT: int = 10
+    # 관련성 판정 시 전각/반각·하이픈/공백 차이 무시 ("ＡＢＣ－１２３" = "abc 123")
+    RELEVANCE_NORMALIZE: bool = True
+    RELEVANCE_RECOMPUTE_BATCH_SIZE: int = 5000
+
+    MARGIN_SWEEP_MAX_POINTS: int = 5000  # 마진 곡선 1회 계산 최대 가격 구간 수
+    REPRICING_MIN_MARGIN_PERCENT: float = 5.0  # 가격 추천 시 지켜야 할 최소 마진율
+    REPRICING_UNDERCUT_WON: int = 0  # 최저가보다 낮출 금액 (0이면 동일가로 맞춤)
 
     SCHEDULER_CHECK_INTERVAL_MIN: int = 10
+    SCHEDULER_LEASE_TTL_SEC: int = 15  # 리더 임대 유효 시간 (리더 장애 시 최대 이 시간 안에 다른 프로세스가 인수)
+    SCHEDULER_LEASE_HEARTBEAT_SEC: int = 5  # 임대 연장/인수 시도 주기 (TTL보다 충분히 짧게)
     DATA_RETENTION_DAYS: int = 30
     CLEANUP_BATCH_SIZE: int = 10000
+    EXPORT_CHUNK_SIZE: int = 1000  # CSV/NDJSON 내보내기 시 한 번에 읽고 전송하는 행 수
+    BULK_DELETE_INLINE_MAX_ROWS: int = 20000  # 초과 시 순위 이력을 백그라운드 청크 삭제
+    BACKGROUND_JOB_STALE_SEC: int = 300  # 백그라운드 작업(삭제 등) 진행 기록이 이 시간 넘게 멈추면 다른 프로세스가 재개
+
+    CRAWL_STATS_FLUSH_SEC: int = 10  # 크롤링 통계 카운터 버퍼 DB 반영 주기 (워커별)
 
     ALERT_DEDUP_HOURS: int = 24
+    ALERT_DISPATCH_INTERVAL_SEC: int = 15
+    ALERT_DISPATCH_BATCH_SIZE: int = 200
+    ALERT_DISPATCH_CONCURRENCY: int = 5
+    ALERT_DELIVERY_MAX_ATTEMPTS: int = 5
+    ALERT_DELIVERY_BACKOFF_SEC: int = 30
     SPARKLINE_DAYS: int = 7
     MAX_KEYWORDS_PER_PRODUCT: int = 5
+    PRODUCT_SEARCH_MAX_RESULTS: int = 1000
+    KEYWORD_DICT_REFRESH_SEC: int = 300
+    KEYWORD_SUGGEST_WORKERS: int = 2  # 일괄 추천 프로세스 풀 크기 (0이면 스레드 실행)
+    KEYWORD_SUGGEST_CHUNK_SIZE: int = 100
+    STORE_IMPORT_CONCURRENCY: int = 4  # 스토어 상품 수집 시 쇼핑 API 동시 요청 수
+    STORE_PRODUCTS_CACHE_TTL_SEC: int = 600
 
     # 인증: 빈 문자열이면 인증 비활성화 (하위호환)
     API_KEY: str = ""
 
     # 텔레그램: 빈 문자열이면 텔레그램 알림 비활성화 (하위호환)
     TELEGRAM_BOT_TOKEN: str = ""
+    TELEGRAM_DIGEST_ENABLED: bool = True  # 발송 배치(선점 1회분) 안의 유저별 알림을 메시지 1개로 묶음
+    TELEGRAM_GLOBAL_RATE_PER_SEC: float = 25
+    TELEGRAM_CHAT_RATE_PER_SEC: float = 1
 
     LOG_FORMAT: str = "json"  # "json" | "text"
     LOG_LEVEL: str = "INFO"
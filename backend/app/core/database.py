@@ -1,3 +1,6 @@
+from datetime import timedelta
+
+from sqlalchemy import DateTime, func
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -18,3 +21,29 @@ async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit
 
 class Base(DeclarativeBase):
     pass
+
+
+def upsert_insert(db: AsyncSession, model):
+    """ON CONFLICT 지원 INSERT (PostgreSQL 운영 / SQLite 테스트 공용)."""
+    dialect = db.bind.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"지원하지 않는 DB: {dialect}")
+    return insert(model)
+
+
+def db_utcnow(db: AsyncSession, offset_sec: int = 0):
+    """DB 서버 시계 기준 현재 UTC 시각 SQL 식 (+offset_sec초) — 프로세스 간 시각 비교용.
+
+    애플리케이션 utcnow()와 같은 tz 없는 UTC 값이라 기존 컬럼과 그대로 비교/저장된다.
+    """
+    dialect = db.bind.dialect.name
+    if dialect == "postgresql":
+        now = func.timezone("utc", func.now(), type_=DateTime)
+        return now + timedelta(seconds=offset_sec) if offset_sec else now
+    elif dialect == "sqlite":
+        return func.strftime("%Y-%m-%d %H:%M:%f", "now", f"{offset_sec:+d} seconds", type_=DateTime)
+    raise NotImplementedError(f"지원하지 않는 DB: {dialect}")
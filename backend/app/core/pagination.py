@@ -0,0 +1,44 @@
+"""(created_at, id) 키셋 페이지네이션 — 최신순 목록의 깊은 페이지도 인덱스 범위 스캔 한 번.
+
+커서는 마지막 행의 (created_at, id)를 URL-safe base64로 감싼 불투명 문자열.
+다음 페이지 커서는 응답 헤더 X-Next-Cursor로 전달한다 (본문은 기존 목록 형식 유지).
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from sqlalchemy import Select, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """잘못된 커서는 ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("잘못된 커서입니다.") from e
+
+
+def keyset_page(query: Select, created_col, id_col, cursor: str | None, size: int) -> Select:
+    """최신순 정렬 + 커서 이후 행만 (size+1개를 읽어 다음 페이지 존재 여부 판단)."""
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(created_col, id_col) < tuple_(created_at, row_id))
+    return query.order_by(created_col.desc(), id_col.desc()).limit(size + 1)
+
+
+def split_page(rows: list, size: int) -> tuple[list, str | None]:
+    """keyset_page 결과를 (현재 페이지, 다음 커서)로."""
+    if len(rows) <= size:
+        return rows, None
+    last = rows[size - 1]
+    return rows[:size], encode_cursor(last.created_at, last.id)
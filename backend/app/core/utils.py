@@ -1,6 +1,42 @@
+import re
+import unicodedata
 from datetime import datetime, timezone
 
+# 검색 정규화 시 제거할 구분자 (공백, 하이픈류, 밑줄, 점, 슬래시, 괄호 등)
+_SEARCH_SEPARATORS = re.compile(r"[\s\-‐‑‒–—―_./\\·•,()\[\]{}]+")
+
 
 def utcnow() -> datetime:
     """timezone-aware UTC now를 naive datetime으로 변환 (DB 호환)."""
     return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def normalize_search_text(text: str | None) -> str:
+    """검색용 정규화: NFKD(전각→반각, 한글 음절→자모 분해) + 소문자 + 구분자/띄어쓰기 제거.
+
+    - 한글 상품명은 띄어쓰기가 제각각이므로("무선 청소기" / "무선청소기") 공백까지 제거
+    - 자모 단위로 분해해 두면 오타 1글자가 트라이그램 1~2개에만 영향을 주고,
+      입력 중인 미완성 음절("청ㅅ")도 부분 일치로 잡힌다
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKD", text).casefold()
+    return _SEARCH_SEPARATORS.sub("", text)
+
+
+def normalize_match_text(text: str | None) -> str:
+    """포함 여부 판정용 정규화: NFKC(전각→반각, 음절 유지) + 소문자 + 구분자 연속은 공백 1개로.
+
+    "ＡＢＣ－１２３" / "abc  123" / "ABC_123" → "abc 123". 단어 경계(공백)는 남겨 두어
+    "MAX 1"이 "x1"처럼 단어를 넘어 이어 붙는 오탐이 없고, 자모로 분해하지 않으므로
+    "가"가 "강" 안에서 일치하는 식의 음절 경계 오탐도 없다.
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _SEARCH_SEPARATORS.sub(" ", text).strip()
+
+
+def build_product_search_text(name: str | None, model_code: str | None, brand: str | None) -> str:
+    """products.search_text 값 (필드별 정규화 후 공백으로 연결)."""
+    return " ".join(p for p in (normalize_search_text(v) for v in (name, model_code, brand)) if p)
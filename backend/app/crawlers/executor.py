@@ -0,0 +1,149 @@
+"""크롤링 실행기 — 여러 사업체를 동시에 크롤링할 때 전역 API 예산을 사업체 간 공정 분배.
+
+- 네이버 API 호출 슬롯 CRAWL_GLOBAL_CONCURRENCY개를 대기 중인 사업체 간 라운드로빈으로 배정
+  (사업체마다 차례로 1건씩) → 키워드 2,000개 사업체가 대기열을 채워도 작은 사업체의 요청은
+  최대 "대기 사업체 수"건 뒤에 실행된다
+- 슬롯을 받은 요청은 CRAWL_GLOBAL_RATE_PER_SEC 간격으로 출발 (0이면 속도 제한 없음)
+- 사업체별 대기 시간(슬롯 + 속도 제한)을 크롤링 1회 단위로 집계해 결과/상태 조회에 보고
+- 프로세스 단위 예산 — 스케줄 크롤링은 리더 프로세스 1개에서만 실행된다
+- 종료 시 drain(): 대기 중인 요청을 ExecutorDrainingError로 돌려보내고 새 요청도 거절
+  (이미 실행 중인 호출은 끝까지 진행)
+"""
+
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+
+class ExecutorDrainingError(Exception):
+    """종료 중이라 API 호출 슬롯을 배정하지 않음."""
+    pass
+
+
+@dataclass(slots=True)
+class QueueWaitStats:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, wait_ms: float) -> None:
+        self.count += 1
+        self.total_ms += wait_ms
+        if wait_ms > self.max_ms:
+            self.max_ms = wait_ms
+
+    def merge(self, other: "QueueWaitStats") -> None:
+        self.count += other.count
+        self.total_ms += other.total_ms
+        if other.max_ms > self.max_ms:
+            self.max_ms = other.max_ms
+
+    def as_dict(self) -> dict:
+        return {
+            "queue_wait_avg_ms": round(self.total_ms / self.count) if self.count else None,
+            "queue_wait_max_ms": round(self.max_ms) if self.count else None,
+        }
+
+
+class FairShareExecutor:
+    def __init__(self, concurrency: int | None = None, rate_per_sec: float | None = None):
+        # None이면 설정값 사용 (실행 중 설정 변경 반영)
+        self._concurrency = concurrency
+        self._rate_per_sec = rate_per_sec
+        self._in_use = 0
+        # 사업체별 대기 Future — 맨 앞 사업체가 다음 차례, 배정 후 맨 뒤로 이동
+        self._waiters: OrderedDict[int, deque[asyncio.Future]] = OrderedDict()
+        self._next_start = 0.0
+        self._draining = False
+        # 사업체별 마지막 크롤링의 대기 시간 집계
+        self.last_wait: dict[int, QueueWaitStats] = {}
+
+    @property
+    def concurrency(self) -> int:
+        return max(1, self._concurrency or settings.CRAWL_GLOBAL_CONCURRENCY)
+
+    @property
+    def rate_per_sec(self) -> float:
+        return self._rate_per_sec if self._rate_per_sec is not None else settings.CRAWL_GLOBAL_RATE_PER_SEC
+
+    def waiting(self, user_id: int) -> int:
+        queue = self._waiters.get(user_id)
+        return sum(1 for f in queue if not f.done()) if queue else 0
+
+    def snapshot(self) -> dict:
+        return {
+            "in_flight": self._in_use,
+            "waiting": sum(self.waiting(uid) for uid in self._waiters),
+            "waiting_users": sum(1 for uid in self._waiters if self.waiting(uid)),
+        }
+
+    @property
+    def draining(self) -> bool:
+        return self._draining
+
+    def drain(self) -> None:
+        """새 슬롯 배정 중단 — 대기 중인 요청은 즉시 ExecutorDrainingError."""
+        self._draining = True
+        for queue in self._waiters.values():
+            for future in queue:
+                if not future.done():
+                    future.set_exception(ExecutorDrainingError())
+        self._waiters.clear()
+
+    def _grant(self) -> None:
+        while self._in_use < self.concurrency and self._waiters:
+            user_id, queue = next(iter(self._waiters.items()))
+            future = queue.popleft()
+            if queue:
+                self._waiters.move_to_end(user_id)
+            else:
+                del self._waiters[user_id]
+            if future.done():  # 대기 중 취소됨
+                continue
+            self._in_use += 1
+            future.set_result(None)
+
+    def _release(self) -> None:
+        self._in_use -= 1
+        self._grant()
+
+    async def _pace(self, loop: asyncio.AbstractEventLoop) -> None:
+        rate = self.rate_per_sec
+        if rate <= 0:
+            return
+        now = loop.time()
+        start = max(now, self._next_start)
+        self._next_start = start + 1 / rate
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    @asynccontextmanager
+    async def slot(self, user_id: int, stats: QueueWaitStats | None = None):
+        """API 호출 1건 실행 권한 (사업체 간 라운드로빈 + 전역 속도 제한)."""
+        if self._draining:
+            raise ExecutorDrainingError()
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        future = loop.create_future()
+        self._waiters.setdefault(user_id, deque()).append(future)
+        self._grant()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 배정 직후 취소되면 슬롯 반환 (drain으로 거절된 요청은 슬롯 없음)
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self._release()
+            raise
+        try:
+            await self._pace(loop)
+            if stats is not None:
+                stats.add((loop.time() - queued_at) * 1000)
+            yield
+        finally:
+            self._release()
+
+
+crawl_executor = FairShareExecutor()
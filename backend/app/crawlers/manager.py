@@ -2,12 +2,18 @@ import asyncio
 import logging
 import random
 import time
-from sqlalchemy import select
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.crawlers.base import KeywordCrawlResult, RankingItem
+from app.crawlers.executor import ExecutorDrainingError, QueueWaitStats, crawl_executor
 from app.crawlers.naver import NaverCrawler
+from app.models.crawl_checkpoint import CrawlCheckpoint
 from app.models.crawl_log import CrawlLog
 from app.models.excluded_product import ExcludedProduct
 from app.models.included_override import IncludedOverride
@@ -17,49 +23,67 @@ from app.models.search_keyword import SearchKeyword
 from app.models.shipping_override import ShippingOverride
 from app.models.user import User
 from app.core.utils import utcnow
-from app.services.alert_service import check_and_create_alerts
+from app.services.alert_service import check_and_create_alerts, check_and_create_alerts_for_user
+from app.services.category_service import count_category_paths, record_category_paths
+from app.services.crawl_stats_service import CrawlStatCounts, buffer_crawl_stats, count_crawl_result
+from app.services.keyword_engine.dictionary import count_dictionary_terms, record_dictionary_terms
+from app.services.relevance import RelevanceMatcher, decide_relevance
+from app.services.relevance_service import recheck_crawled_rows
 
 logger = logging.getLogger(__name__)
 
 crawler = NaverCrawler()
 
 
+async def _record_ingest_aggregates(db: AsyncSession, items: list[RankingItem]) -> None:
+    """적재된 rankings로 카테고리 경로 건수 + 키워드 사전 증분 갱신."""
+    await record_category_paths(db, count_category_paths(items))
+    await record_dictionary_terms(db, count_dictionary_terms(items))
+
+
+async def _max_ranking_id(db: AsyncSession) -> int:
+    """이번 크롤링 적재 전 순위 이력 마지막 id (recheck_crawled_rows 기준점)."""
+    return await db.scalar(select(func.max(KeywordRanking.id))) or 0
+
+
+def _finish_crawl_run(user: User, run_id: str, succeeded: bool) -> None:
+    """크롤링 완료 기록 — 스케줄러는 next_crawl_due_at 범위 조회만 한다.
+
+    성공 키워드가 없으면 마지막 크롤링 시각을 유지해 다음 체크에 다시 시도한다.
+    """
+    now = utcnow()
+    user.last_crawl_run_id = run_id
+    if succeeded:
+        user.last_crawled_at = now
+    user.schedule_next_crawl(now)
+
+
 class CrawlAlreadyRunningError(Exception):
     """크롤링이 이미 진행 중일 때 발생."""
     pass
 
 
-def _check_relevance(item: RankingItem, product: Product | None) -> tuple[bool, str | None]:
+class CrawlDrainingError(Exception):
+    """종료(drain) 중이라 새 크롤링을 시작하지 않을 때 발생."""
+    pass
+
+
+def _check_relevance(
+    item: RankingItem,
+    product: Product | None,
+    matcher: RelevanceMatcher | None = None,
+) -> tuple[bool, str | None]:
     """모델코드 + 규격 키워드 + 가격 범위 기반 관련성 판별.
 
+    matcher: 크롤링 시작 시 상품별로 컴파일해 둔 매처 (없으면 여기서 생성)
     Returns: (is_relevant, reason)
         reason은 제외 사유. relevant이면 None.
     """
     if not product:
         return True, None
-
-    # 가격 범위 필터 (배송비 포함 총액 기준)
-    total_price = item.price + item.shipping_fee
-    if product.price_filter_min_pct is not None and product.selling_price > 0:
-        min_price = product.selling_price * product.price_filter_min_pct / 100
-        if total_price < min_price:
-            return False, "price_filter_min"
-    if product.price_filter_max_pct is not None and product.selling_price > 0:
-        max_price = product.selling_price * product.price_filter_max_pct / 100
-        if total_price > max_price:
-            return False, "price_filter_max"
-
-    # 모델코드 + 규격 키워드 필터
-    if not product.model_code:
-        return True, None
-    title_lower = item.product_name.lower()
-    if product.model_code.lower() not in title_lower:
-        return False, "model_code"
-    if product.spec_keywords:
-        for spec in product.spec_keywords:
-            if spec.lower() not in title_lower:
-                return False, "spec_keywords"
-    return True, None
+    matcher = matcher or RelevanceMatcher.for_product(product)
+    # 가격 범위 필터는 배송비 포함 총액 기준
+    return matcher.check(item.product_name, item.price + item.shipping_fee)
 
 
 class CrawlManager:
@@ -67,6 +91,47 @@ class CrawlManager:
     def __init__(self):
         self._user_locks: dict[int, asyncio.Lock] = {}
         self._product_locks: dict[int, asyncio.Lock] = {}
+        # 종료 시 drain() 대상 — 크롤링을 실행 중인 태스크 (호출자의 커밋까지 포함)
+        self._runs: set[asyncio.Task] = set()
+        self.draining = False
+        self._db_slots: asyncio.Semaphore | None = None
+
+    def _start_run(self) -> None:
+        if self.draining:
+            raise CrawlDrainingError("서버 종료 중이라 새 크롤링을 시작하지 않습니다.")
+        task = asyncio.current_task()
+        if task is not None and task not in self._runs:
+            self._runs.add(task)
+            task.add_done_callback(self._runs.discard)
+
+    async def drain(self, timeout: float) -> bool:
+        """새 크롤링 거절 + 진행 중 크롤링이 받은 결과를 저장할 때까지 최대 timeout초 대기.
+
+        아직 API 호출을 시작하지 않은 키워드는 건너뛰고(사업체 크롤링은 체크포인트로 남김),
+        기한을 넘긴 크롤링은 취소한다 (트랜잭션 롤백). 사업체 크롤링은 종료 중 저장분을
+        CRAWL_DRAIN_COMMIT_CHUNK개 단위로 커밋하고 남은 키워드를 체크포인트로 남기므로
+        취소돼도 진행 중이던 청크만 다음 프로세스가 다시 수행한다.
+        Returns: 기한 내 모두 끝났는지
+        """
+        self.draining = True
+        crawl_executor.drain()
+        current = asyncio.current_task()
+        runs = {t for t in self._runs if not t.done() and t is not current}
+        if not runs:
+            return True
+        logger.info(f"진행 중 크롤링 {len(runs)}건 저장 대기 (최대 {timeout}초)")
+        _, pending = await asyncio.wait(runs, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(f"종료 기한 초과로 크롤링 {len(pending)}건 취소")
+        return not pending
+
+    def _db_phase(self) -> asyncio.Semaphore:
+        """사업체 크롤링의 DB 단계 동시 실행 수 제한 (설정값으로 처음 사용할 때 생성)."""
+        if self._db_slots is None:
+            self._db_slots = asyncio.Semaphore(max(1, settings.CRAWL_DB_CONCURRENCY))
+        return self._db_slots
 
     def _get_user_lock(self, user_id: int) -> asyncio.Lock:
         return self._user_locks.setdefault(user_id, asyncio.Lock())
@@ -88,12 +153,23 @@ class CrawlManager:
         lock = self._product_locks.get(product_id)
         return lock.locked() if lock else False
 
-    async def _fetch_keyword(self, keyword_str: str, sort_type: str = "sim") -> KeywordCrawlResult:
-        """네이버 API 호출만 수행 (DB 접근 없음, 병렬 안전)."""
+    async def _fetch_keyword(
+        self,
+        keyword_str: str,
+        sort_type: str = "sim",
+        user_id: int = 0,
+        wait_stats: QueueWaitStats | None = None,
+    ) -> KeywordCrawlResult:
+        """네이버 API 호출만 수행 (DB 접근 없음, 병렬 안전).
+
+        호출마다 전역 실행기 슬롯을 사업체 단위로 받는다 (재시도 대기 중에는 슬롯 반환).
+        종료(drain) 중이면 ExecutorDrainingError.
+        """
         max_retries = settings.CRAWL_MAX_RETRIES
         result = None
         for attempt in range(1, max_retries + 1):
-            result = await crawler.search_keyword(keyword_str, sort_type=sort_type)
+            async with crawl_executor.slot(user_id, wait_stats):
+                result = await crawler.search_keyword(keyword_str, sort_type=sort_type)
             if result.success:
                 break
             if attempt < max_retries:
@@ -120,15 +196,34 @@ class CrawlManager:
         my_product_ids: set[str] | None = None,
         included_override_ids: set[str] | None = None,
         shipping_override_map: dict[str, int] | None = None,
+        ingested_items: list[RankingItem] | None = None,
+        relevance: RelevanceMatcher | None = None,
+        crawl_stats: CrawlStatCounts | None = None,
     ) -> None:
-        """크롤링 결과를 DB에 저장 (순차 호출)."""
+        """크롤링 결과를 DB에 저장 (순차 호출).
+
+        ingested_items를 넘기면 카테고리/사전 집계용 항목을 누적만 하고
+        호출자가 크롤링 마지막에 한 번에 반영한다. crawl_stats(통계 카운터)도 같은 방식으로
+        호출자가 프로세스 버퍼에 넘기고, 없으면 이 결과 1건을 바로 버퍼에 누적한다.
+        relevance: 상품별 컴파일된 관련성 매처 (크롤링당 1회 생성해 재사용)
+        """
+        if product is not None and relevance is None:
+            relevance = RelevanceMatcher.for_product(product)
+        user_id = product.user_id if product is not None else None
         log = CrawlLog(
             keyword_id=keyword.id,
+            user_id=user_id,
             status="success" if result.success else "failed",
             error_message=result.error,
             duration_ms=duration_ms,
         )
         db.add(log)
+        if crawl_stats is not None:
+            count_crawl_result(crawl_stats, user_id, result.success, duration_ms, utcnow())
+        else:
+            stats: CrawlStatCounts = {}
+            count_crawl_result(stats, user_id, result.success, duration_ms, utcnow())
+            buffer_crawl_stats(stats)
 
         if result.success and result.items:
             for item in result.items:
@@ -137,37 +232,13 @@ class CrawlManager:
                     and item.mall_name.strip().lower() == naver_store_name.strip().lower()
                 )
 
-                # is_relevant 판정 우선순위:
-                # 1) 수동 블랙리스트 → False (최우선)
-                # 2) 내 상품 → False
-                # 3) 수동 포함 예외(included_override) → True (자동 필터 우회)
-                # 4) 자동 필터(_check_relevance) → True/False
-                is_blacklisted = (
-                    excluded_ids and item.naver_product_id in excluded_ids
-                )
-                is_my_product = (
-                    my_product_ids
-                    and item.naver_product_id
-                    and item.naver_product_id in my_product_ids
-                )
-                is_override = (
-                    included_override_ids
-                    and item.naver_product_id
-                    and item.naver_product_id in included_override_ids
+                # is_relevant 판정: 블랙리스트 → 내 상품 → 수동 포함 예외 → 자동 필터
+                # (가격 범위 필터는 배송비 포함 총액 기준)
+                is_relevant, relevance_reason = decide_relevance(
+                    item.naver_product_id, item.product_name, item.price + item.shipping_fee,
+                    relevance, excluded_ids, my_product_ids, included_override_ids,
                 )
 
-                if is_blacklisted:
-                    is_relevant = False
-                    relevance_reason = "manual_blacklist"
-                elif is_my_product:
-                    is_relevant = False
-                    relevance_reason = "my_product"
-                elif is_override:
-                    is_relevant = True
-                    relevance_reason = "included_override"
-                else:
-                    is_relevant, relevance_reason = _check_relevance(item, product)
-
                 # 내 상품의 최신 판매가 자동 갱신
                 # is_my_product는 유저의 모든 등록 상품을 의미하므로,
                 # 현재 크롤링 중인 상품 자체인지 별도로 체크해야 함
@@ -220,6 +291,11 @@ class CrawlManager:
                 )
                 db.add(ranking)
 
+            if ingested_items is not None:
+                ingested_items.extend(result.items)
+            else:
+                await _record_ingest_aggregates(db, result.items)
+
             keyword.last_crawled_at = utcnow()
             keyword.crawl_status = "success"
         else:
@@ -229,6 +305,7 @@ class CrawlManager:
 
     async def crawl_product(self, db: AsyncSession, product_id: int) -> list[KeywordCrawlResult]:
         """단일 상품 크롤링 (API 수동 호출용). 키워드 병렬 처리."""
+        self._start_run()
         lock = self._get_product_lock(product_id)
         if lock.locked():
             raise CrawlAlreadyRunningError(f"상품 {product_id} 크롤링이 이미 진행 중입니다.")
@@ -289,26 +366,44 @@ class CrawlManager:
         )
         my_product_ids = {pid for pid in all_products_result.scalars().all() if pid}
 
-        # 병렬 API 호출
+        # 병렬 API 호출 (전역 실행기 대기 시간은 소요 시간에서 제외)
         sem = asyncio.Semaphore(settings.CRAWL_CONCURRENCY)
+        run_waits = QueueWaitStats()
 
         async def _fetch_one(kw: SearchKeyword):
             async with sem:
+                if self.draining:
+                    return kw, None, 0
                 delay = random.uniform(
                     settings.CRAWL_REQUEST_DELAY_MIN,
                     settings.CRAWL_REQUEST_DELAY_MAX,
                 )
                 await asyncio.sleep(delay)
+                waits = QueueWaitStats()
                 start = time.time()
-                r = await self._fetch_keyword(kw.keyword, sort_type=kw.sort_type or "sim")
-                ms = int((time.time() - start) * 1000)
+                try:
+                    r = await self._fetch_keyword(
+                        kw.keyword, sort_type=kw.sort_type or "sim",
+                        user_id=product.user_id, wait_stats=waits,
+                    )
+                except ExecutorDrainingError:
+                    r = None  # 종료 중 — 호출하지 않은 키워드는 저장하지 않음
+                ms = int((time.time() - start) * 1000 - waits.total_ms)
+                run_waits.merge(waits)
                 return kw, r, ms
 
         fetch_results = await asyncio.gather(*[_fetch_one(kw) for kw in keywords])
+        crawl_executor.last_wait[product.user_id] = run_waits
 
         # 순차 DB 기록
         results = []
+        ingested_items: list[RankingItem] = []
+        crawl_stats: CrawlStatCounts = {}
+        relevance = RelevanceMatcher.for_product(product)
+        since_id = await _max_ranking_id(db)
         for kw, crawl_result, duration_ms in fetch_results:
+            if crawl_result is None:
+                continue
             try:
                 await self._save_keyword_result(
                     db, kw, crawl_result, naver_store_name, duration_ms,
@@ -316,10 +411,19 @@ class CrawlManager:
                     my_product_ids=my_product_ids,
                     included_override_ids=included_override_ids,
                     shipping_override_map=shipping_override_map,
+                    ingested_items=ingested_items,
+                    relevance=relevance,
+                    crawl_stats=crawl_stats,
                 )
             except Exception as e:
                 logger.error(f"키워드 '{kw.keyword}' 저장 실패: {e}")
             results.append(crawl_result)
+        await _record_ingest_aggregates(db, ingested_items)
+        buffer_crawl_stats(crawl_stats)
+        # 크롤링 중 필터가 바뀌었으면 이번 적재분을 현재 필터로 재판정
+        await recheck_crawled_rows(db, {product.id: relevance}, since_id)
+        if user:
+            _finish_crawl_run(user, uuid.uuid4().hex, any(r.success for r in results))
 
         # 알림 체크
         if results:
@@ -327,139 +431,258 @@ class CrawlManager:
 
         return results
 
-    async def crawl_user_all(self, db: AsyncSession, user_id: int) -> dict:
-        """유저 전체 크롤링. 키워드 중복 제거 + 병렬 처리."""
+    async def crawl_user_all(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        before_start: Callable[[AsyncSession], Awaitable[bool]] | None = None,
+    ) -> dict:
+        """유저 전체 크롤링. 키워드 중복 제거 + 병렬 처리 (조회/저장 트랜잭션을 각각 커밋).
+
+        before_start: DB 단계 슬롯을 얻은 직후 호출 — False면 크롤링하지 않고 skipped 반환
+        (스케줄러의 리더 확인/사업체 선점)
+        """
+        self._start_run()
         lock = self._get_user_lock(user_id)
         if lock.locked():
             raise CrawlAlreadyRunningError(f"유저 {user_id} 크롤링이 이미 진행 중입니다.")
         try:
             async with lock:
-                return await self._crawl_user_all_impl(db, user_id)
+                return await self._crawl_user_all_impl(db, user_id, before_start)
         finally:
             self._cleanup_lock(self._user_locks, user_id)
 
-    async def _crawl_user_all_impl(self, db: AsyncSession, user_id: int) -> dict:
-        crawler.clear_shipping_cache()
-        user = await db.get(User, user_id)
-        if not user:
-            return {"total": 0, "success": 0, "failed": 0}
-        naver_store_name = user.naver_store_name
-
-        # 1. 전체 활성 키워드 수집
-        kw_result = await db.execute(
-            select(SearchKeyword)
-            .join(Product, SearchKeyword.product_id == Product.id)
-            .where(
-                Product.user_id == user_id,
-                Product.is_active == True,
-                SearchKeyword.is_active == True,
+    async def _crawl_user_all_impl(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        before_start: Callable[[AsyncSession], Awaitable[bool]] | None = None,
+    ) -> dict:
+        # DB 단계(조회/저장)만 CRAWL_DB_CONCURRENCY개로 제한 — 사업체 수와 무관하게 연결 사용량 고정,
+        # API 호출 대기 중에는 트랜잭션을 닫아 연결을 반납한다 (API 동시성은 crawl_executor가 제한)
+        async with self._db_phase():
+            if before_start is not None and not await before_start(db):
+                return {"total": 0, "success": 0, "failed": 0, "skipped": True}
+            crawler.clear_shipping_cache()
+            user = await db.get(User, user_id)
+            if not user:
+                return {"total": 0, "success": 0, "failed": 0}
+            naver_store_name = user.naver_store_name
+
+            # 1. 전체 활성 키워드 수집
+            kw_result = await db.execute(
+                select(SearchKeyword)
+                .join(Product, SearchKeyword.product_id == Product.id)
+                .where(
+                    Product.user_id == user_id,
+                    Product.is_active == True,
+                    SearchKeyword.is_active == True,
+                )
             )
-        )
-        all_keywords = kw_result.scalars().all()
-        if not all_keywords:
-            return {"total": 0, "success": 0, "failed": 0}
-
-        # 상품별 블랙리스트 조회 (배치 쿼리)
-        product_ids = {kw.product_id for kw in all_keywords}
-        excluded_ids_by_product: dict[int, set[str]] = {pid: set() for pid in product_ids}
-        ex_result = await db.execute(
-            select(ExcludedProduct).where(ExcludedProduct.product_id.in_(product_ids))
-        )
-        for ep in ex_result.scalars().all():
-            excluded_ids_by_product[ep.product_id].add(ep.naver_product_id)
-
-        # 상품별 수동 포함 예외 조회 (배치 쿼리)
-        included_ids_by_product: dict[int, set[str]] = {pid: set() for pid in product_ids}
-        inc_result = await db.execute(
-            select(IncludedOverride).where(IncludedOverride.product_id.in_(product_ids))
-        )
-        for io in inc_result.scalars().all():
-            included_ids_by_product[io.product_id].add(io.naver_product_id)
+            all_keywords = kw_result.scalars().all()
+            if not all_keywords:
+                return {"total": 0, "success": 0, "failed": 0}
+
+            # 상품별 블랙리스트 조회 (배치 쿼리)
+            product_ids = {kw.product_id for kw in all_keywords}
+            excluded_ids_by_product: dict[int, set[str]] = {pid: set() for pid in product_ids}
+            ex_result = await db.execute(
+                select(ExcludedProduct).where(ExcludedProduct.product_id.in_(product_ids))
+            )
+            for ep in ex_result.scalars().all():
+                excluded_ids_by_product[ep.product_id].add(ep.naver_product_id)
 
-        # 상품별 배송비 오버라이드 조회 (배치 쿼리)
-        shipping_override_by_product: dict[int, dict[str, int]] = {pid: {} for pid in product_ids}
-        ship_result = await db.execute(
-            select(ShippingOverride).where(ShippingOverride.product_id.in_(product_ids))
-        )
-        for so in ship_result.scalars().all():
-            shipping_override_by_product[so.product_id][so.naver_product_id] = so.shipping_fee
+            # 상품별 수동 포함 예외 조회 (배치 쿼리)
+            included_ids_by_product: dict[int, set[str]] = {pid: set() for pid in product_ids}
+            inc_result = await db.execute(
+                select(IncludedOverride).where(IncludedOverride.product_id.in_(product_ids))
+            )
+            for io in inc_result.scalars().all():
+                included_ids_by_product[io.product_id].add(io.naver_product_id)
 
-        # 상품 객체 캐시 (배치 쿼리)
-        prod_result = await db.execute(
-            select(Product).where(Product.id.in_(product_ids))
-        )
-        products_cache: dict[int, Product] = {p.id: p for p in prod_result.scalars().all()}
+            # 상품별 배송비 오버라이드 조회 (배치 쿼리)
+            shipping_override_by_product: dict[int, dict[str, int]] = {pid: {} for pid in product_ids}
+            ship_result = await db.execute(
+                select(ShippingOverride).where(ShippingOverride.product_id.in_(product_ids))
+            )
+            for so in ship_result.scalars().all():
+                shipping_override_by_product[so.product_id][so.naver_product_id] = so.shipping_fee
 
-        # 유저의 모든 등록 상품 naver_product_id 수집 (내 스토어 다른 제품 제외용)
-        all_products_result = await db.execute(
-            select(Product.naver_product_id).where(
-                Product.user_id == user_id,
-                Product.is_active == True,
-                Product.naver_product_id.isnot(None),
+            # 상품 객체 캐시 (배치 쿼리)
+            prod_result = await db.execute(
+                select(Product).where(Product.id.in_(product_ids))
             )
-        )
-        my_product_ids = {pid for pid in all_products_result.scalars().all() if pid}
+            products_cache: dict[int, Product] = {p.id: p for p in prod_result.scalars().all()}
+            # 상품별 관련성 매처 (공유 키워드의 모든 상품·항목 판정에 재사용)
+            relevance_by_product = {
+                pid: RelevanceMatcher.for_product(p) for pid, p in products_cache.items()
+            }
+
+            # 유저의 모든 등록 상품 naver_product_id 수집 (내 스토어 다른 제품 제외용)
+            all_products_result = await db.execute(
+                select(Product.naver_product_id).where(
+                    Product.user_id == user_id,
+                    Product.is_active == True,
+                    Product.naver_product_id.isnot(None),
+                )
+            )
+            my_product_ids = {pid for pid in all_products_result.scalars().all() if pid}
+
+            # 종료로 중단된 이전 크롤링이 있으면 남은 키워드만 같은 run으로 이어서 수행
+            # (주기가 지난 체크포인트는 버리고 전체 크롤링)
+            run_keywords = all_keywords
+            run_id = uuid.uuid4().hex
+            checkpoint = await db.get(CrawlCheckpoint, user_id)
+            if checkpoint is not None:
+                interval = user.crawl_interval_min or settings.CRAWL_DEFAULT_INTERVAL_MIN
+                if checkpoint.created_at >= utcnow() - timedelta(minutes=interval):
+                    pending_ids = set(checkpoint.pending_keyword_ids)
+                    run_keywords = [kw for kw in all_keywords if kw.id in pending_ids]
+                    run_id = checkpoint.run_id
+                    logger.info(f"크롤링 재개: user={user_id} run={run_id} 남은 키워드 {len(run_keywords)}개")
+                else:
+                    await db.delete(checkpoint)
+                    checkpoint = None
+            # 조회 트랜잭션 종료 → 키워드 호출 동안 DB 연결을 잡지 않음
+            await db.commit()
 
         # 2. 키워드 문자열+정렬유형 기준 중복 제거
         unique_map: dict[tuple[str, str], list[SearchKeyword]] = {}
-        for kw in all_keywords:
+        for kw in run_keywords:
             key = (kw.keyword.strip().lower(), kw.sort_type or "sim")
             unique_map.setdefault(key, []).append(kw)
 
         # 3. 유니크 키워드만 병렬 크롤링
+        # 사업체 내 동시성은 CRAWL_CONCURRENCY, 사업체 간 전역 예산은 crawl_executor가 공정 분배
         sem = asyncio.Semaphore(settings.CRAWL_CONCURRENCY)
+        run_waits = QueueWaitStats()
 
         async def _fetch_one(keyword_str: str, sort_type: str):
             async with sem:
+                if self.draining:
+                    return keyword_str, sort_type, None, 0
                 delay = random.uniform(
                     settings.CRAWL_REQUEST_DELAY_MIN,
                     settings.CRAWL_REQUEST_DELAY_MAX,
                 )
                 await asyncio.sleep(delay)
+                waits = QueueWaitStats()
                 start = time.time()
-                r = await self._fetch_keyword(keyword_str, sort_type=sort_type)
-                ms = int((time.time() - start) * 1000)
+                try:
+                    r = await self._fetch_keyword(
+                        keyword_str, sort_type=sort_type, user_id=user_id, wait_stats=waits,
+                    )
+                except ExecutorDrainingError:
+                    r = None  # 종료 중 — 체크포인트에 남겨 다음 크롤링이 이어서 수행
+                ms = int((time.time() - start) * 1000 - waits.total_ms)
+                run_waits.merge(waits)
                 return keyword_str, sort_type, r, ms
 
         fetch_results = await asyncio.gather(
             *[_fetch_one(kw_str, st) for (kw_str, st) in unique_map.keys()]
         )
+        crawl_executor.last_wait[user_id] = run_waits
+
+        async with self._db_phase():
+            # 4. 결과를 각 SearchKeyword에 순차적으로 DB 기록
+            total = 0
+            success = 0
+            failed = 0
+            ingested_items: list[RankingItem] = []
+            crawl_stats: CrawlStatCounts = {}
+            unfinished_ids: list[int] = []
+            since_id = await _max_ranking_id(db)
+
+            def _write_checkpoint(pending_ids: list[int]) -> None:
+                # 체크포인트 저장 후 즉시 예정 — 다음 프로세스의 첫 스케줄 체크에서 재개
+                nonlocal checkpoint
+                if checkpoint is None:
+                    checkpoint = CrawlCheckpoint(user_id=user_id, created_at=utcnow())
+                    db.add(checkpoint)
+                checkpoint.run_id = run_id
+                checkpoint.pending_keyword_ids = sorted(pending_ids)
+                user.last_crawl_run_id = run_id
+                user.next_crawl_due_at = utcnow()
+
+            async def _commit_drain_chunk(remaining) -> None:
+                # 종료 중: 지금까지 저장분을 커밋하고 아직 저장하지 않은 키워드를 체크포인트로 남김
+                # → 기한 초과로 취소돼도 잃는 것은 진행 중인 청크뿐
+                nonlocal ingested_items, crawl_stats
+                await _record_ingest_aggregates(db, ingested_items)
+                buffer_crawl_stats(crawl_stats)
+                ingested_items, crawl_stats = [], {}
+                await recheck_crawled_rows(db, relevance_by_product, since_id)
+                _write_checkpoint(unfinished_ids + [
+                    kw.id for kw_str, sort_type, _, _ in remaining for kw in unique_map[(kw_str, sort_type)]
+                ])
+                await db.commit()
+
+            drain_committed = False
+            chunk_saved = 0
+            for i, (kw_str, sort_type, crawl_result, duration_ms) in enumerate(fetch_results):
+                if self.draining and (
+                    not drain_committed or chunk_saved >= settings.CRAWL_DRAIN_COMMIT_CHUNK
+                ):
+                    await _commit_drain_chunk(fetch_results[i:])
+                    drain_committed = True
+                    chunk_saved = 0
+                if crawl_result is None:
+                    unfinished_ids.extend(kw.id for kw in unique_map[(kw_str, sort_type)])
+                    continue
+                for kw in unique_map[(kw_str, sort_type)]:
+                    product = products_cache.get(kw.product_id)
+                    excluded_ids = excluded_ids_by_product.get(kw.product_id, set())
+                    included_ids = included_ids_by_product.get(kw.product_id, set())
+                    shipping_map = shipping_override_by_product.get(kw.product_id, {})
+                    try:
+                        await self._save_keyword_result(
+                            db, kw, crawl_result, naver_store_name, duration_ms,
+                            product=product, excluded_ids=excluded_ids,
+                            my_product_ids=my_product_ids,
+                            included_override_ids=included_ids,
+                            shipping_override_map=shipping_map,
+                            ingested_items=ingested_items,
+                            relevance=relevance_by_product.get(kw.product_id),
+                            crawl_stats=crawl_stats,
+                        )
+                    except Exception as e:
+                        logger.error(f"키워드 '{kw.keyword}' 저장 실패: {e}")
+                    total += 1
+                    chunk_saved += 1
+                    if crawl_result.success:
+                        success += 1
+                    else:
+                        failed += 1
+
+            # 카테고리 경로/키워드 사전 1회 반영 (집계 행 잠금을 커밋 직전까지로 최소화)
+            # 통계 카운터는 프로세스 버퍼로 — 크롤링 트랜잭션 밖에서 주기적으로 반영
+            await _record_ingest_aggregates(db, ingested_items)
+            buffer_crawl_stats(crawl_stats)
+            # 크롤링 중 필터가 바뀐 상품은 이번 적재분을 현재 필터로 재판정
+            await recheck_crawled_rows(db, relevance_by_product, since_id)
+            if unfinished_ids:
+                _write_checkpoint(unfinished_ids)
+                logger.info(f"크롤링 중단 체크포인트: user={user_id} run={run_id} 남은 키워드 {len(unfinished_ids)}개")
+            else:
+                if checkpoint is not None:
+                    await db.delete(checkpoint)
+                _finish_crawl_run(user, run_id, success > 0)
+
+            # 5. 알림 체크 (유저 단위 일괄 평가)
+            keywords_by_product: dict[int, list[SearchKeyword]] = {}
+            for kw in all_keywords:
+                keywords_by_product.setdefault(kw.product_id, []).append(kw)
+            await check_and_create_alerts_for_user(
+                db, user_id, list(products_cache.values()), keywords_by_product, naver_store_name,
+            )
+            # 저장 트랜잭션 커밋까지 DB 단계에 포함 (연결 반납 후 슬롯 해제)
+            await db.commit()
 
-        # 4. 결과를 각 SearchKeyword에 순차적으로 DB 기록
-        total = 0
-        success = 0
-        failed = 0
-
-        for kw_str, sort_type, crawl_result, duration_ms in fetch_results:
-            for kw in unique_map[(kw_str, sort_type)]:
-                product = products_cache.get(kw.product_id)
-                excluded_ids = excluded_ids_by_product.get(kw.product_id, set())
-                included_ids = included_ids_by_product.get(kw.product_id, set())
-                shipping_map = shipping_override_by_product.get(kw.product_id, {})
-                try:
-                    await self._save_keyword_result(
-                        db, kw, crawl_result, naver_store_name, duration_ms,
-                        product=product, excluded_ids=excluded_ids,
-                        my_product_ids=my_product_ids,
-                        included_override_ids=included_ids,
-                        shipping_override_map=shipping_map,
-                    )
-                except Exception as e:
-                    logger.error(f"키워드 '{kw.keyword}' 저장 실패: {e}")
-                total += 1
-                if crawl_result.success:
-                    success += 1
-                else:
-                    failed += 1
-
-        # 5. 알림 체크 (상품별)
-        for pid in product_ids:
-            product = products_cache.get(pid)
-            product_keywords = [kw for kw in all_keywords if kw.product_id == pid]
-            if product and product_keywords:
-                await check_and_create_alerts(db, product, product_keywords, naver_store_name)
-
-        return {"total": total, "success": success, "failed": failed}
+        return {
+            "total": total, "success": success, "failed": failed, "run_id": run_id,
+            "pending": len(unfinished_ids),
+            **run_waits.as_dict(),
+        }
 
 
 shared_manager = CrawlManager()
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
@@ -13,6 +16,13 @@ logger = logging.getLogger(__name__)
 
 _client: httpx.AsyncClient | None = None
 
+# 스토어 slug → (만료 시각(monotonic), 상품 목록): 미리보기 → 등록 사이 재수집 방지
+_products_cache: dict[str, tuple[float, list[StoreProduct]]] = {}
+_PRODUCTS_CACHE_MAX = 100
+
+_PAGE_SIZE = 100
+_MAX_START = 901  # 쇼핑 API start 상한 (최대 1000개)
+
 
 def _get_client() -> httpx.AsyncClient:
     global _client
@@ -52,31 +62,12 @@ def suggest_keywords(
 ) -> list[str]:
     """상품명에서 검색 키워드 5개 자동 추출 (키워드 엔진 활용).
 
-    DB 세션 없이 호출되므로 db_brands/db_types=None으로 분류기 사용.
+    DB 세션 없이 호출되므로 내장 사전만 사용한다.
+    DB 사전을 쓰는 대량 추천은 keyword_engine.batch.suggest_keyword_lists 사용.
     """
-    from app.services.keyword_engine.classifier import classify_tokens
-    from app.services.keyword_engine.generator import generate_keywords
-
-    name = product_name.strip()
-
-    # 스토어명 제거
-    if store_name:
-        for variant in [store_name, store_name.replace(" ", "")]:
-            name = re.sub(re.escape(variant), "", name, flags=re.IGNORECASE).strip()
-
-    # 키워드 엔진으로 분류 + 생성
-    tokens = classify_tokens(name)
-    generated = generate_keywords(tokens, max_count=5)
-
-    result = [g.keyword for g in generated]
+    from app.services.keyword_engine.suggest import suggest
 
-    # 5개 미만이면 전체 상품명(클린)으로 보충
-    seen = {kw.lower() for kw in result}
-    clean = name.strip()
-    if len(result) < 5 and clean and clean.lower() not in seen:
-        result.append(clean)
-
-    return result[:5]
+    return suggest(product_name, store_name).keyword_list(5)
 
 
 async def _get_store_info(store_slug: str) -> StoreInfo:
@@ -165,16 +156,106 @@ def parse_store_slug(store_url: str) -> str:
     return slug
 
 
+def clear_products_cache() -> None:
+    _products_cache.clear()
+
+
+def _cache_get(slug: str) -> list[StoreProduct] | None:
+    cached = _products_cache.get(slug)
+    if cached is None:
+        return None
+    if cached[0] <= time.monotonic():
+        _products_cache.pop(slug, None)
+        return None
+    return list(cached[1])
+
+
+def _cache_put(slug: str, products: list[StoreProduct]) -> None:
+    if len(_products_cache) >= _PRODUCTS_CACHE_MAX:
+        # 만료가 가장 이른 항목부터 제거
+        oldest = min(_products_cache, key=lambda k: _products_cache[k][0])
+        _products_cache.pop(oldest, None)
+    ttl = settings.STORE_PRODUCTS_CACHE_TTL_SEC
+    _products_cache[slug] = (time.monotonic() + ttl, list(products))
+
+
+async def _fetch_page(channel_name: str, start: int) -> dict | None:
+    """쇼핑 API 한 페이지 (오류 시 None)."""
+    resp = await _get_client().get(
+        "https://openapi.naver.com/v1/search/shop.json",
+        params={
+            "query": channel_name,
+            "display": _PAGE_SIZE,
+            "start": start,
+            "sort": "date",
+        },
+        headers={
+            "X-Naver-Client-Id": settings.NAVER_CLIENT_ID,
+            "X-Naver-Client-Secret": settings.NAVER_CLIENT_SECRET,
+        },
+    )
+    if resp.status_code != 200:
+        logger.warning(f"쇼핑 API 오류: {resp.status_code} (start={start})")
+        return None
+    return resp.json()
+
+
+def _collect_items(items: list[dict], channel_name: str, products: dict[str, StoreProduct]) -> None:
+    for item in items:
+        mall = item.get("mallName", "")
+        # mallName이 channelName과 일치하는 상품만 수집
+        if mall != channel_name and channel_name not in mall and mall not in channel_name:
+            continue
+
+        pid = str(item.get("productId", ""))
+        if not pid or pid in products:
+            continue
+
+        name = re.sub(r"<[^>]+>", "", item.get("title", ""))
+        cat_parts = [
+            item.get("category1", ""),
+            item.get("category2", ""),
+            item.get("category3", ""),
+        ]
+        category = "/".join(p for p in cat_parts if p)
+
+        products[pid] = StoreProduct(
+            name=name,
+            price=int(item.get("lprice", 0)),
+            image_url=item.get("image", ""),
+            category=category,
+            naver_product_id=pid,
+            mall_name=mall,
+            brand=item.get("brand", ""),
+            maker=item.get("maker", ""),
+        )
+
+
 async def fetch_store_products(
     store_url: str,
     fallback_store_name: str | None = None,
+    use_cache: bool = True,
+    on_progress: Callable[[int, int], None] | None = None,
 ) -> list[StoreProduct]:
     """스마트스토어 URL에서 상품 목록을 가져옴.
 
     1단계: 페이지 스크래핑으로 channelName(=mallName) 확보 (실패 시 fallback 사용)
     2단계: 네이버 쇼핑 API로 상품 검색 + mallName 필터
+      - 첫 페이지의 total로 남은 페이지 수를 정한 뒤 동시 요청 (STORE_IMPORT_CONCURRENCY 제한)
+      - 결과는 페이지 순서대로 병합, 실패/빈 페이지 이후는 버림 (순차 수집과 동일한 결과)
+    3단계: slug별 결과 캐시 (STORE_PRODUCTS_CACHE_TTL_SEC) — 미리보기 → 등록 재수집 방지
+
+    on_progress: (완료 페이지 수, 전체 페이지 수) 콜백 — 대형 스토어 진행률 표시용
     """
     slug = parse_store_slug(store_url)
+    if use_cache:
+        cached = _cache_get(slug)
+        if cached is not None:
+            logger.info(f"스토어 상품 캐시 사용: {slug} ({len(cached)}개)")
+            if on_progress:
+                on_progress(1, 1)
+            return cached
+
     logger.info(f"스토어 스크래핑 시작: {slug}")
 
     # 1단계: 스토어 정보 추출 (해외 IP에서 실패 가능 → fallback)
@@ -200,65 +281,40 @@ async def fetch_store_products(
     # 2단계: 네이버 쇼핑 API로 상품 검색
     products: dict[str, StoreProduct] = {}
 
-    client = _get_client()
-    # 최대 1000개까지 (display=100, start 1~901)
-    for start in range(1, 902, 100):
-        resp = await client.get(
-            "https://openapi.naver.com/v1/search/shop.json",
-            params={
-                "query": channel_name,
-                "display": 100,
-                "start": start,
-                "sort": "date",
-            },
-            headers={
-                "X-Naver-Client-Id": settings.NAVER_CLIENT_ID,
-                "X-Naver-Client-Secret": settings.NAVER_CLIENT_SECRET,
-            },
-        )
-
-        if resp.status_code != 200:
-            logger.warning(f"쇼핑 API 오류: {resp.status_code}")
-            break
-
-        data = resp.json()
-        items = data.get("items", [])
+    first = await _fetch_page(channel_name, 1)
+    pages: list[dict | None] = [first]
+    if first and first.get("items"):
+        total = first.get("total", 0)
+        starts = [s for s in range(1 + _PAGE_SIZE, _MAX_START + 1, _PAGE_SIZE) if s <= total]
+        pages_total = 1 + len(starts)
+        done = 1
+        if on_progress:
+            on_progress(done, pages_total)
+
+        sem = asyncio.Semaphore(max(settings.STORE_IMPORT_CONCURRENCY, 1))
+
+        async def fetch(start: int) -> dict | None:
+            nonlocal done
+            async with sem:
+                page = await _fetch_page(channel_name, start)
+            done += 1
+            if on_progress:
+                on_progress(done, pages_total)
+            return page
+
+        pages += await asyncio.gather(*(fetch(s) for s in starts))
+    elif on_progress:
+        on_progress(1, 1)
+
+    for page in pages:
+        items = page.get("items", []) if page else []
         if not items:
             break
-
-        for item in items:
-            mall = item.get("mallName", "")
-            # mallName이 channelName과 일치하는 상품만 수집
-            if mall != channel_name and channel_name not in mall and mall not in channel_name:
-                continue
-
-            pid = str(item.get("productId", ""))
-            if not pid or pid in products:
-                continue
-
-            name = re.sub(r"<[^>]+>", "", item.get("title", ""))
-            cat_parts = [
-                item.get("category1", ""),
-                item.get("category2", ""),
-                item.get("category3", ""),
-            ]
-            category = "/".join(p for p in cat_parts if p)
-
-            products[pid] = StoreProduct(
-                name=name,
-                price=int(item.get("lprice", 0)),
-                image_url=item.get("image", ""),
-                category=category,
-                naver_product_id=pid,
-                mall_name=mall,
-                brand=item.get("brand", ""),
-                maker=item.get("maker", ""),
-            )
-
-        total = data.get("total", 0)
-        if start + 100 > total:
-            break
+        _collect_items(items, channel_name, products)
 
     result = list(products.values())
     logger.info(f"스토어 '{channel_name}' 상품 {len(result)}개 수집 완료")
+    # API 오류가 섞인 불완전한 결과는 캐시하지 않음
+    if all(page is not None for page in pages):
+        _cache_put(slug, result)
     return result
@@ -11,13 +11,14 @@ setup_logging()
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from sqlalchemy import case, func, select, text
+from sqlalchemy import text
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.api.router import api_router
 from app.core.config import settings
 from app.core.database import async_session, engine, Base
 from app.core.exceptions import AppError, DuplicateError, NotFoundError
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.core.rate_limit import limiter
 from app.models import *  # noqa: F401, F403 - ensure all models are registered
 from app.scheduler.setup import init_scheduler, shutdown_scheduler
@@ -37,33 +38,99 @@ async def _ensure_columns():
     _PENDING_COLUMNS = [
         ("users", "password_hash", "VARCHAR(200)"),
         ("users", "telegram_chat_id", "VARCHAR(50)"),
+        ("products", "search_text", "TEXT"),
+        ("crawl_logs", "user_id", "INTEGER REFERENCES users(id) ON DELETE CASCADE"),
+        ("users", "last_crawled_at", "TIMESTAMP WITHOUT TIME ZONE"),
+        ("users", "last_crawl_run_id", "VARCHAR(32)"),
+        ("users", "next_crawl_due_at", "TIMESTAMP WITHOUT TIME ZONE"),
+        ("alert_deliveries", "delivered_endpoints", "JSON"),
     ]
+    # 컬럼을 새로 추가했을 때 이어서 실행 (기존 행 백필 + 인덱스)
+    _AFTER_ADD = {
+        ("crawl_logs", "user_id"): [
+            "UPDATE crawl_logs SET user_id = p.user_id FROM search_keywords k "
+            "JOIN products p ON p.id = k.product_id "
+            "WHERE k.id = crawl_logs.keyword_id AND crawl_logs.user_id IS NULL",
+            "CREATE INDEX IF NOT EXISTS ix_crawl_logs_user_created "
+            "ON crawl_logs (user_id, created_at, id)",
+            "CREATE INDEX IF NOT EXISTS ix_alerts_user_created "
+            "ON alerts (user_id, created_at, id)",
+        ],
+        ("users", "next_crawl_due_at"): [
+            "UPDATE users SET last_crawled_at = k.max_at FROM ("
+            "SELECT p.user_id, max(sk.last_crawled_at) AS max_at FROM search_keywords sk "
+            "JOIN products p ON p.id = sk.product_id WHERE p.is_active GROUP BY p.user_id"
+            ") k WHERE k.user_id = users.id",
+            "UPDATE users SET next_crawl_due_at = COALESCE("
+            "last_crawled_at + make_interval(mins => crawl_interval_min), "
+            "now() AT TIME ZONE 'utc')",
+            "CREATE INDEX IF NOT EXISTS ix_users_next_crawl_due_at ON users (next_crawl_due_at)",
+        ],
+    }
+    # 컬럼(+백필/인덱스)마다 별도 트랜잭션 — 하나가 실패해도 나머지 추가분은 롤백되지 않음
+    for table, column, col_type in _PENDING_COLUMNS:
+        try:
+            async with engine.begin() as conn:
+                table_exists = await conn.execute(text(
+                    "SELECT 1 FROM information_schema.tables WHERE table_name = :table"
+                ), {"table": table})
+                if not table_exists.scalar():
+                    # 아직 없는 테이블은 이어지는 create_all이 새 컬럼까지 포함해 생성
+                    continue
+                exists = await conn.execute(text(
+                    "SELECT 1 FROM information_schema.columns "
+                    "WHERE table_name = :table AND column_name = :column"
+                ), {"table": table, "column": column})
+                if not exists.scalar():
+                    await conn.execute(text(
+                        f'ALTER TABLE "{table}" ADD COLUMN "{column}" {col_type}'
+                    ))
+                    logger.info("컬럼 추가: %s.%s (%s)", table, column, col_type)
+                    for statement in _AFTER_ADD.get((table, column), []):
+                        await conn.execute(text(statement))
+        except Exception as e:
+            logger.warning("컬럼 추가 실패: %s.%s - %s", table, column, e)
+
+
+async def _ensure_extensions():
+    """상품 검색 GIN 인덱스(gin_trgm_ops)용 pg_trgm 확장 (create_all 전에 필요)."""
     async with engine.begin() as conn:
-        for table, column, col_type in _PENDING_COLUMNS:
-            exists = await conn.execute(text(
-                "SELECT 1 FROM information_schema.columns "
-                "WHERE table_name = :table AND column_name = :column"
-            ), {"table": table, "column": column})
-            if not exists.scalar():
-                await conn.execute(text(
-                    f'ALTER TABLE "{table}" ADD COLUMN "{column}" {col_type}'
-                ))
-                logger.info("컬럼 추가: %s.%s (%s)", table, column, col_type)
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 누락된 컬럼 추가 + 새 테이블 생성
+    try:
+        await _ensure_extensions()
+    except Exception as e:
+        logger.warning("pg_trgm 확장 생성 실패: %s", e)
     try:
         await _ensure_columns()
     except Exception as e:
         logger.warning("컬럼 추가 실패: %s", e)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as db:
+        from app.services.category_service import ensure_category_paths
+        from app.services.crawl_stats_service import ensure_crawl_stats
+        from app.services.keyword_engine.dictionary import ensure_dictionary
+        from app.services.product_search import backfill_search_text
+        await backfill_search_text(db)
+        await ensure_category_paths(db)
+        await ensure_dictionary(db)
+        await ensure_crawl_stats(db)
+        await db.commit()
 
     init_scheduler()
     yield
-    shutdown_scheduler()
+    # 새 크롤링 중단 + 진행 중 크롤링이 받은 결과 저장 대기 (리더 임대는 그 뒤 반납)
+    from app.crawlers.manager import shared_manager
+    await shared_manager.drain(settings.CRAWL_DRAIN_TIMEOUT_SEC)
+    await shutdown_scheduler()
+    # 아직 반영하지 않은 크롤링 통계 카운터 저장
+    from app.scheduler.jobs import flush_crawl_stats_buffer
+    await flush_crawl_stats_buffer()
     # httpx 클라이언트 정리
     from app.crawlers.manager import crawler
     await crawler.close()
@@ -71,6 +138,10 @@ async def lifespan(app: FastAPI):
     await close_scraper_client()
     from app.services.telegram_service import close_client as close_telegram_client
     await close_telegram_client()
+    from app.services.push_service import shutdown_executor as shutdown_push_executor
+    shutdown_push_executor()
+    from app.services.keyword_engine.batch import shutdown_pool as shutdown_suggest_pool
+    shutdown_suggest_pool()
 
 
 app = FastAPI(
@@ -110,6 +181,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
     allow_headers=["Content-Type", "Authorization", "X-API-Key"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
@@ -132,42 +204,27 @@ async def app_error_handler(request: Request, exc: AppError):
 
 
 async def _get_crawl_metrics(session) -> dict:
-    """최근 24시간 크롤링 메트릭스 조회."""
-    from datetime import timedelta
-    from app.core.utils import utcnow
-    from app.models.crawl_log import CrawlLog
+    """최근 24시간 크롤링 메트릭스 조회 (전체 합계 버킷 카운터)."""
+    from app.services.crawl_stats_service import get_crawl_stats, get_last_crawled_at
 
-    result = await session.execute(
-        select(func.max(CrawlLog.created_at))
-    )
-    last_crawl = result.scalar_one_or_none()
-
-    since_24h = utcnow() - timedelta(hours=24)
-    metrics_result = await session.execute(
-        select(
-            func.count(CrawlLog.id),
-            func.sum(case((CrawlLog.status == "success", 1), else_=0)),
-            func.avg(CrawlLog.duration_ms),
-        ).where(CrawlLog.created_at >= since_24h)
-    )
-    row = metrics_result.one()
-    total = row[0] or 0
-    success = row[1] or 0
+    last_crawl = await get_last_crawled_at(session)
+    stats = await get_crawl_stats(session)
 
     return {
         "last_crawl_at": last_crawl.isoformat() if last_crawl else None,
         "crawl_metrics_24h": {
-            "total": total,
-            "success": success,
-            "failed": total - success,
-            "success_rate": round(success / total * 100, 1) if total > 0 else 0,
-            "avg_duration_ms": round(row[2]) if row[2] else None,
+            "total": stats["total"],
+            "success": stats["success"],
+            "failed": stats["failed"],
+            "success_rate": stats["success_rate"] or 0,
+            "avg_duration_ms": stats["avg_duration_ms"],
         },
     }
 
 
 @app.get("/health")
 async def health_check():
+    from app.crawlers.executor import crawl_executor
     from app.scheduler.setup import scheduler
 
     checks = {}
@@ -188,6 +245,7 @@ async def health_check():
         status = "unhealthy"
 
     checks["scheduler"] = "running" if scheduler.running else "stopped"
+    checks["crawl_queue"] = crawl_executor.snapshot()
     if not scheduler.running:
         status = "degraded" if status == "healthy" else status
 
@@ -1,9 +1,17 @@
 from app.models.alert import Alert, AlertSetting
+from app.models.alert_delivery import AlertDelivery
 from app.models.cost import CostItem, CostPreset
+from app.models.crawl_checkpoint import CrawlCheckpoint
 from app.models.crawl_log import CrawlLog
+from app.models.crawl_stat import CrawlStatHourly
+from app.models.deletion_job import DeletionJob
 from app.models.excluded_product import ExcludedProduct
 from app.models.included_override import IncludedOverride
+from app.models.keyword_dictionary import KeywordDictionaryTerm
 from app.models.keyword_ranking import KeywordRanking
+from app.models.naver_category_path import NaverCategoryPath
+from app.models.relevance_job import RelevanceJob
+from app.models.scheduler_lease import SchedulerLease
 from app.models.shipping_override import ShippingOverride
 from app.models.product import Product
 from app.models.push_subscription import PushSubscription
@@ -15,13 +23,21 @@ __all__ = [
     "Product",
     "SearchKeyword",
     "KeywordRanking",
+    "KeywordDictionaryTerm",
+    "NaverCategoryPath",
     "CostItem",
     "CostPreset",
     "Alert",
     "AlertSetting",
+    "AlertDelivery",
     "CrawlLog",
+    "CrawlCheckpoint",
+    "CrawlStatHourly",
+    "DeletionJob",
     "PushSubscription",
     "ExcludedProduct",
     "IncludedOverride",
     "ShippingOverride",
+    "SchedulerLease",
+    "RelevanceJob",
 ]
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+from app.core.utils import utcnow
+
+
+class AlertDelivery(Base):
+    # 알림 발송 outbox: Alert와 같은 트랜잭션에서 기록, 디스패처가 크롤링 밖에서 발송
+    __tablename__ = "alert_deliveries"
+    __table_args__ = (
+        Index("ix_alert_deliveries_status_next", "status", "next_attempt_at"),
+        Index("ix_alert_deliveries_alert_id", "alert_id"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    alert_id: Mapped[int] = mapped_column(ForeignKey("alerts.id", ondelete="CASCADE"), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    channel: Mapped[str] = mapped_column(String(20), nullable=False)  # 'push' | 'telegram'
+    status: Mapped[str] = mapped_column(String(20), default="pending")  # pending|sent|skipped|failed
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(default=utcnow, server_default=func.now(), nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text)
+    # push 채널: 이미 전송된 구독 endpoint — 재시도 시 실패한 기기에만 다시 전송
+    delivered_endpoints: Mapped[list | None] = mapped_column(JSON)
+    sent_at: Mapped[datetime | None] = mapped_column()
+    created_at: Mapped[datetime] = mapped_column(server_default=func.now())
+
+    alert: Mapped["Alert"] = relationship(back_populates="deliveries")
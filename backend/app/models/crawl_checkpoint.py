@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.core.utils import utcnow
+
+
+class CrawlCheckpoint(Base):
+    # 종료(drain)로 중단된 사업체 크롤링의 미완료 키워드 — 다음 크롤링이 같은 run으로 이어서 수행
+    __tablename__ = "crawl_checkpoints"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    run_id: Mapped[str] = mapped_column(String(32), nullable=False)
+    pending_keyword_ids: Mapped[list] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(nullable=False, default=utcnow)
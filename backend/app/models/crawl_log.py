@@ -11,10 +11,14 @@ class CrawlLog(Base):
     __table_args__ = (
         Index("ix_crawl_logs_keyword_created", "keyword_id", "created_at"),
         Index("ix_crawl_logs_status", "status"),
+        # 사업체별 최신 로그 (키셋 페이지네이션 / 최근 N건 집계)
+        Index("ix_crawl_logs_user_created", "user_id", "created_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     keyword_id: Mapped[int | None] = mapped_column(ForeignKey("search_keywords.id", ondelete="SET NULL"))
+    # 키워드 → 상품 → 사업체 조인 없이 사업체별 조회 (비정규화)
+    user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     status: Mapped[str] = mapped_column(String(20), nullable=False)
     error_message: Mapped[str | None] = mapped_column(Text)
     duration_ms: Mapped[int | None] = mapped_column(Integer)
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class CrawlStatHourly(Base):
+    # 사업체별 1시간 버킷 크롤링 결과 카운터 (crawl_logs 집계의 물리화, 로그 기록 시 증분 갱신)
+    # user_id=0은 전체 합계 — 사업체 삭제 후에도 보존 기간 동안 전체 합계에 남도록 FK 없음
+    __tablename__ = "crawl_stats_hourly"
+    __table_args__ = (
+        UniqueConstraint("user_id", "bucket_start", name="uq_crawl_stats_hourly_user_bucket"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    success_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    success_duration_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    failed_duration_ms: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    last_crawled_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
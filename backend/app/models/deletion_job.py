@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, Boolean, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.core.utils import utcnow
+
+
+class DeletionJob(Base):
+    # 대용량 삭제 작업 — 상품 숨김과 같은 트랜잭션에 기록, 재시작/다른 레플리카에서도 이어서 수행·조회
+    __tablename__ = "deletion_jobs"
+    __table_args__ = (
+        Index("ix_deletion_jobs_status", "status"),
+    )
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    # 사업체 삭제 후에도 작업 상태를 조회할 수 있도록 FK 없음
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    product_ids: Mapped[list] = mapped_column(JSON, nullable=False)
+    delete_user: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)  # pending|running|completed|failed
+    rankings_deleted: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow, nullable=False)
+    # 실행 중 청크마다 갱신 — 오래 멈춰 있으면 실행하던 프로세스가 죽은 것으로 보고 재개
+    heartbeat_at: Mapped[datetime | None] = mapped_column()
+    finished_at: Mapped[datetime | None] = mapped_column()
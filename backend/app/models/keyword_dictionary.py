@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import Index, Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class KeywordDictionaryTerm(Base):
+    # 키워드 엔진 DB 사전 (브랜드/카테고리 용어, 크롤링 적재 시 증분 갱신)
+    __tablename__ = "keyword_dictionary"
+    __table_args__ = (
+        UniqueConstraint("kind", "term", name="uq_keyword_dictionary_kind_term"),
+        Index("ix_keyword_dictionary_last_seen", "last_seen"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    term: Mapped[str] = mapped_column(String(200), nullable=False)  # 소문자 정규화
+    kind: Mapped[str] = mapped_column(String(10), nullable=False)  # 'brand' | 'type'
+    frequency: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_seen: Mapped[datetime] = mapped_column(server_default=func.now(), nullable=False)
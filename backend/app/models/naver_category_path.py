@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class NaverCategoryPath(Base):
+    # 네이버 카테고리 경로별 수집 건수 (keyword_rankings 집계의 물리화, 적재 시 증분 갱신)
+    # 하위 카테고리가 없으면 빈 문자열 — NULL이면 유니크 제약이 동작하지 않음
+    __tablename__ = "naver_category_paths"
+    __table_args__ = (
+        UniqueConstraint("category1", "category2", "category3", "category4", name="uq_naver_category_paths_path"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    category1: Mapped[str] = mapped_column(String(100), nullable=False)
+    category2: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    category3: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    category4: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    product_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now())
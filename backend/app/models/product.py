@@ -1,9 +1,10 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, ForeignKey, Index, Integer, JSON, String, func
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, JSON, String, Text, event, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
+from app.core.utils import build_product_search_text
 
 
 class Product(Base):
@@ -12,6 +13,11 @@ class Product(Base):
         Index("ix_products_user_id", "user_id"),
         Index("ix_products_user_category", "user_id", "category"),
         Index("ix_products_user_locked", "user_id", "is_price_locked"),
+        # 상품 검색: pg_trgm GIN (부분 일치 LIKE + 유사도 <% 모두 인덱스 사용)
+        Index(
+            "ix_products_search_trgm", "search_text",
+            postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -36,6 +42,8 @@ class Product(Base):
     color: Mapped[str | None] = mapped_column(String(50))
     material: Mapped[str | None] = mapped_column(String(50))
     product_attributes: Mapped[dict | None] = mapped_column(JSON)
+    # 검색용 정규화 텍스트 (name + model_code + brand, 저장 시 자동 갱신)
+    search_text: Mapped[str | None] = mapped_column(Text)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now())
@@ -46,3 +54,9 @@ class Product(Base):
     excluded_products: Mapped[list["ExcludedProduct"]] = relationship(back_populates="product", cascade="all, delete-orphan")
     included_overrides: Mapped[list["IncludedOverride"]] = relationship(back_populates="product", cascade="all, delete-orphan")
     shipping_overrides: Mapped[list["ShippingOverride"]] = relationship(back_populates="product", cascade="all, delete-orphan")
+
+
+@event.listens_for(Product, "before_insert")
+@event.listens_for(Product, "before_update")
+def _sync_search_text(mapper, connection, target: Product) -> None:
+    target.search_text = build_product_search_text(target.name, target.model_code, target.brand)
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.core.utils import utcnow
+
+
+class RelevanceJob(Base):
+    # 관련성 재계산 작업 — 상품 수정과 같은 트랜잭션에 기록, 진행 위치(last_id)를 청크마다 커밋해 재시작 후 이어서 수행
+    __tablename__ = "relevance_jobs"
+    __table_args__ = (
+        Index("ix_relevance_jobs_product_created", "product_id", "created_at"),
+        Index("ix_relevance_jobs_status", "status"),
+    )
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    product_id: Mapped[int] = mapped_column(ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)  # pending|running|completed|failed|cancelled
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # 마지막으로 처리한 keyword_rankings.id (키셋 커서)
+    last_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(default=utcnow, nullable=False)
+    heartbeat_at: Mapped[datetime | None] = mapped_column()
+    finished_at: Mapped[datetime | None] = mapped_column()
@@ -1,10 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from sqlalchemy import String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.config import settings
 from app.core.database import Base
+from app.core.utils import utcnow
 
 
 class User(Base):
@@ -18,11 +19,23 @@ class User(Base):
     password_hash: Mapped[str | None] = mapped_column(String(200))
     telegram_chat_id: Mapped[str | None] = mapped_column(String(50))
     updated_at: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now())
+    # 크롤링 완료 시 갱신 (키워드 → 상품 조인 없이 스케줄링/요약)
+    last_crawled_at: Mapped[datetime | None] = mapped_column()
+    last_crawl_run_id: Mapped[str | None] = mapped_column(String(32))
+    # 신규 사업체는 다음 스케줄러 체크에 바로 크롤링
+    next_crawl_due_at: Mapped[datetime | None] = mapped_column(default=utcnow, index=True)
 
     @property
     def has_password(self) -> bool:
         return self.password_hash is not None
 
+    def schedule_next_crawl(self, now: datetime | None = None) -> None:
+        """다음 자동 크롤링 예정 시각 = 마지막 성공 크롤링 + 주기 (성공 이력이 없으면 지금)."""
+        if self.last_crawled_at is None:
+            self.next_crawl_due_at = now or utcnow()
+        else:
+            self.next_crawl_due_at = self.last_crawled_at + timedelta(minutes=self.crawl_interval_min)
+
     products: Mapped[list["Product"]] = relationship(back_populates="user", cascade="all, delete-orphan")
     alerts: Mapped[list["Alert"]] = relationship(back_populates="user", cascade="all, delete-orphan")
     alert_settings: Mapped[list["AlertSetting"]] = relationship(back_populates="user", cascade="all, delete-orphan")
@@ -1,8 +1,8 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
-from sqlalchemy import delete, select, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select, update
 
 from app.core.config import settings
 from app.core.database import async_session
@@ -10,67 +10,126 @@ from app.core.utils import utcnow
 from app.crawlers.manager import shared_manager
 from app.models.crawl_log import CrawlLog
 from app.models.keyword_ranking import KeywordRanking
-from app.models.product import Product
-from app.models.search_keyword import SearchKeyword
 from app.models.user import User
+from app.scheduler.leader import elector
+from app.services.alert_dispatcher import dispatch_pending_deliveries
+from app.services.category_service import rebuild_category_paths
+from app.services.crawl_stats_service import flush_crawl_stats, prune_crawl_stats
+from app.services.deletion_service import prune_deletion_jobs, resume_deletion_jobs
+from app.services.keyword_engine.dictionary import prune_dictionary, refresh_snapshot
+from app.services.relevance_service import prune_relevance_jobs, resume_relevance_jobs
 
 logger = logging.getLogger(__name__)
 
 
-async def _get_user_last_crawled(db: AsyncSession, user_id: int) -> datetime | None:
-    """유저의 모든 상품 키워드 중 가장 최근 크롤링 시각 조회"""
+async def _claim_user(db, user) -> datetime | None:
+    """조회 시점의 예정 시각이 그대로인 경우에만 다음 주기로 미뤄 선점 (원자적 조건부 UPDATE).
+
+    리더가 바뀌는 순간 두 프로세스가 같은 사업체를 조회했더라도 한쪽만 크롤링한다.
+    선점한 예정 시각을 반환 (이미 다른 프로세스가 가져갔으면 None).
+    """
+    claimed_due = utcnow() + timedelta(minutes=user.crawl_interval_min)
     result = await db.execute(
-        select(func.max(SearchKeyword.last_crawled_at))
-        .join(Product, SearchKeyword.product_id == Product.id)
-        .where(Product.user_id == user_id, Product.is_active == True)
+        update(User)
+        .where(User.id == user.id, User.next_crawl_due_at == user.next_crawl_due_at)
+        .values(next_crawl_due_at=claimed_due)
     )
-    return result.scalar_one_or_none()
+    await db.commit()
+    return claimed_due if result.rowcount else None
+
+
+async def _release_claim(user, claimed_due: datetime) -> None:
+    """선점 해제 — 원래 예정 시각으로 되돌려 다음 체크에 재시도 (체크포인트로 이미 바뀌었으면 그대로)."""
+    try:
+        async with async_session() as db:
+            await db.execute(
+                update(User)
+                .where(User.id == user.id, User.next_crawl_due_at == claimed_due)
+                .values(next_crawl_due_at=user.next_crawl_due_at)
+            )
+            await db.commit()
+    except Exception as e:
+        logger.error(f"크롤링 선점 해제 실패: {user.name} - {e}")
+
+
+async def _crawl_scheduled_user(user) -> None:
+    """예정 사업체 1곳 크롤링 (독립 세션) — 예정 시각 대비 시작 지연을 함께 기록."""
+    if shared_manager.draining:
+        # 종료 중 — 예정 시각이 그대로라 다음 리더가 바로 수행
+        return
+    claimed_due = None
+
+    async def before_start(db) -> bool:
+        # DB 단계 슬롯을 얻어 실제로 시작하는 시점에 리더 확인 + 선점
+        nonlocal claimed_due
+        if not elector.is_leader:
+            # 조회 후 리더를 잃음 — 남은 사업체는 새 리더가 수행
+            logger.info(f"리더 상실로 크롤링 스킵: {user.name} (ID: {user.id})")
+            return False
+        claimed_due = await _claim_user(db, user)
+        if claimed_due is None:
+            logger.info(f"다른 프로세스가 선점한 사업체 스킵: {user.name} (ID: {user.id})")
+            return False
+        start_delay = int((utcnow() - user.next_crawl_due_at).total_seconds())
+        logger.info(
+            f"크롤링 시작: {user.name} (ID: {user.id}, 주기: {user.crawl_interval_min}분, "
+            f"예정 대비 {start_delay}초 지연)"
+        )
+        return True
+
+    async with async_session() as db:
+        try:
+            stats = await shared_manager.crawl_user_all(db, user.id, before_start=before_start)
+            await db.commit()
+            if stats.get("skipped"):
+                return
+            logger.info(
+                f"크롤링 완료: {user.name} - "
+                f"총 {stats['total']}건, 성공 {stats['success']}건, 실패 {stats['failed']}건, "
+                f"미완료 {stats.get('pending', 0)}건"
+                f" (run={stats.get('run_id')}, API 대기 평균 {stats.get('queue_wait_avg_ms')}ms"
+                f" / 최대 {stats.get('queue_wait_max_ms')}ms)"
+            )
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"크롤링 실패: {user.name} - {e}")
+            if claimed_due is not None:
+                await _release_claim(user, claimed_due)
+        except asyncio.CancelledError:
+            # 종료 기한 초과로 취소 — 체크포인트를 남기지 못했으면 선점을 풀어 다음 리더가 바로 수행
+            if claimed_due is not None:
+                await asyncio.shield(_release_claim(user, claimed_due))
+            raise
 
 
 async def crawl_all_users():
-    """크롤링 주기가 도래한 사업체의 활성 상품을 크롤링"""
-    # 1. 유저 목록 조회 세션
+    """크롤링 주기가 도래한 사업체의 활성 상품을 크롤링 (next_crawl_due_at 인덱스 범위 조회)
+
+    예정 사업체를 모두 동시에 시작한다 — API 호출 예산은 crawl_executor가 사업체 간
+    라운드로빈으로 나누고, DB 연결 사용은 크롤링의 조회/저장 단계만 CRAWL_DB_CONCURRENCY개로
+    제한하므로 키워드가 많은 사업체가 작은 사업체의 시작을 막지 않는다.
+    """
+    now = utcnow()
+
+    # 1. 예정 시각이 지난 사업체 조회 세션
     async with async_session() as db:
         try:
-            result = await db.execute(select(User))
-            users = result.scalars().all()
+            result = await db.execute(
+                select(User.id, User.name, User.crawl_interval_min, User.next_crawl_due_at)
+                .where(User.next_crawl_due_at <= now, User.crawl_interval_min > 0)
+                .order_by(User.next_crawl_due_at)
+            )
+            users = result.all()
         except Exception as e:
             logger.error(f"유저 목록 조회 실패: {e}")
             return
 
-    now = utcnow()
-
-    # 2. 유저별 독립 세션으로 크롤링
-    for user in users:
-        if user.crawl_interval_min <= 0:
-            continue
-
-        async with async_session() as db:
-            try:
-                last_crawled = await _get_user_last_crawled(db, user.id)
-                if last_crawled:
-                    elapsed = now - last_crawled
-                    if elapsed < timedelta(minutes=user.crawl_interval_min):
-                        logger.debug(
-                            f"크롤링 스킵: {user.name} "
-                            f"(다음 크롤링까지 {user.crawl_interval_min - int(elapsed.total_seconds() / 60)}분)"
-                        )
-                        continue
-
-                logger.info(f"크롤링 시작: {user.name} (ID: {user.id}, 주기: {user.crawl_interval_min}분)")
-                stats = await shared_manager.crawl_user_all(db, user.id)
-                await db.commit()
-                logger.info(
-                    f"크롤링 완료: {user.name} - "
-                    f"총 {stats['total']}건, 성공 {stats['success']}건, 실패 {stats['failed']}건"
-                )
-            except Exception as e:
-                await db.rollback()
-                logger.error(f"크롤링 실패: {user.name} - {e}")
+    # 2. 유저별 독립 세션으로 동시 크롤링 (예정 시각 순으로 시작)
+    await asyncio.gather(*[_crawl_scheduled_user(user) for user in users])
 
 
 async def cleanup_old_rankings():
-    """오래된 keyword_rankings + crawl_logs 배치 삭제."""
+    """오래된 keyword_rankings + crawl_logs 배치 삭제 (통계 버킷 포함)."""
     cutoff = utcnow() - timedelta(days=settings.DATA_RETENTION_DAYS)
     batch_size = settings.CLEANUP_BATCH_SIZE
     async with async_session() as db:
@@ -109,6 +168,16 @@ async def cleanup_old_rankings():
                 if deleted < batch_size:
                     break
 
+            # 보존 기간이 지난 크롤링 통계 버킷, 끝난 삭제/재계산 작업 행 삭제
+            await prune_crawl_stats(db, cutoff)
+            await prune_deletion_jobs(db, cutoff)
+            await prune_relevance_jobs(db, cutoff)
+            # 카테고리 경로 건수 보정 (보존 기간 만료 + 상품/키워드 삭제분 반영)
+            await rebuild_category_paths(db)
+            # 보존 기간 내 수집되지 않은 사전 용어 삭제
+            await prune_dictionary(db, cutoff)
+            await db.commit()
+
             if total_deleted or logs_deleted:
                 logger.info(
                     f"데이터 정리 완료: rankings {total_deleted}건, logs {logs_deleted}건 삭제 "
@@ -117,3 +186,57 @@ async def cleanup_old_rankings():
         except Exception as e:
             await db.rollback()
             logger.error(f"데이터 정리 실패: {e}")
+
+
+async def resume_background_jobs():
+    """재시작/배포로 중단된 백그라운드 작업 재개 (작업 행 선점으로 중복 실행 방지)."""
+    try:
+        await resume_deletion_jobs()
+    except Exception as e:
+        logger.error(f"삭제 작업 재개 실패: {e}")
+    try:
+        await resume_relevance_jobs()
+    except Exception as e:
+        logger.error(f"관련성 재계산 재개 실패: {e}")
+
+
+async def flush_crawl_stats_buffer():
+    """크롤링 통계 카운터 버퍼를 별도 트랜잭션으로 반영."""
+    try:
+        await flush_crawl_stats()
+    except Exception as e:
+        logger.error(f"크롤링 통계 반영 실패: {e}")
+
+
+async def dispatch_alert_deliveries():
+    """alert_deliveries outbox의 대기 알림 발송."""
+    try:
+        await dispatch_pending_deliveries()
+    except Exception as e:
+        logger.error(f"알림 발송 디스패치 실패: {e}")
+
+
+async def refresh_keyword_dictionary():
+    """키워드 사전 스냅샷 백그라운드 갱신 (워커별)."""
+    try:
+        await refresh_snapshot()
+    except Exception as e:
+        logger.error(f"키워드 사전 갱신 실패: {e}")
+
+
+async def crawl_imported_products(product_ids: list[int]):
+    """스토어 일괄 등록 직후 신규 상품 초기 크롤링 (상품별 독립 세션/커밋)."""
+    done = 0
+    for product_id in product_ids:
+        if shared_manager.draining:
+            # 종료 중 — 남은 상품은 사업체 스케줄 크롤링에서 수집
+            break
+        async with async_session() as db:
+            try:
+                await shared_manager.crawl_product(db, product_id)
+                await db.commit()
+                done += 1
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"초기 크롤링 실패: product={product_id} - {e}")
+    logger.info(f"등록 상품 초기 크롤링 완료: {done}/{len(product_ids)}개")
@@ -0,0 +1,116 @@
+"""스케줄러 리더 선출 — scheduler_leases 임대 행 + heartbeat.
+
+모든 API 프로세스(워커/레플리카)가 스케줄러를 띄우지만 크롤링·데이터 정리 잡은
+임대를 보유한 프로세스 하나만 실행한다 (leader_only).
+- heartbeat마다 "내가 보유 중이거나 만료된 임대"를 조건부 UPDATE 1회로 연장/인수 (원자적)
+- 행이 없으면 INSERT ... ON CONFLICT DO NOTHING으로 생성 경쟁
+- 마지막 연장 성공 후 TTL 안에서만 리더로 간주 — DB 장애로 연장하지 못하면 스스로 물러남
+- 종료 시 임대를 반납해 다른 프로세스가 다음 heartbeat에 바로 인수
+- 만료 시각 기록/판정은 DB 서버 시계 기준 — 레플리카 간 시계 차이로 리더가 둘이 되지 않음
+"""
+
+import functools
+import logging
+import os
+import socket
+import time
+import uuid
+
+from sqlalchemy import case, delete, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session, db_utcnow, upsert_insert
+from app.models.scheduler_lease import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElector:
+    def __init__(
+        self,
+        name: str = "scheduler",
+        session_factory: async_sessionmaker = async_session,
+        instance_id: str | None = None,
+    ):
+        self.name = name
+        self.session_factory = session_factory
+        self.instance_id = instance_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # time.monotonic() 기준 리더 유효 기한
+        self._valid_until = 0.0
+
+    @property
+    def is_leader(self) -> bool:
+        return time.monotonic() < self._valid_until
+
+    async def _try_acquire(self, db: AsyncSession, ttl: int) -> bool:
+        now = db_utcnow(db)
+        expires_at = db_utcnow(db, ttl)
+        mine = SchedulerLease.holder == self.instance_id
+        result = await db.execute(
+            update(SchedulerLease)
+            .where(SchedulerLease.name == self.name, or_(mine, SchedulerLease.expires_at < now))
+            .values(
+                holder=self.instance_id,
+                acquired_at=case((mine, SchedulerLease.acquired_at), else_=now),
+                expires_at=expires_at,
+            )
+        )
+        if result.rowcount:
+            return True
+        stmt = upsert_insert(db, SchedulerLease).values(
+            name=self.name, holder=self.instance_id, acquired_at=now, expires_at=expires_at,
+        ).on_conflict_do_nothing(index_elements=["name"])
+        result = await db.execute(stmt)
+        return bool(result.rowcount)
+
+    async def heartbeat(self) -> bool:
+        """임대 연장 또는 인수 시도 — 현재 리더 여부 반환."""
+        ttl = settings.SCHEDULER_LEASE_TTL_SEC
+        started = time.monotonic()
+        was_leader = self.is_leader
+        try:
+            async with self.session_factory() as db:
+                acquired = await self._try_acquire(db, ttl)
+                await db.commit()
+        except Exception as e:
+            # 연장 실패 — 기존 임대가 만료될 때까지만 리더 유지
+            logger.error(f"스케줄러 임대 갱신 실패: {e}")
+            return self.is_leader
+
+        self._valid_until = started + ttl if acquired else 0.0
+        if acquired and not was_leader:
+            logger.info(f"스케줄러 리더 획득: {self.instance_id}")
+        elif was_leader and not acquired:
+            logger.warning(f"스케줄러 리더 상실: {self.instance_id}")
+        return acquired
+
+    async def release(self) -> None:
+        """보유 중인 임대 반납 (종료 시)."""
+        if not self.is_leader:
+            return
+        self._valid_until = 0.0
+        try:
+            async with self.session_factory() as db:
+                await db.execute(
+                    delete(SchedulerLease)
+                    .where(SchedulerLease.name == self.name, SchedulerLease.holder == self.instance_id)
+                )
+                await db.commit()
+            logger.info(f"스케줄러 리더 반납: {self.instance_id}")
+        except Exception as e:
+            logger.error(f"스케줄러 임대 반납 실패: {e}")
+
+
+elector = LeaderElector()
+
+
+def leader_only(job):
+    """리더 프로세스에서만 실행되는 잡으로 감싸기."""
+    @functools.wraps(job)
+    async def wrapper(*args, **kwargs):
+        if not elector.is_leader:
+            logger.debug(f"리더가 아니므로 스킵: {job.__name__}")
+            return None
+        return await job(*args, **kwargs)
+    return wrapper
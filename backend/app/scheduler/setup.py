@@ -1,11 +1,20 @@
 import asyncio
 import logging
+from datetime import datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import settings
-from app.scheduler.jobs import crawl_all_users, cleanup_old_rankings
+from app.scheduler.jobs import (
+    cleanup_old_rankings,
+    crawl_all_users,
+    dispatch_alert_deliveries,
+    flush_crawl_stats_buffer,
+    refresh_keyword_dictionary,
+    resume_background_jobs,
+)
+from app.scheduler.leader import elector, leader_only
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +23,21 @@ scheduler = AsyncIOScheduler()
 
 def init_scheduler():
     check_interval = settings.SCHEDULER_CHECK_INTERVAL_MIN
+    # 리더 임대 heartbeat — 시작 즉시 1회 시도 후 주기 반복 (모든 프로세스)
     scheduler.add_job(
-        crawl_all_users,
+        elector.heartbeat,
+        trigger=IntervalTrigger(seconds=settings.SCHEDULER_LEASE_HEARTBEAT_SEC),
+        id="leader_heartbeat",
+        name="스케줄러 리더 임대 갱신",
+        replace_existing=True,
+        next_run_time=datetime.now(),
+        misfire_grace_time=settings.SCHEDULER_LEASE_HEARTBEAT_SEC,
+        max_instances=1,
+        coalesce=True,
+    )
+    # 크롤링/데이터 정리는 리더 1개 프로세스만 실행
+    scheduler.add_job(
+        leader_only(crawl_all_users),
         trigger=IntervalTrigger(minutes=check_interval),
         id="crawl_scheduled",
         name="전체 크롤링",
@@ -24,7 +46,7 @@ def init_scheduler():
         max_instances=1,
     )
     scheduler.add_job(
-        cleanup_old_rankings,
+        leader_only(cleanup_old_rankings),
         trigger=IntervalTrigger(hours=24),
         id="cleanup_old_data",
         name="30일 이전 데이터 정리",
@@ -32,10 +54,58 @@ def init_scheduler():
         misfire_grace_time=3600,
         max_instances=1,
     )
+    scheduler.add_job(
+        leader_only(resume_background_jobs),
+        trigger=IntervalTrigger(seconds=settings.BACKGROUND_JOB_STALE_SEC),
+        id="resume_background_jobs",
+        name="중단된 백그라운드 작업 재개",
+        replace_existing=True,
+        misfire_grace_time=60,
+        max_instances=1,
+        coalesce=True,
+    )
+    # 알림 발송은 SKIP LOCKED로 행을 나눠 가지므로 모든 프로세스에서 실행
+    scheduler.add_job(
+        dispatch_alert_deliveries,
+        trigger=IntervalTrigger(seconds=settings.ALERT_DISPATCH_INTERVAL_SEC),
+        id="dispatch_alert_deliveries",
+        name="알림 발송",
+        replace_existing=True,
+        misfire_grace_time=60,
+        max_instances=1,
+        coalesce=True,
+    )
+    # 크롤링 통계 카운터 버퍼는 프로세스 메모리라 워커별 반영
+    scheduler.add_job(
+        flush_crawl_stats_buffer,
+        trigger=IntervalTrigger(seconds=settings.CRAWL_STATS_FLUSH_SEC),
+        id="flush_crawl_stats",
+        name="크롤링 통계 반영",
+        replace_existing=True,
+        misfire_grace_time=60,
+        max_instances=1,
+        coalesce=True,
+    )
+    # 키워드 사전 스냅샷은 프로세스 메모리라 워커별 갱신
+    scheduler.add_job(
+        refresh_keyword_dictionary,
+        trigger=IntervalTrigger(seconds=settings.KEYWORD_DICT_REFRESH_SEC),
+        id="refresh_keyword_dictionary",
+        name="키워드 사전 갱신",
+        replace_existing=True,
+        misfire_grace_time=60,
+        max_instances=1,
+        coalesce=True,
+    )
     scheduler.start()
-    logger.info(f"스케줄러 시작 (체크 주기: {check_interval}분, 유저별 크롤링 주기 적용)")
+    logger.info(
+        f"스케줄러 시작 (체크 주기: {check_interval}분, 유저별 크롤링 주기 적용, "
+        f"인스턴스: {elector.instance_id})"
+    )
 
 
-def shutdown_scheduler():
+async def shutdown_scheduler():
     scheduler.shutdown()
+    # 리더였다면 임대 반납 — 다른 프로세스가 TTL을 기다리지 않고 인수
+    await elector.release()
     logger.info("스케줄러 종료")
@@ -82,3 +82,54 @@ class MarginResult(BaseModel):
 
 class MarginSimulateRequest(BaseModel):
     selling_price: int = Field(..., ge=0)
+
+
+class MarginSweepRequest(BaseModel):
+    """미지정 시 기준가(최저가, 없으면 판매가)의 70~130% 구간을 약 200개 간격으로 스윕."""
+    min_price: int | None = Field(None, ge=0)
+    max_price: int | None = Field(None, ge=0)
+    step: int | None = Field(None, ge=1)
+    target_margin_percent: float | None = Field(None, ge=-100, le=100)
+
+
+class MarginSweepResult(BaseModel):
+    selling_price: int
+    cost_price: int
+    lowest_price: int | None = None
+    step: int
+    # 곡선 데이터 (같은 인덱스끼리 한 가격 지점)
+    prices: list[int]
+    net_margins: list[int]
+    margin_percents: list[float]
+    statuses: list[str]  # winning | close | losing (현재 최저가 기준)
+    break_even_price: int | None = None  # 순마진 0 이상이 되는 첫 가격
+    target_margin_percent: float | None = None
+    target_price: int | None = None  # 목표 마진율에 도달하는 첫 가격
+
+
+class RepricingItem(BaseModel):
+    product_id: int
+    name: str
+    category: str | None = None
+    is_price_locked: bool
+    action: str  # lower | raise | keep | locked | unreachable | no_competitor
+    selling_price: int
+    lowest_price: int | None = None
+    price_gap_percent: float | None = None
+    floor_price: int | None = None  # 최소 마진율을 지키는 최저 판매가
+    recommended_price: int
+    projected_status: str  # 추천가 적용 시 winning | close | losing
+    current_margin: int
+    current_margin_percent: float
+    projected_margin: int
+    projected_margin_percent: float
+    margin_delta: int
+
+
+class RepricingPage(BaseModel):
+    total: int  # 필터 적용 후 전체 건수
+    page: int
+    limit: int
+    summary: dict[str, int]  # action별 상품 수 (필터 적용 전)
+    total_margin_delta: int  # 추천가 전체 적용 시 순마진 변화 합
+    items: list[RepricingItem]
@@ -15,6 +15,8 @@ class CrawlBatchResult(BaseModel):
     total: int
     success: int
     failed: int
+    queue_wait_avg_ms: int | None = None
+    queue_wait_max_ms: int | None = None
 
 
 class CrawlStatusResponse(BaseModel):
@@ -22,6 +24,10 @@ class CrawlStatusResponse(BaseModel):
     last_24h_success: int
     last_24h_failed: int
     avg_duration_ms: int | None
+    # 크롤링 실행기 대기 (현재 대기 중인 API 요청 수, 마지막 크롤링의 대기 시간)
+    queue_waiting: int = 0
+    queue_wait_avg_ms: int | None = None
+    queue_wait_max_ms: int | None = None
 
 
 class CrawlLogResponse(BaseModel):
@@ -23,3 +23,12 @@ class KeywordSuggestionResponse(BaseModel):
     tokens: list[TokenItem]
     keywords: list[SuggestedKeyword]
     field_guide: dict[str, str | None]
+
+
+class KeywordSuggestBatchRequest(BaseModel):
+    items: list[KeywordSuggestRequest] = Field(..., min_length=1, max_length=1000)
+
+
+class KeywordSuggestBatchItem(KeywordSuggestionResponse):
+    """일괄 추천 NDJSON 한 줄 (index = 요청 items 내 위치)."""
+    index: int
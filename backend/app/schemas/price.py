@@ -13,6 +13,29 @@ class PriceHistoryItem(BaseModel):
     crawled_at: datetime
 
 
+class PriceHistorySeries(BaseModel):
+    keyword_id: int
+    is_my_store: bool
+    total: int  # 다운샘플링 전 행 수
+    # 같은 인덱스끼리 한 행 (시간순)
+    crawled_at: list[int]  # UTC epoch 초
+    price: list[int]
+    rank: list[int]
+    mall: list[int]  # malls 인덱스
+    product_name: list[int]  # product_names 인덱스
+
+
+class PriceHistoryColumnar(BaseModel):
+    period: str
+    downsample: str
+    points: int  # 시리즈당 최대 점 수
+    total_rows: int
+    returned_rows: int
+    malls: list[str]
+    product_names: list[str]
+    series: list[PriceHistorySeries]
+
+
 class PriceSnapshotItem(BaseModel):
     keyword_id: int
     keyword: str
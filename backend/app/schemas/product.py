@@ -191,6 +191,36 @@ class BulkDeleteRequest(BaseModel):
 
 class BulkDeleteResult(BaseModel):
     deleted: int
+    # 삭제 작업 핸들: completed(즉시 삭제) 또는 pending(백그라운드 청크 삭제, 상품은 즉시 숨김)
+    job_id: str | None = None
+    status: str = "completed"
+
+
+class DeletionJobResponse(BaseModel):
+    id: str
+    user_id: int
+    product_count: int
+    delete_user: bool
+    status: str  # pending | running | completed | failed
+    rankings_deleted: int
+    error: str | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+
+
+class RelevanceJobResponse(BaseModel):
+    """관련성 재계산 작업 진행률."""
+    id: str
+    product_id: int
+    status: str  # pending | running | completed | failed | cancelled
+    total: int
+    processed: int
+    updated: int
+    error: str | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
 
 
 class ProductDetail(BaseModel):
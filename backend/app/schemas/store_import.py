@@ -33,7 +33,9 @@ class StoreImportItem(BaseModel):
 
 class StoreImportRequest(BaseModel):
     """선택한 상품 일괄 등록 요청."""
-    products: list[StoreImportItem] = Field(..., min_length=1, max_length=100)
+    products: list[StoreImportItem] = Field(..., min_length=1, max_length=1000)
+    # 등록 직후 신규 상품 초기 크롤링 예약 (응답 후 백그라운드 실행)
+    crawl: bool = False
 
 
 class CreatedProductMapping(BaseModel):
@@ -48,3 +50,4 @@ class StoreImportResult(BaseModel):
     skipped: int
     skipped_names: list[str]
     created_products: list[CreatedProductMapping] = []
+    crawl_enqueued: bool = False
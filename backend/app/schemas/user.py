@@ -24,6 +24,8 @@ class UserResponse(BaseModel):
     crawl_interval_min: int
     has_password: bool
     telegram_chat_id: str | None
+    last_crawled_at: datetime | None = None
+    next_crawl_due_at: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -0,0 +1,261 @@
+"""알림 발송 디스패처 — alert_deliveries outbox를 읽어 푸시/텔레그램 발송.
+
+크롤링 트랜잭션은 Alert + AlertDelivery 기록까지만 담당하고,
+외부 API 호출(웹 푸시, 텔레그램)은 스케줄러 잡에서 이 모듈이 처리한다.
+
+처리 흐름:
+1) 발송 대상 행을 선점(claim): attempts+1, next_attempt_at을 백오프 시각으로 미리 설정 후 커밋
+   → 프로세스가 중간에 죽어도 백오프 이후 자동 재시도 (lease 역할)
+2) 채널별 발송 — 푸시는 유저 단위로 구독을 1회 조회해 전용 스레드 풀에서 병렬 전송
+   (기기별 전송 결과를 delivered_endpoints에 기록해 재시도는 실패한 기기에만),
+   텔레그램은 유저별 chat_id를 1회 조회 후 발송 배치(선점 1회분) 안의 유저별 알림을
+   다이제스트로 묶어 전송 (크롤링 실행 단위 아님, rate limit은 telegram_service)
+3) 결과 반영: sent/skipped 확정, 최대 시도 초과 또는 영구 오류(텔레그램 4xx) 시 failed
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.utils import utcnow
+from app.models.alert import Alert
+from app.models.alert_delivery import AlertDelivery
+from app.models.user import User
+from app.services.push_service import (
+    PushMessage,
+    load_subscriptions,
+    prune_subscriptions,
+    send_push_batch,
+)
+from app.services.telegram_service import (
+    _format_alert_entry,
+    build_digest_messages,
+    deliver_telegram_message,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _ClaimedDelivery:
+    id: int
+    user_id: int
+    channel: str
+    attempts: int
+    alert_type: str
+    product_id: int | None
+    title: str
+    message: str
+    delivered_endpoints: list[str]
+
+
+def _backoff(attempts: int) -> timedelta:
+    """지수 백오프 (base * 2^(attempts-1), 최대 1시간)."""
+    seconds = settings.ALERT_DELIVERY_BACKOFF_SEC * (2 ** max(attempts - 1, 0))
+    return timedelta(seconds=min(seconds, 3600))
+
+
+async def _claim_batch(db: AsyncSession) -> list[_ClaimedDelivery]:
+    """발송 대상 outbox 행 선점 (Postgres: SKIP LOCKED로 다중 워커 안전)."""
+    now = utcnow()
+    result = await db.execute(
+        select(AlertDelivery, Alert)
+        .join(Alert, AlertDelivery.alert_id == Alert.id)
+        .where(
+            AlertDelivery.status == "pending",
+            AlertDelivery.next_attempt_at <= now,
+        )
+        .order_by(AlertDelivery.id)
+        .limit(settings.ALERT_DISPATCH_BATCH_SIZE)
+        .with_for_update(skip_locked=True, of=AlertDelivery)
+    )
+    claimed = []
+    for delivery, alert in result.all():
+        delivery.attempts = (delivery.attempts or 0) + 1
+        delivery.next_attempt_at = now + _backoff(delivery.attempts)
+        claimed.append(_ClaimedDelivery(
+            id=delivery.id,
+            user_id=delivery.user_id,
+            channel=delivery.channel,
+            attempts=delivery.attempts,
+            alert_type=alert.type,
+            product_id=alert.product_id,
+            title=alert.title,
+            message=alert.message or "",
+            delivered_endpoints=list(delivery.delivered_endpoints or []),
+        ))
+    await db.commit()
+    return claimed
+
+
+async def _deliver_push(
+    session_factory: async_sessionmaker, items: list[_ClaimedDelivery],
+) -> dict[int, tuple[str, str | None]]:
+    """푸시 일괄 발송: 구독 1회 조회 → 유저별 병렬 전송 → 만료 구독 1회 삭제."""
+    outcomes: dict[int, tuple[str, str | None]] = {}
+    by_user: dict[int, list[_ClaimedDelivery]] = {}
+    for item in items:
+        by_user.setdefault(item.user_id, []).append(item)
+
+    async with session_factory() as db:
+        subs_by_user = await load_subscriptions(db, set(by_user))
+
+    async def _send_user(user_id: int, user_items: list[_ClaimedDelivery]):
+        subscriptions = subs_by_user.get(user_id, [])
+        if not subscriptions:
+            for item in user_items:
+                outcomes[item.id] = ("skipped", "푸시 구독 없음")
+            return set()
+        messages = [
+            PushMessage(item.title, item.message, {"type": item.alert_type, "product_id": item.product_id})
+            for item in user_items
+        ]
+        delivered = [set(item.delivered_endpoints) for item in user_items]
+        ok, expired = await send_push_batch(subscriptions, messages, delivered)
+        for item, item_ok, endpoints in zip(user_items, ok, delivered):
+            item.delivered_endpoints = sorted(endpoints)
+            outcomes[item.id] = ("sent", None) if item_ok else ("retry", "push 전송 실패")
+        return expired
+
+    expired_sets = await asyncio.gather(
+        *[_send_user(uid, user_items) for uid, user_items in by_user.items()],
+        return_exceptions=True,
+    )
+    expired: set[str] = set()
+    for res in expired_sets:
+        if isinstance(res, BaseException):
+            logger.error("푸시 일괄 발송 오류: %s", res)
+            continue
+        expired |= res
+    for item in items:
+        outcomes.setdefault(item.id, ("retry", "push 발송 오류"))
+
+    if expired:
+        async with session_factory() as db:
+            await prune_subscriptions(db, expired)
+            await db.commit()
+    return outcomes
+
+
+async def _deliver_telegram(
+    session_factory: async_sessionmaker, items: list[_ClaimedDelivery],
+) -> dict[int, tuple[str, str | None]]:
+    """텔레그램 발송: chat_id 1회 배치 조회 → 이번 발송 배치의 유저별 알림을 다이제스트로 전송."""
+    outcomes: dict[int, tuple[str, str | None]] = {}
+    by_user: dict[int, list[_ClaimedDelivery]] = {}
+    for item in items:
+        by_user.setdefault(item.user_id, []).append(item)
+
+    async with session_factory() as db:
+        result = await db.execute(
+            select(User.id, User.telegram_chat_id).where(User.id.in_(list(by_user)))
+        )
+        chat_ids = {uid: chat_id for uid, chat_id in result.all()}
+
+    sem = asyncio.Semaphore(settings.ALERT_DISPATCH_CONCURRENCY)
+
+    async def _send_user(user_id: int, user_items: list[_ClaimedDelivery]) -> None:
+        chat_id = chat_ids.get(user_id)
+        if not chat_id:
+            for item in user_items:
+                outcomes[item.id] = ("skipped", "chat_id 미설정")
+            return
+
+        if settings.TELEGRAM_DIGEST_ENABLED:
+            chunks = build_digest_messages(
+                [(item.alert_type, item.title, item.message) for item in user_items]
+            )
+        else:
+            chunks = [
+                (_format_alert_entry(item.alert_type, item.title, item.message), [i])
+                for i, item in enumerate(user_items)
+            ]
+
+        async with sem:
+            for text, indices in chunks:
+                status = await deliver_telegram_message(chat_id, text)
+                error = None if status == "sent" else "텔레그램 전송 실패"
+                for i in indices:
+                    outcomes[user_items[i].id] = (status, error)
+
+    results = await asyncio.gather(
+        *[_send_user(uid, user_items) for uid, user_items in by_user.items()],
+        return_exceptions=True,
+    )
+    for res in results:
+        if isinstance(res, BaseException):
+            logger.error("텔레그램 발송 오류: %s", res)
+    for item in items:
+        outcomes.setdefault(item.id, ("retry", "텔레그램 발송 오류"))
+    return outcomes
+
+
+async def _apply_results(
+    db: AsyncSession,
+    claimed: list[_ClaimedDelivery],
+    outcomes: list[tuple[str, str | None]],
+) -> dict:
+    now = utcnow()
+    stats = {"sent": 0, "skipped": 0, "retry": 0, "failed": 0}
+    for item, (status, error) in zip(claimed, outcomes):
+        if status == "retry" and item.attempts >= settings.ALERT_DELIVERY_MAX_ATTEMPTS:
+            status = "failed"
+        stats[status] += 1
+
+        values: dict = {"last_error": error}
+        if item.channel == "push":
+            # 재시도 시 이미 받은 기기는 제외하도록 기기별 전송 결과 보존
+            values["delivered_endpoints"] = item.delivered_endpoints or None
+        if status == "sent":
+            values.update(status="sent", sent_at=now)
+        elif status in ("skipped", "failed"):
+            values.update(status=status)
+        # retry: status=pending 유지, next_attempt_at은 선점 시 설정한 백오프 시각
+        await db.execute(
+            update(AlertDelivery).where(AlertDelivery.id == item.id).values(**values)
+        )
+    await db.commit()
+    return stats
+
+
+async def dispatch_pending_deliveries(
+    session_factory: async_sessionmaker = async_session,
+) -> dict:
+    """대기 중인 알림 발송 1회 처리 (스케줄러 잡에서 주기적으로 호출)."""
+    async with session_factory() as db:
+        claimed = await _claim_batch(db)
+    if not claimed:
+        return {"sent": 0, "skipped": 0, "retry": 0, "failed": 0}
+
+    push_items = [item for item in claimed if item.channel == "push"]
+    telegram_items = [item for item in claimed if item.channel == "telegram"]
+    outcome_by_id: dict[int, tuple[str, str | None]] = {
+        item.id: ("skipped", f"알 수 없는 채널: {item.channel}")
+        for item in claimed if item.channel not in ("push", "telegram")
+    }
+
+    async def _run_push():
+        if push_items:
+            outcome_by_id.update(await _deliver_push(session_factory, push_items))
+
+    async def _run_telegram():
+        if telegram_items:
+            outcome_by_id.update(await _deliver_telegram(session_factory, telegram_items))
+
+    await asyncio.gather(_run_push(), _run_telegram())
+    outcomes = [outcome_by_id.get(item.id, ("retry", "발송 결과 없음")) for item in claimed]
+
+    async with session_factory() as db:
+        stats = await _apply_results(db, claimed, outcomes)
+
+    logger.info(
+        "알림 발송 처리: 성공 %d, 스킵 %d, 재시도 %d, 실패 %d",
+        stats["sent"], stats["skipped"], stats["retry"], stats["failed"],
+    )
+    return stats
@@ -1,72 +1,133 @@
 """알림 자동 생성 서비스 (크롤링 후 호출)"""
 
 import logging
+from dataclasses import dataclass, field
 from datetime import timedelta
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.models.alert import Alert, AlertSetting
+from app.models.alert_delivery import AlertDelivery
 from app.models.excluded_product import ExcludedProduct
 from app.models.keyword_ranking import KeywordRanking
 from app.models.product import Product
 from app.models.search_keyword import SearchKeyword
-from app.services.product_service import _fetch_latest_rankings
-from app.services.push_service import send_push_to_user
-from app.services.telegram_service import send_telegram_to_user
+from app.services.product_service import _fetch_latest_rankings, _fetch_my_rank_pairs
 from app.core.utils import utcnow
 
 logger = logging.getLogger(__name__)
 
+_ALERT_TYPES = ["price_undercut", "rank_drop"]
 
-async def _batch_prefetch(
-    db: AsyncSession, user_id: int, product: Product, keywords: list[SearchKeyword],
-) -> dict:
-    """알림 체크에 필요한 데이터를 배치 쿼리로 한꺼번에 조회."""
-    keyword_ids = [kw.id for kw in keywords]
+
+@dataclass
+class _UserAlertContext:
+    """유저 단위 알림 평가에 필요한 데이터 (크롤링 1회당 1번 조회)."""
+    alert_settings: dict[str, AlertSetting]
+    recent_alerts: set[tuple[int, str]]  # (product_id, type)
+    excluded_by_product: dict[int, set[str]]
+    latest_by_kw: dict[int, list[KeywordRanking]]
+    # keyword_id → (현재 순위, 직전 크롤링 순위)
+    my_rank_pairs: dict[int, tuple[int, int | None]] = field(default_factory=dict)
+
+
+async def _prefetch_user_context(
+    db: AsyncSession,
+    user_id: int,
+    products: list[Product],
+    keyword_ids: list[int],
+    alert_settings: dict[str, AlertSetting],
+    with_rank_history: bool,
+) -> _UserAlertContext:
+    """유저의 전체 상품에 대한 알림 데이터를 상품 수와 무관하게 쿼리 4회로 일괄 조회."""
+    product_ids = [p.id for p in products]
     now = utcnow()
     dedup_since = now - timedelta(hours=settings.ALERT_DEDUP_HOURS)
 
-    # 1) 알림 설정 2건 한 번에 조회
-    settings_result = await db.execute(
-        select(AlertSetting).where(
-            AlertSetting.user_id == user_id,
-            AlertSetting.alert_type.in_(["price_undercut", "rank_drop"]),
-        )
-    )
-    alert_settings: dict[str, AlertSetting] = {}
-    for s in settings_result.scalars().all():
-        alert_settings[s.alert_type] = s
-
-    # 2) 최근 미읽음 알림 2건 한 번에 조회 (중복 방지)
-    recent_alerts_result = await db.execute(
-        select(Alert.type).where(
+    # 1) 최근 미읽음 알림 (중복 방지) — 상품 전체 한 번에
+    recent_result = await db.execute(
+        select(Alert.product_id, Alert.type).where(
             Alert.user_id == user_id,
-            Alert.product_id == product.id,
-            Alert.type.in_(["price_undercut", "rank_drop"]),
+            Alert.product_id.in_(product_ids),
+            Alert.type.in_(_ALERT_TYPES),
             Alert.is_read == False,
             Alert.created_at > dedup_since,
         )
     )
-    recent_alert_types = set(recent_alerts_result.scalars().all())
+    recent_alerts = {(pid, t) for pid, t in recent_result.all()}
 
-    # 3) 블랙리스트 조회
+    # 2) 블랙리스트
+    excluded_by_product: dict[int, set[str]] = {pid: set() for pid in product_ids}
     ex_result = await db.execute(
-        select(ExcludedProduct).where(ExcludedProduct.product_id == product.id)
+        select(ExcludedProduct.product_id, ExcludedProduct.naver_product_id)
+        .where(ExcludedProduct.product_id.in_(product_ids))
+    )
+    for pid, naver_id in ex_result.all():
+        excluded_by_product[pid].add(naver_id)
+
+    # 3) 최신 rankings (전체 키워드 일괄)
+    latest_by_kw = await _fetch_latest_rankings(db, keyword_ids)
+
+    # 4) 키워드별 내 상품 현재/직전 순위 (DB 윈도 함수, 키워드당 1행)
+    my_rank_pairs: dict[int, tuple[int, int | None]] = {}
+    if with_rank_history:
+        since = now - timedelta(days=settings.SPARKLINE_DAYS)
+        my_rank_pairs = await _fetch_my_rank_pairs(db, keyword_ids, since=since)
+
+    return _UserAlertContext(
+        alert_settings=alert_settings,
+        recent_alerts=recent_alerts,
+        excluded_by_product=excluded_by_product,
+        latest_by_kw=latest_by_kw,
+        my_rank_pairs=my_rank_pairs,
     )
-    excluded_ids = {ep.naver_product_id for ep in ex_result.scalars().all()}
 
-    # 4) 최신 rankings 조회 (keyword_ids 일괄)
-    latest_by_kw = await _fetch_latest_rankings(db, keyword_ids) if keyword_ids else {}
 
-    return {
-        "keyword_ids": keyword_ids,
-        "alert_settings": alert_settings,
-        "recent_alert_types": recent_alert_types,
-        "excluded_ids": excluded_ids,
-        "latest_by_kw": latest_by_kw,
-    }
+def _delivery_channels() -> list[str]:
+    """서버 설정상 발송 가능한 채널 목록."""
+    channels = []
+    if settings.VAPID_PRIVATE_KEY and settings.VAPID_PUBLIC_KEY:
+        channels.append("push")
+    if settings.TELEGRAM_BOT_TOKEN:
+        channels.append("telegram")
+    return channels
+
+
+def _add_alert(db: AsyncSession, alert: Alert) -> None:
+    """Alert + 발송 outbox 행을 같은 트랜잭션에 추가.
+
+    실제 발송은 alert_dispatcher가 커밋 이후 처리하므로
+    크롤링 세션이 외부 API 응답을 기다리지 않는다.
+    """
+    db.add(alert)
+    for channel in _delivery_channels():
+        db.add(AlertDelivery(alert=alert, user_id=alert.user_id, channel=channel))
+
+
+async def _bulk_insert_alerts(db: AsyncSession, rows: list[dict]) -> int:
+    """Alert 일괄 INSERT … RETURNING → 발송 outbox 행 일괄 INSERT.
+
+    outbox 행은 alert_id/user_id만 필요하므로 RETURNING 순서에 의존하지 않는다.
+    """
+    if not rows:
+        return 0
+    result = await db.execute(insert(Alert).returning(Alert.id, Alert.user_id), rows)
+    inserted = result.all()
+
+    channels = _delivery_channels()
+    if channels:
+        now = utcnow()
+        await db.execute(
+            insert(AlertDelivery),
+            [
+                {"alert_id": alert_id, "user_id": user_id, "channel": channel, "next_attempt_at": now}
+                for alert_id, user_id in inserted
+                for channel in channels
+            ],
+        )
+    return len(inserted)
 
 
 def _is_alert_enabled_from_cache(
@@ -78,153 +139,133 @@ def _is_alert_enabled_from_cache(
     return setting.is_enabled, float(setting.threshold) if setting.threshold else None
 
 
-async def _check_price_undercut(
-    db: AsyncSession, product: Product, keywords: list[SearchKeyword],
-    prefetched: dict,
-):
+def _evaluate_price_undercut(
+    product: Product, keywords: list[SearchKeyword], ctx: _UserAlertContext,
+) -> dict | None:
     """최저가 이탈: 전체 키워드 결과 최저가 < 내 판매가."""
-    enabled, _ = _is_alert_enabled_from_cache(prefetched["alert_settings"], "price_undercut")
-    if not enabled:
-        return
-
-    keyword_ids = prefetched["keyword_ids"]
-    if not keyword_ids:
-        return
+    if (product.id, "price_undercut") in ctx.recent_alerts:
+        return None
 
-    excluded_ids = prefetched["excluded_ids"]
-    latest_by_kw = prefetched["latest_by_kw"]
+    excluded_ids = ctx.excluded_by_product.get(product.id, set())
+    kw_names = {kw.id: kw.keyword for kw in keywords}
 
     # 최신 크롤링 rankings 중 relevant + 블랙리스트 제외
-    all_latest: list[KeywordRanking] = []
-    for kw_id in keyword_ids:
-        for r in latest_by_kw.get(kw_id, []):
+    lowest: KeywordRanking | None = None
+    lowest_total = 0
+    for kw in keywords:
+        for r in ctx.latest_by_kw.get(kw.id, []):
             if not r.is_relevant:
                 continue
             if r.naver_product_id and r.naver_product_id in excluded_ids:
                 continue
-            all_latest.append(r)
+            total = r.price + (r.shipping_fee or 0)
+            if lowest is None or total < lowest_total:
+                lowest, lowest_total = r, total
 
-    if not all_latest:
-        return
-
-    lowest = min(all_latest, key=lambda r: r.price + (r.shipping_fee or 0))
-    lowest_total = lowest.price + (lowest.shipping_fee or 0)
-    if lowest_total >= product.selling_price:
-        return
+    if lowest is None or lowest_total >= product.selling_price:
+        return None
 
     gap = product.selling_price - lowest_total
     gap_percent = (gap / product.selling_price) * 100 if product.selling_price > 0 else 0
 
-    if "price_undercut" in prefetched["recent_alert_types"]:
-        return
-
-    title = f"{product.name} - 최저가 이탈"
-    message = f"{lowest.mall_name} {lowest_total:,}원 (내 가격 대비 -{gap:,}원, -{gap_percent:.1f}%)"
-    alert = Alert(
-        user_id=product.user_id,
-        product_id=product.id,
-        type="price_undercut",
-        title=title,
-        message=message,
-        data={
-            "keyword": lowest.keyword.keyword if hasattr(lowest, 'keyword') and lowest.keyword else "",
+    return {
+        "user_id": product.user_id,
+        "product_id": product.id,
+        "type": "price_undercut",
+        "title": f"{product.name} - 최저가 이탈",
+        "message": f"{lowest.mall_name} {lowest_total:,}원 (내 가격 대비 -{gap:,}원, -{gap_percent:.1f}%)",
+        "data": {
+            "keyword": kw_names.get(lowest.keyword_id, ""),
             "my_price": product.selling_price,
             "competitor_price": lowest_total,
             "competitor_name": lowest.mall_name,
             "gap": gap,
             "gap_percent": round(gap_percent, 1),
         },
-    )
-    db.add(alert)
-    await send_push_to_user(db, product.user_id, title, message, {"type": "price_undercut", "product_id": product.id})
-    await send_telegram_to_user(db, product.user_id, title, message, alert_type="price_undercut")
+    }
 
 
-async def _check_rank_drop(
-    db: AsyncSession, product: Product, keywords: list[SearchKeyword],
-    naver_store_name: str | None, prefetched: dict,
-):
-    """내 순위 하락 감지."""
-    if not naver_store_name:
-        return
-
-    enabled, threshold = _is_alert_enabled_from_cache(prefetched["alert_settings"], "rank_drop")
-    if not enabled:
-        return
-
-    keyword_ids = prefetched["keyword_ids"]
-    if not keyword_ids:
-        return
-
-    # 최근 7일 내 내 상품 rankings만 조회
-    since = utcnow() - timedelta(days=settings.SPARKLINE_DAYS)
-    if product.naver_product_id:
-        my_filter = KeywordRanking.naver_product_id == product.naver_product_id
-    else:
-        my_filter = KeywordRanking.is_my_store == True
-    result = await db.execute(
-        select(KeywordRanking)
-        .where(
-            KeywordRanking.keyword_id.in_(keyword_ids),
-            my_filter,
-            KeywordRanking.crawled_at >= since,
-        )
-        .order_by(KeywordRanking.crawled_at.desc())
-    )
-    all_my_rankings = result.scalars().all()
+def _evaluate_rank_drop(
+    product: Product, keywords: list[SearchKeyword], ctx: _UserAlertContext,
+) -> list[dict]:
+    """내 순위 하락 감지 (키워드별 최근 2회 크롤링 비교)."""
+    if (product.id, "rank_drop") in ctx.recent_alerts:
+        return []
 
-    # 키워드별 그룹핑
-    by_keyword: dict[int, list[KeywordRanking]] = {}
-    for r in all_my_rankings:
-        by_keyword.setdefault(r.keyword_id, []).append(r)
+    rows = []
+    for kw in keywords:
+        current_rank, prev_rank = ctx.my_rank_pairs.get(kw.id, (None, None))
+        if current_rank is None or prev_rank is None or current_rank <= prev_rank:
+            continue
 
-    kw_map = {kw.id: kw for kw in keywords}
+        rows.append({
+            "user_id": product.user_id,
+            "product_id": product.id,
+            "type": "rank_drop",
+            "title": f"{product.name} - 순위 하락",
+            "message": f"'{kw.keyword}' 키워드에서 {prev_rank}위 → {current_rank}위로 하락",
+            "data": {
+                "keyword_id": kw.id,
+                "keyword": kw.keyword,
+                "prev_rank": prev_rank,
+                "current_rank": current_rank,
+            },
+        })
+    return rows
+
+
+async def check_and_create_alerts_for_user(
+    db: AsyncSession,
+    user_id: int,
+    products: list[Product],
+    keywords_by_product: dict[int, list[SearchKeyword]],
+    naver_store_name: str | None,
+) -> int:
+    """크롤링 완료 후 유저의 전체 상품 알림 조건을 한 번에 평가.
 
-    for kw_id, rankings in by_keyword.items():
-        if not rankings:
-            continue
-        # distinct crawled_at 시각 추출 (이미 desc 정렬)
-        seen_times = []
-        for r in rankings:
-            if not seen_times or r.crawled_at != seen_times[-1]:
-                seen_times.append(r.crawled_at)
-            if len(seen_times) >= 2:
-                break
-        if len(seen_times) < 2:
-            continue
+    설정/중복/블랙리스트/최신 rankings/순위 이력을 유저 단위로 1회 조회하고
+    메모리에서 평가한 뒤 Alert·발송 outbox를 일괄 INSERT한다.
 
-        current_ranks = [r.rank for r in rankings if r.crawled_at == seen_times[0]]
-        prev_ranks = [r.rank for r in rankings if r.crawled_at == seen_times[1]]
-        if not current_ranks or not prev_ranks:
-            continue
+    Returns: 생성된 알림 수
+    """
+    products = [p for p in products if keywords_by_product.get(p.id)]
+    if not products:
+        return 0
 
-        current_rank = min(current_ranks)
-        prev_rank = min(prev_ranks)
+    # 설정은 상품 무관하므로 먼저 확인 → 비활성 규칙의 데이터는 조회하지 않음
+    settings_result = await db.execute(
+        select(AlertSetting).where(
+            AlertSetting.user_id == user_id,
+            AlertSetting.alert_type.in_(_ALERT_TYPES),
+        )
+    )
+    alert_settings = {s.alert_type: s for s in settings_result.scalars().all()}
+    undercut_enabled, _ = _is_alert_enabled_from_cache(alert_settings, "price_undercut")
+    rank_drop_enabled, _ = _is_alert_enabled_from_cache(alert_settings, "rank_drop")
+    rank_drop_enabled = rank_drop_enabled and bool(naver_store_name)
+    if not undercut_enabled and not rank_drop_enabled:
+        return 0
+
+    keyword_ids = [kw.id for p in products for kw in keywords_by_product[p.id]]
+    ctx = await _prefetch_user_context(
+        db, user_id, products, keyword_ids, alert_settings,
+        with_rank_history=rank_drop_enabled,
+    )
 
-        if current_rank > prev_rank:
-            if "rank_drop" in prefetched["recent_alert_types"]:
-                continue
+    rows: list[dict] = []
+    for product in products:
+        keywords = keywords_by_product[product.id]
+        if undercut_enabled:
+            row = _evaluate_price_undercut(product, keywords, ctx)
+            if row:
+                rows.append(row)
+        if rank_drop_enabled:
+            rows.extend(_evaluate_rank_drop(product, keywords, ctx))
 
-            kw = kw_map.get(kw_id)
-            kw_name = kw.keyword if kw else ""
-            title = f"{product.name} - 순위 하락"
-            message = f"'{kw_name}' 키워드에서 {prev_rank}위 → {current_rank}위로 하락"
-            alert = Alert(
-                user_id=product.user_id,
-                product_id=product.id,
-                type="rank_drop",
-                title=title,
-                message=message,
-                data={
-                    "keyword_id": kw_id,
-                    "keyword": kw_name,
-                    "prev_rank": prev_rank,
-                    "current_rank": current_rank,
-                },
-            )
-            db.add(alert)
-            await send_push_to_user(db, product.user_id, title, message, {"type": "rank_drop", "product_id": product.id})
-            await send_telegram_to_user(db, product.user_id, title, message, alert_type="rank_drop")
+    created = await _bulk_insert_alerts(db, rows)
+    if created:
+        logger.info(f"유저 {user_id} 알림 {created}건 생성 (상품 {len(products)}개 평가)")
+    return created
 
 
 async def check_and_create_alerts(
@@ -233,11 +274,7 @@ async def check_and_create_alerts(
     keywords: list[SearchKeyword],
     naver_store_name: str | None,
 ):
-    """크롤링 완료 후 호출 - 모든 알림 조건 체크.
-
-    N+1 최적화: 알림 설정/중복 체크/블랙리스트/최신 rankings을
-    한 번에 배치 조회 후 개별 체크 함수에 전달.
-    """
-    prefetched = await _batch_prefetch(db, product.user_id, product, keywords)
-    await _check_price_undercut(db, product, keywords, prefetched)
-    await _check_rank_drop(db, product, keywords, naver_store_name, prefetched)
+    """단일 상품 크롤링 완료 후 호출 - 유저 단위 평가를 상품 1개로 실행."""
+    await check_and_create_alerts_for_user(
+        db, product.user_id, [product], {product.id: keywords}, naver_store_name,
+    )
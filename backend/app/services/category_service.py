@@ -1,47 +1,117 @@
-from sqlalchemy import text
+"""네이버 카테고리 트리 서비스.
+
+keyword_rankings 전체 GROUP BY 대신 naver_category_paths(경로별 건수)를 사용한다.
+- 적재 시: 크롤링 결과의 카테고리 경로 건수를 UPSERT로 증분 (record_category_paths)
+- 데이터 정리 후: keyword_rankings 기준 전체 재집계로 보정 (rebuild_category_paths)
+- 조회 시: 버전 태그(경로 수, 건수 합, 최종 갱신 시각)가 같으면 메모리 캐시 반환
+"""
+
+import logging
+from collections import Counter
+
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.database import upsert_insert
+from app.core.utils import utcnow
+from app.crawlers.base import RankingItem
+from app.models.keyword_ranking import KeywordRanking
+from app.models.naver_category_path import NaverCategoryPath
+
+logger = logging.getLogger(__name__)
+
+CategoryPath = tuple[str, str, str, str]
+
+# (version, tree) — 워커 프로세스별 캐시, 버전 확인은 작은 테이블 집계 1회
+_tree_cache: tuple[tuple, dict] | None = None
+
+
+def category_path(item: RankingItem | KeywordRanking) -> CategoryPath | None:
+    """카테고리 경로 키 (category1이 없으면 None, 하위 누락은 빈 문자열)."""
+    if not item.category1:
+        return None
+    return (item.category1, item.category2 or "", item.category3 or "", item.category4 or "")
+
+
+def count_category_paths(items: list[RankingItem]) -> Counter:
+    return Counter(path for path in map(category_path, items) if path)
+
+
+async def _upsert_paths(db: AsyncSession, counts: Counter, increment: bool) -> None:
+    now = utcnow()
+    # 경로 정렬 — 동시 크롤링 간 행 잠금 순서를 고정해 교착 방지
+    rows = [
+        {
+            "category1": c1, "category2": c2, "category3": c3, "category4": c4,
+            "product_count": cnt, "updated_at": now,
+        }
+        for (c1, c2, c3, c4), cnt in sorted(counts.items())
+    ]
+    stmt = upsert_insert(db, NaverCategoryPath)
+    new_count = stmt.excluded.product_count
+    if increment:
+        new_count = NaverCategoryPath.product_count + new_count
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["category1", "category2", "category3", "category4"],
+        set_={"product_count": new_count, "updated_at": stmt.excluded.updated_at},
+    )
+    await db.execute(stmt, rows)
+
+
+async def record_category_paths(db: AsyncSession, counts: Counter) -> None:
+    """크롤링 결과 카테고리 경로 건수를 증분 UPSERT (호출 트랜잭션에 포함)."""
+    if counts:
+        await _upsert_paths(db, counts, increment=True)
 
-async def get_naver_category_tree(db: AsyncSession) -> dict:
-    """크롤링된 keyword_rankings에서 네이버 카테고리 트리 구조를 반환."""
-    result = await db.execute(text("""
-        SELECT
-            category1,
-            category2,
-            category3,
-            category4,
-            COUNT(*) as cnt
-        FROM keyword_rankings
-        WHERE category1 IS NOT NULL AND category1 != ''
-        GROUP BY category1, category2, category3, category4
-        ORDER BY category1, category2, category3, category4
-    """))
-    rows = result.fetchall()
-
-    tree: dict = {}
-    total_paths = 0
-
-    for cat1, cat2, cat3, cat4, cnt in rows:
-        total_paths += 1
-
-        if cat1 not in tree:
-            tree[cat1] = {"name": cat1, "product_count": 0, "children": {}}
-        tree[cat1]["product_count"] += cnt
-
-        if cat2:
-            if cat2 not in tree[cat1]["children"]:
-                tree[cat1]["children"][cat2] = {"name": cat2, "product_count": 0, "children": {}}
-            tree[cat1]["children"][cat2]["product_count"] += cnt
-
-            if cat3:
-                if cat3 not in tree[cat1]["children"][cat2]["children"]:
-                    tree[cat1]["children"][cat2]["children"][cat3] = {"name": cat3, "product_count": 0, "children": {}}
-                tree[cat1]["children"][cat2]["children"][cat3]["product_count"] += cnt
-
-                if cat4:
-                    if cat4 not in tree[cat1]["children"][cat2]["children"][cat3]["children"]:
-                        tree[cat1]["children"][cat2]["children"][cat3]["children"][cat4] = {"name": cat4, "product_count": 0, "children": {}}
-                    tree[cat1]["children"][cat2]["children"][cat3]["children"][cat4]["product_count"] += cnt
+
+async def rebuild_category_paths(db: AsyncSession) -> int:
+    """keyword_rankings 전체 재집계로 경로 테이블 재작성 (정리 잡/초기 백필용)."""
+    result = await db.execute(
+        select(
+            KeywordRanking.category1,
+            func.coalesce(KeywordRanking.category2, ""),
+            func.coalesce(KeywordRanking.category3, ""),
+            func.coalesce(KeywordRanking.category4, ""),
+            func.count(),
+        )
+        .where(KeywordRanking.category1.isnot(None), KeywordRanking.category1 != "")
+        .group_by(
+            KeywordRanking.category1,
+            func.coalesce(KeywordRanking.category2, ""),
+            func.coalesce(KeywordRanking.category3, ""),
+            func.coalesce(KeywordRanking.category4, ""),
+        )
+    )
+    counts = Counter({(c1, c2, c3, c4): cnt for c1, c2, c3, c4, cnt in result.all()})
+    started_at = utcnow()
+    if counts:
+        await _upsert_paths(db, counts, increment=False)
+    # 이번 재집계에서 갱신되지 않은 경로(보존 기간 만료로 사라진 경로) 삭제
+    await db.execute(delete(NaverCategoryPath).where(NaverCategoryPath.updated_at < started_at))
+    logger.info(f"카테고리 경로 재집계: {len(counts)}개")
+    return len(counts)
+
+
+async def ensure_category_paths(db: AsyncSession) -> None:
+    """경로 테이블이 비어 있고 rankings가 있으면 1회 백필 (배포 직후)."""
+    has_paths = await db.scalar(select(NaverCategoryPath.id).limit(1))
+    if has_paths is None and await db.scalar(select(KeywordRanking.id).limit(1)) is not None:
+        await rebuild_category_paths(db)
+
+
+def _build_tree(rows: list[tuple]) -> dict:
+    """경로 행 → 중첩 트리 (레벨별 노드 dict를 한 번씩만 조회)."""
+    root: dict = {}
+    for *path, cnt in rows:
+        children = root
+        for name in path:
+            if not name:
+                break
+            node = children.get(name)
+            if node is None:
+                node = children[name] = {"name": name, "product_count": 0, "children": {}}
+            node["product_count"] += cnt
+            children = node["children"]
 
     def _to_list(d: dict) -> list:
         return sorted(
@@ -57,6 +127,40 @@ async def get_naver_category_tree(db: AsyncSession) -> dict:
         )
 
     return {
-        "categories": _to_list(tree),
-        "total_paths": total_paths,
+        "categories": _to_list(root),
+        "total_paths": len(rows),
     }
+
+
+async def get_naver_category_tree(db: AsyncSession) -> dict:
+    """naver_category_paths 기반 네이버 카테고리 트리 (버전 태그 캐시)."""
+    global _tree_cache
+    version_row = (await db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(NaverCategoryPath.product_count), 0),
+            func.max(NaverCategoryPath.updated_at),
+        )
+    )).one()
+    version = tuple(version_row)
+    if _tree_cache is not None and _tree_cache[0] == version:
+        return _tree_cache[1]
+
+    result = await db.execute(
+        select(
+            NaverCategoryPath.category1,
+            NaverCategoryPath.category2,
+            NaverCategoryPath.category3,
+            NaverCategoryPath.category4,
+            NaverCategoryPath.product_count,
+        )
+        .order_by(
+            NaverCategoryPath.category1,
+            NaverCategoryPath.category2,
+            NaverCategoryPath.category3,
+            NaverCategoryPath.category4,
+        )
+    )
+    tree = _build_tree(result.all())
+    _tree_cache = (version, tree)
+    return tree
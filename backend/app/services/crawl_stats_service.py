@@ -0,0 +1,209 @@
+"""크롤링 통계 카운터 서비스.
+
+crawl_logs 24시간 집계 대신 crawl_stats_hourly(사업체별/전체 1시간 버킷 카운터)를 사용한다.
+- 기록 시: 크롤링 결과를 프로세스 메모리 버퍼에 누적하고(buffer_crawl_stats), 워커별 스케줄러 잡이
+  CRAWL_STATS_FLUSH_SEC마다 별도의 짧은 트랜잭션으로 UPSERT 증분 (flush_crawl_stats)
+  → 크롤링 트랜잭션은 전체 합계 행(user_id=0, 현재 시간대)을 잠그지 않아 동시 크롤링끼리 대기하지 않음
+  → 반영은 최대 flush 주기만큼 늦고, 종료 시 남은 버퍼를 마지막으로 반영
+- 조회 시: 범위 내 버킷(최대 25행)만 합산 — /crawl/status, 대시보드 성공률, /health 공용
+- 데이터 정리: 보존 기간이 지난 버킷 삭제 (prune_crawl_stats)
+- "최근 24시간"은 24시간 전이 속한 버킷부터라 최대 1시간 더 넓게 집계된다
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import case, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session, upsert_insert
+from app.core.utils import utcnow
+from app.models.crawl_log import CrawlLog
+from app.models.crawl_stat import CrawlStatHourly
+
+logger = logging.getLogger(__name__)
+
+# 전체 합계 행의 user_id
+GLOBAL_SCOPE = 0
+
+
+@dataclass(slots=True)
+class CrawlStatBucket:
+    success_count: int = 0
+    failed_count: int = 0
+    success_duration_ms: int = 0
+    failed_duration_ms: int = 0
+    last_crawled_at: datetime | None = None
+
+    def merge(self, other: "CrawlStatBucket") -> None:
+        self.success_count += other.success_count
+        self.failed_count += other.failed_count
+        self.success_duration_ms += other.success_duration_ms
+        self.failed_duration_ms += other.failed_duration_ms
+        if other.last_crawled_at and (self.last_crawled_at is None or other.last_crawled_at > self.last_crawled_at):
+            self.last_crawled_at = other.last_crawled_at
+
+
+# (user_id, bucket_start) → 누적값
+CrawlStatCounts = dict[tuple[int, datetime], CrawlStatBucket]
+
+# 아직 DB에 반영하지 않은 프로세스 누적분
+_pending: CrawlStatCounts = {}
+
+
+def hour_bucket(at: datetime) -> datetime:
+    return at.replace(minute=0, second=0, microsecond=0)
+
+
+def count_crawl_result(
+    counts: CrawlStatCounts,
+    user_id: int | None,
+    success: bool,
+    duration_ms: int | None,
+    at: datetime,
+) -> None:
+    """크롤링 로그 1건을 사업체/전체 버킷에 누적 (사업체를 모르는 로그는 전체에만)."""
+    bucket_start = hour_bucket(at)
+    scopes = (GLOBAL_SCOPE, user_id) if user_id else (GLOBAL_SCOPE,)
+    for scope in scopes:
+        bucket = counts.get((scope, bucket_start))
+        if bucket is None:
+            bucket = counts[(scope, bucket_start)] = CrawlStatBucket()
+        if success:
+            bucket.success_count += 1
+            bucket.success_duration_ms += duration_ms or 0
+        else:
+            bucket.failed_count += 1
+            bucket.failed_duration_ms += duration_ms or 0
+        if bucket.last_crawled_at is None or at > bucket.last_crawled_at:
+            bucket.last_crawled_at = at
+
+
+async def _upsert_stats(db: AsyncSession, counts: CrawlStatCounts, increment: bool) -> None:
+    # (user_id, 버킷) 정렬 — 동시 크롤링 간 행 잠금 순서를 고정해 교착 방지
+    rows = [
+        {
+            "user_id": user_id,
+            "bucket_start": bucket_start,
+            "success_count": b.success_count,
+            "failed_count": b.failed_count,
+            "success_duration_ms": b.success_duration_ms,
+            "failed_duration_ms": b.failed_duration_ms,
+            "last_crawled_at": b.last_crawled_at,
+        }
+        for (user_id, bucket_start), b in sorted(counts.items(), key=lambda kv: kv[0])
+    ]
+    stmt = upsert_insert(db, CrawlStatHourly)
+    excluded = stmt.excluded
+    counters = ("success_count", "failed_count", "success_duration_ms", "failed_duration_ms")
+    if increment:
+        set_ = {col: getattr(CrawlStatHourly, col) + getattr(excluded, col) for col in counters}
+        set_["last_crawled_at"] = case(
+            (excluded.last_crawled_at > CrawlStatHourly.last_crawled_at, excluded.last_crawled_at),
+            else_=CrawlStatHourly.last_crawled_at,
+        )
+    else:
+        set_ = {col: getattr(excluded, col) for col in (*counters, "last_crawled_at")}
+    stmt = stmt.on_conflict_do_update(index_elements=["user_id", "bucket_start"], set_=set_)
+    await db.execute(stmt, rows)
+
+
+async def record_crawl_stats(db: AsyncSession, counts: CrawlStatCounts) -> None:
+    """누적한 크롤링 결과를 버킷 카운터에 증분 UPSERT (호출 트랜잭션에 포함)."""
+    if counts:
+        await _upsert_stats(db, counts, increment=True)
+
+
+def _merge_counts(into: CrawlStatCounts, counts: CrawlStatCounts) -> None:
+    for key, bucket in counts.items():
+        into.setdefault(key, CrawlStatBucket()).merge(bucket)
+
+
+def buffer_crawl_stats(counts: CrawlStatCounts) -> None:
+    """크롤링 결과를 프로세스 버퍼에 누적 (DB 반영은 flush_crawl_stats)."""
+    _merge_counts(_pending, counts)
+
+
+async def flush_crawl_stats(session_factory: async_sessionmaker = async_session) -> int:
+    """버퍼 누적분을 별도 트랜잭션으로 반영. 실패하면 다음 flush에 다시 시도하도록 버퍼로 되돌림."""
+    if not _pending:
+        return 0
+    counts = dict(_pending)
+    _pending.clear()
+    try:
+        async with session_factory() as db:
+            await record_crawl_stats(db, counts)
+            await db.commit()
+    except Exception:
+        _merge_counts(_pending, counts)
+        raise
+    return len(counts)
+
+
+async def get_crawl_stats(db: AsyncSession, user_id: int = GLOBAL_SCOPE, hours: int = 24) -> dict:
+    """최근 hours시간 버킷 합산 — 성공/실패 건수와 평균 소요 시간."""
+    since = hour_bucket(utcnow() - timedelta(hours=hours))
+    row = (await db.execute(
+        select(
+            func.coalesce(func.sum(CrawlStatHourly.success_count), 0),
+            func.coalesce(func.sum(CrawlStatHourly.failed_count), 0),
+            func.coalesce(func.sum(CrawlStatHourly.success_duration_ms), 0),
+            func.coalesce(func.sum(CrawlStatHourly.failed_duration_ms), 0),
+        )
+        .where(CrawlStatHourly.user_id == user_id, CrawlStatHourly.bucket_start >= since)
+    )).one()
+    success, failed, success_ms, failed_ms = (int(v) for v in row)
+    total = success + failed
+    return {
+        "total": total,
+        "success": success,
+        "failed": failed,
+        "success_rate": round(success / total * 100, 1) if total else None,
+        "avg_success_duration_ms": round(success_ms / success) if success else None,
+        "avg_duration_ms": round((success_ms + failed_ms) / total) if total else None,
+    }
+
+
+async def get_last_crawled_at(db: AsyncSession, user_id: int = GLOBAL_SCOPE) -> datetime | None:
+    """가장 최근 버킷의 마지막 크롤링 시각."""
+    return await db.scalar(
+        select(CrawlStatHourly.last_crawled_at)
+        .where(CrawlStatHourly.user_id == user_id)
+        .order_by(CrawlStatHourly.bucket_start.desc())
+        .limit(1)
+    )
+
+
+async def prune_crawl_stats(db: AsyncSession, cutoff: datetime) -> int:
+    """보존 기간이 지난 버킷 삭제 (사업체 삭제로 남은 행도 함께 정리)."""
+    result = await db.execute(
+        delete(CrawlStatHourly).where(CrawlStatHourly.bucket_start < hour_bucket(cutoff))
+    )
+    return result.rowcount
+
+
+async def rebuild_crawl_stats(db: AsyncSession) -> int:
+    """보존 중인 crawl_logs로 카운터 재작성 (초기 백필용, 필요한 컬럼만 스트리밍)."""
+    cutoff = utcnow() - timedelta(days=settings.DATA_RETENTION_DAYS)
+    counts: CrawlStatCounts = {}
+    result = await db.stream(
+        select(CrawlLog.user_id, CrawlLog.status, CrawlLog.duration_ms, CrawlLog.created_at)
+        .where(CrawlLog.created_at >= cutoff)
+        .execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+    )
+    async for partition in result.partitions():
+        for user_id, status, duration_ms, created_at in partition:
+            count_crawl_result(counts, user_id, status == "success", duration_ms, created_at)
+    if counts:
+        await _upsert_stats(db, counts, increment=False)
+    logger.info(f"크롤링 통계 재집계: {len(counts)}개 버킷")
+    return len(counts)
+
+
+async def ensure_crawl_stats(db: AsyncSession) -> None:
+    """카운터 테이블이 비어 있고 crawl_logs가 있으면 1회 백필 (배포 직후)."""
+    has_stats = await db.scalar(select(CrawlStatHourly.id).limit(1))
+    if has_stats is None and await db.scalar(select(CrawlLog.id).limit(1)) is not None:
+        await rebuild_crawl_stats(db)
@@ -6,11 +6,11 @@ from sqlalchemy.orm import selectinload
 
 from app.core.utils import utcnow
 from app.models.alert import Alert
-from app.models.crawl_log import CrawlLog
 from app.models.excluded_product import ExcludedProduct
 from app.models.keyword_ranking import KeywordRanking
 from app.models.product import Product
-from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services.crawl_stats_service import get_crawl_stats
 from app.services.product_service import (
     _fetch_latest_rankings,
     _filter_relevant,
@@ -37,11 +37,8 @@ async def get_dashboard_summary(db: AsyncSession, user_id: int) -> dict:
     # 키워드 ID 수집
     all_keyword_ids: list[int] = []
     product_keyword_map: dict[int, list[int]] = {}
-    product_active_keywords: dict[int, list] = {}
     for p in products:
-        active = [kw for kw in p.keywords if kw.is_active]
-        product_active_keywords[p.id] = active
-        kw_ids = [kw.id for kw in active]
+        kw_ids = [kw.id for kw in p.keywords if kw.is_active]
         product_keyword_map[p.id] = kw_ids
         all_keyword_ids.extend(kw_ids)
 
@@ -60,7 +57,6 @@ async def get_dashboard_summary(db: AsyncSession, user_id: int) -> dict:
 
     status_counts = {"winning": 0, "close": 0, "losing": 0}
     margins = []
-    last_crawled = None
     active_count = 0
     locked_count = 0
 
@@ -90,12 +86,6 @@ async def get_dashboard_summary(db: AsyncSession, user_id: int) -> dict:
         if margin["margin_percent"] is not None:
             margins.append(margin["margin_percent"])
 
-        active_kws = product_active_keywords[product.id]
-        for kw in active_kws:
-            if kw.last_crawled_at:
-                if last_crawled is None or kw.last_crawled_at > last_crawled:
-                    last_crawled = kw.last_crawled_at
-
     avg_margin = round(sum(margins) / len(margins), 1) if margins else None
 
     # 읽지 않은 알림 수
@@ -104,20 +94,11 @@ async def get_dashboard_summary(db: AsyncSession, user_id: int) -> dict:
     )
     unread_alerts = unread_result.scalar() or 0
 
-    # 크롤링 성공률 (해당 유저의 최근 100건)
-    log_result = await db.execute(
-        select(CrawlLog.status)
-        .join(SearchKeyword, CrawlLog.keyword_id == SearchKeyword.id)
-        .join(Product, SearchKeyword.product_id == Product.id)
-        .where(Product.user_id == user_id)
-        .order_by(CrawlLog.created_at.desc())
-        .limit(100)
-    )
-    logs = log_result.scalars().all()
-    success_rate = None
-    if logs:
-        success_count = sum(1 for s in logs if s == "success")
-        success_rate = round((success_count / len(logs)) * 100, 1)
+    # 마지막 크롤링 시각 (크롤링 완료 시 사업체에 기록)
+    last_crawled = await db.scalar(select(User.last_crawled_at).where(User.id == user_id))
+
+    # 크롤링 성공률 (최근 24시간 버킷 카운터)
+    success_rate = (await get_crawl_stats(db, user_id))["success_rate"]
 
     return {
         "total_products": len(products),
@@ -0,0 +1,226 @@
+"""상품/사업체 삭제 — ORM 로드 없이 집합 단위 DELETE, 대용량 이력은 백그라운드 청크 삭제.
+
+- ORM db.delete()는 cascade 관계(키워드 → 순위 이력, 비용, 블랙리스트, 오버라이드)를
+  전부 메모리에 올린 뒤 한 건씩 지우므로, 여기서는 Core DELETE + DB ON DELETE CASCADE 사용
+- 순위 이력이 BULK_DELETE_INLINE_MAX_ROWS 이하: 요청 트랜잭션에서 바로 삭제
+- 초과: 상품을 즉시 비활성화(목록/검색/크롤링에서 제외)하고, 작업 핸들을 돌려준 뒤
+  keyword_rankings를 CLEANUP_BATCH_SIZE 단위로 커밋하며 지우고 마지막에 상품/사업체 행 삭제
+- 작업은 deletion_jobs 행으로 숨김과 같은 트랜잭션에 기록 — 어느 레플리카에서든 상태 조회,
+  재시작/배포로 중단된 작업은 스케줄러가 resume_deletion_jobs로 이어서 수행
+"""
+
+import logging
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi import BackgroundTasks
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.utils import utcnow
+from app.models.deletion_job import DeletionJob
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.schemas.product import DeletionJobResponse
+
+logger = logging.getLogger(__name__)
+
+
+def _new_job(
+    db: AsyncSession, user_id: int, product_ids: list[int], delete_user: bool, done: bool,
+) -> DeletionJob:
+    """작업 행을 요청 트랜잭션에 추가 (숨김/삭제와 함께 커밋)."""
+    now = utcnow()
+    job = DeletionJob(
+        id=uuid.uuid4().hex, user_id=user_id, product_ids=product_ids, delete_user=delete_user,
+        status="completed" if done else "pending", rankings_deleted=0, created_at=now,
+        finished_at=now if done else None,
+    )
+    db.add(job)
+    return job
+
+
+async def get_deletion_job(db: AsyncSession, job_id: str) -> DeletionJob | None:
+    return await db.get(DeletionJob, job_id)
+
+
+def deletion_job_response(job: DeletionJob) -> DeletionJobResponse:
+    return DeletionJobResponse(
+        id=job.id,
+        user_id=job.user_id,
+        product_count=len(job.product_ids),
+        delete_user=job.delete_user,
+        status=job.status,
+        rankings_deleted=job.rankings_deleted,
+        error=job.error,
+        created_at=job.created_at,
+        finished_at=job.finished_at,
+    )
+
+
+def schedule_deletion(job: DeletionJob, background_tasks: BackgroundTasks) -> None:
+    # 요청 세션 커밋(숨김 + 작업 행) 후 실행 — 실행 전에 프로세스가 죽어도 resume_deletion_jobs가 이어서 수행
+    if job.status == "pending":
+        background_tasks.add_task(run_deletion_job, job.id)
+
+
+def _keyword_ids_of(product_ids: list[int]):
+    return select(SearchKeyword.id).where(SearchKeyword.product_id.in_(product_ids))
+
+
+async def _history_exceeds(db: AsyncSession, product_ids: list[int], limit: int) -> bool:
+    """순위 이력이 limit건 초과인지 (최대 limit+1건만 세므로 대용량에서도 비용 고정)."""
+    if not product_ids:
+        return False
+    sub = (
+        select(KeywordRanking.id)
+        .where(KeywordRanking.keyword_id.in_(_keyword_ids_of(product_ids)))
+        .limit(limit + 1)
+        .subquery()
+    )
+    return (await db.scalar(select(func.count()).select_from(sub))) > limit
+
+
+async def _deactivate(db: AsyncSession, product_ids: list[int]) -> None:
+    if product_ids:
+        await db.execute(
+            update(Product).where(Product.id.in_(product_ids)).values(is_active=False)
+        )
+
+
+async def request_product_deletion(
+    db: AsyncSession, user_id: int, product_ids: list[int],
+) -> DeletionJob:
+    """사업체 소유 상품 삭제 요청. status가 pending이면 run_deletion_job을 예약해야 함."""
+    result = await db.execute(
+        select(Product.id).where(Product.id.in_(product_ids), Product.user_id == user_id)
+    )
+    owned = sorted(result.scalars().all())
+    if not owned:
+        return _new_job(db, user_id, [], False, done=True)
+
+    if await _history_exceeds(db, owned, settings.BULK_DELETE_INLINE_MAX_ROWS):
+        await _deactivate(db, owned)
+        return _new_job(db, user_id, owned, False, done=False)
+
+    await db.execute(delete(Product).where(Product.id.in_(owned)))
+    return _new_job(db, user_id, owned, False, done=True)
+
+
+async def request_user_deletion(db: AsyncSession, user_id: int) -> DeletionJob:
+    """사업체 삭제 요청 (상품/키워드/이력/알림 등은 DB cascade)."""
+    result = await db.execute(select(Product.id).where(Product.user_id == user_id))
+    product_ids = sorted(result.scalars().all())
+
+    if await _history_exceeds(db, product_ids, settings.BULK_DELETE_INLINE_MAX_ROWS):
+        await _deactivate(db, product_ids)
+        return _new_job(db, user_id, product_ids, True, done=False)
+
+    await db.execute(delete(User).where(User.id == user_id))
+    return _new_job(db, user_id, product_ids, True, done=True)
+
+
+async def _claim(db: AsyncSession, job_id: str) -> DeletionJob | None:
+    """대기 중이거나 실행 프로세스가 멈춘 작업을 원자적으로 선점 (다른 프로세스와 중복 실행 방지)."""
+    now = utcnow()
+    stale = now - timedelta(seconds=settings.BACKGROUND_JOB_STALE_SEC)
+    result = await db.execute(
+        update(DeletionJob)
+        .where(
+            DeletionJob.id == job_id,
+            or_(
+                DeletionJob.status == "pending",
+                and_(DeletionJob.status == "running", DeletionJob.heartbeat_at < stale),
+            ),
+        )
+        .values(status="running", heartbeat_at=now)
+    )
+    await db.commit()
+    if not result.rowcount:
+        return None
+    return await db.get(DeletionJob, job_id, populate_existing=True)
+
+
+async def run_deletion_job(
+    job_id: str, session_factory: async_sessionmaker = async_session,
+) -> None:
+    """백그라운드: 순위 이력 청크 삭제 → 상품(또는 사업체) 행 삭제.
+
+    청크마다 진행 건수와 heartbeat를 함께 커밋 — 중간에 멈춰도 남은 이력만 이어서 삭제된다.
+    """
+    batch_size = settings.CLEANUP_BATCH_SIZE
+    async with session_factory() as db:
+        job = await _claim(db, job_id)
+        if job is None:
+            return
+        try:
+            keyword_ids = _keyword_ids_of(job.product_ids)
+            while True:
+                sub = (
+                    select(KeywordRanking.id)
+                    .where(KeywordRanking.keyword_id.in_(keyword_ids))
+                    .limit(batch_size)
+                )
+                result = await db.execute(
+                    delete(KeywordRanking).where(KeywordRanking.id.in_(sub)),
+                    execution_options={"synchronize_session": False},
+                )
+                job.rankings_deleted += result.rowcount
+                job.heartbeat_at = utcnow()
+                await db.commit()
+                if result.rowcount < batch_size:
+                    break
+
+            if job.delete_user:
+                await db.execute(delete(User).where(User.id == job.user_id))
+            else:
+                await db.execute(delete(Product).where(Product.id.in_(job.product_ids)))
+            job.status = "completed"
+            job.finished_at = utcnow()
+            await db.commit()
+            logger.info(
+                f"삭제 작업 완료: {job.id} (user={job.user_id}, 상품 {len(job.product_ids)}개, "
+                f"순위 이력 {job.rankings_deleted}건)"
+            )
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"삭제 작업 실패: {job_id} - {e}")
+            await db.execute(
+                update(DeletionJob)
+                .where(DeletionJob.id == job_id)
+                .values(status="failed", error=str(e), finished_at=utcnow())
+            )
+            await db.commit()
+
+
+async def resume_deletion_jobs(session_factory: async_sessionmaker = async_session) -> int:
+    """재시작/배포로 중단되었거나 아직 시작되지 않은 삭제 작업 이어서 수행 (스케줄러 잡)."""
+    stale = utcnow() - timedelta(seconds=settings.BACKGROUND_JOB_STALE_SEC)
+    async with session_factory() as db:
+        result = await db.execute(
+            select(DeletionJob.id)
+            .where(or_(
+                DeletionJob.status == "pending",
+                and_(DeletionJob.status == "running", DeletionJob.heartbeat_at < stale),
+            ))
+            .order_by(DeletionJob.created_at)
+        )
+        job_ids = result.scalars().all()
+    for job_id in job_ids:
+        logger.info(f"삭제 작업 재개: {job_id}")
+        await run_deletion_job(job_id, session_factory)
+    return len(job_ids)
+
+
+async def prune_deletion_jobs(db: AsyncSession, cutoff: datetime) -> int:
+    """끝난 지 오래된 삭제 작업 행 정리."""
+    result = await db.execute(
+        delete(DeletionJob).where(
+            DeletionJob.status.in_(("completed", "failed")), DeletionJob.finished_at < cutoff,
+        )
+    )
+    return result.rowcount
@@ -0,0 +1,200 @@
+"""CSV/NDJSON 내보내기 — 서버 측 커서로 읽으면서 청크 단위로 바로 전송.
+
+- 상품 목록: 상품을 EXPORT_CHUNK_SIZE 단위 파티션으로 스트리밍하고, 파티션마다 내보낼
+  컬럼(최저가/순위/마진/상태)만 계산 (스파크라인·순위 변동·프리셋은 조회하지 않음)
+- 순위 이력: keyword_rankings를 컬럼 단위로 yield_per 스트리밍 (수백만 행도 메모리 일정)
+- 응답이 시작된 뒤 요청 세션은 닫히므로 스트림마다 자체 세션을 연다
+- 상품 목록은 정렬 없이 등록 순(id)으로 내보낸다 (긴급도 정렬은 전체를 모아야 가능)
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.utils import utcnow
+from app.models.excluded_product import ExcludedProduct
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.services.product_service import (
+    _calc_my_rank,
+    _calc_price_gap,
+    _fetch_latest_rankings,
+    _filter_relevant,
+    _find_lowest,
+    calculate_margin,
+    calculate_status,
+)
+
+# (필드, CSV 헤더)
+PRODUCT_COLUMNS = [
+    ("name", "상품명"),
+    ("category", "카테고리"),
+    ("selling_price", "판매가"),
+    ("lowest_price", "최저가"),
+    ("price_gap", "차이"),
+    ("price_gap_percent", "차이(%)"),
+    ("my_rank", "순위"),
+    ("margin_amount", "마진(원)"),
+    ("margin_percent", "마진(%)"),
+    ("status", "상태"),
+    ("is_price_locked", "가격고정"),
+]
+
+RANKING_COLUMNS = [
+    ("crawled_at", "수집시각"),
+    ("product_id", "상품ID"),
+    ("keyword", "키워드"),
+    ("rank", "순위"),
+    ("product_name", "노출 상품명"),
+    ("mall_name", "판매처"),
+    ("price", "가격"),
+    ("shipping_fee", "배송비"),
+    ("is_my_store", "내 스토어"),
+    ("is_relevant", "관련"),
+    ("naver_product_id", "네이버 상품ID"),
+]
+
+RANKING_PERIOD_DAYS = {"1d": 1, "7d": 7, "30d": 30}
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "Y" if value else "N"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    return value
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"직렬화할 수 없는 값: {type(value).__name__}")
+
+
+def encode_rows(rows: list[dict], columns: list[tuple[str, str]], fmt: str, header: bool = False) -> str:
+    """행 묶음을 CSV 또는 NDJSON 문자열 한 덩어리로."""
+    if fmt == "ndjson":
+        return "".join(
+            json.dumps({key: row[key] for key, _ in columns}, ensure_ascii=False, default=_json_default) + "\n"
+            for row in rows
+        )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow([label for _, label in columns])
+    writer.writerows([_csv_value(row[key]) for key, _ in columns] for row in rows)
+    return buffer.getvalue()
+
+
+async def _product_export_rows(db: AsyncSession, products: list[Product]) -> list[dict]:
+    """상품 파티션의 내보내기 컬럼 계산 (상품 목록 화면과 같은 규칙)."""
+    product_ids = [p.id for p in products]
+    excluded_by_product: dict[int, set[str]] = {pid: set() for pid in product_ids}
+    ex_result = await db.execute(
+        select(ExcludedProduct.product_id, ExcludedProduct.naver_product_id)
+        .where(ExcludedProduct.product_id.in_(product_ids))
+    )
+    for pid, naver_id in ex_result.all():
+        excluded_by_product[pid].add(naver_id)
+
+    kw_ids_by_product = {p.id: [kw.id for kw in p.keywords if kw.is_active] for p in products}
+    latest = await _fetch_latest_rankings(
+        db, [kid for ids in kw_ids_by_product.values() for kid in ids],
+    )
+
+    rows = []
+    for product in products:
+        latest_rankings = [r for kid in kw_ids_by_product[product.id] for r in latest.get(kid, [])]
+        relevant = _filter_relevant(latest_rankings, excluded_by_product[product.id])
+        lowest_price, _ = _find_lowest(relevant)
+        price_gap, price_gap_pct = _calc_price_gap(product.selling_price, lowest_price)
+        margin = calculate_margin(product.selling_price, product.cost_price, [
+            {"name": ci.name, "type": ci.type, "value": float(ci.value)}
+            for ci in product.cost_items
+        ])
+        rows.append({
+            "name": product.name,
+            "category": product.category,
+            "selling_price": product.selling_price,
+            "lowest_price": lowest_price,
+            "price_gap": price_gap,
+            "price_gap_percent": price_gap_pct,
+            "my_rank": _calc_my_rank(latest_rankings, product.naver_product_id),
+            "margin_amount": margin["net_margin"],
+            "margin_percent": margin["margin_percent"],
+            "status": calculate_status(product.selling_price, lowest_price),
+            "is_price_locked": product.is_price_locked,
+        })
+    return rows
+
+
+async def stream_product_export(
+    user_id: int, fmt: str = "csv", session_factory: async_sessionmaker = async_session,
+) -> AsyncIterator[str]:
+    """사업체 상품 목록 내보내기 (파티션마다 한 청크)."""
+    chunk_size = settings.EXPORT_CHUNK_SIZE
+    if fmt == "csv":
+        yield encode_rows([], PRODUCT_COLUMNS, fmt, header=True)
+    async with session_factory() as db:
+        result = await db.stream_scalars(
+            select(Product)
+            .options(selectinload(Product.keywords), selectinload(Product.cost_items))
+            .where(Product.user_id == user_id, Product.is_active == True)
+            .order_by(Product.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for products in result.partitions():
+            rows = await _product_export_rows(db, products)
+            # 세션 identity map은 약한 참조라 전송한 파티션의 객체는 바로 해제된다
+            yield encode_rows(rows, PRODUCT_COLUMNS, fmt)
+
+
+async def stream_ranking_export(
+    user_id: int,
+    fmt: str = "csv",
+    period: str = "7d",
+    product_id: int | None = None,
+    session_factory: async_sessionmaker = async_session,
+) -> AsyncIterator[str]:
+    """순위 이력 원본 내보내기 — 필요한 컬럼만 서버 측 커서로 읽어 청크 전송."""
+    since = utcnow() - timedelta(days=RANKING_PERIOD_DAYS.get(period, 7))
+    query = (
+        select(
+            KeywordRanking.crawled_at,
+            SearchKeyword.product_id,
+            SearchKeyword.keyword,
+            KeywordRanking.rank,
+            KeywordRanking.product_name,
+            KeywordRanking.mall_name,
+            KeywordRanking.price,
+            KeywordRanking.shipping_fee,
+            KeywordRanking.is_my_store,
+            KeywordRanking.is_relevant,
+            KeywordRanking.naver_product_id,
+        )
+        .join(SearchKeyword, SearchKeyword.id == KeywordRanking.keyword_id)
+        .join(Product, Product.id == SearchKeyword.product_id)
+        .where(Product.user_id == user_id, KeywordRanking.crawled_at >= since)
+        .order_by(KeywordRanking.crawled_at, KeywordRanking.id)
+        .execution_options(yield_per=settings.EXPORT_CHUNK_SIZE)
+    )
+    if product_id:
+        query = query.where(SearchKeyword.product_id == product_id)
+
+    if fmt == "csv":
+        yield encode_rows([], RANKING_COLUMNS, fmt, header=True)
+    async with session_factory() as db:
+        result = await db.stream(query)
+        async for partition in result.mappings().partitions():
+            yield encode_rows(partition, RANKING_COLUMNS, fmt)
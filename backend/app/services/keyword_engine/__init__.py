@@ -1,10 +1,11 @@
-from app.services.keyword_engine.classifier import ClassifiedToken, classify_tokens
+from app.services.keyword_engine.classifier import ClassifiedToken, build_matcher, classify_tokens
 from app.services.keyword_engine.generator import GeneratedKeyword, generate_keywords
 from app.services.keyword_engine.weights import WEIGHTS
 
 __all__ = [
     "ClassifiedToken",
     "classify_tokens",
+    "build_matcher",
     "GeneratedKeyword",
     "generate_keywords",
     "WEIGHTS",
@@ -0,0 +1,141 @@
+"""키워드 일괄 추천 — 프로세스 풀에서 청크 단위로 분류/생성.
+
+- 분류·생성은 순수 CPU 작업이므로 요청 코루틴(이벤트 루프)에서 돌리지 않는다
+- 워커 프로세스는 시작 시 DB 사전 스냅샷으로 매처를 1회 컴파일 (청크마다 사전 전송 없음)
+- 스냅샷 버전이 바뀌면 새 풀을 만들고, 이전 풀은 진행 중 청크를 마친 뒤 종료
+- KEYWORD_SUGGEST_WORKERS=0이면 프로세스 풀 없이 스레드에서 실행 (테스트/소형 인스턴스)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
+
+from app.core.config import settings
+from app.services.keyword_engine.classifier import build_matcher
+from app.services.keyword_engine.matcher import PhraseMatcher
+from app.services.keyword_engine.suggest import KeywordSuggestion, suggest
+
+logger = logging.getLogger(__name__)
+
+
+class SuggestInput(NamedTuple):
+    product_name: str
+    store_name: str | None = None
+    category_hint: str | None = None
+
+
+# --- 워커 프로세스 측 ---
+
+_worker_matcher: PhraseMatcher | None = None
+
+
+def _init_worker(brands: frozenset[str], types: frozenset[str]) -> None:
+    global _worker_matcher
+    _worker_matcher = build_matcher(brands, types)
+
+
+def _suggest_chunk(items: list[SuggestInput], matcher: PhraseMatcher | None = None) -> list[KeywordSuggestion]:
+    matcher = matcher or _worker_matcher
+    return [
+        suggest(item.product_name, item.store_name, item.category_hint, matcher=matcher)
+        for item in items
+    ]
+
+
+# --- 요청 프로세스 측 ---
+
+_pool: ProcessPoolExecutor | None = None
+_pool_version: tuple | None = None
+
+
+def _get_pool(dictionary) -> ProcessPoolExecutor | None:
+    """스냅샷 버전에 맞는 프로세스 풀 (워커 0이면 None)."""
+    global _pool, _pool_version
+    if settings.KEYWORD_SUGGEST_WORKERS <= 0:
+        return None
+    if _pool is not None and _pool_version == dictionary.version:
+        return _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False)
+    # spawn: 이벤트 루프/스레드 풀을 가진 부모 프로세스를 fork하지 않도록
+    _pool = ProcessPoolExecutor(
+        max_workers=settings.KEYWORD_SUGGEST_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(dictionary.brands, dictionary.types),
+    )
+    _pool_version = dictionary.version
+    return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor | None = None) -> None:
+    """현재 풀 종료. pool을 주면 그 풀이 아직 현재 풀일 때만 (다른 요청이 만든 새 풀은 유지)."""
+    global _pool, _pool_version
+    if pool is not None and _pool is not pool:
+        return
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool = None
+    _pool_version = None
+
+
+def shutdown_pool() -> None:
+    _discard_pool()
+
+
+async def suggest_batch(
+    items: list[SuggestInput], dictionary,
+) -> AsyncIterator[list[KeywordSuggestion]]:
+    """입력 순서대로 청크별 추천 결과를 내보낸다.
+
+    모든 청크를 먼저 풀에 제출하고 앞 청크부터 완료를 기다리므로, 첫 청크가 끝나는
+    즉시 응답을 흘려보낼 수 있다. 호출측이 중간에 멈추면 남은 청크는 취소된다.
+
+    dictionary: DictionarySnapshot (version/brands/types/matcher)
+    """
+    size = max(settings.KEYWORD_SUGGEST_CHUNK_SIZE, 1)
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+    if not chunks:
+        return
+
+    loop = asyncio.get_running_loop()
+    pool = _get_pool(dictionary)
+    if pool is None:
+        futures = [
+            asyncio.ensure_future(asyncio.to_thread(_suggest_chunk, chunk, dictionary.matcher))
+            for chunk in chunks
+        ]
+    else:
+        futures = [loop.run_in_executor(pool, _suggest_chunk, chunk) for chunk in chunks]
+
+    try:
+        for chunk, future in zip(chunks, futures):
+            try:
+                yield await future
+            except BrokenProcessPool:
+                # 워커 비정상 종료: 풀을 버리고 남은 청크는 스레드에서 처리
+                logger.warning("키워드 추천 프로세스 풀 손상 — 스레드 실행으로 대체")
+                _discard_pool(pool)
+                yield await asyncio.to_thread(_suggest_chunk, chunk, dictionary.matcher)
+            except asyncio.CancelledError:
+                # 손상된 풀을 버리면서(cancel_futures) 취소된 청크도 스레드에서 처리 — 요청 자체의 취소는 전파
+                if pool is None or asyncio.current_task().cancelling():
+                    raise
+                yield await asyncio.to_thread(_suggest_chunk, chunk, dictionary.matcher)
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def suggest_keyword_lists(
+    items: list[SuggestInput], dictionary, limit: int = 5,
+) -> list[list[str]]:
+    """일괄 추천 → 상품별 키워드 문자열 목록 (스토어 상품 미리보기용)."""
+    result: list[list[str]] = []
+    async for chunk in suggest_batch(items, dictionary):
+        result.extend(s.keyword_list(limit) for s in chunk)
+    return result
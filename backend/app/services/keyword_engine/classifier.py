@@ -4,6 +4,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+from app.services.keyword_engine.matcher import MatchLabel, PhraseMatcher
 from app.services.keyword_engine.weights import WEIGHTS
 
 # ---------------------------------------------------------------------------
@@ -107,6 +108,49 @@ _MODIFIERS = {
 _MODIFIERS_LOWER = {m.lower() for m in _MODIFIERS}
 
 
+# ---------------------------------------------------------------------------
+# 사전 매처 (2~3단계) — 사전 버전당 1회 컴파일
+# ---------------------------------------------------------------------------
+
+def _add_builtin_dicts(matcher: PhraseMatcher) -> None:
+    # 같은 구문이 여러 사전에 있으면 먼저 추가된 쪽이 우선 (기존 판정 순서 유지)
+    matcher.add_all(_MODIFIERS_LOWER, MatchLabel("MODIFIER", "dict"))
+    matcher.add_all(_COLORS_LOWER, MatchLabel("COLOR", "dict"))
+    matcher.add_all(_MATERIALS_LOWER, MatchLabel("MATERIAL", "dict"))
+    matcher.add_all(_BRANDS_LOWER, MatchLabel("BRAND", "dict"))
+
+
+def build_matcher(
+    db_brands: set[str] | frozenset[str] | None = None,
+    db_types: set[str] | frozenset[str] | None = None,
+) -> PhraseMatcher:
+    """내장 사전 + DB 사전을 하나의 매처로 컴파일."""
+    matcher = PhraseMatcher()
+    _add_builtin_dicts(matcher)
+    if db_brands:
+        matcher.add_all(db_brands, MatchLabel("BRAND", "db"))
+    if db_types:
+        matcher.add_all(db_types, MatchLabel("TYPE", "db"))
+    return matcher
+
+
+_BUILTIN_MATCHER = build_matcher()
+# 사전 집합을 직접 넘기는 호출용 1칸 캐시 (같은 집합 객체면 재컴파일하지 않음)
+_adhoc_matcher: tuple[object, object, PhraseMatcher] | None = None
+
+
+def _matcher_for(db_brands, db_types) -> PhraseMatcher:
+    global _adhoc_matcher
+    if not db_brands and not db_types:
+        return _BUILTIN_MATCHER
+    cached = _adhoc_matcher
+    if cached is not None and cached[0] is db_brands and cached[1] is db_types:
+        return cached[2]
+    matcher = build_matcher(db_brands, db_types)
+    _adhoc_matcher = (db_brands, db_types, matcher)
+    return matcher
+
+
 # ---------------------------------------------------------------------------
 # 분류 함수
 # ---------------------------------------------------------------------------
@@ -115,20 +159,49 @@ def classify_tokens(
     product_name: str,
     db_brands: set[str] | None = None,
     db_types: set[str] | None = None,
+    matcher: PhraseMatcher | None = None,
 ) -> list[ClassifiedToken]:
     """상품명을 토큰으로 분류.
 
+    여러 단어로 된 사전 항목("new balance", "로즈 골드")은 하나의 토큰으로 합쳐진다.
+
     Args:
         product_name: 상품명
         db_brands: DB에서 가져온 브랜드/제조사 집합 (소문자)
         db_types: DB에서 가져온 카테고리 집합 (소문자)
+        matcher: 미리 컴파일된 매처 (DB 사전 스냅샷에 포함). 주어지면 db_brands/db_types 무시
     """
     tokens = _tokenize(product_name)
-    result: list[ClassifiedToken] = []
+    if matcher is None:
+        matcher = _matcher_for(db_brands, db_types)
+
+    # 1단계: 정규식 — 분류된 토큰은 사전 구간에 포함되지 않음
+    by_regex: dict[int, ClassifiedToken] = {}
+    for i, token in enumerate(tokens):
+        classified = _classify_regex(token)
+        if classified:
+            by_regex[i] = classified
+
+    # 2~3단계: 내장/DB 사전 최장 구간 매칭 (1회 스캔)
+    spans = {span.start: span for span in matcher.find_spans(tokens, blocked=set(by_regex))}
 
-    for token in tokens:
-        classified = _classify_single(token, db_brands, db_types)
-        result.append(classified)
+    result: list[ClassifiedToken] = []
+    i = 0
+    while i < len(tokens):
+        if i in by_regex:
+            result.append(by_regex[i])
+            i += 1
+        elif i in spans:
+            span = spans[i]
+            text = " ".join(tokens[span.start:span.end])
+            category = span.label.category
+            result.append(ClassifiedToken(text, category, WEIGHTS[category], span.label.source))
+            i = span.end
+        else:
+            # 첫 번째 토큰이면 BRAND 추정, 아니면 TYPE
+            # (caller에서 위치 정보가 필요하므로 FEATURE로 분류)
+            result.append(ClassifiedToken(tokens[i], "FEATURE", WEIGHTS["FEATURE"], "dict"))
+            i += 1
 
     return result
 
@@ -163,15 +236,8 @@ def _tokenize(name: str) -> list[str]:
     return tokens
 
 
-def _classify_single(
-    token: str,
-    db_brands: set[str] | None,
-    db_types: set[str] | None,
-) -> ClassifiedToken:
-    """단일 토큰 분류."""
-    lower = token.lower()
-
-    # 1단계: 정규식 (CAPACITY/SIZE/QUANTITY를 MODEL보다 먼저 체크)
+def _classify_regex(token: str) -> ClassifiedToken | None:
+    """정규식 분류 (CAPACITY/SIZE/QUANTITY를 MODEL보다 먼저 체크)."""
     if _CAPACITY_RE.match(token):
         return ClassifiedToken(token, "CAPACITY", WEIGHTS["CAPACITY"], "regex")
     if _SIZE_RE.match(token):
@@ -180,23 +246,4 @@ def _classify_single(
         return ClassifiedToken(token, "QUANTITY", WEIGHTS["QUANTITY"], "regex")
     if _MODEL_RE.match(token):
         return ClassifiedToken(token, "MODEL", WEIGHTS["MODEL"], "regex")
-
-    # 2단계: 내장 사전
-    if lower in _MODIFIERS_LOWER:
-        return ClassifiedToken(token, "MODIFIER", WEIGHTS["MODIFIER"], "dict")
-    if lower in _COLORS_LOWER:
-        return ClassifiedToken(token, "COLOR", WEIGHTS["COLOR"], "dict")
-    if lower in _MATERIALS_LOWER:
-        return ClassifiedToken(token, "MATERIAL", WEIGHTS["MATERIAL"], "dict")
-    if lower in _BRANDS_LOWER:
-        return ClassifiedToken(token, "BRAND", WEIGHTS["BRAND"], "dict")
-
-    # 3단계: DB 사전
-    if db_brands and lower in db_brands:
-        return ClassifiedToken(token, "BRAND", WEIGHTS["BRAND"], "db")
-    if db_types and lower in db_types:
-        return ClassifiedToken(token, "TYPE", WEIGHTS["TYPE"], "db")
-
-    # 기본: 첫 번째 토큰이면 BRAND 추정, 아니면 TYPE
-    # (caller에서 위치 정보가 필요하므로 FEATURE로 분류)
-    return ClassifiedToken(token, "FEATURE", WEIGHTS["FEATURE"], "dict")
+    return None
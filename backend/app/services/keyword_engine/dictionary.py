@@ -1,83 +1,154 @@
-"""DB 기반 브랜드/카테고리 사전 — 24시간 TTL 캐시."""
+"""DB 기반 브랜드/카테고리 사전 — keyword_dictionary 테이블 + 워커별 스냅샷.
+
+- 적재 시: 크롤링 결과의 brand/maker/category1~4를 UPSERT로 증분 (record_dictionary_terms)
+- 워커 시작 시: 스냅샷 1회 로드 + 구문 매처 컴파일 (load_snapshot)
+- 백그라운드: 버전 태그(용어 수, 최대 id)가 바뀌었을 때만 재로드 (refresh_snapshot)
+  빈도만 증가하는 평상시 크롤링은 용어 집합을 바꾸지 않으므로 재로드하지 않는다
+- 요청 처리: 메모리 스냅샷만 사용하므로 keyword_rankings 스캔으로 멈추지 않음
+"""
 
 import logging
-import time
+from collections import Counter
+from dataclasses import dataclass, field
 
-from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.database import async_session, upsert_insert
+from app.core.utils import utcnow
+from app.crawlers.base import RankingItem
+from app.models.keyword_dictionary import KeywordDictionaryTerm
 from app.models.keyword_ranking import KeywordRanking
+from app.services.keyword_engine.classifier import build_matcher
+from app.services.keyword_engine.matcher import PhraseMatcher
 
 logger = logging.getLogger(__name__)
 
-_TTL = 86400  # 24시간
-
-_brand_cache: set[str] = set()
-_brand_ts: float = 0.0
-
-_type_cache: set[str] = set()
-_type_ts: float = 0.0
+_BRAND_FIELDS = ("brand", "maker")
+_TYPE_FIELDS = ("category1", "category2", "category3", "category4")
+
+
+@dataclass(frozen=True)
+class DictionarySnapshot:
+    version: tuple
+    brands: frozenset[str] = field(default_factory=frozenset)
+    types: frozenset[str] = field(default_factory=frozenset)
+    # 내장 + DB 사전 컴파일 결과 (스냅샷 로드 시 1회 구성, 요청 처리 중 재사용)
+    matcher: PhraseMatcher = field(default_factory=build_matcher)
+
+
+_snapshot: DictionarySnapshot | None = None
+
+
+def _normalize_term(value: str | None) -> str:
+    return value.strip().lower() if value else ""
+
+
+def count_dictionary_terms(items: list[RankingItem]) -> Counter:
+    """크롤링 결과 → {(kind, term): 등장 횟수}."""
+    counts: Counter = Counter()
+    for item in items:
+        for kind, fields in (("brand", _BRAND_FIELDS), ("type", _TYPE_FIELDS)):
+            for name in fields:
+                term = _normalize_term(getattr(item, name, None))
+                if term:
+                    counts[(kind, term[:200])] += 1
+    return counts
+
+
+async def record_dictionary_terms(db: AsyncSession, counts: Counter) -> None:
+    """용어 빈도 증분 UPSERT (호출 트랜잭션에 포함)."""
+    if not counts:
+        return
+    now = utcnow()
+    rows = [
+        {"kind": kind, "term": term, "frequency": cnt, "last_seen": now}
+        for (kind, term), cnt in sorted(counts.items())
+    ]
+    stmt = upsert_insert(db, KeywordDictionaryTerm)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["kind", "term"],
+        set_={
+            "frequency": KeywordDictionaryTerm.frequency + stmt.excluded.frequency,
+            "last_seen": stmt.excluded.last_seen,
+        },
+    )
+    await db.execute(stmt, rows)
+
+
+async def rebuild_dictionary(db: AsyncSession) -> int:
+    """keyword_rankings 전체에서 사전 재구성 (배포 직후 1회 백필용)."""
+    counts: Counter = Counter()
+    for kind, fields in (("brand", _BRAND_FIELDS), ("type", _TYPE_FIELDS)):
+        for name in fields:
+            col = getattr(KeywordRanking, name)
+            term = func.lower(func.trim(col))
+            result = await db.execute(
+                select(term, func.count())
+                .where(col.isnot(None), col != "")
+                .group_by(term)
+            )
+            for value, cnt in result.all():
+                if value:
+                    counts[(kind, value[:200])] += cnt
+    await record_dictionary_terms(db, counts)
+    logger.info(f"키워드 사전 백필: {len(counts)}개")
+    return len(counts)
+
+
+async def prune_dictionary(db: AsyncSession, before) -> int:
+    """보존 기간 동안 한 번도 수집되지 않은 용어 삭제."""
+    result = await db.execute(
+        delete(KeywordDictionaryTerm).where(KeywordDictionaryTerm.last_seen < before)
+    )
+    return result.rowcount
+
+
+async def _current_version(db: AsyncSession) -> tuple:
+    row = (await db.execute(
+        select(func.count(), func.max(KeywordDictionaryTerm.id))
+    )).one()
+    return tuple(row)
+
+
+async def load_snapshot(db: AsyncSession) -> DictionarySnapshot:
+    """사전 테이블 → 메모리 스냅샷 (term/kind 컬럼만 조회)."""
+    global _snapshot
+    version = await _current_version(db)
+    result = await db.execute(select(KeywordDictionaryTerm.kind, KeywordDictionaryTerm.term))
+    brands, types = set(), set()
+    for kind, term in result.all():
+        (brands if kind == "brand" else types).add(term)
+    _snapshot = DictionarySnapshot(
+        version=version,
+        brands=frozenset(brands),
+        types=frozenset(types),
+        matcher=build_matcher(brands, types),
+    )
+    logger.info(f"키워드 사전 로드: 브랜드 {len(brands)}개, 카테고리 {len(types)}개")
+    return _snapshot
 
 
-async def build_brand_dict(db: AsyncSession) -> set[str]:
-    """keyword_rankings에서 DISTINCT brand + maker 수집 (소문자)."""
-    global _brand_cache, _brand_ts
+async def refresh_snapshot(session_factory: async_sessionmaker = async_session) -> bool:
+    """백그라운드 갱신: 버전이 바뀐 경우에만 재로드. Returns: 재로드 여부."""
+    async with session_factory() as db:
+        if _snapshot is not None and await _current_version(db) == _snapshot.version:
+            return False
+        await load_snapshot(db)
+        return True
 
-    if _brand_cache and (time.monotonic() - _brand_ts) < _TTL:
-        return _brand_cache
 
-    brands: set[str] = set()
+async def ensure_dictionary(db: AsyncSession) -> None:
+    """워커 시작 시: 사전이 비어 있으면 백필 후 스냅샷 로드."""
+    has_terms = await db.scalar(select(KeywordDictionaryTerm.id).limit(1))
+    if has_terms is None and await db.scalar(select(KeywordRanking.id).limit(1)) is not None:
+        await rebuild_dictionary(db)
+        await db.flush()
+    await load_snapshot(db)
 
-    # brand
-    result = await db.execute(
-        select(func.lower(KeywordRanking.brand))
-        .where(KeywordRanking.brand.isnot(None), KeywordRanking.brand != "")
-        .distinct()
-    )
-    for row in result.scalars().all():
-        if row:
-            brands.add(row.strip())
 
-    # maker
-    result = await db.execute(
-        select(func.lower(KeywordRanking.maker))
-        .where(KeywordRanking.maker.isnot(None), KeywordRanking.maker != "")
-        .distinct()
-    )
-    for row in result.scalars().all():
-        if row:
-            brands.add(row.strip())
-
-    _brand_cache = brands
-    _brand_ts = time.monotonic()
-    logger.info(f"브랜드 사전 갱신: {len(brands)}개")
-    return brands
-
-
-async def build_type_dict(db: AsyncSession) -> set[str]:
-    """keyword_rankings에서 DISTINCT category1~4 수집 (소문자)."""
-    global _type_cache, _type_ts
-
-    if _type_cache and (time.monotonic() - _type_ts) < _TTL:
-        return _type_cache
-
-    types: set[str] = set()
-    for col in [
-        KeywordRanking.category1,
-        KeywordRanking.category2,
-        KeywordRanking.category3,
-        KeywordRanking.category4,
-    ]:
-        result = await db.execute(
-            select(func.lower(col))
-            .where(col.isnot(None), col != "")
-            .distinct()
-        )
-        for row in result.scalars().all():
-            if row:
-                types.add(row.strip())
-
-    _type_cache = types
-    _type_ts = time.monotonic()
-    logger.info(f"카테고리 사전 갱신: {len(types)}개")
-    return types
+async def get_snapshot(db: AsyncSession) -> DictionarySnapshot:
+    """현재 스냅샷 (시작 시 로드되지 않은 경우에만 1회 로드)."""
+    if _snapshot is None:
+        return await load_snapshot(db)
+    return _snapshot
@@ -0,0 +1,94 @@
+"""사전 구문 매처 — 상품명의 최장 사전 구간을 1회 스캔으로 탐색.
+
+- 사전 항목은 소문자 + 공백 제거 키로 저장: "new balance" / "newbalance" / "로즈 골드" 모두 매칭
+- 매칭은 토큰 경계에서 시작·종료하는 구간만 인정 (단어 중간 부분 일치 방지)
+- 각 위치에서 가장 긴 구간을 선택하고 그 다음 토큰부터 이어서 탐색 (leftmost-longest)
+- 위치당 연속 토큰 결합 키를 최대 MAX_SPAN_TOKENS개까지 해시 조회하므로
+  탐색 비용은 상품명 토큰 수에 비례하고 사전 크기와 무관
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# 한 사전 항목이 걸칠 수 있는 최대 토큰 수 ("삼성 전자 비스포크 그랑데" 정도까지)
+MAX_SPAN_TOKENS = 4
+
+
+@dataclass(frozen=True)
+class MatchLabel:
+    category: str
+    source: str  # "dict" | "db"
+
+
+@dataclass(frozen=True)
+class MatchSpan:
+    start: int  # 토큰 인덱스 (포함)
+    end: int  # 토큰 인덱스 (미포함)
+    label: MatchLabel
+
+
+def _phrase_key(phrase: str) -> str:
+    return "".join(phrase.lower().split())
+
+
+class PhraseMatcher:
+    """사전 구문 → 라벨. 같은 키는 먼저 추가된 라벨이 우선."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, MatchLabel] = {}
+        self._max_key_len = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    def add(self, phrase: str, label: MatchLabel) -> None:
+        key = _phrase_key(phrase)
+        if not key or key in self._entries:
+            return
+        self._entries[key] = label
+        self._max_key_len = max(self._max_key_len, len(key))
+
+    def add_all(self, phrases, label: MatchLabel) -> None:
+        for phrase in phrases:
+            self.add(phrase, label)
+
+    def find_spans(self, tokens: list[str], blocked: set[int] | None = None) -> list[MatchSpan]:
+        """토큰 목록에서 겹치지 않는 최장 사전 구간 목록.
+
+        blocked: 구간에 포함될 수 없는 토큰 인덱스 (정규식으로 이미 분류된 토큰 등)
+        """
+        blocked = blocked or set()
+        entries = self._entries
+        max_len = self._max_key_len
+        lowered = [t.lower() for t in tokens]
+        n = len(tokens)
+        spans: list[MatchSpan] = []
+        i = 0
+        while i < n:
+            if i in blocked:
+                i += 1
+                continue
+            # 결합 키 후보 (짧은 것부터) → 뒤에서부터 조회해 최장 일치 우선
+            keys: list[str] = []
+            key = ""
+            j = i
+            while j < n and j not in blocked and j - i < MAX_SPAN_TOKENS:
+                key += lowered[j]
+                if len(key) > max_len:
+                    break
+                keys.append(key)
+                j += 1
+            best: MatchSpan | None = None
+            for length in range(len(keys), 0, -1):
+                label = entries.get(keys[length - 1])
+                if label is not None:
+                    best = MatchSpan(i, i + length, label)
+                    break
+            if best is not None:
+                spans.append(best)
+                i = best.end
+            else:
+                i += 1
+        return spans
@@ -0,0 +1,64 @@
+"""상품명 → 키워드 추천 (순수 함수, DB/이벤트 루프 비의존).
+
+단건 추천 API, 일괄 추천 프로세스 풀 워커, 스토어 상품 미리보기가 같은 로직을 공유한다.
+"""
+
+import re
+from dataclasses import dataclass, field
+
+from app.services.keyword_engine.classifier import ClassifiedToken, classify_tokens
+from app.services.keyword_engine.generator import GeneratedKeyword, generate_keywords
+from app.services.keyword_engine.matcher import PhraseMatcher
+
+
+@dataclass
+class KeywordSuggestion:
+    name: str  # 스토어명 제거 후 상품명
+    tokens: list[ClassifiedToken]
+    keywords: list[GeneratedKeyword]
+    field_guide: dict[str, str | None] = field(default_factory=dict)
+
+    def keyword_list(self, limit: int = 5) -> list[str]:
+        """추천 키워드 문자열 (부족하면 정리된 상품명으로 보충)."""
+        result = [g.keyword for g in self.keywords]
+        seen = {kw.lower() for kw in result}
+        if len(result) < limit and self.name and self.name.lower() not in seen:
+            result.append(self.name)
+        return result[:limit]
+
+
+def strip_store_name(product_name: str, store_name: str | None) -> str:
+    name = product_name.strip()
+    if store_name:
+        for variant in [store_name, store_name.replace(" ", "")]:
+            name = re.sub(re.escape(variant), "", name, flags=re.IGNORECASE).strip()
+    return name
+
+
+def suggest(
+    product_name: str,
+    store_name: str | None = None,
+    category_hint: str | None = None,
+    matcher: PhraseMatcher | None = None,
+    max_count: int = 5,
+) -> KeywordSuggestion:
+    """상품명 분류 + SEO 키워드 조합 생성.
+
+    matcher: DB 사전 스냅샷의 컴파일된 매처 (None이면 내장 사전만 사용)
+    """
+    name = strip_store_name(product_name, store_name)
+    tokens = classify_tokens(name, matcher=matcher)
+    generated = generate_keywords(tokens, max_count=max_count)
+
+    # field_guide: 첫 번째 BRAND, category_hint 또는 첫 TYPE
+    brand_token = next((t for t in tokens if t.category == "BRAND"), None)
+    type_token = next((t for t in tokens if t.category == "TYPE"), None)
+    return KeywordSuggestion(
+        name=name,
+        tokens=tokens,
+        keywords=generated,
+        field_guide={
+            "brand": brand_token.text if brand_token else None,
+            "category": category_hint or (type_token.text if type_token else None),
+        },
+    )
@@ -1,23 +1,41 @@
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.models.cost import CostItem
+from app.models.excluded_product import ExcludedProduct
 from app.models.product import Product
-from app.services.product_service import calculate_margin
+from app.models.search_keyword import SearchKeyword
+from app.services.product_service import (
+    CLOSE_GAP_PERCENT,
+    _fetch_latest_rankings,
+    _filter_relevant,
+    _find_lowest,
+    calculate_margin,
+)
 
+# 가격 범위 미지정 시 기준가(최저가, 없으면 판매가) 대비 스윕 범위
+SWEEP_DEFAULT_RANGE = (0.7, 1.3)
+SWEEP_DEFAULT_POINTS = 200
 
-async def get_margin(db: AsyncSession, product_id: int) -> dict | None:
-    product = await db.get(Product, product_id)
-    if not product:
-        return None
 
+async def _load_cost_items(db: AsyncSession, product_id: int) -> list[dict]:
     result = await db.execute(
         select(CostItem).where(CostItem.product_id == product_id).order_by(CostItem.sort_order)
     )
-    cost_items = [
+    return [
         {"name": ci.name, "type": ci.type, "value": float(ci.value)}
         for ci in result.scalars().all()
     ]
+
+
+async def get_margin(db: AsyncSession, product_id: int) -> dict | None:
+    product = await db.get(Product, product_id)
+    if not product:
+        return None
+
+    cost_items = await _load_cost_items(db, product_id)
     return calculate_margin(product.selling_price, product.cost_price, cost_items)
 
 
@@ -28,11 +46,120 @@ async def simulate_margin(
     if not product:
         return None
 
-    result = await db.execute(
-        select(CostItem).where(CostItem.product_id == product_id).order_by(CostItem.sort_order)
-    )
-    cost_items = [
-        {"name": ci.name, "type": ci.type, "value": float(ci.value)}
-        for ci in result.scalars().all()
-    ]
+    cost_items = await _load_cost_items(db, product_id)
     return calculate_margin(new_selling_price, product.cost_price, cost_items)
+
+
+async def _lowest_competitor_price(db: AsyncSession, product_id: int) -> int | None:
+    """활성 키워드 최신 크롤링 기준 배송비 포함 최저가 (상품 상세와 동일 규칙)."""
+    kw_result = await db.execute(
+        select(SearchKeyword.id).where(
+            SearchKeyword.product_id == product_id, SearchKeyword.is_active == True,
+        )
+    )
+    kw_ids = list(kw_result.scalars().all())
+    ex_result = await db.execute(
+        select(ExcludedProduct.naver_product_id).where(ExcludedProduct.product_id == product_id)
+    )
+    excluded_ids = set(ex_result.scalars().all())
+
+    latest_by_kw = await _fetch_latest_rankings(db, kw_ids)
+    latest_rankings = [r for rows in latest_by_kw.values() for r in rows]
+    lowest_price, _ = _find_lowest(_filter_relevant(latest_rankings, excluded_ids))
+    return lowest_price
+
+
+def sweep_margin_curve(
+    prices: np.ndarray,
+    cost_price: int,
+    cost_items: list[dict],
+    lowest_price: int | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """가격 배열 전체에 대해 (순마진, 마진율, 가격 상태)를 한 번에 계산.
+
+    calculate_margin/calculate_status와 같은 규칙 — 비율 비용은 항목별로 원 단위 절사.
+    """
+    total_costs = np.zeros(prices.shape, dtype=np.int64)
+    for item in cost_items:
+        if item["type"] == "percent":
+            total_costs += np.trunc(prices * item["value"] / 100).astype(np.int64)
+        else:
+            total_costs += int(item["value"])
+
+    net_margin = prices - cost_price - total_costs
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margin_percent = np.where(prices > 0, np.round(net_margin / prices * 100, 1), 0.0)
+
+    if lowest_price is None:
+        status = np.full(prices.shape, "winning", dtype=object)
+    elif lowest_price == 0:
+        status = np.full(prices.shape, "losing", dtype=object)
+    else:
+        gap_percent = (prices - lowest_price) / lowest_price * 100
+        status = np.select(
+            [prices <= lowest_price, gap_percent <= CLOSE_GAP_PERCENT],
+            ["winning", "close"],
+            default="losing",
+        ).astype(object)
+    return net_margin, margin_percent, status
+
+
+def _first_price_where(prices: np.ndarray, mask: np.ndarray) -> int | None:
+    idx = np.flatnonzero(mask)
+    return int(prices[idx[0]]) if idx.size else None
+
+
+async def sweep_margin(
+    db: AsyncSession,
+    product_id: int,
+    min_price: int | None = None,
+    max_price: int | None = None,
+    step: int | None = None,
+    target_margin_percent: float | None = None,
+) -> dict | None:
+    """가격 범위 전체의 마진/마진율/가격 상태 곡선 + 손익분기·목표 마진 가격."""
+    product = await db.get(Product, product_id)
+    if not product:
+        return None
+
+    cost_items = await _load_cost_items(db, product_id)
+    lowest_price = await _lowest_competitor_price(db, product_id)
+
+    reference = lowest_price or product.selling_price
+    if min_price is None:
+        min_price = int(reference * SWEEP_DEFAULT_RANGE[0])
+    if max_price is None:
+        max_price = max(int(reference * SWEEP_DEFAULT_RANGE[1]), min_price)
+    if max_price < min_price:
+        raise ValueError("max_price는 min_price 이상이어야 합니다.")
+    if step is None:
+        step = max(1, (max_price - min_price) // SWEEP_DEFAULT_POINTS)
+    points = (max_price - min_price) // step + 1
+    if points > settings.MARGIN_SWEEP_MAX_POINTS:
+        raise ValueError(
+            f"가격 구간이 너무 많습니다 ({points}개, 최대 {settings.MARGIN_SWEEP_MAX_POINTS}개). "
+            "step을 늘려주세요."
+        )
+
+    prices = np.arange(min_price, max_price + 1, step, dtype=np.int64)
+    net_margin, margin_percent, status = sweep_margin_curve(
+        prices, product.cost_price, cost_items, lowest_price,
+    )
+
+    target_price = None
+    if target_margin_percent is not None:
+        target_price = _first_price_where(prices, margin_percent >= target_margin_percent)
+
+    return {
+        "selling_price": product.selling_price,
+        "cost_price": product.cost_price,
+        "lowest_price": lowest_price,
+        "step": step,
+        "prices": prices.tolist(),
+        "net_margins": net_margin.tolist(),
+        "margin_percents": margin_percent.tolist(),
+        "statuses": status.tolist(),
+        "break_even_price": _first_price_where(prices, net_margin >= 0),
+        "target_margin_percent": target_margin_percent,
+        "target_price": target_price,
+    }
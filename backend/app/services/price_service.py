@@ -1,5 +1,6 @@
-from datetime import timedelta
+from datetime import timedelta, timezone
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,19 +12,13 @@ from app.services.product_service import _fetch_latest_rankings
 PERIOD_DAYS = {"1d": 1, "7d": 7, "30d": 30}
 
 
-async def get_price_history(
-    db: AsyncSession,
-    product_id: int,
-    period: str = "7d",
-    keyword_id: int | None = None,
-) -> list[dict]:
-    """키워드별 가격/순위 이력 조회."""
+def _history_query(product_id: int, period: str, keyword_id: int | None, *columns):
     days = PERIOD_DAYS.get(period, 7)
     since = utcnow() - timedelta(days=days)
 
     query = (
-        select(KeywordRanking)
-        .join(SearchKeyword)
+        select(*columns)
+        .join(SearchKeyword, SearchKeyword.id == KeywordRanking.keyword_id)
         .where(
             SearchKeyword.product_id == product_id,
             SearchKeyword.is_active == True,
@@ -32,8 +27,17 @@ async def get_price_history(
     )
     if keyword_id:
         query = query.where(SearchKeyword.id == keyword_id)
+    return query.order_by(KeywordRanking.crawled_at)
+
 
-    query = query.order_by(KeywordRanking.crawled_at)
+async def get_price_history(
+    db: AsyncSession,
+    product_id: int,
+    period: str = "7d",
+    keyword_id: int | None = None,
+) -> list[dict]:
+    """키워드별 가격/순위 이력 조회."""
+    query = _history_query(product_id, period, keyword_id, KeywordRanking)
     result = await db.execute(query)
     rankings = result.scalars().all()
 
@@ -51,6 +55,121 @@ async def get_price_history(
     ]
 
 
+def downsample_minmax(t: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """시간 구간 points/2개마다 최저가·최고가 행 인덱스 (시간순) — 가격 변동 극값 보존."""
+    size = len(t)
+    if size <= points:
+        return np.arange(size)
+    buckets = max(points // 2, 1)
+    span = int(t[-1] - t[0])
+    if span > 0:
+        bucket = np.minimum((t - t[0]) * buckets // span, buckets - 1)
+    else:
+        bucket = np.arange(size) * buckets // size
+    order = np.lexsort((y, bucket))
+    b = bucket[order]
+    boundary = b[1:] != b[:-1]
+    first = np.r_[True, boundary]
+    last = np.r_[boundary, True]
+    return np.union1d(order[first], order[last])
+
+
+def downsample_lttb(t: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets — 선 모양을 가장 잘 유지하는 points개 행 인덱스."""
+    size = len(t)
+    if size <= points:
+        return np.arange(size)
+    if points < 3:
+        return downsample_minmax(t, y, points)
+    x = t.astype(np.float64)
+    yf = y.astype(np.float64)
+    # 첫/마지막 점은 고정, 나머지를 points-2개 구간으로
+    edges = np.linspace(1, size - 1, points - 1).astype(np.int64)
+    keep = np.empty(points, dtype=np.int64)
+    keep[0], keep[-1] = 0, size - 1
+    a = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else size
+        avg_x = x[hi:next_hi].mean()
+        avg_y = yf[hi:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (yf[lo:hi] - yf[a]) - (x[a] - x[lo:hi]) * (avg_y - yf[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+async def get_price_history_columnar(
+    db: AsyncSession,
+    product_id: int,
+    period: str = "7d",
+    keyword_id: int | None = None,
+    points: int = 300,
+    downsample: str = "minmax",
+) -> dict:
+    """차트용 가격 이력 — 시리즈(키워드 × 내 스토어 여부)별 컬럼 배열 + 다운샘플링.
+
+    판매처/상품명은 사전(malls, product_names)에 한 번만 담고 시리즈에는 인덱스만 보낸다.
+    crawled_at은 UTC epoch 초.
+    """
+    query = _history_query(
+        product_id, period, keyword_id,
+        KeywordRanking.keyword_id,
+        KeywordRanking.is_my_store,
+        KeywordRanking.crawled_at,
+        KeywordRanking.price,
+        KeywordRanking.rank,
+        KeywordRanking.mall_name,
+        KeywordRanking.product_name,
+    )
+    rows = (await db.execute(query)).all()
+
+    grouped: dict[tuple[int, bool], list] = {}
+    for row in rows:
+        grouped.setdefault((row.keyword_id, bool(row.is_my_store)), []).append(row)
+
+    malls: dict[str, int] = {}
+    product_names: dict[str, int] = {}
+    series = []
+    returned = 0
+    for (kw_id, is_my_store), group in sorted(grouped.items()):
+        t = np.fromiter(
+            (int(r.crawled_at.replace(tzinfo=timezone.utc).timestamp()) for r in group),
+            dtype=np.int64, count=len(group),
+        )
+        y = np.fromiter((r.price for r in group), dtype=np.int64, count=len(group))
+        if downsample == "lttb":
+            keep = downsample_lttb(t, y, points)
+        elif downsample == "minmax":
+            keep = downsample_minmax(t, y, points)
+        else:
+            keep = np.arange(len(group))
+
+        kept = [group[i] for i in keep.tolist()]
+        returned += len(kept)
+        series.append({
+            "keyword_id": kw_id,
+            "is_my_store": is_my_store,
+            "total": len(group),
+            "crawled_at": t[keep].tolist(),
+            "price": y[keep].tolist(),
+            "rank": [r.rank for r in kept],
+            "mall": [malls.setdefault(r.mall_name, len(malls)) for r in kept],
+            "product_name": [product_names.setdefault(r.product_name, len(product_names)) for r in kept],
+        })
+
+    return {
+        "period": period,
+        "downsample": downsample,
+        "points": points,
+        "total_rows": len(rows),
+        "returned_rows": returned,
+        "malls": list(malls),
+        "product_names": list(product_names),
+        "series": series,
+    }
+
+
 async def get_price_snapshot(db: AsyncSession, product_id: int) -> list[dict]:
     """키워드별 최신 가격 스냅샷."""
     result = await db.execute(
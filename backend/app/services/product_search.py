@@ -0,0 +1,113 @@
+"""상품 검색 — products.search_text 기반 부분 일치 + 유사도 랭킹.
+
+PostgreSQL: pg_trgm GIN 인덱스(ix_products_search_trgm)로 토큰별 LIKE와
+word_similarity(<%) 오타 허용 검색을 처리하고 DB에서 점수 순으로 정렬한다.
+SQLite(테스트/로컬): 동일 정규화 + Python 트라이그램 유사도로 대체.
+"""
+
+import logging
+
+from sqlalchemy import and_, case, func, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.utils import build_product_search_text, normalize_search_text
+from app.models.product import Product
+
+logger = logging.getLogger(__name__)
+
+# pg_trgm.word_similarity_threshold 기본값과 동일
+_FUZZY_THRESHOLD = 0.6
+
+
+def _search_tokens(term: str) -> list[str]:
+    """검색어 → 정규화 토큰 (공백 기준 분리, 모든 토큰이 포함되어야 부분 일치)."""
+    return [t for t in (normalize_search_text(w) for w in term.split()) if t]
+
+
+def _trigrams(text: str) -> set[str]:
+    """pg_trgm과 같은 방식의 단어별 트라이그램 (앞 공백 2개, 뒤 공백 1개 패딩)."""
+    grams: set[str] = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def _word_similarity(query: str, text: str) -> float:
+    """검색어 트라이그램 중 대상 텍스트에 포함된 비율 (word_similarity 근사)."""
+    q = _trigrams(query)
+    if not q:
+        return 0.0
+    return len(q & _trigrams(text)) / len(q)
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+async def search_product_ids(
+    db: AsyncSession,
+    user_id: int,
+    term: str,
+    category: str | None = None,
+    limit: int | None = None,
+) -> list[int]:
+    """검색어에 맞는 활성 상품 ID를 관련도 순으로 반환.
+
+    모든 토큰을 포함하는 상품이 우선, 그 다음 유사도(오타 허용) 순.
+    """
+    tokens = _search_tokens(term)
+    if not tokens:
+        return []
+    query_text = " ".join(tokens)
+    limit = limit or settings.PRODUCT_SEARCH_MAX_RESULTS
+
+    base = [Product.user_id == user_id, Product.is_active == True]
+    if category:
+        base.append(Product.category == category)
+
+    if db.bind.dialect.name == "postgresql":
+        contains_all = and_(*[
+            Product.search_text.like(f"%{_escape_like(t)}%", escape="\\") for t in tokens
+        ])
+        fuzzy = literal(query_text).op("<%")(Product.search_text)
+        score = func.word_similarity(query_text, Product.search_text)
+        result = await db.execute(
+            select(Product.id)
+            .where(*base, or_(contains_all, fuzzy))
+            .order_by(case((contains_all, 0), else_=1), score.desc(), Product.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    # 포터블 fallback: 후보 (id, search_text)만 조회 후 Python 점수화
+    result = await db.execute(select(Product.id, Product.search_text).where(*base))
+    scored = []
+    for pid, search_text in result.all():
+        search_text = search_text or ""
+        contains_all = all(t in search_text for t in tokens)
+        score = _word_similarity(query_text, search_text)
+        if contains_all or score >= _FUZZY_THRESHOLD:
+            scored.append((0 if contains_all else 1, -score, pid))
+    scored.sort()
+    return [pid for _, _, pid in scored[:limit]]
+
+
+async def backfill_search_text(db: AsyncSession, batch_size: int = 1000) -> int:
+    """search_text가 비어 있는 기존 상품 채우기 (컬럼 추가 직후 1회성)."""
+    filled = 0
+    while True:
+        result = await db.execute(
+            select(Product).where(Product.search_text.is_(None)).limit(batch_size)
+        )
+        products = result.scalars().all()
+        if not products:
+            break
+        for p in products:
+            p.search_text = build_product_search_text(p.name, p.model_code, p.brand)
+        await db.flush()
+        filled += len(products)
+    if filled:
+        logger.info(f"상품 검색 텍스트 백필: {filled}건")
+    return filled
@@ -1,6 +1,6 @@
 from datetime import timedelta
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,6 +12,10 @@ from app.models.search_keyword import SearchKeyword
 from app.models.shipping_override import ShippingOverride
 from app.core.utils import utcnow
 from app.services.cost_service import get_applied_preset_ids, get_applied_preset_ids_batch
+from app.services.product_search import search_product_ids
+
+# 최저가 대비 이 비율(%) 이내로 비싸면 close
+CLOSE_GAP_PERCENT = 3.0
 
 
 def calculate_status(selling_price: int, lowest_price: int | None) -> str:
@@ -22,7 +26,7 @@ def calculate_status(selling_price: int, lowest_price: int | None) -> str:
     if selling_price <= lowest_price:
         return "winning"
     gap_percent = ((selling_price - lowest_price) / lowest_price) * 100
-    if gap_percent <= 3.0:
+    if gap_percent <= CLOSE_GAP_PERCENT:
         return "close"
     return "losing"
 
@@ -231,123 +235,70 @@ def _build_sparkline_from_batch(
     return [day_mins[d] for d in sorted(day_mins)]
 
 
-async def _fetch_rank_change(
+async def _fetch_my_rank_pairs(
     db: AsyncSession,
     keyword_ids: list[int],
-    product_naver_id: str | None,
     since=None,
-) -> int | None:
-    """내 상품의 최근 2회 크롤링 순위 변동 계산."""
-    if not keyword_ids:
-        return None
-
-    # 내 상품 rankings만 조회
-    query = (
-        select(
-            KeywordRanking.keyword_id,
-            KeywordRanking.rank,
-            KeywordRanking.crawled_at,
-        )
-        .where(KeywordRanking.keyword_id.in_(keyword_ids))
-    )
-    if since is not None:
-        query = query.where(KeywordRanking.crawled_at >= since)
-
-    if product_naver_id:
-        query = query.where(KeywordRanking.naver_product_id == product_naver_id)
-    else:
-        query = query.where(KeywordRanking.is_my_store == True)
-
-    query = query.order_by(KeywordRanking.crawled_at.desc())
-    result = await db.execute(query)
-    rows = result.all()
-
-    if not rows:
-        return None
-
-    # 키워드별로 그룹핑해서 첫 번째 키워드의 변동 반환
-    by_keyword: dict[int, list] = {}
-    for r in rows:
-        by_keyword.setdefault(r.keyword_id, []).append(r)
-
-    for kw_id, kw_rows in by_keyword.items():
-        if len(kw_rows) < 2:
-            continue
-        latest_time = kw_rows[0].crawled_at
-        latest = [r for r in kw_rows if r.crawled_at == latest_time]
-        prev = [r for r in kw_rows if r.crawled_at != latest_time]
-        if not latest or not prev:
-            continue
-        prev_time = max(r.crawled_at for r in prev)
-        prev_at = [r for r in prev if r.crawled_at == prev_time]
-        current_rank = min(r.rank for r in latest)
-        prev_rank = min(r.rank for r in prev_at)
-        return current_rank - prev_rank
-
-    return None
+) -> dict[int, tuple[int, int | None]]:
+    """키워드별 내 상품의 (현재 순위, 직전 크롤링 순위)를 DB 윈도 함수로 계산.
 
+    내 상품 행 = 키워드 소속 상품의 naver_product_id 일치 (미등록 상품은 is_my_store).
+    크롤링 시각별 최고 순위로 집계 → LAG로 직전 순위, ROW_NUMBER로 최신 1행만 반환.
 
-async def _fetch_rank_change_batch(
-    db: AsyncSession,
-    all_keyword_ids: list[int],
-    since=None,
-) -> dict[int, list]:
-    """전체 keyword_ids에 대한 내 상품 rank 원시 데이터를 1회 쿼리로 수집.
-
-    Returns: {keyword_id: [(rank, crawled_at, naver_product_id, is_my_store)]}
-    상품별 naver_product_id가 다르므로 원시 데이터만 수집, Python에서 필터링.
+    Returns: {keyword_id: (current_rank, prev_rank | None)}
     """
-    if not all_keyword_ids:
+    if not keyword_ids:
         return {}
 
-    query = (
+    my_row = or_(
+        and_(
+            Product.naver_product_id.isnot(None),
+            KeywordRanking.naver_product_id == Product.naver_product_id,
+        ),
+        and_(Product.naver_product_id.is_(None), KeywordRanking.is_my_store == True),
+    )
+    per_crawl = (
         select(
             KeywordRanking.keyword_id,
-            KeywordRanking.rank,
             KeywordRanking.crawled_at,
-            KeywordRanking.naver_product_id,
-            KeywordRanking.is_my_store,
+            func.min(KeywordRanking.rank).label("best_rank"),
         )
-        .where(KeywordRanking.keyword_id.in_(all_keyword_ids))
+        .join(SearchKeyword, KeywordRanking.keyword_id == SearchKeyword.id)
+        .join(Product, SearchKeyword.product_id == Product.id)
+        .where(KeywordRanking.keyword_id.in_(keyword_ids), my_row)
+        .group_by(KeywordRanking.keyword_id, KeywordRanking.crawled_at)
     )
     if since is not None:
-        query = query.where(KeywordRanking.crawled_at >= since)
-    query = query.order_by(KeywordRanking.crawled_at.desc())
-    result = await db.execute(query)
-    rows = result.all()
+        per_crawl = per_crawl.where(KeywordRanking.crawled_at >= since)
+    per_crawl = per_crawl.subquery()
+
+    ranked = select(
+        per_crawl.c.keyword_id,
+        per_crawl.c.best_rank,
+        func.lag(per_crawl.c.best_rank).over(
+            partition_by=per_crawl.c.keyword_id, order_by=per_crawl.c.crawled_at,
+        ).label("prev_rank"),
+        func.row_number().over(
+            partition_by=per_crawl.c.keyword_id, order_by=per_crawl.c.crawled_at.desc(),
+        ).label("rn"),
+    ).subquery()
 
-    grouped: dict[int, list] = {}
-    for r in rows:
-        grouped.setdefault(r.keyword_id, []).append(r)
-    return grouped
+    result = await db.execute(
+        select(ranked.c.keyword_id, ranked.c.best_rank, ranked.c.prev_rank)
+        .where(ranked.c.rn == 1)
+    )
+    return {kid: (current, prev) for kid, current, prev in result.all()}
 
 
-def _calc_rank_change_from_batch(
-    raw_data: dict[int, list],
+def _rank_change_from_pairs(
+    pairs: dict[int, tuple[int, int | None]],
     keyword_ids: list[int],
-    product_naver_id: str | None,
 ) -> int | None:
-    """배치 원시 데이터에서 상품별 naver_product_id로 rank_change 계산."""
+    """키워드 순서대로 첫 번째 비교 가능한 키워드의 순위 변동 (양수 = 하락)."""
     for kid in keyword_ids:
-        kw_rows = raw_data.get(kid, [])
-        # 내 상품만 필터
-        if product_naver_id:
-            my_rows = [r for r in kw_rows if r.naver_product_id == product_naver_id]
-        else:
-            my_rows = [r for r in kw_rows if r.is_my_store]
-
-        if len(my_rows) < 2:
-            continue
-        latest_time = my_rows[0].crawled_at
-        latest = [r for r in my_rows if r.crawled_at == latest_time]
-        prev = [r for r in my_rows if r.crawled_at != latest_time]
-        if not latest or not prev:
-            continue
-        prev_time = max(r.crawled_at for r in prev)
-        prev_at = [r for r in prev if r.crawled_at == prev_time]
-        current_rank = min(r.rank for r in latest)
-        prev_rank = min(r.rank for r in prev_at)
-        return current_rank - prev_rank
+        current, prev = pairs.get(kid, (None, None))
+        if current is not None and prev is not None:
+            return current - prev
     return None
 
 
@@ -367,14 +318,21 @@ async def get_product_list_items(
         .options(selectinload(Product.cost_items))
         .where(Product.user_id == user_id, Product.is_active == True)
     )
-    if category:
-        query = query.where(Product.category == category)
+    search_ids: list[int] | None = None
     if search:
-        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        query = query.where(Product.name.ilike(f"%{escaped}%"))
+        # 검색어 매칭 ID만 먼저 (인덱스 검색) → 이후 rankings 집계는 매칭 상품만 대상
+        search_ids = await search_product_ids(db, user_id, search, category=category)
+        if not search_ids:
+            return []
+        query = query.where(Product.id.in_(search_ids))
+    elif category:
+        query = query.where(Product.category == category)
 
     result = await db.execute(query)
     products = result.scalars().unique().all()
+    if search_ids is not None:
+        search_order = {pid: i for i, pid in enumerate(search_ids)}
+        products = sorted(products, key=lambda p: search_order[p.id])
 
     if not products:
         return []
@@ -406,9 +364,9 @@ async def get_product_list_items(
     now = utcnow()
     seven_days_ago = now - timedelta(days=settings.SPARKLINE_DAYS)
 
-    # 배치 쿼리: sparkline 원시 데이터 + rank_change 원시 데이터 (각 1회)
+    # 배치 쿼리: sparkline 원시 데이터 + 키워드별 현재/직전 순위 (각 1회)
     sparkline_raw = await _fetch_sparkline_data_batch(db, all_keyword_ids, seven_days_ago)
-    rank_change_raw = await _fetch_rank_change_batch(db, all_keyword_ids, since=seven_days_ago)
+    rank_pairs = await _fetch_my_rank_pairs(db, all_keyword_ids, since=seven_days_ago)
 
     # 배치 쿼리: 적용된 프리셋 ID 목록
     preset_ids_map = await get_applied_preset_ids_batch(db, product_ids)
@@ -439,12 +397,12 @@ async def get_product_list_items(
         ]
         margin = calculate_margin(product.selling_price, product.cost_price, cost_items_data)
 
-        # sparkline과 rank_change는 배치 데이터에서 Python 필터링
+        # sparkline은 배치 데이터에서 Python 필터링
         sparkline = _build_sparkline_from_batch(
             sparkline_raw, kw_ids, excluded_ids,
         )
         last_crawled = _calc_last_crawled(active_keywords)
-        rank_change = _calc_rank_change_from_batch(rank_change_raw, kw_ids, product_naver_id)
+        rank_change = _rank_change_from_pairs(rank_pairs, kw_ids)
 
         items.append({
             "id": product.id,
@@ -485,6 +443,7 @@ async def get_product_list_items(
         items.sort(key=lambda x: -(x["rank_change"] or 0))
     elif sort_by == "category":
         items.sort(key=lambda x: (x["category"] or "", STATUS_ORDER.get(x["status"], 3)))
+    # relevance: 검색 관련도 순서(products 순서) 유지
 
     # 페이지네이션 (Python 슬라이싱)
     offset = (page - 1) * limit
@@ -541,7 +500,8 @@ async def get_product_detail(
     status = calculate_status(product.selling_price, lowest_price)
 
     seven_days_ago = utcnow() - timedelta(days=settings.SPARKLINE_DAYS)
-    rank_change = await _fetch_rank_change(db, kw_ids, product_naver_id, since=seven_days_ago)
+    rank_pairs = await _fetch_my_rank_pairs(db, kw_ids, since=seven_days_ago)
+    rank_change = _rank_change_from_pairs(rank_pairs, kw_ids)
     last_crawled = _calc_last_crawled(active_keywords)
     sparkline = await _fetch_sparkline_data(
         db, kw_ids, seven_days_ago, excluded_ids,
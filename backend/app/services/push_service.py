@@ -3,9 +3,15 @@
 import asyncio
 import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
 
+from py_vapid import Vapid
 from pywebpush import webpush, WebPushException
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -13,49 +19,161 @@ from app.models.push_subscription import PushSubscription
 
 logger = logging.getLogger(__name__)
 
+# 전용 스레드 풀: 기본 to_thread 풀(DNS, 파일 I/O 등)과 분리하여 푸시 폭주가 다른 작업을 막지 않도록
+_executor: ThreadPoolExecutor | None = None
+
+# VAPID 서명 컨텍스트: 키 파싱 1회 + 푸시 서비스 origin(aud)별 서명 헤더 재사용
+_VAPID_EXP_SEC = 12 * 60 * 60
+_VAPID_REFRESH_MARGIN_SEC = 60 * 60
+_vapid: Vapid | None = None
+_vapid_headers: dict[str, tuple[int, dict]] = {}
+_vapid_lock = threading.Lock()
+
+
+@dataclass
+class PushMessage:
+    title: str
+    body: str
+    data: dict = field(default_factory=dict)
+
+    def to_payload(self) -> str:
+        return json.dumps({"title": self.title, "body": self.body, "data": self.data}, ensure_ascii=False)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.PUSH_MAX_WORKERS, thread_name_prefix="webpush",
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
 
 def _get_vapid_claims() -> dict:
     return {"sub": f"mailto:{settings.VAPID_CLAIM_EMAIL}"}
 
 
+def _get_vapid_headers(endpoint: str) -> dict:
+    """endpoint origin별 VAPID 서명 헤더 (만료 1시간 전까지 캐시 재사용)."""
+    global _vapid
+    parsed = urlparse(endpoint)
+    aud = f"{parsed.scheme}://{parsed.netloc}"
+    now = int(time.time())
+    with _vapid_lock:
+        cached = _vapid_headers.get(aud)
+        if cached and cached[0] - now > _VAPID_REFRESH_MARGIN_SEC:
+            return cached[1]
+        if _vapid is None:
+            _vapid = Vapid.from_string(private_key=settings.VAPID_PRIVATE_KEY)
+        exp = now + _VAPID_EXP_SEC
+        headers = _vapid.sign({**_get_vapid_claims(), "aud": aud, "exp": exp})
+        _vapid_headers[aud] = (exp, headers)
+        return headers
+
+
 def _send_push_sync(subscription_info: dict, payload: str) -> None:
-    """동기 webpush 호출 (asyncio.to_thread에서 실행)."""
+    """동기 webpush 호출 (전용 스레드 풀에서 실행)."""
     webpush(
         subscription_info=subscription_info,
         data=payload,
-        vapid_private_key=settings.VAPID_PRIVATE_KEY,
-        vapid_claims=_get_vapid_claims(),
+        headers=_get_vapid_headers(subscription_info["endpoint"]),
+        timeout=settings.PUSH_TIMEOUT,
     )
 
 
-async def send_push_to_user(db: AsyncSession, user_id: int, title: str, body: str, data: dict | None = None):
-    """특정 유저의 모든 푸시 구독에 알림 전송."""
-    if not settings.VAPID_PRIVATE_KEY or not settings.VAPID_PUBLIC_KEY:
-        logger.debug("VAPID 키 미설정 - 웹 푸시 전송 스킵")
-        return
+def _is_push_configured() -> bool:
+    return bool(settings.VAPID_PRIVATE_KEY and settings.VAPID_PUBLIC_KEY)
+
+
+async def load_subscriptions(
+    db: AsyncSession, user_ids: list[int] | set[int],
+) -> dict[int, list[PushSubscription]]:
+    """유저별 푸시 구독 1회 배치 조회 (발송 패스 동안 캐시로 재사용)."""
+    by_user: dict[int, list[PushSubscription]] = {uid: [] for uid in user_ids}
+    if not user_ids:
+        return by_user
+    result = await db.execute(
+        select(PushSubscription).where(PushSubscription.user_id.in_(list(user_ids)))
+    )
+    for sub in result.scalars().all():
+        by_user.setdefault(sub.user_id, []).append(sub)
+    return by_user
+
+
+async def send_push_batch(
+    subscriptions: list[PushSubscription],
+    messages: list[PushMessage],
+    delivered: list[set[str]] | None = None,
+) -> tuple[list[bool], set[str]]:
+    """한 유저의 모든 구독 × 메시지를 병렬 전송 (DB 접근 없음).
+
+    delivered: 메시지별 이미 전송된 endpoint 집합 — 재시도 시 해당 기기는 건너뛰고,
+        이번에 성공한 endpoint를 추가해 갱신한다 (호출자가 outbox에 저장).
+
+    Returns: (메시지별 재시도 불필요 여부, 만료된 endpoint 집합)
+    """
+    if not messages:
+        return [], set()
+    if not _is_push_configured() or not subscriptions:
+        return [True] * len(messages), set()
+    if delivered is None:
+        delivered = [set() for _ in messages]
+
+    loop = asyncio.get_running_loop()
+    executor = _get_executor()
+    payloads = [m.to_payload() for m in messages]
+
+    jobs = []
+    for msg_idx, payload in enumerate(payloads):
+        for sub in subscriptions:
+            if sub.endpoint in delivered[msg_idx]:
+                continue
+            subscription_info = {
+                "endpoint": sub.endpoint,
+                "keys": {"p256dh": sub.p256dh, "auth": sub.auth},
+            }
+            future = loop.run_in_executor(executor, _send_push_sync, subscription_info, payload)
+            jobs.append((msg_idx, sub, future))
+
+    results = await asyncio.gather(*(f for _, _, f in jobs), return_exceptions=True)
+
+    ok = [True] * len(messages)
+    expired: set[str] = set()
+    for (msg_idx, sub, _), res in zip(jobs, results):
+        if not isinstance(res, BaseException):
+            delivered[msg_idx].add(sub.endpoint)
+            continue
+        if isinstance(res, WebPushException):
+            logger.warning(f"푸시 전송 실패: user_id={sub.user_id} - {res}")
+            if res.response is not None and res.response.status_code in (404, 410):
+                expired.add(sub.endpoint)
+                continue
+        else:
+            logger.error(f"푸시 전송 오류: {res}")
+        ok[msg_idx] = False
+
+    sent = sum(ok)
+    if sent:
+        logger.info(
+            "푸시 전송: 구독 %d개 × 메시지 %d건, 실제 전송 %d회 (재시도 필요 %d건)",
+            len(subscriptions), len(messages), len(jobs), len(messages) - sent,
+        )
+    return ok, expired
+
 
+async def prune_subscriptions(db: AsyncSession, endpoints: set[str]) -> int:
+    """만료(404/410) 구독 일괄 삭제."""
+    if not endpoints:
+        return 0
     result = await db.execute(
-        select(PushSubscription).where(PushSubscription.user_id == user_id)
+        delete(PushSubscription).where(PushSubscription.endpoint.in_(list(endpoints)))
     )
-    subscriptions = result.scalars().all()
-
-    if not subscriptions:
-        return
-
-    payload = json.dumps({"title": title, "body": body, "data": data or {}}, ensure_ascii=False)
-
-    for sub in subscriptions:
-        subscription_info = {
-            "endpoint": sub.endpoint,
-            "keys": {"p256dh": sub.p256dh, "auth": sub.auth},
-        }
-        try:
-            await asyncio.to_thread(_send_push_sync, subscription_info, payload)
-            logger.info(f"푸시 전송 성공: user_id={user_id}")
-        except WebPushException as e:
-            logger.warning(f"푸시 전송 실패: user_id={user_id} - {e}")
-            if e.response and e.response.status_code in (404, 410):
-                await db.delete(sub)
-                logger.info(f"만료된 푸시 구독 삭제: {sub.endpoint[:50]}...")
-        except Exception as e:
-            logger.error(f"푸시 전송 오류: {e}")
+    logger.info(f"만료된 푸시 구독 삭제: {result.rowcount}건")
+    return result.rowcount
@@ -0,0 +1,154 @@
+"""상품별 관련성 매처 — 모델코드/규격 키워드/가격 범위를 크롤링당 1회 컴파일.
+
+크롤링 결과 항목마다 상품 설정(모델코드·규격 소문자화, 가격 범위 계산)을 다시 하지 않도록
+상품별로 미리 만들어 두고, 같은 키워드를 공유하는 상품들이 항목 판정에 재사용한다.
+
+- 모델코드: 패턴 1개 — 기존 부분 문자열 일치를 유지 ("SM-A515"는 "SM-A515F"와 일치).
+  정규화 시 모델코드의 구분자는 종류/유무를 무시하고, 제목에만 있는 구분자는 일치가
+  단어 시작에서 시작할 때만 건너뛴다 — 단어 끝과 다음 단어를 새로 이어 붙이지 않음
+  ("VS20"은 "VS-20"과 일치, "X1"은 "MAX 1"과, "S10"은 "AS 100"과 불일치)
+- 규격 키워드: 전방 탐색(lookahead) 대안 패턴 1개 — 겹치는 규격까지 한 번의 스캔으로 모두 수집
+- 가격 범위: 배송비 포함 총액 하한/상한
+- RELEVANCE_NORMALIZE=True면 전각/반각·대소문자·하이픈/공백 차이를 무시 (normalize_match_text)
+"""
+
+import re
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.core.utils import normalize_match_text
+
+# 같은 크롤링 결과 항목이 공유 키워드의 상품 수만큼 판정되므로 상품명 정규화 결과를 캐시
+_TITLE_CACHE_MAX = 8192
+_title_keys: dict[bool, dict[str, str]] = {True: {}, False: {}}
+
+
+def _title_key(title: str, normalize: bool) -> str:
+    cache = _title_keys[normalize]
+    key = cache.get(title)
+    if key is None:
+        if len(cache) >= _TITLE_CACHE_MAX:
+            cache.clear()
+        key = cache[title] = normalize_match_text(title) if normalize else title.lower()
+    return key
+
+
+def _key(text: str, normalize: bool) -> str:
+    # 정규화 시 설정값은 구분자를 모두 뺀 형태로 비교 (제목 쪽 구분자는 패턴이 허용)
+    return normalize_match_text(text).replace(" ", "") if normalize else text.lower()
+
+
+def _model_pattern(model_code: str, normalize: bool) -> re.Pattern:
+    if not normalize:
+        return re.compile(re.escape(model_code.lower()))
+    key = normalize_match_text(model_code)
+    # 모델코드 자체의 구분자 위치: 제목에서 종류 무관/생략 가능 (부분 문자열 일치 그대로)
+    exact = " ?".join(re.escape(part) for part in key.split(" "))
+    # 제목에만 있는 구분자: 단어 시작에서 시작하는 일치에서만 허용
+    spaced = "(?<![0-9a-z])" + _fragment(key.replace(" ", ""), normalize)
+    return re.compile(f"{exact}|{spaced}")
+
+
+def _fragment(key: str, normalize: bool) -> str:
+    """설정값 → 정규식 조각 (정규화 시 글자 사이에 구분자 1개 허용 — 제목의 구분자는 공백 1개)."""
+    if not normalize:
+        return re.escape(key)
+    return " ?".join(re.escape(ch) for ch in key)
+
+
+@dataclass(frozen=True, slots=True)
+class RelevanceMatcher:
+    min_price: float | None = None
+    max_price: float | None = None
+    model_pattern: re.Pattern | None = None
+    spec_pattern: re.Pattern | None = None
+    spec_count: int = 0
+    normalize: bool = True
+
+    @classmethod
+    def for_product(cls, product, normalize: bool | None = None) -> "RelevanceMatcher":
+        if normalize is None:
+            normalize = settings.RELEVANCE_NORMALIZE
+
+        min_price = max_price = None
+        if product.selling_price and product.selling_price > 0:
+            if product.price_filter_min_pct is not None:
+                min_price = product.selling_price * product.price_filter_min_pct / 100
+            if product.price_filter_max_pct is not None:
+                max_price = product.selling_price * product.price_filter_max_pct / 100
+
+        # 규격 키워드는 모델코드가 있을 때만 적용 (기존 판정 규칙)
+        model_code = _key(product.model_code, normalize) if product.model_code else None
+        model_pattern = _model_pattern(product.model_code, normalize) if model_code else None
+        spec_pattern, spec_count = None, 0
+        if model_code and product.spec_keywords:
+            specs = {_key(s, normalize) for s in product.spec_keywords if s}
+            specs.discard("")
+            # 다른 규격에 포함되는 규격은 그 규격이 있으면 자동 충족 ("500" ⊂ "500ml")
+            required = sorted(
+                (s for s in specs if not any(s != o and s in o for o in specs)),
+                key=len, reverse=True,
+            )
+            if required:
+                # 규격마다 그룹 1개 — 일치한 그룹 번호로 서로 다른 규격 수를 셈
+                alternation = "|".join(f"({_fragment(s, normalize)})" for s in required)
+                spec_pattern = re.compile(f"(?=(?:{alternation}))")
+                spec_count = len(required)
+
+        return cls(
+            min_price=min_price,
+            max_price=max_price,
+            model_pattern=model_pattern,
+            spec_pattern=spec_pattern,
+            spec_count=spec_count,
+            normalize=normalize,
+        )
+
+    def check(self, product_name: str, total_price: int) -> tuple[bool, str | None]:
+        """(is_relevant, reason) — reason은 제외 사유, relevant이면 None."""
+        min_price, max_price = self.min_price, self.max_price
+        if min_price is not None and total_price < min_price:
+            return False, "price_filter_min"
+        if max_price is not None and total_price > max_price:
+            return False, "price_filter_max"
+
+        model_pattern = self.model_pattern
+        if model_pattern is None:
+            return True, None
+        cache = _title_keys[self.normalize]
+        title = cache.get(product_name) or _title_key(product_name, self.normalize)
+        if model_pattern.search(title) is None:
+            return False, "model_code"
+        if self.spec_pattern is not None:
+            found = {m.lastindex for m in self.spec_pattern.finditer(title)}
+            if len(found) < self.spec_count:
+                return False, "spec_keywords"
+        return True, None
+
+
+def decide_relevance(
+    naver_product_id: str | None,
+    product_name: str,
+    total_price: int,
+    matcher: RelevanceMatcher | None,
+    excluded_ids: set[str] | None = None,
+    my_product_ids: set[str] | None = None,
+    included_override_ids: set[str] | None = None,
+) -> tuple[bool, str | None]:
+    """is_relevant 판정 (크롤링 적재와 재계산 작업 공용).
+
+    우선순위:
+    1) 수동 블랙리스트 → False (최우선)
+    2) 내 상품 → False
+    3) 수동 포함 예외(included_override) → True (자동 필터 우회)
+    4) 자동 필터(matcher) → True/False
+    """
+    if excluded_ids and naver_product_id in excluded_ids:
+        return False, "manual_blacklist"
+    if my_product_ids and naver_product_id and naver_product_id in my_product_ids:
+        return False, "my_product"
+    if included_override_ids and naver_product_id and naver_product_id in included_override_ids:
+        return True, "included_override"
+    if matcher is None:
+        return True, None
+    return matcher.check(product_name, total_price)
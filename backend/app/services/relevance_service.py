@@ -0,0 +1,296 @@
+"""관련성 재계산 작업 — 상품 필터 변경 시 보존 중인 순위 이력의 is_relevant 소급 갱신.
+
+- 모델코드/규격 키워드/가격 범위(또는 범위 기준 판매가)가 바뀌면 상품 수정 API가 예약
+- keyword_rankings를 id 키셋 청크(RELEVANCE_RECOMPUTE_BATCH_SIZE)로 읽어 판정 후,
+  결과가 바뀐 행만 (is_relevant, reason) 그룹별 UPDATE ... WHERE id IN (...)으로 반영
+- 작업은 relevance_jobs 행 — 상품 수정과 같은 트랜잭션에 기록하고, 청크마다 판정 결과와
+  진행률(processed/total/updated, 키셋 위치 last_id)을 함께 커밋한다
+  → 어느 레플리카에서든 진행률 조회, 재시작/배포로 중단되면 스케줄러가 남은 구간부터 재개
+- 같은 상품에 새 작업이 들어오면 진행 중 작업은 취소되고 새 설정으로 처음부터 재계산
+- 필터 변경 전에 시작한 크롤링은 시작 시점 매처로 적재하므로, 크롤링 마지막에
+  recheck_crawled_rows가 현재 필터로 이번 적재분을 다시 판정한다
+- 스파크라인/최저가/알림 판정은 모두 keyword_rankings에서 직접 계산하므로
+  별도 롤업 무효화 없이 커밋 즉시 반영된다
+"""
+
+import logging
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.utils import utcnow
+from app.models.excluded_product import ExcludedProduct
+from app.models.included_override import IncludedOverride
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.relevance_job import RelevanceJob
+from app.models.search_keyword import SearchKeyword
+from app.services.relevance import RelevanceMatcher, decide_relevance
+
+logger = logging.getLogger(__name__)
+
+# 상품 수정 시 재계산이 필요한 필드
+RELEVANCE_FIELDS = ("model_code", "spec_keywords", "price_filter_min_pct", "price_filter_max_pct")
+
+_ACTIVE = ("pending", "running")
+
+
+def needs_recompute(product: Product, changes: dict) -> bool:
+    """상품 수정 내용 중 관련성 판정에 영향을 주는 변경이 있는지."""
+    if any(name in changes for name in RELEVANCE_FIELDS):
+        return True
+    # 가격 범위 필터가 있으면 판매가 변경도 범위를 바꿈
+    return "selling_price" in changes and (
+        product.price_filter_min_pct is not None or product.price_filter_max_pct is not None
+    )
+
+
+async def get_latest_relevance_job(db: AsyncSession, product_id: int) -> RelevanceJob | None:
+    result = await db.execute(
+        select(RelevanceJob)
+        .where(RelevanceJob.product_id == product_id)
+        .order_by(RelevanceJob.created_at.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def request_recompute(db: AsyncSession, product_id: int) -> RelevanceJob:
+    """재계산 작업 행 추가 (진행 중인 같은 상품 작업은 취소). 커밋 후 run_relevance_job 예약."""
+    now = utcnow()
+    await db.execute(
+        update(RelevanceJob)
+        .where(RelevanceJob.product_id == product_id, RelevanceJob.status.in_(_ACTIVE))
+        .values(status="cancelled", finished_at=now)
+    )
+    job = RelevanceJob(
+        id=uuid.uuid4().hex, product_id=product_id, status="pending",
+        total=0, processed=0, updated=0, last_id=0, created_at=now,
+    )
+    db.add(job)
+    await db.flush()
+    return job
+
+
+async def _load_context(db: AsyncSession, product: Product) -> tuple:
+    excluded = set((await db.execute(
+        select(ExcludedProduct.naver_product_id).where(ExcludedProduct.product_id == product.id)
+    )).scalars().all())
+    included = set((await db.execute(
+        select(IncludedOverride.naver_product_id).where(IncludedOverride.product_id == product.id)
+    )).scalars().all())
+    mine = {pid for pid in (await db.execute(
+        select(Product.naver_product_id).where(
+            Product.user_id == product.user_id,
+            Product.is_active == True,
+            Product.naver_product_id.isnot(None),
+        )
+    )).scalars().all() if pid}
+    return excluded, mine, included
+
+
+async def _rejudge_chunk(
+    db: AsyncSession, rows, matcher: RelevanceMatcher, context: tuple,
+) -> int:
+    """순위 이력 행 판정 후 결과가 바뀐 행만 (is_relevant, reason) 그룹별 UPDATE."""
+    excluded, mine, included = context
+    changed: dict[tuple[bool, str | None], list[int]] = {}
+    for row in rows:
+        verdict = decide_relevance(
+            row.naver_product_id, row.product_name, row.price + (row.shipping_fee or 0),
+            matcher, excluded, mine, included,
+        )
+        if verdict != (row.is_relevant, row.relevance_reason):
+            changed.setdefault(verdict, []).append(row.id)
+
+    for (is_relevant, reason), ids in changed.items():
+        await db.execute(
+            update(KeywordRanking)
+            .where(KeywordRanking.id.in_(ids))
+            .values(is_relevant=is_relevant, relevance_reason=reason),
+            execution_options={"synchronize_session": False},
+        )
+    return sum(len(ids) for ids in changed.values())
+
+
+def _ranking_rows(keyword_ids, after_id: int, limit: int):
+    return (
+        select(
+            KeywordRanking.id,
+            KeywordRanking.naver_product_id,
+            KeywordRanking.product_name,
+            KeywordRanking.price,
+            KeywordRanking.shipping_fee,
+            KeywordRanking.is_relevant,
+            KeywordRanking.relevance_reason,
+        )
+        .where(KeywordRanking.keyword_id.in_(keyword_ids), KeywordRanking.id > after_id)
+        .order_by(KeywordRanking.id)
+        .limit(limit)
+    )
+
+
+async def recompute_relevance(
+    db: AsyncSession, product_id: int, job: RelevanceJob | None = None,
+) -> RelevanceJob:
+    """상품의 보존 중인 순위 이력 관련성 재판정 (청크마다 판정 결과 + 진행률 커밋).
+
+    job.last_id 이후부터 이어서 처리한다. 청크를 커밋하기 전에 작업 행을 잠그고 상태를 확인해
+    새 작업이 들어와 취소됐으면 그 청크는 버리고 멈춘다.
+    """
+    if job is None:
+        job = await request_recompute(db, product_id)
+        job.status = "running"
+        await db.commit()
+    product = await db.get(Product, product_id)
+    if product is None:
+        job.status = "completed"
+        job.finished_at = utcnow()
+        await db.commit()
+        return job
+
+    matcher = RelevanceMatcher.for_product(product)
+    context = await _load_context(db, product)
+    keyword_ids = select(SearchKeyword.id).where(SearchKeyword.product_id == product_id)
+    remaining = await db.scalar(
+        select(func.count()).select_from(KeywordRanking)
+        .where(KeywordRanking.keyword_id.in_(keyword_ids), KeywordRanking.id > job.last_id)
+    )
+    job.total = job.processed + remaining
+
+    batch_size = settings.RELEVANCE_RECOMPUTE_BATCH_SIZE
+    while True:
+        rows = (await db.execute(_ranking_rows(keyword_ids, job.last_id, batch_size))).all()
+        status = await db.scalar(
+            select(RelevanceJob.status).where(RelevanceJob.id == job.id).with_for_update()
+        )
+        if status != "running":
+            # 새 작업으로 취소됨 — 이 청크는 반영하지 않음
+            await db.rollback()
+            await db.refresh(job)
+            return job
+        if not rows:
+            break
+        job.updated += await _rejudge_chunk(db, rows, matcher, context)
+        job.processed += len(rows)
+        job.last_id = rows[-1].id
+        job.heartbeat_at = utcnow()
+        await db.commit()
+
+    job.status = "completed"
+    job.finished_at = utcnow()
+    await db.commit()
+    return job
+
+
+async def _claim(db: AsyncSession, job_id: str) -> RelevanceJob | None:
+    """대기 중이거나 실행 프로세스가 멈춘 작업을 원자적으로 선점."""
+    now = utcnow()
+    stale = now - timedelta(seconds=settings.BACKGROUND_JOB_STALE_SEC)
+    result = await db.execute(
+        update(RelevanceJob)
+        .where(
+            RelevanceJob.id == job_id,
+            or_(
+                RelevanceJob.status == "pending",
+                and_(RelevanceJob.status == "running", RelevanceJob.heartbeat_at < stale),
+            ),
+        )
+        .values(status="running", heartbeat_at=now)
+    )
+    await db.commit()
+    if not result.rowcount:
+        return None
+    return await db.get(RelevanceJob, job_id, populate_existing=True)
+
+
+async def run_relevance_job(
+    job_id: str, session_factory: async_sessionmaker = async_session,
+) -> None:
+    """백그라운드 실행 (상품 수정 요청 커밋 후, 또는 중단된 작업 재개)."""
+    async with session_factory() as db:
+        job = await _claim(db, job_id)
+        if job is None:
+            return
+        try:
+            await recompute_relevance(db, job.product_id, job)
+            if job.status == "completed":
+                logger.info(
+                    f"관련성 재계산 완료: product={job.product_id} "
+                    f"{job.processed}건 중 {job.updated}건 변경"
+                )
+        except Exception as e:
+            await db.rollback()
+            logger.error(f"관련성 재계산 실패: job={job_id} - {e}")
+            await db.execute(
+                update(RelevanceJob)
+                .where(RelevanceJob.id == job_id, RelevanceJob.status == "running")
+                .values(status="failed", error=str(e), finished_at=utcnow())
+            )
+            await db.commit()
+
+
+async def resume_relevance_jobs(session_factory: async_sessionmaker = async_session) -> int:
+    """재시작/배포로 중단되었거나 아직 시작되지 않은 재계산 작업 이어서 수행 (스케줄러 잡)."""
+    stale = utcnow() - timedelta(seconds=settings.BACKGROUND_JOB_STALE_SEC)
+    async with session_factory() as db:
+        result = await db.execute(
+            select(RelevanceJob.id)
+            .where(or_(
+                RelevanceJob.status == "pending",
+                and_(RelevanceJob.status == "running", RelevanceJob.heartbeat_at < stale),
+            ))
+            .order_by(RelevanceJob.created_at)
+        )
+        job_ids = result.scalars().all()
+    for job_id in job_ids:
+        logger.info(f"관련성 재계산 재개: {job_id}")
+        await run_relevance_job(job_id, session_factory)
+    return len(job_ids)
+
+
+async def prune_relevance_jobs(db: AsyncSession, cutoff: datetime) -> int:
+    """끝난 지 오래된 재계산 작업 행 정리."""
+    result = await db.execute(
+        delete(RelevanceJob).where(
+            RelevanceJob.status.in_(("completed", "failed", "cancelled")),
+            RelevanceJob.finished_at < cutoff,
+        )
+    )
+    return result.rowcount
+
+
+async def recheck_crawled_rows(
+    db: AsyncSession, matchers: dict[int, RelevanceMatcher], since_id: int,
+) -> int:
+    """크롤링 마지막 단계: 크롤링 중 필터가 바뀐 상품의 이번 적재분(id > since_id)을 현재 필터로 재판정.
+
+    상품 행을 공유 잠금으로 다시 읽어(커밋 전까지 필터 수정 대기) 시작 시점 매처와 비교한다.
+    잠금 전에 커밋된 수정은 여기서 반영되고, 이후 수정은 이 크롤링 커밋 뒤에 실행되는
+    재계산 작업이 이번 적재분까지 포함해 처리한다.
+    """
+    if not matchers:
+        return 0
+    result = await db.execute(
+        select(Product)
+        .where(Product.id.in_(sorted(matchers)))
+        .with_for_update(read=True)
+        .execution_options(populate_existing=True)
+    )
+    updated = 0
+    for product in result.scalars().all():
+        matcher = RelevanceMatcher.for_product(product)
+        if matcher == matchers.get(product.id):
+            continue
+        context = await _load_context(db, product)
+        keyword_ids = select(SearchKeyword.id).where(SearchKeyword.product_id == product.id)
+        rows = (await db.execute(_ranking_rows(keyword_ids, since_id, None))).all()
+        changed = await _rejudge_chunk(db, rows, matcher, context)
+        if changed:
+            logger.info(f"크롤링 중 필터 변경 반영: product={product.id} {len(rows)}건 중 {changed}건 재판정")
+        updated += changed
+    return updated
@@ -0,0 +1,213 @@
+"""카탈로그 전체 가격 조정 추천 — 최저가를 이기거나 맞추면서 마진 하한을 지키는 가격.
+
+- 상품/비용 항목/상품별 최저가를 쿼리 3번으로 읽고 (최저가는 DB에서 집계)
+- 추천가·예상 마진·상태를 NumPy로 상품 배열 전체에 대해 한 번에 계산
+- 정렬/필터도 배열 인덱스로 처리하고, 응답 dict는 요청한 페이지만 생성
+
+추천가 = max(최저가 - undercut, 마진 하한 가격)
+마진 하한 가격 = ceil((원가 + 고정비) / (1 - 비율 비용 합 - 하한 마진율)) — 비율 비용의
+원 단위 절사를 무시한 값이라 실제 마진율은 하한 이상이 보장된다 (최대 비용 항목 수만큼 원 단위 보수적).
+"""
+
+import numpy as np
+from sqlalchemy import and_, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.cost import CostItem
+from app.models.excluded_product import ExcludedProduct
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.services.product_service import CLOSE_GAP_PERCENT
+
+ACTIONS = ("lower", "raise", "keep", "locked", "unreachable", "no_competitor")
+
+
+async def _fetch_lowest_prices(db: AsyncSession, user_id: int) -> dict[int, int]:
+    """상품별 최신 크롤링의 관련 결과 중 배송비 포함 최저가 (블랙리스트 제외, 상품 상세와 동일 규칙)."""
+    active_kw = (
+        select(SearchKeyword.id, SearchKeyword.product_id)
+        .join(Product, Product.id == SearchKeyword.product_id)
+        .where(
+            Product.user_id == user_id,
+            Product.is_active == True,
+            SearchKeyword.is_active == True,
+        )
+    ).subquery()
+    latest = (
+        select(
+            KeywordRanking.keyword_id,
+            func.max(KeywordRanking.crawled_at).label("max_at"),
+        )
+        .where(KeywordRanking.keyword_id.in_(select(active_kw.c.id)))
+        .group_by(KeywordRanking.keyword_id)
+    ).subquery()
+    blacklisted = exists().where(
+        ExcludedProduct.product_id == active_kw.c.product_id,
+        ExcludedProduct.naver_product_id == KeywordRanking.naver_product_id,
+    )
+    result = await db.execute(
+        select(
+            active_kw.c.product_id,
+            func.min(KeywordRanking.price + func.coalesce(KeywordRanking.shipping_fee, 0)),
+        )
+        .join(latest, and_(
+            KeywordRanking.keyword_id == latest.c.keyword_id,
+            KeywordRanking.crawled_at == latest.c.max_at,
+        ))
+        .join(active_kw, active_kw.c.id == KeywordRanking.keyword_id)
+        .where(KeywordRanking.is_relevant == True, ~blacklisted)
+        .group_by(active_kw.c.product_id)
+    )
+    return {pid: int(price) for pid, price in result.all()}
+
+
+def _margins_at(
+    prices: np.ndarray,
+    cost_price: np.ndarray,
+    item_idx: np.ndarray,
+    item_pct: np.ndarray,
+    item_fixed: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """상품별 가격 배열에서 (순마진, 마진율) — calculate_margin과 같은 항목별 절사 규칙."""
+    per_item = np.trunc(prices[item_idx] * item_pct / 100) + item_fixed
+    total_costs = np.bincount(item_idx, weights=per_item, minlength=len(prices)).astype(np.int64)
+    net = prices - cost_price - total_costs
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(prices > 0, np.round(net / prices * 100, 1), 0.0)
+    return net, pct
+
+
+async def get_repricing_recommendations(
+    db: AsyncSession,
+    user_id: int,
+    min_margin_percent: float | None = None,
+    undercut: int | None = None,
+    action: str | None = None,
+    sort_by: str = "urgency",
+    page: int = 1,
+    limit: int = 50,
+) -> dict:
+    if min_margin_percent is None:
+        min_margin_percent = settings.REPRICING_MIN_MARGIN_PERCENT
+    if undercut is None:
+        undercut = settings.REPRICING_UNDERCUT_WON
+
+    rows = (await db.execute(
+        select(
+            Product.id, Product.name, Product.category, Product.selling_price,
+            Product.cost_price, Product.is_price_locked,
+        )
+        .where(Product.user_id == user_id, Product.is_active == True)
+        .order_by(Product.id)
+    )).all()
+    n = len(rows)
+    summary = {a: 0 for a in ACTIONS}
+    if not n:
+        return {"total": 0, "page": page, "limit": limit, "summary": summary,
+                "total_margin_delta": 0, "items": []}
+
+    ids = np.fromiter((r.id for r in rows), dtype=np.int64, count=n)
+    selling = np.fromiter((r.selling_price for r in rows), dtype=np.int64, count=n)
+    cost_price = np.fromiter((r.cost_price for r in rows), dtype=np.int64, count=n)
+    locked = np.fromiter((bool(r.is_price_locked) for r in rows), dtype=bool, count=n)
+
+    cost_rows = (await db.execute(
+        select(CostItem.product_id, CostItem.type, CostItem.value)
+        .join(Product, Product.id == CostItem.product_id)
+        .where(Product.user_id == user_id, Product.is_active == True)
+    )).all()
+    item_idx = np.searchsorted(ids, np.fromiter((c.product_id for c in cost_rows), dtype=np.int64))
+    item_value = np.fromiter((float(c.value) for c in cost_rows), dtype=np.float64)
+    is_pct = np.fromiter((c.type == "percent" for c in cost_rows), dtype=bool)
+    item_pct = np.where(is_pct, item_value, 0.0)
+    item_fixed = np.where(is_pct, 0.0, np.trunc(item_value))
+
+    lowest_map = await _fetch_lowest_prices(db, user_id)
+    lowest = np.fromiter((lowest_map.get(int(pid), -1) for pid in ids), dtype=np.int64, count=n)
+    has_lowest = lowest >= 0
+
+    # 마진 하한 가격 (분모 <= 0이면 어떤 가격으로도 하한 불가)
+    pct_sum = np.bincount(item_idx, weights=item_pct, minlength=n)
+    fixed_sum = np.bincount(item_idx, weights=item_fixed, minlength=n)
+    denom = 1 - pct_sum / 100 - min_margin_percent / 100
+    feasible = denom > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        floor_price = np.where(feasible, np.ceil((cost_price + fixed_sum) / denom), 0)
+    floor_price = np.maximum(floor_price, 0).astype(np.int64)
+
+    target = np.maximum(lowest - undercut, 0)
+    recommended = np.where(has_lowest & feasible, np.maximum(target, floor_price), selling)
+
+    cur_net, cur_pct = _margins_at(selling, cost_price, item_idx, item_pct, item_fixed)
+    rec_net, rec_pct = _margins_at(recommended, cost_price, item_idx, item_pct, item_fixed)
+    margin_delta = rec_net - cur_net
+
+    actions = np.select(
+        [~has_lowest, locked, ~feasible, recommended < selling, recommended > selling],
+        ["no_competitor", "locked", "unreachable", "lower", "raise"],
+        default="keep",
+    )
+    # 추천 적용 대상이 아니면 현재 가격 유지로 표시
+    applies = np.isin(actions, ["lower", "raise", "keep"])
+    recommended = np.where(applies, recommended, selling)
+    margin_delta = np.where(applies, margin_delta, 0)
+
+    safe_lowest = np.where(lowest > 0, lowest, 1)
+    gap_pct = np.where(lowest > 0, (selling - lowest) / safe_lowest * 100, 0.0)
+    rec_gap_pct = np.where(lowest > 0, (recommended - lowest) / safe_lowest * 100, 0.0)
+    rec_status = np.select(
+        [~has_lowest, lowest == 0, recommended <= lowest, rec_gap_pct <= CLOSE_GAP_PERCENT],
+        ["winning", "losing", "winning", "close"],
+        default="losing",
+    )
+
+    for a, count in zip(*np.unique(actions, return_counts=True)):
+        summary[str(a)] = int(count)
+    total_margin_delta = int(margin_delta.sum())
+
+    mask = actions == action if action else np.ones(n, dtype=bool)
+    idx = np.flatnonzero(mask)
+    if sort_by == "margin_delta":
+        order = np.lexsort((ids[idx], -margin_delta[idx]))
+    elif sort_by == "margin":
+        order = np.lexsort((ids[idx], np.where(applies, rec_pct, cur_pct)[idx]))
+    elif sort_by == "name":
+        order = np.array(sorted(range(len(idx)), key=lambda i: rows[idx[i]].name), dtype=np.int64)
+    else:
+        # urgency: 최저가 대비 비싼 순, 경쟁 상품 없는 상품은 뒤로
+        order = np.lexsort((ids[idx], -np.where(has_lowest, gap_pct, -np.inf)[idx]))
+    idx = idx[order]
+
+    offset = (page - 1) * limit
+    items = []
+    for i in idx[offset:offset + limit].tolist():
+        row = rows[i]
+        items.append({
+            "product_id": row.id,
+            "name": row.name,
+            "category": row.category,
+            "is_price_locked": bool(locked[i]),
+            "action": str(actions[i]),
+            "selling_price": int(selling[i]),
+            "lowest_price": int(lowest[i]) if has_lowest[i] else None,
+            "price_gap_percent": round(float(gap_pct[i]), 1) if lowest[i] > 0 else None,
+            "floor_price": int(floor_price[i]) if feasible[i] else None,
+            "recommended_price": int(recommended[i]),
+            "projected_status": str(rec_status[i]),
+            "current_margin": int(cur_net[i]),
+            "current_margin_percent": float(cur_pct[i]),
+            "projected_margin": int(rec_net[i]) if applies[i] else int(cur_net[i]),
+            "projected_margin_percent": float(rec_pct[i]) if applies[i] else float(cur_pct[i]),
+            "margin_delta": int(margin_delta[i]),
+        })
+
+    return {
+        "total": int(len(idx)),
+        "page": page,
+        "limit": limit,
+        "summary": summary,
+        "total_margin_delta": total_margin_delta,
+        "items": items,
+    }
@@ -0,0 +1,106 @@
+"""스토어 상품 일괄 등록 — 상품/키워드를 각각 1회 배치 INSERT.
+
+- 중복 판정: 요청 내 중복은 메모리에서, 기존 상품과의 중복은 lower(name) IN (...) 한 번으로
+- 상품: INSERT ... RETURNING id, name (executemany → insertmanyvalues 배치)
+- 키워드: 반환된 id로 한 번에 INSERT
+Core INSERT는 ORM 이벤트(before_insert)를 거치지 않으므로 search_text는 여기서 직접 계산한다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.utils import build_product_search_text
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.schemas.store_import import StoreImportItem
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImportOutcome:
+    created: list[tuple[str, int]] = field(default_factory=list)  # (상품명, product_id) 요청 순서
+    skipped_names: list[str] = field(default_factory=list)
+
+
+async def _existing_names(db: AsyncSession, user_id: int, lowered: set[str]) -> set[str]:
+    if not lowered:
+        return set()
+    result = await db.execute(
+        select(func.lower(Product.name)).where(
+            Product.user_id == user_id,
+            Product.is_active == True,
+            func.lower(Product.name).in_(lowered),
+        )
+    )
+    return set(result.scalars().all())
+
+
+def _product_row(user_id: int, item: StoreImportItem) -> dict:
+    model_code = item.model_code or None
+    brand = item.brand or None
+    return {
+        "user_id": user_id,
+        "name": item.name,
+        "selling_price": item.selling_price,
+        "cost_price": 0,
+        "image_url": item.image_url,
+        "category": item.category,
+        "naver_product_id": item.naver_product_id,
+        "model_code": model_code,
+        "spec_keywords": item.spec_keywords if item.spec_keywords else None,
+        "price_filter_min_pct": item.price_filter_min_pct,
+        "price_filter_max_pct": item.price_filter_max_pct,
+        "brand": brand,
+        "maker": item.maker or None,
+        "search_text": build_product_search_text(item.name, model_code, brand),
+    }
+
+
+async def bulk_import_products(
+    db: AsyncSession, user_id: int, items: list[StoreImportItem],
+) -> ImportOutcome:
+    """상품 + 키워드 일괄 등록 (이미 등록된 이름/요청 내 중복 이름은 건너뜀)."""
+    outcome = ImportOutcome()
+
+    existing = await _existing_names(db, user_id, {item.name.lower() for item in items})
+    to_create: list[StoreImportItem] = []
+    for item in items:
+        lowered = item.name.lower()
+        if lowered in existing:
+            outcome.skipped_names.append(item.name)
+            continue
+        existing.add(lowered)
+        to_create.append(item)
+
+    if not to_create:
+        return outcome
+
+    # 1) 상품 배치 INSERT — RETURNING 순서에 의존하지 않고 이름으로 매핑 (요청 내 이름은 유일)
+    result = await db.execute(
+        insert(Product).returning(Product.id, Product.name),
+        [_product_row(user_id, item) for item in to_create],
+    )
+    id_by_name = {name.lower(): pid for pid, name in result.all()}
+
+    # 2) 키워드 배치 INSERT: 사용자 선택 키워드 또는 기본 상품명
+    keyword_rows = []
+    for item in to_create:
+        product_id = id_by_name[item.name.lower()]
+        outcome.created.append((item.name, product_id))
+        kw_list = item.keywords if item.keywords else [item.name]
+        keyword_rows.extend(
+            {"product_id": product_id, "keyword": kw, "is_primary": i == 0}
+            for i, kw in enumerate(kw_list)
+        )
+    if keyword_rows:
+        await db.execute(insert(SearchKeyword), keyword_rows)
+
+    logger.info(
+        f"스토어 상품 일괄 등록: user={user_id} 생성 {len(outcome.created)}개, "
+        f"키워드 {len(keyword_rows)}개, 중복 {len(outcome.skipped_names)}개"
+    )
+    return outcome
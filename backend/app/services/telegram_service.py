@@ -1,18 +1,82 @@
 """텔레그램 봇 알림 전송 서비스"""
 
+import asyncio
+import html
 import logging
+import time
 
 import httpx
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
 _client: httpx.AsyncClient | None = None
 
+# Telegram sendMessage 본문 최대 길이
+_MAX_MESSAGE_LEN = 4096
+_MAX_TITLE_LEN = 256
+_MAX_RETRY_AFTER_ATTEMPTS = 3
+
+
+class _TokenBucket:
+    """단순 토큰 버킷 — 이벤트 루프 단일 스레드에서 동기적으로 예약하므로 락 불필요."""
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self) -> float:
+        """토큰 1개 예약 후 대기해야 할 시간(초) 반환."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+    def block(self, seconds: float) -> None:
+        """429 retry_after 동안 해당 버킷 전송 중단."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class _TelegramRateLimiter:
+    """전역 + chat별 토큰 버킷 (Telegram: 전역 ~30msg/s, chat당 ~1msg/s)."""
+
+    def __init__(self, global_rate: float, chat_rate: float):
+        self._global = _TokenBucket(global_rate, global_rate)
+        self._chat_rate = chat_rate
+        self._chats: dict[str, _TokenBucket] = {}
+
+    def _chat_bucket(self, chat_id: str) -> _TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            # 오래 사용되지 않은(토큰이 가득 찬) 버킷 정리 (메모리 누적 방지)
+            if len(self._chats) > 10000:
+                now = time.monotonic()
+                self._chats = {
+                    k: b for k, b in self._chats.items()
+                    if now - b.updated < 60 or b.blocked_until > now
+                }
+            bucket = self._chats[chat_id] = _TokenBucket(self._chat_rate, 1)
+        return bucket
+
+    async def acquire(self, chat_id: str) -> None:
+        wait = max(self._global.reserve(), self._chat_bucket(chat_id).reserve())
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def block(self, chat_id: str, seconds: float) -> None:
+        self._chat_bucket(chat_id).block(seconds)
+
+
+_limiter = _TelegramRateLimiter(
+    settings.TELEGRAM_GLOBAL_RATE_PER_SEC, settings.TELEGRAM_CHAT_RATE_PER_SEC,
+)
+
 
 def _get_client() -> httpx.AsyncClient:
     global _client
@@ -38,40 +102,108 @@ def _format_telegram_message(alert_type: str | None, title: str, message: str) -
     return f"{icon} <b>{title}</b>\n\n{message}"
 
 
-async def send_telegram_message(chat_id: str, text: str) -> bool:
-    """Telegram Bot API sendMessage 호출."""
+def _escape_truncated(text: str, limit: int) -> str:
+    """HTML 이스케이프 후 limit자 이내로 자르기 — 엔티티 중간에서 끊지 않도록 원문 기준으로 자름."""
+    escaped = html.escape(text, quote=False)
+    if len(escaped) <= limit:
+        return escaped
+    pieces: list[str] = []
+    size = 0
+    for ch in text:
+        piece = html.escape(ch, quote=False)
+        if size + len(piece) > limit - 1:
+            break
+        pieces.append(piece)
+        size += len(piece)
+    return "".join(pieces) + "…"
+
+
+def _format_alert_entry(alert_type: str | None, title: str, message: str, limit: int = _MAX_MESSAGE_LEN) -> str:
+    """알림 1건을 limit자 이내 HTML로 포맷 (제목/본문을 태그로 감싸기 전에 이스케이프 + 자르기)."""
+    overhead = len(_format_telegram_message(alert_type, "", ""))
+    safe_title = _escape_truncated(title, min(_MAX_TITLE_LEN, limit - overhead))
+    safe_message = _escape_truncated(message, limit - overhead - len(safe_title))
+    return _format_telegram_message(alert_type, safe_title, safe_message)
+
+
+def build_digest_messages(entries: list[tuple[str | None, str, str]]) -> list[tuple[str, list[int]]]:
+    """한 사용자의 알림들을 Telegram 길이 제한 내 다이제스트 메시지로 묶음.
+
+    디스패처는 발송 배치(선점 1회분, 최대 ALERT_DISPATCH_BATCH_SIZE건) 안의 사용자별 알림을
+    넘긴다 — 크롤링 실행 단위가 아니라, 한 실행의 알림이 여러 배치에 나뉘거나 다음 실행의
+    알림과 합쳐질 수 있다.
+
+    Args:
+        entries: [(alert_type, title, message)]
+    Returns: [(메시지 본문, 포함된 entries 인덱스 목록)]
+    """
+    if len(entries) == 1:
+        alert_type, title, message = entries[0]
+        return [(_format_alert_entry(alert_type, title, message), [0])]
+
+    blocks = [
+        _format_alert_entry(alert_type, title, message, _MAX_MESSAGE_LEN - 100).replace("\n\n", "\n", 1)
+        for alert_type, title, message in entries
+    ]
+
+    header = f"\U0001f514 <b>가격 모니터링 알림 {len(entries)}건</b>"
+    chunks: list[tuple[str, list[int]]] = []
+    current: list[str] = [header]
+    current_idx: list[int] = []
+    current_len = len(header)
+    for idx, block in enumerate(blocks):
+        added = len(block) + 2
+        if current_idx and current_len + added > _MAX_MESSAGE_LEN:
+            chunks.append(("\n\n".join(current), current_idx))
+            current, current_idx, current_len = [], [], 0
+        current.append(block)
+        current_idx.append(idx)
+        current_len += added
+    if current_idx:
+        chunks.append(("\n\n".join(current), current_idx))
+    return chunks
+
+
+async def deliver_telegram_message(chat_id: str, text: str) -> str:
+    """Telegram Bot API sendMessage 호출 (토큰 버킷 + 429 retry_after 처리).
+
+    Returns: "sent" | "retry"(일시적 오류: 5xx, 네트워크, 429 반복) | "failed"(그 외 4xx — 재시도해도 같은 응답)
+    """
     if not settings.TELEGRAM_BOT_TOKEN:
-        return False
+        return "retry"
 
     url = f"https://api.telegram.org/bot{settings.TELEGRAM_BOT_TOKEN}/sendMessage"
     try:
-        resp = await _get_client().post(url, json={
-            "chat_id": chat_id,
-            "text": text,
-            "parse_mode": "HTML",
-        })
-        if resp.status_code == 200:
-            logger.info("텔레그램 전송 성공: chat_id=%s", chat_id)
-            return True
-        logger.warning("텔레그램 전송 실패: chat_id=%s, status=%s, body=%s", chat_id, resp.status_code, resp.text)
-        return False
+        for _ in range(_MAX_RETRY_AFTER_ATTEMPTS):
+            await _limiter.acquire(chat_id)
+            resp = await _get_client().post(url, json={
+                "chat_id": chat_id,
+                "text": text,
+                "parse_mode": "HTML",
+            })
+            if resp.status_code == 200:
+                logger.info("텔레그램 전송 성공: chat_id=%s", chat_id)
+                return "sent"
+            if resp.status_code == 429:
+                retry_after = _parse_retry_after(resp)
+                logger.warning("텔레그램 429: chat_id=%s, retry_after=%ss", chat_id, retry_after)
+                _limiter.block(chat_id, retry_after)
+                continue
+            logger.warning("텔레그램 전송 실패: chat_id=%s, status=%s, body=%s", chat_id, resp.status_code, resp.text)
+            return "failed" if 400 <= resp.status_code < 500 else "retry"
+        return "retry"
     except Exception as e:
         logger.error("텔레그램 전송 오류: %s", e)
-        return False
+        return "retry"
 
 
-async def send_telegram_to_user(
-    db: AsyncSession, user_id: int, title: str, message: str,
-    alert_type: str | None = None,
-) -> bool:
-    """user_id로 chat_id 조회 후 텔레그램 전송."""
-    if not settings.TELEGRAM_BOT_TOKEN:
-        return False
+async def send_telegram_message(chat_id: str, text: str) -> bool:
+    """텔레그램 메시지 전송 — 성공 여부만 반환."""
+    return await deliver_telegram_message(chat_id, text) == "sent"
 
-    result = await db.execute(select(User.telegram_chat_id).where(User.id == user_id))
-    chat_id = result.scalar_one_or_none()
-    if not chat_id:
-        return False
 
-    text = _format_telegram_message(alert_type, title, message)
-    return await send_telegram_message(chat_id, text)
+def _parse_retry_after(resp: httpx.Response) -> float:
+    try:
+        return float(resp.json().get("parameters", {}).get("retry_after", 1))
+    except Exception:
+        return 1.0
@@ -0,0 +1,45 @@
+"""add relevance_jobs table
+
+Revision ID: a2d4f6b8c135
+Revises: f1c3e5a7b924
+Create Date: 2026-10-20 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a2d4f6b8c135"
+down_revision: Union[str, None] = "f1c3e5a7b924"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "relevance_jobs",
+        sa.Column("id", sa.String(length=32), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.Column("processed", sa.Integer(), nullable=False),
+        sa.Column("updated", sa.Integer(), nullable=False),
+        sa.Column("last_id", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("heartbeat_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["product_id"], ["products.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_relevance_jobs_product_created", "relevance_jobs", ["product_id", "created_at"])
+    op.create_index("ix_relevance_jobs_status", "relevance_jobs", ["status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_relevance_jobs_status", table_name="relevance_jobs")
+    op.drop_index("ix_relevance_jobs_product_created", table_name="relevance_jobs")
+    op.drop_table("relevance_jobs")
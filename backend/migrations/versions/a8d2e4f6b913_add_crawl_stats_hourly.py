@@ -0,0 +1,39 @@
+"""add crawl_stats_hourly table
+
+Revision ID: a8d2e4f6b913
+Revises: f3b9d6a1c527
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d2e4f6b913"
+down_revision: Union[str, None] = "f3b9d6a1c527"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "crawl_stats_hourly",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("success_count", sa.Integer(), nullable=False),
+        sa.Column("failed_count", sa.Integer(), nullable=False),
+        sa.Column("success_duration_ms", sa.BigInteger(), nullable=False),
+        sa.Column("failed_duration_ms", sa.BigInteger(), nullable=False),
+        sa.Column("last_crawled_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "bucket_start", name="uq_crawl_stats_hourly_user_bucket"),
+    )
+    # 초기 데이터는 애플리케이션 시작 시 ensure_crawl_stats()가 crawl_logs에서 백필
+
+
+def downgrade() -> None:
+    op.drop_table("crawl_stats_hourly")
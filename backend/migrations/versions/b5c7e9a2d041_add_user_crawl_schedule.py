@@ -0,0 +1,46 @@
+"""add users.last_crawled_at / last_crawl_run_id / next_crawl_due_at
+
+Revision ID: b5c7e9a2d041
+Revises: a8d2e4f6b913
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5c7e9a2d041"
+down_revision: Union[str, None] = "a8d2e4f6b913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("last_crawled_at", sa.DateTime(), nullable=True))
+    op.add_column("users", sa.Column("last_crawl_run_id", sa.String(length=32), nullable=True))
+    op.add_column("users", sa.Column("next_crawl_due_at", sa.DateTime(), nullable=True))
+
+    # 기존 사업체 백필: 활성 상품 키워드의 최근 크롤링 시각 + 주기 (이력이 없으면 즉시 예정)
+    op.execute(
+        "UPDATE users SET last_crawled_at = k.max_at FROM ("
+        "SELECT p.user_id, max(sk.last_crawled_at) AS max_at FROM search_keywords sk "
+        "JOIN products p ON p.id = sk.product_id WHERE p.is_active GROUP BY p.user_id"
+        ") k WHERE k.user_id = users.id"
+    )
+    op.execute(
+        "UPDATE users SET next_crawl_due_at = COALESCE("
+        "last_crawled_at + make_interval(mins => crawl_interval_min), "
+        "now() AT TIME ZONE 'utc')"
+    )
+
+    op.create_index("ix_users_next_crawl_due_at", "users", ["next_crawl_due_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_next_crawl_due_at", table_name="users")
+    op.drop_column("users", "next_crawl_due_at")
+    op.drop_column("users", "last_crawl_run_id")
+    op.drop_column("users", "last_crawled_at")
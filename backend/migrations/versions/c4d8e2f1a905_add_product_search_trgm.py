@@ -0,0 +1,55 @@
+"""add products.search_text with pg_trgm GIN index
+
+Revision ID: c4d8e2f1a905
+Revises: b7e2c91d4a10
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.utils import build_product_search_text
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8e2f1a905"
+down_revision: Union[str, None] = "b7e2c91d4a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column("products", sa.Column("search_text", sa.Text(), nullable=True))
+
+    # 기존 상품 백필 (애플리케이션과 동일한 정규화)
+    conn = op.get_bind()
+    products = sa.table(
+        "products",
+        sa.column("id", sa.Integer),
+        sa.column("name", sa.String),
+        sa.column("model_code", sa.String),
+        sa.column("brand", sa.String),
+        sa.column("search_text", sa.String),
+    )
+    rows = conn.execute(sa.select(products.c.id, products.c.name, products.c.model_code, products.c.brand)).all()
+    if rows:
+        conn.execute(
+            products.update().where(products.c.id == sa.bindparam("pid")),
+            [
+                {"pid": r.id, "search_text": build_product_search_text(r.name, r.model_code, r.brand)}
+                for r in rows
+            ],
+        )
+
+    op.create_index(
+        "ix_products_search_trgm", "products", ["search_text"],
+        postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_products_search_trgm", table_name="products")
+    op.drop_column("products", "search_text")
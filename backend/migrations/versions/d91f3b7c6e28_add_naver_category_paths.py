@@ -0,0 +1,45 @@
+"""add naver_category_paths table
+
+Revision ID: d91f3b7c6e28
+Revises: c4d8e2f1a905
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d91f3b7c6e28"
+down_revision: Union[str, None] = "c4d8e2f1a905"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "naver_category_paths",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("category1", sa.String(length=100), nullable=False),
+        sa.Column("category2", sa.String(length=100), nullable=False),
+        sa.Column("category3", sa.String(length=100), nullable=False),
+        sa.Column("category4", sa.String(length=100), nullable=False),
+        sa.Column("product_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("category1", "category2", "category3", "category4", name="uq_naver_category_paths_path"),
+    )
+    # 기존 keyword_rankings로 초기 집계
+    op.execute("""
+        INSERT INTO naver_category_paths (category1, category2, category3, category4, product_count, updated_at)
+        SELECT category1, COALESCE(category2, ''), COALESCE(category3, ''), COALESCE(category4, ''), COUNT(*), now()
+        FROM keyword_rankings
+        WHERE category1 IS NOT NULL AND category1 != ''
+        GROUP BY category1, COALESCE(category2, ''), COALESCE(category3, ''), COALESCE(category4, '')
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("naver_category_paths")
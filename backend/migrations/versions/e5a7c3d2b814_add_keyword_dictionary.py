@@ -0,0 +1,38 @@
+"""add keyword_dictionary table
+
+Revision ID: e5a7c3d2b814
+Revises: d91f3b7c6e28
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a7c3d2b814"
+down_revision: Union[str, None] = "d91f3b7c6e28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "keyword_dictionary",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("term", sa.String(length=200), nullable=False),
+        sa.Column("kind", sa.String(length=10), nullable=False),
+        sa.Column("frequency", sa.Integer(), nullable=False),
+        sa.Column("last_seen", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("kind", "term", name="uq_keyword_dictionary_kind_term"),
+    )
+    op.create_index("ix_keyword_dictionary_last_seen", "keyword_dictionary", ["last_seen"])
+    # 초기 데이터는 애플리케이션 시작 시 ensure_dictionary()가 keyword_rankings에서 백필
+
+
+def downgrade() -> None:
+    op.drop_index("ix_keyword_dictionary_last_seen", table_name="keyword_dictionary")
+    op.drop_table("keyword_dictionary")
@@ -0,0 +1,26 @@
+"""add delivered_endpoints to alert_deliveries
+
+Revision ID: e8b1d3f5a729
+Revises: d7a9c1e3f265
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b1d3f5a729"
+down_revision: Union[str, None] = "d7a9c1e3f265"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("alert_deliveries", sa.Column("delivered_endpoints", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("alert_deliveries", "delivered_endpoints")
@@ -0,0 +1,42 @@
+"""add crawl_logs.user_id + (user_id, created_at, id) keyset indexes
+
+Revision ID: f3b9d6a1c527
+Revises: e5a7c3d2b814
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b9d6a1c527"
+down_revision: Union[str, None] = "e5a7c3d2b814"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("crawl_logs", sa.Column("user_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "crawl_logs_user_id_fkey", "crawl_logs", "users", ["user_id"], ["id"], ondelete="CASCADE",
+    )
+
+    # 기존 로그 백필 (키워드가 삭제된 로그는 사업체를 알 수 없어 NULL 유지)
+    op.execute(
+        "UPDATE crawl_logs SET user_id = p.user_id FROM search_keywords k "
+        "JOIN products p ON p.id = k.product_id "
+        "WHERE k.id = crawl_logs.keyword_id AND crawl_logs.user_id IS NULL"
+    )
+
+    op.create_index("ix_crawl_logs_user_created", "crawl_logs", ["user_id", "created_at", "id"])
+    op.create_index("ix_alerts_user_created", "alerts", ["user_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_alerts_user_created", table_name="alerts")
+    op.drop_index("ix_crawl_logs_user_created", table_name="crawl_logs")
+    op.drop_constraint("crawl_logs_user_id_fkey", "crawl_logs", type_="foreignkey")
+    op.drop_column("crawl_logs", "user_id")
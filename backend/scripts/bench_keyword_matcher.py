@@ -0,0 +1,93 @@
+"""Benchmark the keyword classifier's dictionary matcher on real product names.
+
+Compares the compiled phrase matcher (one scan per product name) against the
+previous per-token set lookups, using KeywordRanking.product_name values and
+the keyword_dictionary snapshot from the configured database.
+
+Usage:
+    cd backend && python3 -m scripts.bench_keyword_matcher [--limit 20000]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Ensure backend package is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.core.database import async_session  # noqa: E402
+from app.models.keyword_ranking import KeywordRanking  # noqa: E402
+from app.services.keyword_engine import classifier  # noqa: E402
+from app.services.keyword_engine.dictionary import load_snapshot  # noqa: E402
+
+
+def _baseline(name: str, brands: frozenset[str], types: frozenset[str]) -> list:
+    """이전 방식: 공백 토큰마다 사전 집합을 개별 조회 (단어 1개짜리 항목만 인식)."""
+    out = []
+    for token in classifier._tokenize(name):
+        lower = token.lower()
+        classified = classifier._classify_regex(token)
+        if classified is None:
+            if lower in classifier._MODIFIERS_LOWER:
+                category = "MODIFIER"
+            elif lower in classifier._COLORS_LOWER:
+                category = "COLOR"
+            elif lower in classifier._MATERIALS_LOWER:
+                category = "MATERIAL"
+            elif lower in classifier._BRANDS_LOWER or lower in brands:
+                category = "BRAND"
+            elif lower in types:
+                category = "TYPE"
+            else:
+                category = "FEATURE"
+            classified = classifier.ClassifiedToken(token, category, classifier.WEIGHTS[category], "dict")
+        out.append(classified)
+    return out
+
+
+async def _load(limit: int):
+    async with async_session() as db:
+        snapshot = await load_snapshot(db)
+        result = await db.execute(
+            select(KeywordRanking.product_name).distinct().limit(limit)
+        )
+        names = [n for n in result.scalars().all() if n]
+    return snapshot, names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, default=20000)
+    args = parser.parse_args()
+
+    snapshot, names = asyncio.run(_load(args.limit))
+    print(f"corpus: {len(names)} product names, dictionary: "
+          f"{len(snapshot.brands)} brands / {len(snapshot.types)} types")
+
+    start = time.perf_counter()
+    matcher = classifier.build_matcher(snapshot.brands, snapshot.types)
+    print(f"matcher build: {(time.perf_counter() - start) * 1000:.1f} ms ({matcher.size} entries)")
+
+    start = time.perf_counter()
+    for name in names:
+        _baseline(name, snapshot.brands, snapshot.types)
+    baseline_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    multi_word = 0
+    for name in names:
+        tokens = classifier.classify_tokens(name, matcher=matcher)
+        multi_word += sum(1 for t in tokens if " " in t.text)
+    matcher_s = time.perf_counter() - start
+
+    per_name = 1e6 / max(len(names), 1)
+    print(f"per-token lookups: {baseline_s * 1000:.1f} ms ({baseline_s * per_name:.1f} us/name)")
+    print(f"phrase matcher:    {matcher_s * 1000:.1f} ms ({matcher_s * per_name:.1f} us/name)")
+    print(f"multi-word dictionary spans found: {multi_word}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark price-history payloads: row objects vs columnar + downsampled.
+
+Seeds one product with 5 keywords x 40 results x 180 crawls (36,000 rows, the
+30-day worst case) and reports service time, JSON serialization time and
+payload size for /price-history and /price-history/columnar.
+
+Usage:
+    cd backend && python3 -m scripts.bench_price_history [--crawls 180] [--points 300]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# Ensure backend package is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("NAVER_CLIENT_ID", "bench")
+os.environ.setdefault("NAVER_CLIENT_SECRET", "bench")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.core.utils import utcnow  # noqa: E402
+from app.models import *  # noqa: E402, F401, F403
+from app.models.keyword_ranking import KeywordRanking  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.search_keyword import SearchKeyword  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.price import PriceHistoryColumnar, PriceHistoryItem  # noqa: E402
+from app.services.price_service import get_price_history, get_price_history_columnar  # noqa: E402
+
+
+async def _seed(db: AsyncSession, crawls: int) -> int:
+    user = User(name="bench-history")
+    db.add(user)
+    await db.flush()
+    product = Product(user_id=user.id, name="벤치 상품", cost_price=0, selling_price=30000)
+    db.add(product)
+    await db.flush()
+    keywords = [SearchKeyword(product_id=product.id, keyword=f"벤치 키워드 {i}") for i in range(5)]
+    db.add_all(keywords)
+    await db.flush()
+    start = utcnow() - timedelta(days=29)
+    step = timedelta(days=29) / crawls
+    await db.execute(insert(KeywordRanking), [
+        {
+            "keyword_id": kw.id, "rank": r + 1, "price": 30000 + (c * 37 + r * 113) % 5000,
+            "product_name": f"경쟁 상품 {r} 무선 청소기 대용량 정품 빠른배송", "mall_name": f"경쟁몰 {r}",
+            "is_my_store": r == 7, "crawled_at": start + step * c,
+        }
+        for kw in keywords for c in range(crawls) for r in range(40)
+    ])
+    return product.id
+
+
+def _serialize(build) -> tuple[float, int]:
+    """response_model 검증 + JSON 인코딩 (FastAPI 응답 경로와 동일)."""
+    start = time.perf_counter()
+    body = JSONResponse(jsonable_encoder(build())).body
+    return time.perf_counter() - start, len(body)
+
+
+async def main_async(crawls: int, points: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as db:
+        product_id = await _seed(db, crawls)
+
+        start = time.perf_counter()
+        rows = await get_price_history(db, product_id, "30d")
+        query_s = time.perf_counter() - start
+        ser_s, size = _serialize(lambda: [PriceHistoryItem(**r) for r in rows])
+        print(f"{'rows':>16}: {len(rows)} rows, service {query_s * 1000:.0f} ms, "
+              f"serialize {ser_s * 1000:.0f} ms, {size / 1024:.0f} KiB")
+
+        for method in ("none", "minmax", "lttb"):
+            start = time.perf_counter()
+            data = await get_price_history_columnar(db, product_id, "30d", points=points, downsample=method)
+            query_s = time.perf_counter() - start
+            ser_s, size = _serialize(lambda: PriceHistoryColumnar(**data))
+            print(f"{'columnar/' + method:>16}: {data['returned_rows']} rows, service {query_s * 1000:.0f} ms, "
+                  f"serialize {ser_s * 1000:.0f} ms, {size / 1024:.0f} KiB")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--crawls", type=int, default=180)
+    parser.add_argument("--points", type=int, default=300)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.crawls, args.points))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark catalog-wide repricing recommendations.
+
+Seeds one user with N products (2 cost items and 1 keyword with 5 latest
+rankings each) and times the lowest-price aggregate query and the full
+get_repricing_recommendations call.
+
+Usage:
+    cd backend && python3 -m scripts.bench_repricing [--count 10000]
+    cd backend && python3 -m scripts.bench_repricing --database-url postgresql+asyncpg://...
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# Ensure backend package is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("NAVER_CLIENT_ID", "bench")
+os.environ.setdefault("NAVER_CLIENT_SECRET", "bench")
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.core.utils import utcnow  # noqa: E402
+from app.models import *  # noqa: E402, F401, F403
+from app.models.cost import CostItem  # noqa: E402
+from app.models.keyword_ranking import KeywordRanking  # noqa: E402
+from app.models.product import Product  # noqa: E402
+from app.models.search_keyword import SearchKeyword  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services import repricing_service  # noqa: E402
+
+
+async def _seed(db: AsyncSession, count: int) -> int:
+    rng = random.Random(42)
+    user = User(name="bench-repricing")
+    db.add(user)
+    await db.flush()
+    product_ids = (await db.execute(
+        insert(Product).returning(Product.id),
+        [
+            {
+                "user_id": user.id, "name": f"벤치 상품 {i}", "search_text": f"벤치 상품 {i}",
+                "cost_price": rng.randint(5000, 50000), "selling_price": rng.randint(10000, 90000),
+                "is_price_locked": i % 20 == 0,
+            }
+            for i in range(count)
+        ],
+    )).scalars().all()
+    await db.execute(insert(CostItem), [
+        row for pid in product_ids for row in (
+            {"product_id": pid, "name": "수수료", "type": "percent", "value": 5.5},
+            {"product_id": pid, "name": "택배비", "type": "fixed", "value": 3000},
+        )
+    ])
+    keyword_ids = (await db.execute(
+        insert(SearchKeyword).returning(SearchKeyword.id),
+        [{"product_id": pid, "keyword": f"kw {pid}", "is_primary": True} for pid in product_ids],
+    )).scalars().all()
+    now = utcnow()
+    await db.execute(insert(KeywordRanking), [
+        {
+            "keyword_id": kid, "rank": r + 1, "product_name": "경쟁", "price": rng.randint(10000, 90000),
+            "shipping_fee": 0, "mall_name": "m", "naver_product_id": str(r), "crawled_at": now,
+        }
+        for kid in keyword_ids for r in range(5)
+    ])
+    return user.id
+
+
+async def main_async(count: int, database_url: str) -> None:
+    engine = create_async_engine(database_url)
+    if database_url.startswith("sqlite"):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as db:
+        user_id = await _seed(db, count)
+        print(f"{count} products seeded ({engine.dialect.name})")
+
+        start = time.perf_counter()
+        lowest = await repricing_service._fetch_lowest_prices(db, user_id)
+        print(f"lowest-price aggregate: {(time.perf_counter() - start) * 1000:.1f} ms ({len(lowest)} products)")
+
+        for sort in ("urgency", "margin_delta"):
+            start = time.perf_counter()
+            page = await repricing_service.get_repricing_recommendations(db, user_id, sort_by=sort)
+            elapsed = time.perf_counter() - start
+            print(f"recommendations sort={sort}: {elapsed * 1000:.1f} ms, summary={page['summary']}")
+        await db.rollback()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite://")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.count, args.database_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark store import: per-row flush (previous handler) vs bulk INSERT ... RETURNING.
+
+Each run imports N products with 2 keywords each for a fresh user inside a
+transaction that is rolled back, and reports wall time plus the number of SQL
+statements sent to the database.
+
+Usage:
+    cd backend && python3 -m scripts.bench_store_import [--count 1000]
+    cd backend && python3 -m scripts.bench_store_import --database-url postgresql+asyncpg://...
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ensure backend package is importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("NAVER_CLIENT_ID", "bench")
+os.environ.setdefault("NAVER_CLIENT_SECRET", "bench")
+
+from sqlalchemy import event, select  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.models import *  # noqa: E402, F401, F403
+from app.models.product import Product  # noqa: E402
+from app.models.search_keyword import SearchKeyword  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.store_import import StoreImportItem  # noqa: E402
+from app.services.store_import_service import bulk_import_products  # noqa: E402
+
+
+async def _legacy_import(db: AsyncSession, user_id: int, items: list[StoreImportItem]) -> int:
+    """이전 핸들러: 상품마다 flush → 키워드 flush."""
+    result = await db.execute(
+        select(Product.name).where(Product.user_id == user_id, Product.is_active == True)
+    )
+    existing = {name.lower() for name in result.scalars().all()}
+    created = 0
+    for item in items:
+        if item.name.lower() in existing:
+            continue
+        product = Product(
+            user_id=user_id, name=item.name, selling_price=item.selling_price, cost_price=0,
+            category=item.category, naver_product_id=item.naver_product_id,
+        )
+        db.add(product)
+        await db.flush()
+        for i, kw in enumerate(item.keywords or [item.name]):
+            db.add(SearchKeyword(product_id=product.id, keyword=kw, is_primary=(i == 0)))
+        await db.flush()
+        existing.add(item.name.lower())
+        created += 1
+    return created
+
+
+async def _bulk_import(db: AsyncSession, user_id: int, items: list[StoreImportItem]) -> int:
+    return len((await bulk_import_products(db, user_id, items)).created)
+
+
+async def _run(engine, label: str, fn, items: list[StoreImportItem]) -> None:
+    statements = 0
+
+    def _count(*_args, **_kwargs):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_factory() as db:
+            user = User(name=f"bench-{label}")
+            db.add(user)
+            await db.flush()
+            statements = 0
+            start = time.perf_counter()
+            created = await fn(db, user.id, items)
+            elapsed = time.perf_counter() - start
+            await db.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _count)
+    print(f"{label:>8}: {created} products in {elapsed * 1000:.1f} ms, {statements} statements")
+
+
+async def main_async(count: int, database_url: str) -> None:
+    engine = create_async_engine(database_url)
+    if database_url.startswith("sqlite"):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    items = [
+        StoreImportItem(
+            name=f"벤치 상품 {i} 무선 청소기 모델 X{i:04d}",
+            selling_price=10000 + i,
+            category="가전/청소기",
+            naver_product_id=str(80000000 + i),
+            keywords=[f"벤치 상품 {i}", f"무선 청소기 X{i:04d}"],
+        )
+        for i in range(count)
+    ]
+    print(f"importing {count} products x 2 keywords ({engine.dialect.name})")
+    await _run(engine, "legacy", _legacy_import, items)
+    await _run(engine, "bulk", _bulk_import, items)
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite://")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.count, args.database_url))
+
+
+if __name__ == "__main__":
+    main()
@@ -56,3 +56,18 @@ async def client(engine):
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def scheduler_leader(engine, monkeypatch):
+    """스케줄러 잡이 리더로 실행되도록 테스트 DB에서 임대를 획득한 elector로 교체."""
+    from app.scheduler import jobs
+    from app.scheduler.leader import LeaderElector
+
+    elector = LeaderElector(
+        session_factory=async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+        instance_id="test-leader",
+    )
+    await elector.heartbeat()
+    monkeypatch.setattr(jobs, "elector", elector)
+    return elector
@@ -0,0 +1,192 @@
+"""알림 outbox + 디스패처 테스트 — 같은 트랜잭션 기록, 발송, 재시도/실패 처리."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.alert import Alert
+from app.models.alert_delivery import AlertDelivery
+from app.models.push_subscription import PushSubscription
+from app.models.user import User
+from app.services.alert_dispatcher import dispatch_pending_deliveries
+from app.services.alert_service import _add_alert
+
+
+async def _create_alert(session_factory, channels: list[str], chat_id: str | None = "123") -> int:
+    async with session_factory() as db:
+        user = User(name="디스패처테스트", telegram_chat_id=chat_id)
+        db.add(user)
+        await db.flush()
+        alert = Alert(user_id=user.id, type="price_undercut", title="상품 - 최저가 이탈", message="경쟁사 9,000원")
+        with patch("app.services.alert_service._delivery_channels", return_value=channels):
+            _add_alert(db, alert)
+        await db.commit()
+        return alert.id
+
+
+async def _deliveries(session_factory) -> list[AlertDelivery]:
+    async with session_factory() as db:
+        result = await db.execute(select(AlertDelivery).order_by(AlertDelivery.id))
+        return list(result.scalars().all())
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_alert_and_outbox_written_together(session_factory):
+    """Alert 커밋 시 채널별 outbox 행이 함께 기록된다."""
+    alert_id = await _create_alert(session_factory, ["push", "telegram"])
+    rows = await _deliveries(session_factory)
+    assert {r.channel for r in rows} == {"push", "telegram"}
+    assert all(r.alert_id == alert_id and r.status == "pending" for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_marks_sent(session_factory):
+    alert_id = await _create_alert(session_factory, ["push", "telegram"])
+    async with session_factory() as db:
+        alert = await db.get(Alert, alert_id)
+        db.add(PushSubscription(user_id=alert.user_id, endpoint="https://push.test/1", p256dh="k", auth="a"))
+        await db.commit()
+
+    push = AsyncMock(return_value=([True], set()))
+    with patch("app.services.alert_dispatcher.send_push_batch", push), \
+         patch("app.services.alert_dispatcher.deliver_telegram_message", AsyncMock(return_value="sent")) as tg:
+        stats = await dispatch_pending_deliveries(session_factory)
+
+    assert stats["sent"] == 2
+    tg.assert_awaited_once()
+    push.assert_awaited_once()
+    rows = await _deliveries(session_factory)
+    assert all(r.status == "sent" and r.sent_at is not None and r.attempts == 1 for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_skips_without_chat_id(session_factory):
+    await _create_alert(session_factory, ["telegram"], chat_id=None)
+    with patch("app.services.alert_dispatcher.deliver_telegram_message", AsyncMock(return_value="sent")) as tg:
+        stats = await dispatch_pending_deliveries(session_factory)
+
+    assert stats["skipped"] == 1
+    tg.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_dispatch_retry_with_backoff_then_failed(session_factory):
+    """실패 시 백오프 후 재시도, 최대 시도 초과 시 failed."""
+    await _create_alert(session_factory, ["telegram"])
+    failing = AsyncMock(return_value="retry")
+    with patch("app.services.alert_dispatcher.deliver_telegram_message", failing), \
+         patch("app.services.alert_dispatcher.settings.ALERT_DELIVERY_MAX_ATTEMPTS", 2):
+        stats = await dispatch_pending_deliveries(session_factory)
+        assert stats["retry"] == 1
+
+        # 백오프 시각 전에는 다시 선점되지 않음
+        stats = await dispatch_pending_deliveries(session_factory)
+        assert stats["retry"] == 0 and failing.await_count == 1
+
+        with patch("app.services.alert_dispatcher.settings.ALERT_DELIVERY_BACKOFF_SEC", 0):
+            async with session_factory() as db:
+                row = (await db.execute(select(AlertDelivery))).scalar_one()
+                row.next_attempt_at = row.created_at
+                await db.commit()
+            stats = await dispatch_pending_deliveries(session_factory)
+
+    assert stats["failed"] == 1
+    rows = await _deliveries(session_factory)
+    assert rows[0].status == "failed"
+    assert rows[0].attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_dispatch_telegram_client_error_fails_without_retry(session_factory):
+    """429 외 4xx는 재시도해도 같은 응답 → 바로 failed."""
+    await _create_alert(session_factory, ["telegram"])
+    with patch("app.services.alert_dispatcher.deliver_telegram_message", AsyncMock(return_value="failed")):
+        stats = await dispatch_pending_deliveries(session_factory)
+
+    assert stats["failed"] == 1
+    rows = await _deliveries(session_factory)
+    assert rows[0].status == "failed" and rows[0].attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_push_prunes_expired_subscriptions(session_factory):
+    """만료 endpoint는 발송 패스 종료 후 일괄 삭제."""
+    alert_id = await _create_alert(session_factory, ["push"])
+    async with session_factory() as db:
+        alert = await db.get(Alert, alert_id)
+        for i in range(3):
+            db.add(PushSubscription(user_id=alert.user_id, endpoint=f"https://push.test/{i}", p256dh="k", auth="a"))
+        await db.commit()
+
+    push = AsyncMock(return_value=([True], {"https://push.test/0", "https://push.test/2"}))
+    with patch("app.services.alert_dispatcher.send_push_batch", push):
+        stats = await dispatch_pending_deliveries(session_factory)
+
+    assert stats["sent"] == 1
+    subscriptions, messages, _ = push.await_args.args
+    assert len(subscriptions) == 3 and len(messages) == 1
+    async with session_factory() as db:
+        remaining = (await db.execute(select(PushSubscription.endpoint))).scalars().all()
+    assert remaining == ["https://push.test/1"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_telegram_digest_per_user(session_factory):
+    """한 유저의 여러 알림은 chat_id 1회 조회 + 다이제스트 1건으로 전송."""
+    alert_id = await _create_alert(session_factory, ["telegram"])
+    async with session_factory() as db:
+        first = await db.get(Alert, alert_id)
+        for i in range(4):
+            alert = Alert(user_id=first.user_id, type="rank_drop", title=f"상품{i} - 순위 하락", message="1위 → 3위")
+            with patch("app.services.alert_service._delivery_channels", return_value=["telegram"]):
+                _add_alert(db, alert)
+        await db.commit()
+
+    with patch("app.services.alert_dispatcher.deliver_telegram_message", AsyncMock(return_value="sent")) as tg:
+        stats = await dispatch_pending_deliveries(session_factory)
+
+    assert stats["sent"] == 5
+    tg.assert_awaited_once()
+    chat_id, text = tg.await_args.args
+    assert chat_id == "123"
+    assert "알림 5건" in text
+
+
+@pytest.mark.asyncio
+async def test_dispatch_push_retries_only_failed_endpoints(session_factory):
+    """일부 기기만 실패하면 재시도는 실패한 기기에만 전송."""
+    alert_id = await _create_alert(session_factory, ["push"])
+    async with session_factory() as db:
+        alert = await db.get(Alert, alert_id)
+        for i in range(2):
+            db.add(PushSubscription(user_id=alert.user_id, endpoint=f"https://push.test/{i}", p256dh="k", auth="a"))
+        await db.commit()
+
+    sent: list[str] = []
+    down = {"https://push.test/1"}
+
+    def _fake_send(info, payload):
+        if info["endpoint"] in down:
+            raise RuntimeError("503")
+        sent.append(info["endpoint"])
+
+    with patch("app.services.push_service._is_push_configured", return_value=True), \
+         patch("app.services.push_service._send_push_sync", side_effect=_fake_send), \
+         patch("app.services.alert_dispatcher.settings.ALERT_DELIVERY_BACKOFF_SEC", 0):
+        stats = await dispatch_pending_deliveries(session_factory)
+        assert stats["retry"] == 1
+        row = (await _deliveries(session_factory))[0]
+        assert row.delivered_endpoints == ["https://push.test/0"]
+
+        down.clear()
+        stats = await dispatch_pending_deliveries(session_factory)
+
+    assert stats["sent"] == 1
+    assert sent == ["https://push.test/0", "https://push.test/1"]
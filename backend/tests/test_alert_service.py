@@ -137,3 +137,165 @@ def test_relevance_model_code_case_insensitive():
     )
     is_rel, reason = _check_relevance(item, _FakeProduct())
     assert is_rel is True
+
+
+# ===== 유저 단위 일괄 알림 평가 =====
+
+async def _seed_user_products(db: AsyncSession, count: int) -> tuple[User, list[Product], dict]:
+    from datetime import timedelta
+
+    from app.core.utils import utcnow
+
+    user = User(name="알림일괄", naver_store_name="내스토어")
+    db.add(user)
+    await db.flush()
+
+    now = utcnow()
+    prev_at, cur_at = now - timedelta(hours=2), now - timedelta(minutes=1)
+    products, keywords_by_product = [], {}
+    for i in range(count):
+        product = Product(
+            user_id=user.id, name=f"상품{i}", cost_price=5000, selling_price=10000,
+            naver_product_id=f"np_my_{i}",
+        )
+        db.add(product)
+        await db.flush()
+        kw = SearchKeyword(product_id=product.id, keyword=f"키워드{i}")
+        db.add(kw)
+        await db.flush()
+        products.append(product)
+        keywords_by_product[product.id] = [kw]
+        db.add_all([
+            # 직전: 내 상품 2위 → 현재: 5위 (순위 하락)
+            KeywordRanking(keyword_id=kw.id, rank=2, product_name="내 상품", price=10000,
+                           mall_name="내스토어", naver_product_id=f"np_my_{i}", is_my_store=True,
+                           crawled_at=prev_at),
+            KeywordRanking(keyword_id=kw.id, rank=5, product_name="내 상품", price=10000,
+                           mall_name="내스토어", naver_product_id=f"np_my_{i}", is_my_store=True,
+                           crawled_at=cur_at),
+            # 현재: 경쟁사 9,000원 (최저가 이탈)
+            KeywordRanking(keyword_id=kw.id, rank=1, product_name="경쟁 상품", price=9000,
+                           mall_name="경쟁몰", naver_product_id=f"np_other_{i}", crawled_at=cur_at),
+        ])
+    await db.flush()
+    return user, products, keywords_by_product
+
+
+@pytest.mark.asyncio
+async def test_user_alerts_batched_queries(db: AsyncSession, engine):
+    """상품 수와 무관하게 고정 쿼리 수로 평가 + 알림/outbox 일괄 기록."""
+    from unittest.mock import patch
+
+    from sqlalchemy import event, select
+
+    from app.models.alert import Alert
+    from app.models.alert_delivery import AlertDelivery
+    from app.services.alert_service import check_and_create_alerts_for_user
+
+    user, products, keywords_by_product = await _seed_user_products(db, 20)
+
+    statements: list[str] = []
+
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _count)
+    try:
+        with patch("app.services.alert_service._delivery_channels", return_value=["telegram"]):
+            created = await check_and_create_alerts_for_user(
+                db, user.id, products, keywords_by_product, user.naver_store_name,
+            )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _count)
+
+    assert created == 40
+    # 설정 + 중복 + 블랙리스트 + 최신 rankings + 순위 이력 + Alert INSERT + outbox INSERT
+    assert len(statements) <= 7
+
+    alerts = (await db.execute(select(Alert))).scalars().all()
+    assert sorted(a.type for a in alerts).count("rank_drop") == 20
+    undercut = next(a for a in alerts if a.type == "price_undercut")
+    assert undercut.data["competitor_price"] == 9000
+    assert undercut.data["keyword"].startswith("키워드")
+    rank_drop = next(a for a in alerts if a.type == "rank_drop")
+    assert (rank_drop.data["prev_rank"], rank_drop.data["current_rank"]) == (2, 5)
+
+    deliveries = (await db.execute(select(AlertDelivery))).scalars().all()
+    assert len(deliveries) == 40
+    assert {d.alert_id for d in deliveries} == {a.id for a in alerts}
+
+
+@pytest.mark.asyncio
+async def test_user_alerts_dedup_and_blacklist(db: AsyncSession):
+    """미읽음 중복 알림이 있으면 스킵, 블랙리스트 경쟁사는 최저가 판정에서 제외."""
+    from sqlalchemy import select
+
+    from app.models.alert import Alert
+    from app.models.excluded_product import ExcludedProduct
+    from app.services.alert_service import check_and_create_alerts_for_user
+
+    user, products, keywords_by_product = await _seed_user_products(db, 2)
+    db.add(Alert(user_id=user.id, product_id=products[0].id, type="rank_drop", title="기존"))
+    db.add(ExcludedProduct(product_id=products[1].id, naver_product_id="np_other_1"))
+    await db.flush()
+
+    created = await check_and_create_alerts_for_user(
+        db, user.id, products, keywords_by_product, user.naver_store_name,
+    )
+
+    assert created == 2
+    result = await db.execute(select(Alert.product_id, Alert.type).where(Alert.title != "기존"))
+    assert set(result.all()) == {
+        (products[0].id, "price_undercut"),
+        (products[1].id, "rank_drop"),
+    }
+
+
+# ===== _fetch_my_rank_pairs (윈도 함수) 테스트 =====
+
+@pytest.mark.asyncio
+async def test_fetch_my_rank_pairs_window(db: AsyncSession):
+    """키워드별 최신/직전 크롤링의 내 최고 순위 1쌍만 반환."""
+    from datetime import timedelta
+
+    from app.core.utils import utcnow
+    from app.services.product_service import _fetch_my_rank_pairs, _rank_change_from_pairs
+
+    user = User(name="윈도")
+    db.add(user)
+    await db.flush()
+    with_id = Product(user_id=user.id, name="등록", cost_price=1, selling_price=1, naver_product_id="np_mine")
+    without_id = Product(user_id=user.id, name="미등록", cost_price=1, selling_price=1)
+    db.add_all([with_id, without_id])
+    await db.flush()
+    kw_a = SearchKeyword(product_id=with_id.id, keyword="a")
+    kw_b = SearchKeyword(product_id=without_id.id, keyword="b")
+    kw_c = SearchKeyword(product_id=with_id.id, keyword="c")
+    db.add_all([kw_a, kw_b, kw_c])
+    await db.flush()
+
+    now = utcnow()
+    t1, t2, t3 = now - timedelta(hours=3), now - timedelta(hours=2), now - timedelta(hours=1)
+
+    def _r(kw, rank, at, naver_id=None, mine=False):
+        return KeywordRanking(keyword_id=kw.id, rank=rank, product_name="p", price=1,
+                              naver_product_id=naver_id, is_my_store=mine, crawled_at=at)
+
+    db.add_all([
+        # kw_a: t1 9위, t2 3위·7위(중복 노출) → t3 6위, 같은 스토어 다른 상품은 무시
+        _r(kw_a, 9, t1, "np_mine", True),
+        _r(kw_a, 3, t2, "np_mine", True), _r(kw_a, 7, t2, "np_mine", True),
+        _r(kw_a, 6, t3, "np_mine", True), _r(kw_a, 1, t3, "np_other", True),
+        # kw_b: naver_product_id 없는 상품 → is_my_store fallback, t2 4위 → t3 2위
+        _r(kw_b, 4, t2, "np_x", True), _r(kw_b, 2, t3, "np_y", True), _r(kw_b, 1, t3, "np_z", False),
+        # kw_c: 한 번만 크롤링
+        _r(kw_c, 5, t3, "np_mine", True),
+    ])
+    await db.flush()
+
+    pairs = await _fetch_my_rank_pairs(db, [kw_a.id, kw_b.id, kw_c.id], since=now - timedelta(days=7))
+
+    assert pairs == {kw_a.id: (6, 3), kw_b.id: (2, 4), kw_c.id: (5, None)}
+    assert _rank_change_from_pairs(pairs, [kw_c.id, kw_a.id]) == 3
+    assert _rank_change_from_pairs(pairs, [kw_b.id]) == -2
+    assert _rank_change_from_pairs(pairs, [kw_c.id]) is None
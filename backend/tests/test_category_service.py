@@ -0,0 +1,87 @@
+"""네이버 카테고리 트리 테스트 — 경로 테이블 증분 갱신, 재집계, 버전 캐시."""
+
+from collections import Counter
+
+import pytest
+from sqlalchemy import select
+
+from app.crawlers.base import RankingItem
+from app.models.keyword_ranking import KeywordRanking
+from app.models.naver_category_path import NaverCategoryPath
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services.category_service import (
+    count_category_paths,
+    get_naver_category_tree,
+    rebuild_category_paths,
+    record_category_paths,
+)
+
+
+def _item(*cats: str) -> RankingItem:
+    cats = list(cats) + [""] * (4 - len(cats))
+    return RankingItem(
+        rank=1, product_name="p", price=1000, mall_name="m",
+        category1=cats[0], category2=cats[1], category3=cats[2], category4=cats[3],
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_paths_and_tree(db):
+    """적재 시 증분 UPSERT → 트리 집계."""
+    await record_category_paths(db, count_category_paths([
+        _item("가전", "주방가전", "전기포트"),
+        _item("가전", "주방가전", "전기포트"),
+        _item("가전", "생활가전"),
+        _item(""),  # 카테고리 없음 → 무시
+    ]))
+    await record_category_paths(db, count_category_paths([_item("가전", "주방가전", "전기포트")]))
+    await record_category_paths(db, Counter())
+
+    tree = await get_naver_category_tree(db)
+
+    assert tree["total_paths"] == 2
+    (home,) = tree["categories"]
+    assert (home["name"], home["product_count"]) == ("가전", 4)
+    assert [(c["name"], c["product_count"]) for c in home["children"]] == [("주방가전", 3), ("생활가전", 1)]
+    assert home["children"][0]["children"][0] == {"name": "전기포트", "product_count": 3, "children": []}
+
+
+@pytest.mark.asyncio
+async def test_tree_cache_by_version(db):
+    """경로 테이블 변경이 없으면 캐시 반환, 변경 시 재구성."""
+    await record_category_paths(db, count_category_paths([_item("도서")]))
+    first = await get_naver_category_tree(db)
+    assert await get_naver_category_tree(db) is first
+
+    await record_category_paths(db, count_category_paths([_item("도서")]))
+    second = await get_naver_category_tree(db)
+    assert second is not first
+    assert second["categories"][0]["product_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rebuild_matches_rankings(db):
+    """재집계는 keyword_rankings 기준으로 건수를 맞추고 사라진 경로를 삭제."""
+    user = User(name="카테고리")
+    db.add(user)
+    await db.flush()
+    product = Product(user_id=user.id, name="p", cost_price=1, selling_price=1)
+    db.add(product)
+    await db.flush()
+    kw = SearchKeyword(product_id=product.id, keyword="k")
+    db.add(kw)
+    await db.flush()
+    db.add_all([
+        KeywordRanking(keyword_id=kw.id, rank=1, product_name="a", price=1, category1="식품", category2="과자"),
+        KeywordRanking(keyword_id=kw.id, rank=2, product_name="b", price=1, category1="식품", category2="과자"),
+        KeywordRanking(keyword_id=kw.id, rank=3, product_name="c", price=1, category1=None),
+    ])
+    await record_category_paths(db, count_category_paths([_item("만료된", "경로")]))
+    await db.flush()
+
+    assert await rebuild_category_paths(db) == 1
+
+    rows = (await db.execute(select(NaverCategoryPath))).scalars().all()
+    assert [(r.category1, r.category2, r.category3, r.product_count) for r in rows] == [("식품", "과자", "", 2)]
@@ -0,0 +1,180 @@
+"""종료 drain 테스트 — 진행 중 크롤링은 받은 결과를 청크 단위로 저장하고, 미완료 키워드는 체크포인트 후 재개."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.utils import utcnow
+from app.crawlers import manager as manager_module
+from app.crawlers.base import KeywordCrawlResult
+from app.crawlers.executor import FairShareExecutor
+from app.crawlers.manager import CrawlDrainingError, CrawlManager, shared_manager
+from app.models.crawl_checkpoint import CrawlCheckpoint
+from app.models.crawl_log import CrawlLog
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def isolated_executor(monkeypatch):
+    monkeypatch.setattr(manager_module, "crawl_executor", FairShareExecutor())
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MIN", 0)
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MAX", 0)
+    monkeypatch.setattr(settings, "CRAWL_CONCURRENCY", 1)
+
+
+async def _seed(db) -> int:
+    user = User(name="종료테스트", crawl_interval_min=60)
+    db.add(user)
+    await db.flush()
+    product = Product(user_id=user.id, name="종료 상품", cost_price=0, selling_price=1000)
+    db.add(product)
+    await db.flush()
+    db.add_all([
+        SearchKeyword(product_id=product.id, keyword=f"키워드 {i}", is_primary=i == 0)
+        for i in range(4)
+    ])
+    await db.commit()
+    return user.id
+
+
+def _fake_fetch(crawled: list[str], gate: asyncio.Event | None = None, started: asyncio.Event | None = None):
+    async def fetch(keyword_str, sort_type="sim", **kwargs):
+        crawled.append(keyword_str)
+        if started is not None:
+            started.set()
+        if gate is not None:
+            await gate.wait()
+        return KeywordCrawlResult(keyword=keyword_str, success=True)
+    return fetch
+
+
+@pytest.mark.asyncio
+async def test_drain_checkpoints_unfinished_keywords_and_resumes(db, monkeypatch):
+    user_id = await _seed(db)
+    old = CrawlManager()
+    crawled: list[str] = []
+    gate, started = asyncio.Event(), asyncio.Event()
+    monkeypatch.setattr(old, "_fetch_keyword", _fake_fetch(crawled, gate, started))
+
+    async def crawl_and_commit():
+        stats = await old.crawl_user_all(db, user_id)
+        await db.commit()
+        return stats
+
+    run = asyncio.create_task(crawl_and_commit())
+    await started.wait()
+    drain = asyncio.create_task(old.drain(timeout=5))
+    await asyncio.sleep(0)
+    gate.set()
+    assert await drain is True
+    stats = await run
+
+    # 호출 중이던 1개만 저장, 나머지 3개는 체크포인트
+    assert len(crawled) == 1
+    assert (stats["total"], stats["pending"]) == (1, 3)
+    checkpoint = await db.get(CrawlCheckpoint, user_id)
+    assert checkpoint.run_id == stats["run_id"] and len(checkpoint.pending_keyword_ids) == 3
+    user = await db.get(User, user_id)
+    assert user.last_crawled_at is None and user.next_crawl_due_at <= utcnow()
+    with pytest.raises(CrawlDrainingError):
+        await old.crawl_user_all(db, user_id)
+
+    # 다음 프로세스: 남은 키워드만 같은 run으로 이어서 수행
+    new = CrawlManager()
+    resumed: list[str] = []
+    monkeypatch.setattr(new, "_fetch_keyword", _fake_fetch(resumed))
+    stats2 = await new.crawl_user_all(db, user_id)
+    await db.commit()
+
+    assert sorted(resumed + crawled) == [f"키워드 {i}" for i in range(4)]
+    assert stats2["run_id"] == stats["run_id"] and stats2["pending"] == 0
+    db.expire_all()
+    assert (await db.execute(select(CrawlCheckpoint))).scalars().all() == []
+    user = await db.get(User, user_id)
+    assert user.last_crawled_at is not None
+    assert user.next_crawl_due_at == user.last_crawled_at + timedelta(minutes=60)
+
+
+@pytest.mark.asyncio
+async def test_stale_checkpoint_is_ignored(db, monkeypatch):
+    user_id = await _seed(db)
+    kw_id = await db.scalar(select(SearchKeyword.id).limit(1))
+    db.add(CrawlCheckpoint(
+        user_id=user_id, run_id="old", pending_keyword_ids=[kw_id],
+        created_at=utcnow() - timedelta(hours=2),
+    ))
+    await db.commit()
+
+    manager = CrawlManager()
+    crawled: list[str] = []
+    monkeypatch.setattr(manager, "_fetch_keyword", _fake_fetch(crawled))
+    stats = await manager.crawl_user_all(db, user_id)
+    await db.commit()
+
+    assert len(crawled) == 4 and stats["run_id"] != "old"
+    db.expire_all()
+    assert await db.get(CrawlCheckpoint, user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_crawl_api_rejects_new_work_while_draining(client, db, monkeypatch):
+    user_id = await _seed(db)
+    monkeypatch.setattr(shared_manager, "draining", True)
+
+    resp = await client.post(f"/api/v1/crawl/user/{user_id}")
+    assert resp.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_drain_commits_in_chunks_so_cancel_loses_only_current_chunk(db, engine, monkeypatch):
+    user = User(name="청크 커밋", crawl_interval_min=60)
+    db.add(user)
+    await db.flush()
+    product = Product(user_id=user.id, name="청크 상품", cost_price=0, selling_price=1000)
+    db.add(product)
+    await db.flush()
+    keywords = [SearchKeyword(product_id=product.id, keyword=f"청크 {i}", is_primary=i == 0) for i in range(6)]
+    db.add_all(keywords)
+    await db.commit()
+    user_id = user.id
+    keyword_ids = {kw.keyword: kw.id for kw in keywords}
+
+    monkeypatch.setattr(settings, "CRAWL_CONCURRENCY", 6)
+    monkeypatch.setattr(settings, "CRAWL_DRAIN_COMMIT_CHUNK", 2)
+    manager = CrawlManager()
+    crawled: list[str] = []
+    gate, started = asyncio.Event(), asyncio.Event()
+    monkeypatch.setattr(manager, "_fetch_keyword", _fake_fetch(crawled, gate, started))
+
+    save = manager._save_keyword_result
+
+    async def slow_save(session, keyword, *args, **kwargs):
+        if keyword.keyword in ("청크 4", "청크 5"):
+            await asyncio.sleep(5)  # 종료 기한을 넘기는 저장
+        return await save(session, keyword, *args, **kwargs)
+
+    monkeypatch.setattr(manager, "_save_keyword_result", slow_save)
+
+    run = asyncio.create_task(manager.crawl_user_all(db, user_id))
+    while len(crawled) < 6:  # 6개 모두 호출 중인 상태에서 종료 시작
+        await asyncio.sleep(0)
+    drain = asyncio.create_task(manager.drain(timeout=0.3))
+    await asyncio.sleep(0)
+    gate.set()
+    assert await drain is False
+    with pytest.raises(asyncio.CancelledError):
+        await run
+
+    # 커밋된 청크(4개)는 남고, 진행 중이던 청크의 키워드만 체크포인트로 재개
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as check:
+        saved = set((await check.execute(select(CrawlLog.keyword_id))).scalars().all())
+        assert saved == {keyword_ids[f"청크 {i}"] for i in range(4)}
+        checkpoint = await check.get(CrawlCheckpoint, user_id)
+        assert checkpoint.pending_keyword_ids == sorted([keyword_ids["청크 4"], keyword_ids["청크 5"]])
+        assert (await check.get(User, user_id)).next_crawl_due_at <= utcnow()
@@ -0,0 +1,153 @@
+"""크롤링 실행기 테스트 — 사업체 간 라운드로빈, 전역 속도 제한, 대기 시간 집계, 예정 사업체 동시 시작."""
+
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.utils import utcnow
+from app.crawlers import manager as manager_module
+from app.crawlers.base import KeywordCrawlResult
+from app.crawlers.executor import FairShareExecutor, QueueWaitStats
+from app.crawlers.manager import CrawlManager
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.scheduler import jobs
+
+
+async def _run(executor, user_id, order, stats=None):
+    async with executor.slot(user_id, stats):
+        order.append(user_id)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_small_user_not_starved_behind_large_user():
+    executor = FairShareExecutor(concurrency=1, rate_per_sec=0)
+    order: list[int] = []
+    small_stats = QueueWaitStats()
+    gate = asyncio.Event()
+
+    async def hold():
+        async with executor.slot(1):
+            await gate.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    large = [asyncio.create_task(_run(executor, 1, order)) for _ in range(20)]
+    await asyncio.sleep(0)  # 큰 사업체 요청이 먼저 대기열을 채움
+    small = [asyncio.create_task(_run(executor, 2, order, small_stats)) for _ in range(2)]
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(holder, *large, *small)
+
+    # FIFO였다면 21, 22번째 — 라운드로빈이라 번갈아 배정
+    assert [i for i, uid in enumerate(order) if uid == 2] == [1, 3]
+    assert small_stats.count == 2 and small_stats.as_dict()["queue_wait_avg_ms"] is not None
+    assert executor.snapshot() == {"in_flight": 0, "waiting": 0, "waiting_users": 0}
+
+
+@pytest.mark.asyncio
+async def test_global_rate_limit_and_cancellation():
+    executor = FairShareExecutor(concurrency=5, rate_per_sec=50)
+    order: list[int] = []
+    started = time.monotonic()
+    await asyncio.gather(*[_run(executor, uid % 2, order) for uid in range(5)])
+    assert time.monotonic() - started >= 4 / 50 * 0.9
+
+    # 대기 중 취소된 요청은 슬롯을 차지하지 않음
+    executor = FairShareExecutor(concurrency=1, rate_per_sec=0)
+    gate = asyncio.Event()
+
+    async def hold():
+        async with executor.slot(1):
+            await gate.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_run(executor, 2, order))
+    await asyncio.sleep(0)
+    assert executor.waiting(2) == 1
+    waiter.cancel()
+    gate.set()
+    await holder
+    await _run(executor, 3, order)
+    assert executor.snapshot()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_starts_all_due_users(db, engine, scheduler_leader, monkeypatch):
+    now = utcnow()
+    db.add_all([
+        User(name=f"동시 {i}", crawl_interval_min=60, next_crawl_due_at=now - timedelta(minutes=i))
+        for i in range(5)
+    ])
+    await db.commit()
+
+    active = 0
+    peak = 0
+
+    async def fake_crawl_user_all(session, user_id, before_start=None):
+        nonlocal active, peak
+        assert await before_start(session)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"total": 0, "success": 0, "failed": 0}
+
+    monkeypatch.setattr(jobs, "async_session", async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+    monkeypatch.setattr(jobs.shared_manager, "crawl_user_all", fake_crawl_user_all)
+    await jobs.crawl_all_users()
+
+    # 사업체 수로 입장을 막지 않음 — API 동시성은 실행기, DB 연결은 조회/저장 단계에서 제한
+    assert peak == 5
+
+
+@pytest.mark.asyncio
+async def test_small_user_not_blocked_by_large_users_holding_db_slots(db, engine, scheduler_leader, monkeypatch):
+    now = utcnow()
+    users = []
+    for i in range(3):  # DB 슬롯보다 많은 큰 사업체가 먼저 예정
+        users.append(User(name=f"대형 {i}", crawl_interval_min=60, next_crawl_due_at=now - timedelta(hours=1, minutes=i)))
+    users.append(User(name="소형", crawl_interval_min=60, next_crawl_due_at=now - timedelta(minutes=1)))
+    db.add_all(users)
+    await db.flush()
+    for user in users:
+        product = Product(user_id=user.id, name=f"{user.name} 상품", cost_price=0, selling_price=1000)
+        db.add(product)
+        await db.flush()
+        count = 1 if user.name == "소형" else 10
+        db.add_all([
+            SearchKeyword(product_id=product.id, keyword=f"{user.name} {k}", is_primary=k == 0)
+            for k in range(count)
+        ])
+    await db.commit()
+
+    fetched: list[str] = []
+
+    async def fake_search(keyword_str, sort_type="sim"):
+        fetched.append(keyword_str)
+        await asyncio.sleep(0.01)  # API 호출이 DB 단계보다 오래 걸림
+        return KeywordCrawlResult(keyword=keyword_str, success=True)
+
+    monkeypatch.setattr(settings, "CRAWL_DB_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "CRAWL_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MIN", 0)
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MAX", 0)
+    monkeypatch.setattr(manager_module, "crawl_executor", FairShareExecutor(concurrency=1, rate_per_sec=0))
+    monkeypatch.setattr(manager_module.crawler, "search_keyword", fake_search)
+    monkeypatch.setattr(jobs, "shared_manager", CrawlManager())
+    monkeypatch.setattr(jobs, "async_session", async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+    await jobs.crawl_all_users()
+
+    assert len(fetched) == 31
+    # 큰 사업체 크롤링이 하나라도 끝나기를 기다리지 않고 호출됨
+    last_large = min(
+        max(i for i, kw in enumerate(fetched) if kw.startswith(f"대형 {n} ")) for n in range(3)
+    )
+    assert fetched.index("소형 0") < last_large
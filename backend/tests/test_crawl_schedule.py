@@ -0,0 +1,162 @@
+"""크롤링 스케줄 테스트 — 사업체별 next_crawl_due_at 범위 조회와 완료 시 갱신."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.utils import utcnow
+from app.crawlers.base import KeywordCrawlResult
+from app.crawlers.manager import CrawlManager
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.scheduler import jobs
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_crawls_only_due_users(db, session_factory, scheduler_leader, monkeypatch):
+    now = utcnow()
+    db.add_all([
+        User(name="도래", crawl_interval_min=60, next_crawl_due_at=now - timedelta(minutes=5)),
+        User(name="대기", crawl_interval_min=60, next_crawl_due_at=now + timedelta(minutes=30)),
+        User(name="자동 끔", crawl_interval_min=0, next_crawl_due_at=now - timedelta(hours=1)),
+        User(name="오래 도래", crawl_interval_min=60, next_crawl_due_at=now - timedelta(hours=2)),
+    ])
+    await db.commit()
+
+    crawled = []
+
+    async def fake_crawl_user_all(session, user_id, before_start=None):
+        assert await before_start(session)
+        crawled.append((await session.get(User, user_id)).name)
+        return {"total": 0, "success": 0, "failed": 0}
+
+    monkeypatch.setattr(jobs, "async_session", session_factory)
+    monkeypatch.setattr(jobs.shared_manager, "crawl_user_all", fake_crawl_user_all)
+    await jobs.crawl_all_users()
+
+    assert crawled == ["오래 도래", "도래"]
+
+
+@pytest.mark.asyncio
+async def test_crawl_completion_updates_user_schedule(db, monkeypatch):
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MIN", 0)
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MAX", 0)
+    user = User(name="스케줄", crawl_interval_min=30)
+    db.add(user)
+    await db.flush()
+    assert user.next_crawl_due_at is not None  # 신규 사업체는 즉시 예정
+    product = Product(user_id=user.id, name="스케줄 상품", cost_price=0, selling_price=1000)
+    db.add(product)
+    await db.flush()
+    db.add(SearchKeyword(product_id=product.id, keyword="스케줄", is_primary=True))
+    await db.commit()
+
+    manager = CrawlManager()
+    outcome = {"success": True}
+
+    async def fake_fetch(keyword_str, sort_type="sim", **kwargs):
+        return KeywordCrawlResult(keyword=keyword_str, success=outcome["success"])
+
+    monkeypatch.setattr(manager, "_fetch_keyword", fake_fetch)
+
+    stats = await manager.crawl_user_all(db, user.id)
+    await db.commit()
+    assert user.last_crawl_run_id == stats["run_id"]
+    crawled_at = user.last_crawled_at
+    assert crawled_at is not None
+    assert user.next_crawl_due_at == crawled_at + timedelta(minutes=30)
+
+    # 전부 실패하면 마지막 크롤링 시각을 유지 → 예정 시각도 그대로라 다음 체크에 재시도
+    outcome["success"] = False
+    stats = await manager.crawl_user_all(db, user.id)
+    await db.commit()
+    assert user.last_crawl_run_id == stats["run_id"]
+    assert user.last_crawled_at == crawled_at
+    assert user.next_crawl_due_at == crawled_at + timedelta(minutes=30)
+
+
+@pytest.mark.asyncio
+async def test_interval_change_reschedules(client, db):
+    crawled_at = utcnow() - timedelta(minutes=10)
+    user = User(name="주기 변경", crawl_interval_min=60, last_crawled_at=crawled_at)
+    db.add(user)
+    await db.flush()
+    db.add(Product(user_id=user.id, name="주기 상품", cost_price=0, selling_price=1000))
+    await db.commit()
+
+    resp = await client.put(f"/api/v1/users/{user.id}", json={"crawl_interval_min": 15})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["next_crawl_due_at"].startswith((crawled_at + timedelta(minutes=15)).isoformat()[:19])
+
+    summary = (await client.get(f"/api/v1/users/{user.id}/dashboard/summary")).json()
+    assert summary["last_crawled_at"].startswith(crawled_at.isoformat()[:19])
+
+
+@pytest.mark.asyncio
+async def test_scheduler_claims_each_user_once(db, session_factory, scheduler_leader, monkeypatch):
+    due = utcnow() - timedelta(minutes=5)
+    users = [User(name=f"선점 {i}", crawl_interval_min=60, next_crawl_due_at=due) for i in range(3)]
+    db.add_all(users)
+    await db.commit()
+    user_ids = [u.id for u in users]
+
+    crawled = []
+    slot = asyncio.Semaphore(1)
+
+    async def fake_crawl_user_all(session, user_id, before_start=None):
+        async with slot:  # DB 단계 슬롯 1개 — 먼저 시작한 사업체가 끝난 뒤 다음 사업체 선점
+            if not await before_start(session):
+                return {"total": 0, "success": 0, "failed": 0, "skipped": True}
+            crawled.append(user_id)
+            if user_id == user_ids[0]:
+                # 첫 사업체 크롤링 중 다른 리더가 두 번째 사업체를 먼저 선점
+                async with session_factory() as other:
+                    (await other.get(User, user_ids[1])).next_crawl_due_at = utcnow() + timedelta(hours=1)
+                    await other.commit()
+            if user_id == user_ids[2]:
+                raise RuntimeError("크롤링 오류")
+            return {"total": 0, "success": 0, "failed": 0}
+
+    monkeypatch.setattr(jobs, "async_session", session_factory)
+    monkeypatch.setattr(jobs.shared_manager, "crawl_user_all", fake_crawl_user_all)
+    await jobs.crawl_all_users()
+
+    assert crawled == [user_ids[0], user_ids[2]]
+    db.expire_all()
+    # 선점한 사업체는 다음 주기로, 실패한 사업체는 선점을 풀어 다음 체크에 재시도
+    assert (await db.get(User, user_ids[0])).next_crawl_due_at > utcnow() + timedelta(minutes=55)
+    assert (await db.get(User, user_ids[2])).next_crawl_due_at == due
+
+
+@pytest.mark.asyncio
+async def test_scheduler_stops_starting_users_after_losing_leadership(db, session_factory, scheduler_leader, monkeypatch):
+    due = utcnow() - timedelta(minutes=5)
+    db.add_all([User(name=f"리더 {i}", crawl_interval_min=60, next_crawl_due_at=due) for i in range(3)])
+    await db.commit()
+
+    crawled = []
+    slot = asyncio.Semaphore(1)
+
+    async def fake_crawl_user_all(session, user_id, before_start=None):
+        async with slot:  # DB 단계 슬롯 1개 — 먼저 시작한 사업체가 끝난 뒤 다음 사업체 시작
+            if not await before_start(session):
+                return {"total": 0, "success": 0, "failed": 0, "skipped": True}
+            crawled.append(user_id)
+            await scheduler_leader.release()  # 크롤링 도중 리더 상실
+        return {"total": 0, "success": 0, "failed": 0}
+
+    monkeypatch.setattr(jobs, "async_session", session_factory)
+    monkeypatch.setattr(jobs.shared_manager, "crawl_user_all", fake_crawl_user_all)
+    await jobs.crawl_all_users()
+
+    assert len(crawled) == 1
@@ -0,0 +1,165 @@
+"""크롤링 통계 카운터 테스트 — 버퍼 누적 후 별도 트랜잭션 반영, 24시간 버킷 합산, 정리/백필."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.utils import utcnow
+from app.crawlers.base import KeywordCrawlResult
+from app.crawlers.manager import CrawlManager
+from app.models.crawl_log import CrawlLog
+from app.models.crawl_stat import CrawlStatHourly
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services import crawl_stats_service
+from app.services.crawl_stats_service import (
+    GLOBAL_SCOPE,
+    CrawlStatCounts,
+    count_crawl_result,
+    ensure_crawl_stats,
+    flush_crawl_stats,
+    get_crawl_stats,
+    get_last_crawled_at,
+    hour_bucket,
+    prune_crawl_stats,
+    record_crawl_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_buffer(monkeypatch):
+    monkeypatch.setattr(crawl_stats_service, "_pending", {})
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _seed(db) -> tuple[Product, SearchKeyword]:
+    user = User(name="통계테스트")
+    db.add(user)
+    await db.flush()
+    product = Product(user_id=user.id, name="통계 상품", cost_price=0, selling_price=10000)
+    db.add(product)
+    await db.flush()
+    kw = SearchKeyword(product_id=product.id, keyword="통계", is_primary=True)
+    db.add(kw)
+    await db.commit()
+    return product, kw
+
+
+@pytest.mark.asyncio
+async def test_save_keyword_result_increments_user_and_global(client, db, session_factory):
+    product, kw = await _seed(db)
+    manager = CrawlManager()
+
+    for success, ms in [(True, 100), (True, 300), (False, 1000)]:
+        result = KeywordCrawlResult(keyword=kw.keyword, success=success, error=None if success else "timeout")
+        await manager._save_keyword_result(db, kw, result, None, ms, product=product)
+    # 누적 모드: 호출자가 마지막에 한 번 반영
+    counts: CrawlStatCounts = {}
+    result = KeywordCrawlResult(keyword=kw.keyword, success=True)
+    await manager._save_keyword_result(db, kw, result, None, 200, product=product, crawl_stats=counts)
+    await record_crawl_stats(db, counts)
+    await db.commit()
+    # 단건 저장분은 버퍼에 있다가 별도 트랜잭션으로 반영
+    assert (await get_crawl_stats(db))["total"] == 1
+    assert await flush_crawl_stats(session_factory) == 2
+
+    stats = await get_crawl_stats(db, product.user_id)
+    assert (stats["success"], stats["failed"]) == (3, 1)
+    assert stats["avg_success_duration_ms"] == 200
+    assert stats["avg_duration_ms"] == 400
+    assert stats["success_rate"] == 75.0
+    assert (await get_crawl_stats(db))["total"] == 4
+    # 같은 시간대는 사업체/전체 각 1행
+    assert len((await db.execute(select(CrawlStatHourly))).scalars().all()) == 2
+
+    status = (await client.get(f"/api/v1/crawl/status/{product.user_id}")).json()
+    assert status["last_24h_success"] == 3 and status["last_24h_failed"] == 1
+    assert status["avg_duration_ms"] == 200
+
+    summary = (await client.get(f"/api/v1/users/{product.user_id}/dashboard/summary")).json()
+    assert summary["crawl_success_rate"] == 75.0
+
+
+@pytest.mark.asyncio
+async def test_window_excludes_old_buckets_and_prune(db):
+    now = hour_bucket(utcnow())  # 같은 버킷에 기록되도록 시각 고정
+    counts: CrawlStatCounts = {}
+    count_crawl_result(counts, 7, True, 100, now - timedelta(hours=30))
+    count_crawl_result(counts, 7, False, 50, now)
+    count_crawl_result(counts, None, True, 10, now)  # 사업체를 모르는 로그는 전체에만
+    await record_crawl_stats(db, counts)
+    await db.commit()
+
+    stats = await get_crawl_stats(db, 7)
+    assert (stats["success"], stats["failed"]) == (0, 1)
+    assert stats["success_rate"] == 0.0 and stats["avg_success_duration_ms"] is None
+    assert (await get_crawl_stats(db, GLOBAL_SCOPE))["total"] == 2
+    assert await get_last_crawled_at(db) == now
+    assert (await get_crawl_stats(db, 999))["success_rate"] is None
+
+    assert await prune_crawl_stats(db, now - timedelta(hours=24)) == 2
+    await db.commit()
+    remaining = (await db.execute(select(CrawlStatHourly.user_id))).scalars().all()
+    assert sorted(remaining) == [GLOBAL_SCOPE, 7]
+
+
+@pytest.mark.asyncio
+async def test_ensure_backfills_from_crawl_logs(db):
+    product, kw = await _seed(db)
+    now = utcnow()
+    db.add_all([
+        CrawlLog(keyword_id=kw.id, user_id=product.user_id, status="success", duration_ms=100, created_at=now),
+        CrawlLog(keyword_id=kw.id, user_id=product.user_id, status="failed", duration_ms=300, created_at=now),
+        CrawlLog(keyword_id=None, user_id=None, status="success", duration_ms=200, created_at=now),
+    ])
+    await db.commit()
+
+    await ensure_crawl_stats(db)
+    await db.commit()
+
+    assert (await get_crawl_stats(db, product.user_id))["total"] == 2
+    assert (await get_crawl_stats(db))["total"] == 3
+    # 이미 카운터가 있으면 다시 백필하지 않음
+    await ensure_crawl_stats(db)
+    assert (await get_crawl_stats(db))["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_crawl_buffers_stats_outside_its_transaction(db, session_factory, monkeypatch):
+    product, kw = await _seed(db)
+    user_id = product.user_id
+    manager = CrawlManager()
+
+    async def fake_fetch(keyword_str, sort_type="sim", **kwargs):
+        return KeywordCrawlResult(keyword=keyword_str, success=True)
+
+    monkeypatch.setattr(manager, "_fetch_keyword", fake_fetch)
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MIN", 0)
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MAX", 0)
+    await manager.crawl_user_all(db, user_id)
+    await manager.crawl_user_all(db, user_id)
+    # 크롤링 트랜잭션은 카운터 행을 건드리지 않음
+    assert (await db.execute(select(CrawlStatHourly))).scalars().all() == []
+    await db.commit()
+
+    # 반영 실패 시 버퍼 유지 → 다음 flush에 다시 반영
+    async def broken_record(session, counts):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(crawl_stats_service, "record_crawl_stats", broken_record)
+    with pytest.raises(RuntimeError):
+        await flush_crawl_stats(session_factory)
+    monkeypatch.setattr(crawl_stats_service, "record_crawl_stats", record_crawl_stats)
+
+    assert await flush_crawl_stats(session_factory) == 2
+    assert await flush_crawl_stats(session_factory) == 0
+    assert (await get_crawl_stats(db, user_id))["success"] == 2
+    assert (await get_crawl_stats(db))["total"] == 2
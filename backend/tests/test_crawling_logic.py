@@ -172,6 +172,76 @@ def test_relevance_price_filter_includes_shipping():
     assert is_rel is True
 
 
+def test_relevance_normalizes_width_and_hyphens():
+    """전각/반각, 하이픈/공백 차이를 무시하고 모델코드 일치."""
+    product = _make_product(model_code="ABC-123", spec_keywords=["500ml"])
+    for title in ["신형 ＡＢＣ－１２３ ５００ｍｌ", "abc 123 500 ml", "ABC123_500ML"]:
+        is_rel, reason = _check_relevance(_make_item(product_name=title), product)
+        assert is_rel is True, title
+
+
+def test_relevance_model_code_keeps_word_boundaries():
+    """정규화해도 단어를 넘어 이어 붙여 일치시키지 않음 ("MAX 1" ≠ "X1", "AS 100" ≠ "S10")."""
+    from app.services.relevance import RelevanceMatcher
+
+    cases = [("X1", "MAX 1 세트 1500ml"), ("S10", "삼성 AS 100 청소기")]
+    for model_code, title in cases:
+        product = _make_product(model_code=model_code)
+        for normalize in (True, False):
+            matcher = RelevanceMatcher.for_product(product, normalize=normalize)
+            assert matcher.check(title, 45000) == (False, "model_code"), (model_code, normalize)
+
+    matcher = RelevanceMatcher.for_product(_make_product(model_code="X1"), normalize=True)
+    assert matcher.check("신형 X-1 무선", 45000) == (True, None)
+    assert matcher.check("모델X1(화이트)", 45000) == (True, None)
+
+
+def test_relevance_model_code_keeps_substring_match_for_variants():
+    """정규화해도 기존 부분 문자열 일치 유지 — 접미 변형 모델명은 관련 상품."""
+    from app.services.relevance import RelevanceMatcher
+
+    cases = [
+        ("SM-A515", "삼성 갤럭시 SM-A515F 정품"),
+        ("RF85B9121", "비스포크 냉장고 RF85B9121AP"),
+        ("v15", "다이슨 V15s 디텍트"),
+        ("AB-12", "호환 필터 AB-123"),
+        ("SM-A515", "갤럭시 SMA515N"),
+    ]
+    for model_code, title in cases:
+        product = _make_product(model_code=model_code)
+        for normalize in (True, False):
+            if not normalize and "-" in model_code and model_code not in title:
+                continue  # 정규화 없이는 하이픈 차이를 무시하지 않음
+            matcher = RelevanceMatcher.for_product(product, normalize=normalize)
+            assert matcher.check(title, 45000) == (True, None), (model_code, title, normalize)
+
+
+def test_relevance_normalization_can_be_disabled():
+    """정규화 비활성화 시 기존 소문자 부분 일치만 사용."""
+    from app.services.relevance import RelevanceMatcher
+
+    product = _make_product(model_code="ABC-123")
+    matcher = RelevanceMatcher.for_product(product, normalize=False)
+    assert matcher.check("ABC 123", 45000) == (False, "model_code")
+    assert matcher.check("abc-123 블랙", 45000) == (True, None)
+
+
+def test_relevance_overlapping_and_nested_specs():
+    """겹치는 규격("ab"/"bc")과 포함 관계 규격("500"/"500ml") 모두 판정."""
+    product = _make_product(model_code="X1", spec_keywords=["500", "500ml", "ab", "bc"])
+    is_rel, _ = _check_relevance(_make_item(product_name="X1 abc 500ml"), product)
+    assert is_rel is True
+    is_rel, reason = _check_relevance(_make_item(product_name="X1 ab 500ml"), product)
+    assert (is_rel, reason) == (False, "spec_keywords")
+
+
+def test_relevance_no_syllable_partial_match():
+    """정규화는 음절을 분해하지 않음 — "가"는 "강"과 일치하지 않음."""
+    product = _make_product(model_code="A1", spec_keywords=["가"])
+    is_rel, reason = _check_relevance(_make_item(product_name="A1 강철"), product)
+    assert (is_rel, reason) == (False, "spec_keywords")
+
+
 # ===== _find_lowest 테스트 (배송비 포함) =====
 
 def test_find_lowest_empty():
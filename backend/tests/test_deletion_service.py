@@ -0,0 +1,157 @@
+"""상품/사업체 삭제 테스트 — 집합 단위 DELETE + DB cascade, 대용량 이력 백그라운드 청크 삭제."""
+
+import pytest
+from datetime import timedelta
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.services import deletion_service
+from app.core.config import settings
+from app.core.utils import utcnow
+from app.models.cost import CostItem
+from app.models.deletion_job import DeletionJob
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services.deletion_service import (
+    get_deletion_job,
+    request_product_deletion,
+    resume_deletion_jobs,
+    run_deletion_job,
+)
+
+
+@pytest.fixture(autouse=True)
+async def _sqlite_foreign_keys(engine):
+    # 운영(PostgreSQL)과 동일하게 ON DELETE CASCADE가 동작하도록
+    async with engine.begin() as conn:
+        await conn.execute(text("PRAGMA foreign_keys=ON"))
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _seed(db, rankings_per_product: int = 3, products: int = 2):
+    user = User(name="삭제테스트")
+    db.add(user)
+    await db.flush()
+    ids = []
+    for i in range(products):
+        product = Product(user_id=user.id, name=f"삭제 상품 {i}", cost_price=0, selling_price=1000)
+        db.add(product)
+        await db.flush()
+        kw = SearchKeyword(product_id=product.id, keyword=f"키워드 {i}", is_primary=True)
+        db.add(kw)
+        db.add(CostItem(product_id=product.id, name="포장", type="fixed", value=100))
+        await db.flush()
+        db.add_all([
+            KeywordRanking(keyword_id=kw.id, rank=r + 1, product_name="p", price=1000)
+            for r in range(rankings_per_product)
+        ])
+        ids.append(product.id)
+    await db.commit()
+    return user, ids
+
+
+async def _count(db, model) -> int:
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_small_history_deletes_inline_with_cascade(db):
+    user, ids = await _seed(db)
+
+    job = await request_product_deletion(db, user.id, [ids[0], 99999])
+    await db.commit()
+
+    assert job.status == "completed" and job.product_ids == [ids[0]]
+    assert await db.get(Product, ids[0]) is None
+    assert await _count(db, SearchKeyword) == 1
+    assert await _count(db, KeywordRanking) == 3
+    assert await _count(db, CostItem) == 1
+
+
+@pytest.mark.asyncio
+async def test_large_history_hides_then_deletes_in_chunks(db, session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_DELETE_INLINE_MAX_ROWS", 4)
+    monkeypatch.setattr(settings, "CLEANUP_BATCH_SIZE", 2)
+    user, ids = await _seed(db, rankings_per_product=5, products=1)
+
+    job = await request_product_deletion(db, user.id, ids)
+    await db.commit()
+    job_id = job.id
+    assert job.status == "pending"
+    db.expire_all()
+    assert (await db.get(Product, ids[0])).is_active is False
+
+    await run_deletion_job(job_id, session_factory=session_factory)
+
+    db.expire_all()
+    job = await get_deletion_job(db, job_id)
+    assert job.status == "completed" and job.finished_at is not None
+    assert job.rankings_deleted == 5
+    assert await _count(db, Product) == 0
+    assert await _count(db, SearchKeyword) == 0
+
+
+@pytest.mark.asyncio
+async def test_api_returns_job_handle(client, db, session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_DELETE_INLINE_MAX_ROWS", 1)
+
+    async def run_on_test_db(job_id):
+        await run_deletion_job(job_id, session_factory=session_factory)
+
+    monkeypatch.setattr(deletion_service, "run_deletion_job", run_on_test_db)
+    user, ids = await _seed(db)
+
+    resp = await client.post(f"/api/v1/users/{user.id}/products/bulk-delete", json={"product_ids": ids})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["deleted"] == 2 and body["status"] == "pending"
+
+    # 백그라운드 작업은 응답 전송 후 실행됨
+    status = (await client.get(f"/api/v1/deletion-jobs/{body['job_id']}")).json()
+    assert status["status"] == "completed"
+    assert status["rankings_deleted"] == 6
+
+    resp = await client.delete(f"/api/v1/users/{user.id}")
+    assert resp.status_code == 204
+    assert (await client.get(f"/api/v1/users/{user.id}")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_interrupted_job_resumes_from_persisted_row(db, session_factory, monkeypatch):
+    """재시작으로 중단된 작업(숨김만 된 상품)은 작업 행으로 찾아 이어서 삭제."""
+    monkeypatch.setattr(settings, "BULK_DELETE_INLINE_MAX_ROWS", 4)
+    monkeypatch.setattr(settings, "CLEANUP_BATCH_SIZE", 2)
+    user, ids = await _seed(db, rankings_per_product=5, products=1)
+    job_id = (await request_product_deletion(db, user.id, ids)).id
+    await db.commit()
+
+    # 실행하던 프로세스가 청크 일부만 지우고 죽은 상태
+    await db.execute(
+        update(DeletionJob).where(DeletionJob.id == job_id)
+        .values(status="running", heartbeat_at=utcnow())
+    )
+    await db.commit()
+    # heartbeat가 최근이면 다른 프로세스가 실행 중인 것으로 보고 건너뜀
+    assert await resume_deletion_jobs(session_factory) == 0
+    await run_deletion_job(job_id, session_factory=session_factory)
+    db.expire_all()
+    assert (await get_deletion_job(db, job_id)).status == "running"
+
+    await db.execute(
+        update(DeletionJob).where(DeletionJob.id == job_id)
+        .values(heartbeat_at=utcnow() - timedelta(seconds=settings.BACKGROUND_JOB_STALE_SEC + 1))
+    )
+    await db.commit()
+    assert await resume_deletion_jobs(session_factory) == 1
+
+    db.expire_all()
+    assert (await get_deletion_job(db, job_id)).status == "completed"
+    assert await _count(db, Product) == 0
+    assert await _count(db, KeywordRanking) == 0
@@ -0,0 +1,121 @@
+"""내보내기 테스트 — 상품 목록/순위 이력 CSV·NDJSON 청크 스트리밍."""
+
+import csv
+import io
+import json
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api import dashboard as dashboard_api
+from app.core.config import settings
+from app.core.utils import utcnow
+from app.models.cost import CostItem
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services import export_service
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+def use_test_db(monkeypatch, session_factory):
+    def product_export(user_id, fmt):
+        return export_service.stream_product_export(user_id, fmt, session_factory=session_factory)
+
+    def ranking_export(user_id, fmt, period, product_id):
+        return export_service.stream_ranking_export(
+            user_id, fmt, period, product_id, session_factory=session_factory,
+        )
+
+    monkeypatch.setattr(dashboard_api, "stream_product_export", product_export)
+    monkeypatch.setattr(dashboard_api, "stream_ranking_export", ranking_export)
+
+
+async def _seed(db, products: int = 5) -> int:
+    user = User(name="내보내기")
+    db.add(user)
+    await db.flush()
+    now = utcnow()
+    for i in range(products):
+        product = Product(
+            user_id=user.id, name=f"상품 {i}", cost_price=5000, selling_price=10000 + i * 1000,
+            naver_product_id=f"my-{i}", is_price_locked=(i == 0),
+        )
+        db.add(product)
+        await db.flush()
+        db.add(CostItem(product_id=product.id, name="수수료", type="percent", value=10))
+        kw = SearchKeyword(product_id=product.id, keyword=f"키워드 {i}", is_primary=True)
+        db.add(kw)
+        await db.flush()
+        db.add_all([
+            KeywordRanking(keyword_id=kw.id, rank=1, product_name="경쟁", price=11000, mall_name="경쟁몰",
+                           crawled_at=now),
+            KeywordRanking(keyword_id=kw.id, rank=2, product_name="내 상품", price=10000,
+                           mall_name="내몰", naver_product_id=f"my-{i}", is_my_store=True, crawled_at=now),
+            # 보관 기간 밖 이력
+            KeywordRanking(keyword_id=kw.id, rank=1, product_name="옛날", price=9000, mall_name="경쟁몰",
+                           crawled_at=now - timedelta(days=3)),
+        ])
+    await db.commit()
+    return user.id
+
+
+@pytest.mark.asyncio
+async def test_product_export_csv_matches_list_columns(client, db, use_test_db, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 2)
+    user_id = await _seed(db)
+
+    resp = await client.get(f"/api/v1/users/{user_id}/dashboard/export")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(resp.text)))
+    assert rows[0][0] == "상품명" and len(rows) == 6
+    first = dict(zip(rows[0], rows[1]))
+    assert first["상품명"] == "상품 0"
+    assert first["최저가"] == "10000"  # 내 상품(10000)도 관련 결과 — 목록 화면과 동일
+    assert first["순위"] == "2"
+    assert first["마진(원)"] == "4000"
+    assert first["가격고정"] == "Y"
+    assert [r[0] for r in rows[1:]] == [f"상품 {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_ranking_export_streams_in_chunks(db, session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 3)
+    user_id = await _seed(db)
+
+    chunks = [
+        chunk async for chunk in export_service.stream_ranking_export(
+            user_id, "ndjson", "1d", session_factory=session_factory,
+        )
+    ]
+    assert len(chunks) == 4  # 10행을 3행씩
+    lines = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert len(lines) == 10
+    assert {line["product_name"] for line in lines} == {"경쟁", "내 상품"}
+    assert set(lines[0]) == {key for key, _ in export_service.RANKING_COLUMNS}
+
+
+@pytest.mark.asyncio
+async def test_ranking_export_endpoint_filters(client, db, use_test_db):
+    user_id = await _seed(db, products=2)
+
+    resp = await client.get(f"/api/v1/users/{user_id}/rankings/export", params={"period": "7d"})
+    rows = list(csv.reader(io.StringIO(resp.text)))
+    assert len(rows) == 1 + 6
+    assert rows[1][rows[0].index("관련")] == "Y"
+
+    product_id = int(rows[1][rows[0].index("상품ID")])
+    resp = await client.get(f"/api/v1/users/{user_id}/rankings/export", params={
+        "period": "30d", "product_id": product_id, "format": "ndjson",
+    })
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(lines) == 3 and {line["product_id"] for line in lines} == {product_id}
@@ -0,0 +1,105 @@
+"""키셋 페이지네이션 테스트 — 크롤링 로그/알림 (created_at, id) 커서, 로그 user_id 비정규화."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.utils import utcnow
+from app.crawlers.base import KeywordCrawlResult
+from app.crawlers.manager import CrawlManager
+from app.models.alert import Alert
+from app.models.crawl_log import CrawlLog
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+
+
+async def _users(db) -> tuple[int, int]:
+    mine, other = User(name="로그 주인"), User(name="다른 사업체")
+    db.add_all([mine, other])
+    await db.flush()
+    return mine.id, other.id
+
+
+async def _collect(client, url: str, size: int) -> list[dict]:
+    items, cursor = [], None
+    while True:
+        params = {"size": size} | ({"cursor": cursor} if cursor else {})
+        resp = await client.get(url, params=params)
+        assert resp.status_code == 200
+        items.extend(resp.json())
+        cursor = resp.headers.get("x-next-cursor")
+        if not cursor:
+            return items
+
+
+def test_cursor_roundtrip_and_rejects_garbage():
+    now = utcnow()
+    assert decode_cursor(encode_cursor(now, 42)) == (now, 42)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_crawl_logs_cursor_pages_without_gaps(client, db):
+    mine, other = await _users(db)
+    base = utcnow()
+    # 같은 시각 로그가 여러 건이어도 id로 순서가 정해져야 함
+    db.add_all([
+        CrawlLog(user_id=mine, status="success", created_at=base - timedelta(minutes=i // 3))
+        for i in range(23)
+    ])
+    db.add_all([CrawlLog(user_id=other, status="failed", created_at=base) for _ in range(5)])
+    await db.commit()
+
+    logs = await _collect(client, f"/api/v1/crawl/logs/{mine}", size=5)
+
+    assert len(logs) == 23 and len({log["id"] for log in logs}) == 23
+    keys = [(log["created_at"], log["id"]) for log in logs]
+    assert keys == sorted(keys, reverse=True)
+    assert all(log["status"] == "success" for log in logs)
+
+    resp = await client.get(f"/api/v1/crawl/logs/{mine}", params={"cursor": "!!"})
+    assert resp.status_code == 400
+    # 기존 page 파라미터도 계속 동작
+    page2 = (await client.get(f"/api/v1/crawl/logs/{mine}", params={"page": 2, "size": 5})).json()
+    assert [log["id"] for log in page2] == [log["id"] for log in logs[5:10]]
+
+
+@pytest.mark.asyncio
+async def test_alerts_cursor_pages(client, db):
+    mine, other = await _users(db)
+    base = utcnow()
+    db.add_all([
+        Alert(user_id=mine, type="price_undercut", title=f"알림 {i}", created_at=base - timedelta(seconds=i // 2))
+        for i in range(11)
+    ])
+    db.add(Alert(user_id=other, type="price_undercut", title="남의 알림", created_at=base))
+    await db.commit()
+
+    alerts = await _collect(client, f"/api/v1/users/{mine}/alerts", size=4)
+
+    # 같은 시각이면 id 큰(나중에 생성된) 알림이 먼저
+    assert [a["title"] for a in alerts] == [f"알림 {i}" for i in (1, 0, 3, 2, 5, 4, 7, 6, 9, 8, 10)]
+
+
+@pytest.mark.asyncio
+async def test_crawl_log_records_owner(db):
+    mine, _ = await _users(db)
+    product = Product(user_id=mine, name="로그 상품", cost_price=0, selling_price=1000)
+    db.add(product)
+    await db.flush()
+    kw = SearchKeyword(product_id=product.id, keyword="로그")
+    db.add(kw)
+    await db.flush()
+
+    await CrawlManager()._save_keyword_result(
+        db, kw, KeywordCrawlResult(keyword="로그", success=False, error="timeout"), None, 10,
+        product=product,
+    )
+    await db.commit()
+
+    log = (await db.execute(select(CrawlLog))).scalar_one()
+    assert log.user_id == mine and log.keyword_id == kw.id
@@ -0,0 +1,145 @@
+"""키워드 일괄 추천 테스트 — NDJSON 스트리밍, DB 사전 적용, 프로세스 풀 청크 처리."""
+
+import json
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.core.config import settings
+from app.models.keyword_dictionary import KeywordDictionaryTerm
+from app.services.keyword_engine import batch, dictionary
+from app.services.keyword_engine.batch import SuggestInput, suggest_batch, suggest_keyword_lists
+from app.services.keyword_engine.dictionary import load_snapshot
+from app.services.keyword_engine.suggest import suggest
+
+
+@pytest.fixture(autouse=True)
+def _reset(monkeypatch):
+    monkeypatch.setattr(dictionary, "_snapshot", None)
+    monkeypatch.setattr(settings, "KEYWORD_SUGGEST_WORKERS", 0)
+    monkeypatch.setattr(settings, "KEYWORD_SUGGEST_CHUNK_SIZE", 2)
+    yield
+    batch.shutdown_pool()
+
+
+async def _seed_dictionary(db):
+    db.add_all([
+        KeywordDictionaryTerm(kind="brand", term="젠트릭스", frequency=3),
+        KeywordDictionaryTerm(kind="type", term="무선청소기", frequency=5),
+    ])
+    await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_batch_endpoint_streams_in_order_with_db_dictionary(client, db):
+    await _seed_dictionary(db)
+    names = [f"젠트릭스 무선청소기 ZX-{i}00" for i in range(5)]
+
+    resp = await client.post("/api/v1/keywords/suggest/batch", json={
+        "items": [{"product_name": n} for n in names],
+    })
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["index"] for line in lines] == list(range(5))
+    first = {t["text"]: t["category"] for t in lines[0]["tokens"]}
+    assert first["젠트릭스"] == "BRAND"
+    assert first["무선청소기"] == "TYPE"
+    assert lines[0]["field_guide"] == {"brand": "젠트릭스", "category": "무선청소기"}
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_single_suggestion(db):
+    await _seed_dictionary(db)
+    snapshot = await load_snapshot(db)
+    items = [
+        SuggestInput("아시마스터 젠트릭스 무선청소기 블랙", "아시마스터"),
+        SuggestInput("삼성 갤럭시 버즈 256GB", None, "이어폰"),
+        SuggestInput("로즈 골드 텀블러 500ml"),
+    ]
+
+    chunks = [chunk async for chunk in suggest_batch(items, snapshot)]
+    assert [len(c) for c in chunks] == [2, 1]
+
+    results = [s for chunk in chunks for s in chunk]
+    for item, result in zip(items, results):
+        expected = suggest(*item, matcher=snapshot.matcher)
+        assert result.keyword_list() == expected.keyword_list()
+        assert result.field_guide == expected.field_guide
+    assert "아시마스터" not in results[0].name
+
+
+@pytest.mark.asyncio
+async def test_process_pool_compiles_dictionary_in_workers(db, monkeypatch):
+    monkeypatch.setattr(settings, "KEYWORD_SUGGEST_WORKERS", 1)
+    await _seed_dictionary(db)
+    snapshot = await load_snapshot(db)
+    items = [SuggestInput(f"젠트릭스 무선청소기 {i}호") for i in range(3)]
+
+    lists = await suggest_keyword_lists(items, snapshot)
+    threaded = [suggest(*item, matcher=snapshot.matcher).keyword_list() for item in items]
+    assert lists == threaded
+
+    # 같은 스냅샷 버전이면 풀 재사용
+    pool = batch._pool
+    await suggest_keyword_lists(items[:1], snapshot)
+    assert batch._pool is pool
+
+
+class _FakePool(Executor):
+    """submit된 청크를 실행하지 않고 Future만 돌려주는 풀 (broken이면 즉시 BrokenProcessPool)."""
+
+    def __init__(self, broken_first_only: bool = False):
+        self.futures: list[Future] = []
+        self.broken_first_only = broken_first_only
+        self.shutdown_calls = 0
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        if not self.broken_first_only or not self.futures:
+            future.set_exception(BrokenProcessPool())
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shutdown_calls += 1
+        if cancel_futures:
+            for future in self.futures:
+                future.cancel()
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_does_not_discard_replacement_pool(db, monkeypatch):
+    monkeypatch.setattr(settings, "KEYWORD_SUGGEST_WORKERS", 1)
+    snapshot = await load_snapshot(db)
+    broken = _FakePool()
+    monkeypatch.setattr(batch, "_pool", broken)
+    monkeypatch.setattr(batch, "_pool_version", snapshot.version)
+    items = [SuggestInput(f"무선청소기 {i}호") for i in range(4)]
+
+    stream = suggest_batch(items, snapshot)
+    first = await stream.__anext__()
+    assert broken.shutdown_calls == 1 and batch._pool is None
+
+    # 다른 요청이 그 사이 새 풀을 만든 경우 — 늦게 실패한 청크가 새 풀을 버리면 안 됨
+    replacement = _FakePool()
+    batch._pool = replacement
+    rest = [chunk async for chunk in stream]
+    assert replacement.shutdown_calls == 0 and batch._pool is replacement
+    assert len(first) + sum(len(c) for c in rest) == 4
+
+
+@pytest.mark.asyncio
+async def test_chunks_cancelled_by_pool_discard_fall_back_to_threads(db, monkeypatch):
+    monkeypatch.setattr(settings, "KEYWORD_SUGGEST_WORKERS", 1)
+    snapshot = await load_snapshot(db)
+    broken = _FakePool(broken_first_only=True)
+    monkeypatch.setattr(batch, "_pool", broken)
+    monkeypatch.setattr(batch, "_pool_version", snapshot.version)
+    items = [SuggestInput(f"무선청소기 {i}호") for i in range(6)]
+
+    results = await suggest_keyword_lists(items, snapshot)
+    assert all(f.cancelled() for f in broken.futures[1:])
+    assert results == [suggest(*item, matcher=snapshot.matcher).keyword_list() for item in items]
@@ -0,0 +1,117 @@
+"""키워드 사전 테스트 — 적재 시 증분 갱신, 백필, 스냅샷 버전 갱신."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.utils import utcnow
+from app.crawlers.base import RankingItem
+from app.models.keyword_dictionary import KeywordDictionaryTerm
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services.keyword_engine import dictionary
+from app.services.keyword_engine.dictionary import (
+    count_dictionary_terms,
+    ensure_dictionary,
+    prune_dictionary,
+    record_dictionary_terms,
+    refresh_snapshot,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_snapshot(monkeypatch):
+    monkeypatch.setattr(dictionary, "_snapshot", None)
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def _item(brand=None, maker=None, *cats) -> RankingItem:
+    cats = list(cats) + [""] * (4 - len(cats))
+    return RankingItem(
+        rank=1, product_name="p", price=1000, mall_name="m", brand=brand, maker=maker,
+        category1=cats[0], category2=cats[1], category3=cats[2], category4=cats[3],
+    )
+
+
+def test_count_dictionary_terms():
+    counts = count_dictionary_terms([
+        _item(" Dyson ", "다이슨", "가전", "청소기"),
+        _item("dyson", None, "가전"),
+    ])
+    assert counts == {
+        ("brand", "dyson"): 2, ("brand", "다이슨"): 1,
+        ("type", "가전"): 2, ("type", "청소기"): 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_record_increments_frequency(db):
+    await record_dictionary_terms(db, count_dictionary_terms([_item("dyson", None, "가전")]))
+    await record_dictionary_terms(db, count_dictionary_terms([_item("Dyson")]))
+
+    rows = (await db.execute(
+        select(KeywordDictionaryTerm.kind, KeywordDictionaryTerm.term, KeywordDictionaryTerm.frequency)
+        .order_by(KeywordDictionaryTerm.kind)
+    )).all()
+    assert rows == [("brand", "dyson", 2), ("type", "가전", 1)]
+
+
+@pytest.mark.asyncio
+async def test_ensure_dictionary_backfills_from_rankings(db):
+    """사전이 비어 있으면 keyword_rankings에서 백필 후 스냅샷 로드."""
+    user = User(name="사전")
+    db.add(user)
+    await db.flush()
+    product = Product(user_id=user.id, name="p", cost_price=1, selling_price=1)
+    db.add(product)
+    await db.flush()
+    kw = SearchKeyword(product_id=product.id, keyword="k")
+    db.add(kw)
+    await db.flush()
+    db.add(KeywordRanking(
+        keyword_id=kw.id, rank=1, product_name="a", price=1,
+        brand="Philips", maker="필립스", category1="생활가전",
+    ))
+    await db.flush()
+
+    await ensure_dictionary(db)
+
+    snapshot = await dictionary.get_snapshot(db)
+    assert snapshot.brands == {"philips", "필립스"}
+    assert snapshot.types == {"생활가전"}
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_when_terms_change(session_factory):
+    """빈도만 증가하면 재로드 안 함, 새 용어가 생기면 재로드."""
+    async with session_factory() as db:
+        await record_dictionary_terms(db, count_dictionary_terms([_item("sony")]))
+        await db.commit()
+
+    assert await refresh_snapshot(session_factory) is True
+    assert await refresh_snapshot(session_factory) is False
+
+    async with session_factory() as db:
+        await record_dictionary_terms(db, count_dictionary_terms([_item("sony")]))
+        await db.commit()
+    assert await refresh_snapshot(session_factory) is False
+
+    async with session_factory() as db:
+        await record_dictionary_terms(db, count_dictionary_terms([_item("bosch")]))
+        await db.commit()
+    assert await refresh_snapshot(session_factory) is True
+    assert dictionary._snapshot.brands == {"sony", "bosch"}
+
+
+@pytest.mark.asyncio
+async def test_prune_dictionary(db):
+    await record_dictionary_terms(db, count_dictionary_terms([_item("old")]))
+    assert await prune_dictionary(db, utcnow() + timedelta(seconds=1)) == 1
@@ -0,0 +1,60 @@
+"""사전 구문 매처 + 토큰 분류기 테스트 — 여러 단어 항목, 최장 일치, 우선순위."""
+
+from app.services.keyword_engine.classifier import build_matcher, classify_tokens
+from app.services.keyword_engine.matcher import MatchLabel, PhraseMatcher
+
+
+def _cats(tokens):
+    return [(t.text, t.category) for t in tokens]
+
+
+def test_matcher_longest_span_across_tokens():
+    m = PhraseMatcher()
+    m.add("삼성", MatchLabel("BRAND", "dict"))
+    m.add("삼성전자", MatchLabel("BRAND", "dict"))
+    m.add("new balance", MatchLabel("BRAND", "dict"))
+
+    spans = m.find_spans(["삼성", "전자", "New", "Balance", "운동화"])
+    assert [(s.start, s.end) for s in spans] == [(0, 2), (2, 4)]
+
+
+def test_matcher_requires_token_boundary():
+    """단어 중간에서 끝나는 부분 일치는 무시."""
+    m = PhraseMatcher()
+    m.add("lg", MatchLabel("BRAND", "dict"))
+    assert m.find_spans(["lgx"]) == []
+    assert [(s.start, s.end) for s in m.find_spans(["lg", "x"])] == [(0, 1)]
+
+
+def test_matcher_blocked_tokens():
+    m = PhraseMatcher()
+    m.add("ab", MatchLabel("BRAND", "dict"))
+    assert m.find_spans(["a", "b"], blocked={1}) == []
+
+
+def test_classify_multi_word_entries():
+    tokens = classify_tokens("New Balance 운동화 로즈 골드 270mm")
+    assert _cats(tokens) == [
+        ("New Balance", "BRAND"),
+        ("운동화", "FEATURE"),
+        ("로즈 골드", "COLOR"),
+        ("270mm", "SIZE"),
+    ]
+
+
+def test_classify_db_dictionaries_and_priority():
+    """DB 사전은 내장 사전보다 후순위, 여러 단어 DB 브랜드도 매칭."""
+    matcher = build_matcher(db_brands={"블랙", "한경희 생활과학"}, db_types={"스팀다리미"})
+    tokens = classify_tokens("한경희 생활과학 블랙 스팀다리미 정품", matcher=matcher)
+    assert _cats(tokens) == [
+        ("한경희 생활과학", "BRAND"),
+        ("블랙", "COLOR"),
+        ("스팀다리미", "TYPE"),
+        ("정품", "MODIFIER"),
+    ]
+    assert tokens[0].source == "db"
+
+
+def test_classify_sets_argument_still_supported():
+    tokens = classify_tokens("쿠첸 밥솥", db_brands={"쿠첸"}, db_types={"밥솥"})
+    assert _cats(tokens) == [("쿠첸", "BRAND"), ("밥솥", "TYPE")]
@@ -0,0 +1,93 @@
+"""마진 스윕 테스트 — 벡터화 곡선이 단건 계산과 일치, 손익분기/목표 마진 가격."""
+
+import numpy as np
+import pytest
+
+from app.models.cost import CostItem
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services.margin_service import sweep_margin_curve
+from app.services.product_service import calculate_margin, calculate_status
+
+COST_ITEMS = [
+    {"name": "수수료", "type": "percent", "value": 5.5},
+    {"name": "카드", "type": "percent", "value": 3.3},
+    {"name": "택배비", "type": "fixed", "value": 3000},
+]
+
+
+@pytest.mark.parametrize("lowest_price", [None, 0, 20000])
+def test_curve_matches_scalar_calculation(lowest_price):
+    prices = np.arange(0, 40001, 37, dtype=np.int64)
+
+    net, pct, status = sweep_margin_curve(prices, 12000, COST_ITEMS, lowest_price)
+
+    for i, price in enumerate(prices.tolist()):
+        expected = calculate_margin(price, 12000, COST_ITEMS)
+        assert net[i] == expected["net_margin"]
+        assert pct[i] == expected["margin_percent"]
+        assert status[i] == calculate_status(price, lowest_price)
+
+
+async def _seed(db) -> int:
+    user = User(name="스윕테스트")
+    db.add(user)
+    await db.flush()
+    product = Product(user_id=user.id, name="스윕 상품", cost_price=10000, selling_price=20000)
+    db.add(product)
+    await db.flush()
+    db.add(CostItem(product_id=product.id, name="수수료", type="percent", value=10))
+    db.add(CostItem(product_id=product.id, name="택배비", type="fixed", value=2000))
+    kw = SearchKeyword(product_id=product.id, keyword="스윕", is_primary=True)
+    db.add(kw)
+    await db.flush()
+    db.add_all([
+        KeywordRanking(keyword_id=kw.id, rank=1, product_name="경쟁 A", price=18000, shipping_fee=0),
+        KeywordRanking(keyword_id=kw.id, rank=2, product_name="경쟁 B", price=17000, shipping_fee=2500),
+        KeywordRanking(keyword_id=kw.id, rank=3, product_name="무관", price=9000, is_relevant=False),
+    ])
+    await db.commit()
+    return product.id
+
+
+@pytest.mark.asyncio
+async def test_sweep_endpoint_marks_break_even_and_target(client, db):
+    product_id = await _seed(db)
+
+    resp = await client.post(f"/api/v1/products/{product_id}/margin/sweep", json={
+        "min_price": 10000, "max_price": 30000, "step": 500, "target_margin_percent": 20,
+    })
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["lowest_price"] == 18000
+    assert len(data["prices"]) == len(data["net_margins"]) == len(data["statuses"]) == 41
+    # 0.9p - 12000 >= 0 → 13334원, 500원 간격의 첫 지점
+    assert data["break_even_price"] == 13500
+    # (0.9p - 12000) / p >= 20% → p >= 17143
+    assert data["target_price"] == 17500
+    i = data["prices"].index(18500)
+    assert data["statuses"][i] == "close"
+    assert data["statuses"][data["prices"].index(18000)] == "winning"
+
+
+@pytest.mark.asyncio
+async def test_sweep_defaults_and_validation(client, db):
+    product_id = await _seed(db)
+
+    data = (await client.post(f"/api/v1/products/{product_id}/margin/sweep", json={})).json()
+    assert data["prices"][0] == 12600 and data["prices"][-1] <= 23400  # 최저가 18000의 70~130%
+    assert data["target_price"] is None
+
+    resp = await client.post(f"/api/v1/products/{product_id}/margin/sweep", json={
+        "min_price": 0, "max_price": 10_000_000, "step": 1,
+    })
+    assert resp.status_code == 400
+
+    resp = await client.post(f"/api/v1/products/{product_id}/margin/sweep", json={
+        "min_price": 5000, "max_price": 1000,
+    })
+    assert resp.status_code == 400
+
+    assert (await client.post("/api/v1/products/99999/margin/sweep", json={})).status_code == 404
@@ -0,0 +1,110 @@
+"""가격 이력 테스트 — 컬럼형 응답(사전 인코딩) + 다운샘플링(min/max, LTTB)."""
+
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from app.core.utils import utcnow
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services.price_service import downsample_lttb, downsample_minmax
+
+
+def test_minmax_keeps_bucket_extremes_in_time_order():
+    t = np.arange(1000, dtype=np.int64) * 60
+    y = np.full(1000, 10000, dtype=np.int64)
+    y[123], y[877] = 500, 99999  # 스파이크는 반드시 남아야 함
+
+    keep = downsample_minmax(t, y, 50)
+
+    assert len(keep) <= 50
+    assert 123 in keep and 877 in keep
+    assert (np.diff(keep) > 0).all()
+    assert len(downsample_minmax(t[:30], y[:30], 50)) == 30
+
+
+def test_lttb_returns_requested_points_with_endpoints():
+    t = np.arange(500, dtype=np.int64)
+    y = (np.sin(t / 20) * 1000).astype(np.int64)
+    y[250] = 50000
+
+    keep = downsample_lttb(t, y, 40)
+
+    assert len(keep) == 40
+    assert keep[0] == 0 and keep[-1] == 499
+    assert 250 in keep
+    assert (np.diff(keep) > 0).all()
+
+
+async def _seed(db, crawls: int = 60, per_crawl: int = 5) -> int:
+    user = User(name="이력테스트")
+    db.add(user)
+    await db.flush()
+    product = Product(user_id=user.id, name="이력 상품", cost_price=0, selling_price=10000)
+    db.add(product)
+    await db.flush()
+    kw = SearchKeyword(product_id=product.id, keyword="이력", is_primary=True)
+    db.add(kw)
+    await db.flush()
+    start = utcnow() - timedelta(hours=crawls)
+    db.add_all([
+        KeywordRanking(
+            keyword_id=kw.id, rank=r + 1, product_name=f"상품 {r}", price=10000 + c * 10 + r,
+            mall_name="내 스토어" if r == 0 else f"몰 {r}", is_my_store=(r == 0),
+            crawled_at=start + timedelta(hours=c),
+        )
+        for c in range(crawls) for r in range(per_crawl)
+    ])
+    await db.commit()
+    return product.id
+
+
+@pytest.mark.asyncio
+async def test_columnar_history_matches_row_history(client, db):
+    product_id = await _seed(db)
+
+    rows = (await client.get(f"/api/v1/products/{product_id}/price-history")).json()
+    resp = await client.get(
+        f"/api/v1/products/{product_id}/price-history/columnar", params={"downsample": "none"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["total_rows"] == data["returned_rows"] == len(rows) == 300
+    assert len(data["malls"]) == 5 and len(data["product_names"]) == 5
+
+    others, mine = data["series"]
+    assert mine["is_my_store"] is True and others["is_my_store"] is False
+    assert mine["total"] == 60 and others["total"] == 240
+    decoded = sorted(
+        (data["malls"][m], data["product_names"][n], p, r)
+        for s in data["series"]
+        for m, n, p, r in zip(s["mall"], s["product_name"], s["price"], s["rank"])
+    )
+    assert decoded == sorted((r["mall_name"], r["product_name"], r["price"], r["rank"]) for r in rows)
+
+
+@pytest.mark.asyncio
+async def test_columnar_history_downsamples_per_series(client, db):
+    product_id = await _seed(db)
+
+    data = (await client.get(
+        f"/api/v1/products/{product_id}/price-history/columnar", params={"points": 20},
+    )).json()
+    others, mine = data["series"]
+    assert len(mine["price"]) <= 20 and len(others["price"]) <= 20
+    assert min(others["price"]) == 10001 and max(others["price"]) == 10594
+    assert others["crawled_at"] == sorted(others["crawled_at"])
+
+    data = (await client.get(
+        f"/api/v1/products/{product_id}/price-history/columnar",
+        params={"points": 20, "downsample": "lttb"},
+    )).json()
+    assert [len(s["price"]) for s in data["series"]] == [20, 20]
+
+    resp = await client.get(
+        f"/api/v1/products/{product_id}/price-history/columnar", params={"downsample": "avg"},
+    )
+    assert resp.status_code == 422
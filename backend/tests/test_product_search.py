@@ -0,0 +1,80 @@
+"""상품 검색 테스트 — 한글/전각 정규화, 부분 일치, 오타 허용, 관련도 순서."""
+
+import pytest
+
+from app.core.utils import build_product_search_text, normalize_search_text
+
+
+def test_normalize_search_text():
+    """전각→반각, 대소문자, 하이픈/띄어쓰기 무시, 한글은 자모 단위."""
+    assert normalize_search_text("ＡＢＣ－１２３") == "abc123"
+    assert normalize_search_text("무선 청소기 V-15") == normalize_search_text("무선청소기v15")
+    assert normalize_search_text("청ㅅ") in normalize_search_text("청소기")
+    assert normalize_search_text(None) == ""
+
+
+def test_build_product_search_text():
+    text = build_product_search_text("다이슨 무선 청소기", "SV-18", "Dyson")
+    assert text.split(" ")[1:] == ["sv18", "dyson"]
+    assert build_product_search_text("상품", None, None) == normalize_search_text("상품")
+
+
+def test_search_text_column_fits_full_length_korean_name():
+    """한글은 자모로 분해돼 길어지므로 길이 제한 없는 컬럼 (이름 200자 + 브랜드 100자)."""
+    from sqlalchemy import Text
+
+    from app.models.product import Product
+
+    text = build_product_search_text("각" * 200, "A" * 100, "한" * 100)
+    assert len(text) > 1000
+    assert isinstance(Product.__table__.c.search_text.type, Text)
+
+
+async def _create(client, user_id: int, name: str, **extra) -> int:
+    resp = await client.post(f"/api/v1/users/{user_id}/products", json={
+        "name": name, "cost_price": 1000, "selling_price": 2000, **extra,
+    })
+    return resp.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_search_products_list(client):
+    """띄어쓰기/모델코드 표기가 달라도 매칭, 부분 일치 결과가 유사도 결과보다 앞."""
+    user_id = (await client.post("/api/v1/users", json={"name": "검색테스트"})).json()["id"]
+    vacuum = await _create(client, user_id, "다이슨 무선청소기", model_code="SV-18", brand="Dyson")
+    other = await _create(client, user_id, "LG 코드제로 무선청소기", brand="LG")
+    await _create(client, user_id, "전기 주전자")
+
+    resp = await client.get(f"/api/v1/users/{user_id}/products", params={"search": "무선 청소기"})
+    assert {p["id"] for p in resp.json()} == {vacuum, other}
+
+    resp = await client.get(f"/api/v1/users/{user_id}/products", params={"search": "ｓｖ18"})
+    assert [p["id"] for p in resp.json()] == [vacuum]
+
+    # 브랜드 + 상품명 토큰 조합
+    resp = await client.get(f"/api/v1/users/{user_id}/products", params={"search": "dyson 청소기"})
+    assert [p["id"] for p in resp.json()] == [vacuum]
+
+    # 오타 허용 (부분 일치 없음 → 유사도)
+    resp = await client.get(f"/api/v1/users/{user_id}/products", params={"search": "코드제러 무선청소기"})
+    assert [p["id"] for p in resp.json()] == [other]
+
+    # 받침 오타, 입력 중인 미완성 음절
+    resp = await client.get(f"/api/v1/users/{user_id}/products", params={"search": "다이스"})
+    assert [p["id"] for p in resp.json()] == [vacuum]
+    resp = await client.get(f"/api/v1/users/{user_id}/products", params={"search": "주전ㅈ"})
+    assert len(resp.json()) == 1
+
+    resp = await client.get(f"/api/v1/users/{user_id}/products", params={"search": "냉장고"})
+    assert resp.json() == []
+
+
+@pytest.mark.asyncio
+async def test_search_text_updated_on_edit(client, db):
+    """상품명 수정 시 검색 텍스트도 갱신."""
+    user_id = (await client.post("/api/v1/users", json={"name": "검색수정"})).json()["id"]
+    pid = await _create(client, user_id, "기존 이름")
+    await client.put(f"/api/v1/products/{pid}", json={"name": "새로운 블렌더"})
+
+    resp = await client.get(f"/api/v1/users/{user_id}/products", params={"search": "블렌더"})
+    assert [p["id"] for p in resp.json()] == [pid]
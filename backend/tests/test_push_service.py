@@ -0,0 +1,102 @@
+"""웹 푸시 일괄 전송 테스트 — 병렬 전송, 만료 구독 수집, VAPID 서명 재사용."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from py_vapid import Vapid, b64urlencode
+from pywebpush import WebPushException
+
+from app.services import push_service
+from app.services.push_service import PushMessage, send_push_batch
+
+
+class _FakeSub:
+    def __init__(self, endpoint: str, user_id: int = 1):
+        self.endpoint = endpoint
+        self.user_id = user_id
+        self.p256dh = "p256dh"
+        self.auth = "auth"
+
+
+def _expired_error(status: int) -> WebPushException:
+    resp = MagicMock()
+    resp.status_code = status
+    return WebPushException("expired", response=resp)
+
+
+@pytest.fixture
+def vapid_configured():
+    with patch.object(push_service.settings, "VAPID_PUBLIC_KEY", "pub"), \
+         patch.object(push_service.settings, "VAPID_PRIVATE_KEY", "priv"):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_send_push_batch_fans_out(vapid_configured):
+    """구독 × 메시지 전 조합 전송."""
+    calls = []
+    with patch.object(push_service, "_send_push_sync", side_effect=lambda info, payload: calls.append(info["endpoint"])):
+        ok, expired = await send_push_batch(
+            [_FakeSub("https://a/1"), _FakeSub("https://a/2")],
+            [PushMessage("t1", "b1"), PushMessage("t2", "b2")],
+        )
+    assert ok == [True, True]
+    assert expired == set()
+    assert sorted(calls) == ["https://a/1", "https://a/1", "https://a/2", "https://a/2"]
+
+
+@pytest.mark.asyncio
+async def test_send_push_batch_collects_expired(vapid_configured):
+    """404/410은 만료로 수집(재시도 없음), 그 외 오류는 재시도 필요."""
+    def _fake_send(info, payload):
+        if info["endpoint"] == "https://a/gone":
+            raise _expired_error(410)
+        if info["endpoint"] == "https://a/down":
+            raise _expired_error(503)
+
+    with patch.object(push_service, "_send_push_sync", side_effect=_fake_send):
+        ok, expired = await send_push_batch(
+            [_FakeSub("https://a/gone"), _FakeSub("https://a/ok")], [PushMessage("t", "b")],
+        )
+        assert ok == [True]
+        assert expired == {"https://a/gone"}
+
+        ok, _ = await send_push_batch([_FakeSub("https://a/down")], [PushMessage("t", "b")])
+        assert ok == [False]
+
+
+@pytest.mark.asyncio
+async def test_send_push_batch_skips_delivered_endpoints(vapid_configured):
+    """이미 받은 기기는 건너뛰고, 성공한 endpoint는 delivered에 추가."""
+    calls = []
+    with patch.object(push_service, "_send_push_sync", side_effect=lambda info, payload: calls.append(info["endpoint"])):
+        delivered = [{"https://a/1"}]
+        ok, _ = await send_push_batch(
+            [_FakeSub("https://a/1"), _FakeSub("https://a/2")], [PushMessage("t", "b")], delivered,
+        )
+    assert ok == [True]
+    assert calls == ["https://a/2"]
+    assert delivered == [{"https://a/1", "https://a/2"}]
+
+
+@pytest.mark.asyncio
+async def test_send_push_batch_no_subscriptions(vapid_configured):
+    ok, expired = await send_push_batch([], [PushMessage("t", "b")])
+    assert ok == [True]
+    assert expired == set()
+
+
+def test_vapid_headers_cached_per_origin():
+    """같은 푸시 서비스 origin이면 서명 헤더 재사용."""
+    key = Vapid()
+    key.generate_keys()
+    raw_key = b64urlencode(key.private_key.private_numbers().private_value.to_bytes(32, "big"))
+    with patch.object(push_service.settings, "VAPID_PRIVATE_KEY", raw_key), \
+         patch.object(push_service, "_vapid", None), \
+         patch.object(push_service, "_vapid_headers", {}):
+        h1 = push_service._get_vapid_headers("https://fcm.googleapis.com/fcm/send/aaa")
+        h2 = push_service._get_vapid_headers("https://fcm.googleapis.com/fcm/send/bbb")
+        h3 = push_service._get_vapid_headers("https://updates.push.services.mozilla.com/wpush/v2/x")
+    assert h1 is h2
+    assert h1 != h3
+    assert "Authorization" in h1
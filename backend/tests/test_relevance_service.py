@@ -0,0 +1,202 @@
+"""관련성 재계산 테스트 — 필터 변경 시 보존 중인 순위 이력 소급 재판정, 작업 재개, 크롤링 중 필터 변경."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api import products as products_api
+from app.core.config import settings
+from app.core.utils import utcnow
+from app.crawlers.base import KeywordCrawlResult, RankingItem
+from app.crawlers.manager import CrawlManager
+from app.models.excluded_product import ExcludedProduct
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.relevance_job import RelevanceJob
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services.relevance_service import (
+    needs_recompute,
+    recompute_relevance,
+    request_recompute,
+    resume_relevance_jobs,
+)
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _seed(db):
+    user = User(name="재계산테스트")
+    db.add(user)
+    await db.flush()
+    product = Product(user_id=user.id, name="무선 청소기", cost_price=0, selling_price=100000)
+    db.add(product)
+    await db.flush()
+    kw = SearchKeyword(product_id=product.id, keyword="무선 청소기", is_primary=True)
+    db.add(kw)
+    await db.flush()
+    names = ["삼성 VS20 청소기", "LG A9 청소기", "삼성 VS-20 무선", "다이슨 V15", "삼성 VS20 정품"]
+    db.add_all([
+        KeywordRanking(
+            keyword_id=kw.id, rank=i + 1, product_name=name, price=100000,
+            naver_product_id=str(1000 + i), is_relevant=True,
+        )
+        for i, name in enumerate(names)
+    ])
+    # 블랙리스트 항목은 재계산 후에도 수동 제외 유지
+    db.add(ExcludedProduct(product_id=product.id, naver_product_id="1004"))
+    await db.commit()
+    return product
+
+
+async def _verdicts(db, product_id) -> dict[str, tuple[bool, str | None]]:
+    db.expire_all()
+    rows = (await db.execute(
+        select(KeywordRanking.naver_product_id, KeywordRanking.is_relevant, KeywordRanking.relevance_reason)
+        .join(SearchKeyword, SearchKeyword.id == KeywordRanking.keyword_id)
+        .where(SearchKeyword.product_id == product_id)
+    )).all()
+    return {r.naver_product_id: (r.is_relevant, r.relevance_reason) for r in rows}
+
+
+@pytest.mark.asyncio
+async def test_recompute_updates_in_chunks(db, monkeypatch):
+    monkeypatch.setattr(settings, "RELEVANCE_RECOMPUTE_BATCH_SIZE", 2)
+    product = await _seed(db)
+    product.model_code = "VS20"
+    await db.commit()
+
+    job = await recompute_relevance(db, product.id)
+
+    assert job.status == "completed"
+    assert job.total == job.processed == 5
+    assert job.updated == 3
+    verdicts = await _verdicts(db, product.id)
+    assert verdicts["1000"] == (True, None)
+    assert verdicts["1001"] == (False, "model_code")
+    assert verdicts["1002"] == (True, None)  # 하이픈 차이는 정규화로 일치
+    assert verdicts["1003"] == (False, "model_code")
+    assert verdicts["1004"] == (False, "manual_blacklist")
+
+
+@pytest.mark.asyncio
+async def test_update_product_schedules_recompute(client, db, session_factory, monkeypatch):
+    from app.services.relevance_service import run_relevance_job
+
+    async def run_on_test_db(job_id):
+        await run_relevance_job(job_id, session_factory=session_factory)
+
+    monkeypatch.setattr(products_api, "run_relevance_job", run_on_test_db)
+    product_id = (await _seed(db)).id
+
+    resp = await client.put(f"/api/v1/products/{product_id}", json={"price_filter_max_pct": 100})
+    assert resp.status_code == 200
+    # 백그라운드 작업은 응답 전송 후 실행됨
+    status = (await client.get(f"/api/v1/products/{product_id}/relevance-recompute")).json()
+    assert status["status"] == "completed"
+    assert status["processed"] == 5 and status["updated"] == 1  # 블랙리스트 반영만
+
+    resp = await client.put(f"/api/v1/products/{product_id}", json={"model_code": "A9"})
+    assert resp.status_code == 200
+    verdicts = await _verdicts(db, product_id)
+    assert [k for k, (ok, _) in sorted(verdicts.items()) if ok] == ["1001"]
+
+    # 이름만 바꾸면 재계산하지 않음
+    before = (await client.get(f"/api/v1/products/{product_id}/relevance-recompute")).json()
+    await client.put(f"/api/v1/products/{product_id}", json={"name": "무선 청소기 2"})
+    after = (await client.get(f"/api/v1/products/{product_id}/relevance-recompute")).json()
+    assert after["id"] == before["id"]
+
+    resp = await client.post(f"/api/v1/products/{product_id}/relevance-recompute")
+    assert resp.status_code == 202
+    status = (await client.get(f"/api/v1/products/{product_id}/relevance-recompute")).json()
+    assert status["status"] == "completed" and status["updated"] == 0
+
+
+@pytest.mark.asyncio
+async def test_interrupted_job_resumes_from_last_id(db, session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "RELEVANCE_RECOMPUTE_BATCH_SIZE", 2)
+    product = await _seed(db)
+    product_id = product.id
+    product.model_code = "VS20"
+    job = await request_recompute(db, product_id)
+    job_id = job.id
+    await db.commit()
+
+    # 첫 청크(2건)만 커밋한 뒤 프로세스가 죽은 상태 재현 — 이미 처리한 구간은 건드리지 않음
+    first_ids = (await db.execute(select(KeywordRanking.id).order_by(KeywordRanking.id).limit(2))).scalars().all()
+    job.status = "running"
+    job.processed = 2
+    job.last_id = first_ids[-1]
+    job.heartbeat_at = utcnow() - timedelta(seconds=settings.BACKGROUND_JOB_STALE_SEC + 60)
+    await db.commit()
+
+    assert await resume_relevance_jobs(session_factory) == 1
+    db.expire_all()
+    job = await db.get(RelevanceJob, job_id)
+    assert (job.status, job.total, job.processed) == ("completed", 5, 5)
+    verdicts = await _verdicts(db, product_id)
+    assert verdicts["1001"] == (True, None)  # 재개 전 구간은 그대로
+    assert verdicts["1003"] == (False, "model_code")
+    assert await resume_relevance_jobs(session_factory) == 0
+
+
+@pytest.mark.asyncio
+async def test_new_request_cancels_running_job(db, session_factory):
+    product = await _seed(db)
+    product_id = product.id
+    first = await request_recompute(db, product_id)
+    first_id = first.id
+    await db.commit()
+    second_id = (await request_recompute(db, product_id)).id
+    await db.commit()
+
+    db.expire_all()
+    assert (await db.get(RelevanceJob, first_id)).status == "cancelled"
+    # 취소된 작업은 선점되지 않고, 새 작업만 실행
+    assert await resume_relevance_jobs(session_factory) == 1
+    assert (await db.get(RelevanceJob, second_id)).status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_crawl_rechecks_rows_when_filter_changes_mid_crawl(db, session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MIN", 0)
+    monkeypatch.setattr(settings, "CRAWL_REQUEST_DELAY_MAX", 0)
+    product = await _seed(db)
+    product_id, user_id = product.id, product.user_id
+    manager = CrawlManager()
+
+    async def fetch_then_edit(keyword_str, sort_type="sim", **kwargs):
+        # 크롤링이 매처를 만든 뒤, 적재 전에 다른 요청이 모델코드를 바꾸고 커밋
+        async with session_factory() as other:
+            (await other.get(Product, product_id)).model_code = "A9"
+            await other.commit()
+        return KeywordCrawlResult(keyword=keyword_str, success=True, items=[
+            RankingItem(rank=1, product_name="삼성 VS20 신형", price=100000, mall_name="몰",
+                        product_url="", naver_product_id="2000"),
+            RankingItem(rank=2, product_name="LG A9 신형", price=100000, mall_name="몰",
+                        product_url="", naver_product_id="2001"),
+        ])
+
+    monkeypatch.setattr(manager, "_fetch_keyword", fetch_then_edit)
+    await manager.crawl_user_all(db, user_id)
+    await db.commit()
+
+    verdicts = await _verdicts(db, product_id)
+    assert verdicts["2000"] == (False, "model_code")
+    assert verdicts["2001"] == (True, None)
+    assert verdicts["1000"] == (True, None)  # 이전 이력은 재계산 작업 몫
+
+
+def test_needs_recompute_ignores_unrelated_fields():
+    product = Product(name="x", selling_price=1000, cost_price=0)
+    assert not needs_recompute(product, {"name": "y"})
+    assert not needs_recompute(product, {"selling_price": 2000})
+    assert needs_recompute(product, {"spec_keywords": ["500ml"]})
+    product.price_filter_min_pct = 50
+    assert needs_recompute(product, {"selling_price": 2000})
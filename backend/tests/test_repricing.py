@@ -0,0 +1,119 @@
+"""가격 조정 추천 테스트 — 최저가 맞춤 + 마진 하한, 잠금/경쟁 없음/불가 분류, 정렬·페이지."""
+
+from datetime import timedelta
+
+import pytest
+
+from app.core.utils import utcnow
+from app.models.cost import CostItem
+from app.models.excluded_product import ExcludedProduct
+from app.models.keyword_ranking import KeywordRanking
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+from app.services.product_service import calculate_margin
+
+# (이름, 판매가, 수수료 %, 잠금, 경쟁 최저가)
+CATALOG = [
+    ("최저가보다 비쌈", 20000, 10, False, 18000),
+    ("최저가보다 쌈", 15000, 10, False, 18000),
+    ("가격 잠금", 25000, 10, True, 18000),
+    ("경쟁 없음", 20000, 10, False, None),
+    ("하한에 걸림", 12000, 10, False, 11000),
+    ("수수료 과다", 20000, 98, False, 18000),
+]
+
+
+async def _seed(db) -> tuple[int, dict[str, int]]:
+    user = User(name="추천테스트")
+    db.add(user)
+    await db.flush()
+    now = utcnow()
+    ids = {}
+    for name, selling, fee, locked, lowest in CATALOG:
+        product = Product(
+            user_id=user.id, name=name, cost_price=10000, selling_price=selling,
+            is_price_locked=locked,
+        )
+        db.add(product)
+        await db.flush()
+        ids[name] = product.id
+        db.add(CostItem(product_id=product.id, name="수수료", type="percent", value=fee))
+        kw = SearchKeyword(product_id=product.id, keyword=name, is_primary=True)
+        db.add(kw)
+        await db.flush()
+        if lowest is None:
+            continue
+        db.add_all([
+            KeywordRanking(keyword_id=kw.id, rank=1, product_name="경쟁", price=lowest - 2000,
+                           shipping_fee=2000, naver_product_id="a", crawled_at=now),
+            # 블랙리스트/무관/이전 크롤링 결과는 최저가에서 제외
+            KeywordRanking(keyword_id=kw.id, rank=2, product_name="차단", price=1000,
+                           naver_product_id="blocked", crawled_at=now),
+            KeywordRanking(keyword_id=kw.id, rank=3, product_name="무관", price=1000,
+                           is_relevant=False, crawled_at=now),
+            KeywordRanking(keyword_id=kw.id, rank=1, product_name="옛날", price=1000,
+                           crawled_at=now - timedelta(hours=2)),
+        ])
+        db.add(ExcludedProduct(product_id=product.id, naver_product_id="blocked"))
+    await db.commit()
+    return user.id, ids
+
+
+@pytest.mark.asyncio
+async def test_recommendations_respect_floor_and_classify(client, db):
+    user_id, _ = await _seed(db)
+
+    resp = await client.get(f"/api/v1/users/{user_id}/repricing", params={"min_margin_percent": 5})
+    assert resp.status_code == 200
+    data = resp.json()
+    items = {i["name"]: i for i in data["items"]}
+    assert data["total"] == 6
+    assert data["summary"] == {
+        "lower": 2, "raise": 1, "keep": 0, "locked": 1, "unreachable": 1, "no_competitor": 1,
+    }
+
+    above = items["최저가보다 비쌈"]
+    assert above["lowest_price"] == 18000
+    assert (above["action"], above["recommended_price"], above["projected_status"]) == ("lower", 18000, "winning")
+    assert above["margin_delta"] == -1800  # 8000 → 6200
+
+    assert (items["최저가보다 쌈"]["action"], items["최저가보다 쌈"]["recommended_price"]) == ("raise", 18000)
+
+    floored = items["하한에 걸림"]
+    # 10000 / (1 - 10% - 5%) = 11765원 — 최저가 11000원은 마진 하한 아래
+    assert floored["floor_price"] == floored["recommended_price"] == 11765
+    assert floored["projected_status"] == "losing"
+    assert floored["projected_margin_percent"] >= 5
+    expected = calculate_margin(11765, 10000, [{"name": "수수료", "type": "percent", "value": 10}])
+    assert floored["projected_margin"] == expected["net_margin"]
+
+    assert items["가격 잠금"]["recommended_price"] == 25000
+    assert items["수수료 과다"]["floor_price"] is None
+    assert items["경쟁 없음"]["lowest_price"] is None
+
+    # urgency: 최저가 대비 비싼 순, 경쟁 없음은 마지막
+    assert [i["name"] for i in data["items"]][0] == "가격 잠금"
+    assert data["items"][-1]["name"] == "경쟁 없음"
+
+
+@pytest.mark.asyncio
+async def test_filter_sort_and_paginate(client, db):
+    user_id, _ = await _seed(db)
+
+    data = (await client.get(f"/api/v1/users/{user_id}/repricing", params={
+        "action": "lower", "sort": "margin_delta", "limit": 1,
+    })).json()
+    assert data["total"] == 2 and len(data["items"]) == 1
+    assert data["items"][0]["name"] == "하한에 걸림"  # 12000 → 11765 (-211)
+
+    page2 = (await client.get(f"/api/v1/users/{user_id}/repricing", params={
+        "action": "lower", "sort": "margin_delta", "limit": 1, "page": 2,
+    })).json()
+    assert page2["items"][0]["name"] == "최저가보다 비쌈"
+
+    data = (await client.get(f"/api/v1/users/{user_id}/repricing", params={"undercut": 100})).json()
+    assert {i["name"]: i["recommended_price"] for i in data["items"]}["최저가보다 쌈"] == 17900
+
+    assert (await client.get("/api/v1/users/99999/repricing")).status_code == 404
+    assert (await client.get(f"/api/v1/users/{user_id}/repricing", params={"sort": "x"})).status_code == 422
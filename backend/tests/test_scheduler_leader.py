@@ -0,0 +1,60 @@
+"""스케줄러 리더 선출 테스트 — 임대 1개를 한 프로세스만 보유, 만료/반납 시 인수."""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.utils import utcnow
+from app.models.scheduler_lease import SchedulerLease
+from app.scheduler import leader
+from app.scheduler.leader import LeaderElector, leader_only
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.mark.asyncio
+async def test_single_leader_and_failover(db, session_factory):
+    a = LeaderElector(session_factory=session_factory, instance_id="a")
+    b = LeaderElector(session_factory=session_factory, instance_id="b")
+
+    assert await a.heartbeat() is True
+    assert await b.heartbeat() is False
+    assert await a.heartbeat() is True  # 연장
+    assert a.is_leader and not b.is_leader
+
+    # a가 heartbeat를 멈춰 임대가 만료되면 b가 인수
+    await db.execute(
+        update(SchedulerLease).values(expires_at=utcnow() - timedelta(seconds=1))
+    )
+    await db.commit()
+    assert await b.heartbeat() is True
+    assert await a.heartbeat() is False
+    assert b.is_leader and not a.is_leader
+
+    # 반납하면 만료를 기다리지 않고 바로 인수
+    await b.release()
+    assert not b.is_leader
+    assert await a.heartbeat() is True
+
+
+@pytest.mark.asyncio
+async def test_leader_only_skips_on_followers(session_factory, monkeypatch):
+    calls = []
+
+    async def job():
+        calls.append(1)
+
+    follower = LeaderElector(session_factory=session_factory, instance_id="follower")
+    monkeypatch.setattr(leader, "elector", follower)
+    wrapped = leader_only(job)
+
+    await wrapped()
+    assert calls == []
+    await follower.heartbeat()
+    await wrapped()
+    assert calls == [1]
@@ -0,0 +1,80 @@
+"""스토어 상품 일괄 등록 테스트 — 배치 INSERT, 집합 단위 중복 판정, 초기 크롤링 예약."""
+
+import pytest
+from sqlalchemy import select
+
+from app.api import store_import as store_import_api
+from app.models.product import Product
+from app.models.search_keyword import SearchKeyword
+from app.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_creates_products_and_keywords(client, db, monkeypatch):
+    enqueued = []
+
+    async def fake_crawl(product_ids):
+        enqueued.append(product_ids)
+
+    monkeypatch.setattr(store_import_api, "crawl_imported_products", fake_crawl)
+
+    user = User(name="일괄등록")
+    db.add(user)
+    await db.flush()
+    db.add(Product(user_id=user.id, name="Existing Item", cost_price=0, selling_price=1000))
+    await db.commit()
+
+    resp = await client.post(f"/api/v1/users/{user.id}/store/import", json={
+        "crawl": True,
+        "products": [
+            {"name": "existing item", "selling_price": 1000},
+            {"name": "다이슨 V15 청소기", "selling_price": 890000, "model_code": "SV47",
+             "brand": "Dyson", "keywords": ["다이슨 V15", "무선청소기"]},
+            {"name": "다이슨 V15 청소기", "selling_price": 1},
+            {"name": "필립스 면도기", "selling_price": 120000},
+        ],
+    })
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["created"] == 2
+    assert body["skipped_names"] == ["existing item", "다이슨 V15 청소기"]
+    assert [c["name"] for c in body["created_products"]] == ["다이슨 V15 청소기", "필립스 면도기"]
+    assert body["crawl_enqueued"] is True
+    assert enqueued == [[c["product_id"] for c in body["created_products"]]]
+
+    dyson_id = body["created_products"][0]["product_id"]
+    dyson = await db.get(Product, dyson_id)
+    assert dyson.selling_price == 890000
+    # Core INSERT 경로에서도 검색 텍스트가 채워짐
+    assert dyson.search_text and "sv47" in dyson.search_text
+
+    keywords = (await db.execute(
+        select(SearchKeyword.product_id, SearchKeyword.keyword, SearchKeyword.is_primary)
+        .order_by(SearchKeyword.id)
+    )).all()
+    assert keywords == [
+        (dyson_id, "다이슨 V15", True),
+        (dyson_id, "무선청소기", False),
+        (body["created_products"][1]["product_id"], "필립스 면도기", True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_all_duplicates_skips_crawl(client, db, monkeypatch):
+    async def fake_crawl(product_ids):
+        raise AssertionError("호출되면 안 됨")
+
+    monkeypatch.setattr(store_import_api, "crawl_imported_products", fake_crawl)
+    user = User(name="중복만")
+    db.add(user)
+    await db.flush()
+    db.add(Product(user_id=user.id, name="상품A", cost_price=0, selling_price=1000))
+    await db.commit()
+
+    resp = await client.post(f"/api/v1/users/{user.id}/store/import", json={
+        "crawl": True, "products": [{"name": "상품A", "selling_price": 1000}],
+    })
+    assert resp.json() == {
+        "created": 0, "skipped": 1, "skipped_names": ["상품A"],
+        "created_products": [], "crawl_enqueued": False,
+    }
@@ -0,0 +1,127 @@
+"""스토어 상품 수집 테스트 — 병렬 페이지 수집, slug별 캐시, 진행률 스트림."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.core.config import settings
+from app.crawlers import store_scraper
+from app.crawlers.store_scraper import StoreInfo, fetch_store_products
+from app.models.user import User
+from app.services.keyword_engine import dictionary
+
+
+def _page(start: int, total: int, mall: str = "내스토어") -> dict:
+    return {
+        "total": total,
+        "items": [
+            {"productId": str(start + i), "title": f"<b>상품</b> {start + i}", "lprice": "1000",
+             "mallName": mall, "category1": "생활", "brand": "", "maker": ""}
+            for i in range(min(100, total - start + 1))
+        ],
+    }
+
+
+@pytest.fixture
+def shop_api(monkeypatch):
+    """가짜 쇼핑 API: 호출된 start 목록 기록, 동시 실행 수 측정."""
+    state = {"calls": [], "in_flight": 0, "max_in_flight": 0, "total": 350, "fail": set()}
+
+    async def fake_store_info(slug):
+        return StoreInfo(channel_name="내스토어", channel_no="12345")
+
+    async def fake_fetch_page(channel_name, start):
+        state["calls"].append(start)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        if start in state["fail"]:
+            return None
+        return _page(start, state["total"])
+
+    monkeypatch.setattr(store_scraper, "_get_store_info", fake_store_info)
+    monkeypatch.setattr(store_scraper, "_fetch_page", fake_fetch_page)
+    monkeypatch.setattr(settings, "STORE_IMPORT_CONCURRENCY", 2)
+    store_scraper.clear_products_cache()
+    yield state
+    store_scraper.clear_products_cache()
+
+
+@pytest.mark.asyncio
+async def test_fetches_remaining_pages_concurrently_in_order(shop_api):
+    progress = []
+    products = await fetch_store_products("mystore", on_progress=lambda d, t: progress.append((d, t)))
+
+    assert shop_api["calls"][0] == 1
+    assert sorted(shop_api["calls"]) == [1, 101, 201, 301]
+    assert shop_api["max_in_flight"] == 2
+    assert [p.naver_product_id for p in products] == [str(i) for i in range(1, 351)]
+    assert progress[0] == (1, 4) and progress[-1] == (4, 4)
+
+
+@pytest.mark.asyncio
+async def test_cache_avoids_refetch_and_refresh_bypasses(shop_api):
+    first = await fetch_store_products("https://smartstore.naver.com/mystore")
+    calls = len(shop_api["calls"])
+
+    again = await fetch_store_products("mystore")
+    assert len(shop_api["calls"]) == calls
+    assert [p.naver_product_id for p in again] == [p.naver_product_id for p in first]
+
+    await fetch_store_products("mystore", use_cache=False)
+    assert len(shop_api["calls"]) == calls * 2
+
+
+@pytest.mark.asyncio
+async def test_failed_page_truncates_and_is_not_cached(shop_api):
+    shop_api["fail"] = {201}
+    products = await fetch_store_products("mystore")
+    # 순차 수집과 동일: 실패 페이지 이후는 버림
+    assert len(products) == 200
+
+    shop_api["fail"] = set()
+    products = await fetch_store_products("mystore")
+    assert len(products) == 350
+
+
+@pytest.mark.asyncio
+async def test_progress_stream_endpoint(client, db, shop_api, monkeypatch):
+    monkeypatch.setattr(dictionary, "_snapshot", None)
+    monkeypatch.setattr(settings, "KEYWORD_SUGGEST_WORKERS", 0)
+    user = User(name="스트림", naver_store_name="내스토어")
+    db.add(user)
+    await db.commit()
+
+    resp = await client.get(
+        f"/api/v1/users/{user.id}/store/products/stream", params={"store_url": "mystore"},
+    )
+    assert resp.status_code == 200
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert [e["event"] for e in events[:-1]] == ["progress"] * 4
+    assert events[-1]["event"] == "result"
+    assert len(events[-1]["products"]) == 350
+    assert events[-1]["products"][0]["suggested_keywords"]
+
+
+@pytest.mark.asyncio
+async def test_progress_stream_reports_network_error(client, db, shop_api, monkeypatch):
+    """200 이후 발생한 타임아웃/연결 오류도 error 이벤트로 끝난다."""
+    import httpx
+
+    async def timeout_page(channel_name, start):
+        raise httpx.ReadTimeout("timed out")
+
+    monkeypatch.setattr(store_scraper, "_fetch_page", timeout_page)
+    monkeypatch.setattr(dictionary, "_snapshot", None)
+    user = User(name="스트림 오류", naver_store_name="내스토어")
+    db.add(user)
+    await db.commit()
+
+    resp = await client.get(
+        f"/api/v1/users/{user.id}/store/products/stream", params={"store_url": "mystore"},
+    )
+    assert resp.status_code == 200
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert events[-1]["event"] == "error" and events[-1]["detail"]
@@ -1,10 +1,16 @@
-"""send_telegram_message 단위 테스트 (mocking 기반)."""
+"""send_telegram_message / 다이제스트 단위 테스트 (mocking 기반)."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.services.telegram_service import send_telegram_message, _format_telegram_message
+from app.services.telegram_service import (
+    _TokenBucket,
+    _format_telegram_message,
+    build_digest_messages,
+    deliver_telegram_message,
+    send_telegram_message,
+)
 
 
 @pytest.mark.asyncio
@@ -45,6 +51,24 @@ async def test_send_telegram_failure():
     assert result is False
 
 
+@pytest.mark.asyncio
+async def test_deliver_telegram_status_by_response_code():
+    """429 외 4xx는 영구 실패, 5xx/네트워크 오류는 재시도 대상."""
+    mock_client = AsyncMock()
+    mock_client.is_closed = False
+
+    with patch("app.services.telegram_service.settings") as mock_settings, \
+         patch("app.services.telegram_service._get_client", return_value=mock_client):
+        mock_settings.TELEGRAM_BOT_TOKEN = "fake-token"
+        for status, expected in [(400, "failed"), (403, "failed"), (502, "retry")]:
+            resp = MagicMock()
+            resp.status_code = status
+            mock_client.post.return_value = resp
+            assert await deliver_telegram_message(f"chat-{status}", "테스트") == expected
+        mock_client.post.side_effect = RuntimeError("connect timeout")
+        assert await deliver_telegram_message("chat-err", "테스트") == "retry"
+
+
 @pytest.mark.asyncio
 async def test_send_telegram_no_token():
     """BOT_TOKEN 빈값 → False 반환 (API 호출 없음)."""
@@ -78,3 +102,69 @@ def test_format_default():
     """알 수 없는 타입 → 기본 아이콘."""
     text = _format_telegram_message(None, "제목", "내용")
     assert "\U0001f514" in text
+
+
+# ===== 다이제스트 + rate limit =====
+
+def test_digest_single_entry_uses_plain_format():
+    chunks = build_digest_messages([("price_undercut", "상품A - 최저가 이탈", "쿠팡 9,800원")])
+    assert chunks == [(_format_telegram_message("price_undercut", "상품A - 최저가 이탈", "쿠팡 9,800원"), [0])]
+
+
+def test_digest_groups_entries_within_limit():
+    """40건 알림 → 4096자 이하 메시지 몇 개로 묶이고 모든 항목 포함."""
+    entries = [("price_undercut", f"상품{i} - 최저가 이탈", "경쟁사 " + "가" * 200) for i in range(40)]
+    chunks = build_digest_messages(entries)
+
+    assert 1 < len(chunks) < 10
+    assert all(len(text) <= 4096 for text, _ in chunks)
+    assert sorted(i for _, idx in chunks for i in idx) == list(range(40))
+    assert "알림 40건" in chunks[0][0]
+
+
+def test_digest_escapes_html():
+    chunks = build_digest_messages([("rank_drop", "A<B>", "x & y"), ("rank_drop", "C", "z")])
+    assert "A&lt;B&gt;" in chunks[0][0]
+    assert "x &amp; y" in chunks[0][0]
+
+
+def test_digest_truncates_before_wrapping_tags():
+    """긴 제목/본문은 이스케이프 후 태그 안에서 잘려 엔티티·닫는 태그가 보존된다."""
+    title = "&" * 5000
+    chunks = build_digest_messages([("rank_drop", title, "<" * 5000)])
+    text = chunks[0][0]
+    assert len(text) <= 4096
+    assert text.count("<b>") == 1 and text.count("</b>") == 1
+    assert text.rstrip("…").endswith("&lt;")
+
+    chunks = build_digest_messages([("rank_drop", title, "<" * 5000), ("rank_drop", "B", "x")])
+    assert all(len(t) <= 4096 for t, _ in chunks)
+    first_block = chunks[0][0].split("\n\n")[1]
+    assert first_block.count("</b>") == 1 and "&am…" not in first_block
+
+
+def test_token_bucket_reserve_delays_after_burst():
+    bucket = _TokenBucket(rate_per_sec=1, capacity=1)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() > 0.9
+
+
+@pytest.mark.asyncio
+async def test_send_telegram_retries_after_429():
+    """429 응답 → retry_after 만큼 대기 후 재시도."""
+    resp_429 = MagicMock()
+    resp_429.status_code = 429
+    resp_429.json.return_value = {"ok": False, "parameters": {"retry_after": 0}}
+    resp_200 = MagicMock()
+    resp_200.status_code = 200
+
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = [resp_429, resp_200]
+
+    with patch("app.services.telegram_service.settings") as mock_settings, \
+         patch("app.services.telegram_service._get_client", return_value=mock_client):
+        mock_settings.TELEGRAM_BOT_TOKEN = "fake-token"
+        result = await send_telegram_message("429-chat", "테스트")
+
+    assert result is True
+    assert mock_client.post.call_count == 2